@@ -0,0 +1,122 @@
+"""Submit, record, and poll one offline provider batch job."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+import time
+from typing import Any
+
+from glk.application._cache import CacheCorruptionError, read_json_object
+from glk.application._hashing import sha256_bytes as _sha256_bytes
+from glk.application._io import write_bytes_atomic as _write_bytes_atomic
+from glk.application._io import write_json_atomic as _write_json_atomic
+from glk.application._progress import ProgressCallback
+
+
+BATCH_JOB_SCHEMA_VERSION = 1
+DEFAULT_BATCH_POLL_SECONDS = 30.0
+
+BatchResults = dict[str, dict[str, Any] | None]
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+def batch_request_lines(lines: list[dict[str, Any]]) -> bytes:
+    return b"".join(
+        json.dumps(
+            line,
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        + b"\n"
+        for line in lines
+    )
+
+
+def _submitted_job(
+    job_path: Path,
+    requests_path: Path,
+    identity: dict[str, Any],
+    data: bytes,
+) -> str | None:
+    """Return a recorded job that already covers every request in ``data``.
+
+    A resumed run asks for fewer requests than the job it submitted, because
+    chunks or pages committed from that job are no longer pending.
+    """
+    try:
+        job = read_json_object(job_path)
+        submitted = requests_path.read_bytes()
+    except (CacheCorruptionError, FileNotFoundError):
+        return None
+    if (
+        job is None
+        or job.get("schema_version") != BATCH_JOB_SCHEMA_VERSION
+        or job.get("requests_sha256") != _sha256_bytes(submitted)
+        or any(job.get(key) != value for key, value in identity.items())
+        or not isinstance(job.get("job_id"), str)
+        or not set(data.splitlines()) <= set(submitted.splitlines())
+    ):
+        return None
+    return job["job_id"]
+
+
+def run_batch_job(
+    *,
+    job_path: Path,
+    requests_path: Path,
+    requests: list[dict[str, Any]],
+    identity: dict[str, Any],
+    submit: Callable[[], str],
+    results: Callable[[str], BatchResults | None],
+    poll_seconds: float,
+    notify: ProgressCallback,
+    sleep: Callable[[float], None] = time.sleep,
+) -> BatchResults:
+    """Submit the requests once, then poll until the provider finishes the job.
+
+    The request file and the job record are written before polling starts, so
+    an interrupted run resumes polling the same job instead of paying for a
+    second submission. A request the recorded job never saw submits a new job.
+    """
+    data = batch_request_lines(requests)
+    job_id = _submitted_job(job_path, requests_path, identity, data)
+    if job_id is not None:
+        notify(f"Batch job {job_id}: resuming the submitted job")
+    else:
+        _write_bytes_atomic(requests_path, data)
+        job_id = submit()
+        _write_json_atomic(
+            job_path,
+            {
+                "schema_version": BATCH_JOB_SCHEMA_VERSION,
+                **identity,
+                "requests_file": requests_path.name,
+                "requests_sha256": _sha256_bytes(data),
+                "request_count": len(requests),
+                "job_id": job_id,
+                "submitted_at": _utc_now(),
+            },
+        )
+        notify(f"Batch job {job_id}: submitted {len(requests)} requests")
+    while True:
+        answered = results(job_id)
+        if answered is not None:
+            break
+        notify(f"Batch job {job_id}: waiting for results")
+        sleep(poll_seconds)
+    usable = sum(answered.get(line["key"]) is not None for line in requests)
+    notify(f"Batch job {job_id}: {usable}/{len(requests)} requests answered")
+    return answered
+
+
+def clear_batch_job(job_path: Path, requests_path: Path) -> None:
+    """Forget a batch job whose results are fully ingested."""
+    job_path.unlink(missing_ok=True)
+    requests_path.unlink(missing_ok=True)
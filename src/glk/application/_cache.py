@@ -6,6 +6,9 @@ import json
 from pathlib import Path
 from typing import Any
 
+from glk.domain.workspace import RESPONSE_CACHE_ROOT
+from glk.infrastructure.response_cache import ResponseCache, shared_response_cache
+
 
 class CacheCorruptionError(ValueError):
     """Raised when an existing JSON cache cannot be decoded or validated."""
@@ -38,3 +41,14 @@ def read_json_object(path: Path) -> dict[str, Any] | None:
 def invalid_cache(path: Path, detail: str) -> CacheCorruptionError:
     """Build a consistent error for a structurally invalid cache object."""
     return CacheCorruptionError(f"Cache file is invalid ({detail}): {path}")
+
+
+def workspace_response_cache(
+    project_path: Path,
+    settings_root: str | Path | None = None,
+) -> ResponseCache | None:
+    """Return the provider response cache of the project's workspace."""
+    return shared_response_cache(
+        project_path.parent / RESPONSE_CACHE_ROOT,
+        settings_root=settings_root,
+    )
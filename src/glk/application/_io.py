@@ -10,6 +10,8 @@ import shutil
 import tempfile
 from typing import Any
 
+from glk.application._hashing import sha256_bytes, sha256_file
+
 
 _UNSUPPORTED_DIRECTORY_FSYNC_ERRNOS = frozenset(
     error_number
@@ -103,16 +105,73 @@ def append_bytes_durable(path: Path, value: bytes) -> None:
         _fsync_parent(path)
 
 
+def append_bytes(path: Path, value: bytes) -> None:
+    """Append bytes without waiting for them to reach the disk.
+
+    Callers pair this with :func:`fsync_file` before recording the appended
+    data as durable.
+    """
+    if not value:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    created = not path.exists()
+    with path.open("ab") as file:
+        file.write(value)
+    if created:
+        _fsync_parent(path)
+
+
+def fsync_file(path: Path) -> None:
+    """Flush every earlier write of an existing file to the disk."""
+    # Windows cannot flush a handle opened read-only.
+    with path.open("ab") as file:
+        os.fsync(file.fileno())
+
+
+def write_bytes_if_changed(path: Path, value: bytes) -> bool:
+    """Write bytes atomically unless the file already holds them.
+
+    Re-running a cached stage then costs a hash of each file instead of a
+    rewrite and fsync. Returns whether the file was written.
+    """
+    try:
+        unchanged = (
+            path.stat().st_size == len(value)
+            and sha256_file(path) == sha256_bytes(value)
+        )
+    except FileNotFoundError:
+        unchanged = False
+    if unchanged:
+        return False
+    write_bytes_atomic(path, value)
+    return True
+
+
+def _text_bytes(value: str) -> bytes:
+    text = value if not value or value.endswith("\n") else value + "\n"
+    return text.encode("utf-8")
+
+
+def _json_bytes(value: Any) -> bytes:
+    return (json.dumps(value, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+
 def write_text_atomic(path: Path, value: str) -> None:
     """Write UTF-8 text with one trailing newline when non-empty."""
-    text = value if not value or value.endswith("\n") else value + "\n"
-    write_bytes_atomic(path, text.encode("utf-8"))
+    write_bytes_atomic(path, _text_bytes(value))
+
+
+def write_text_if_changed(path: Path, value: str) -> bool:
+    return write_bytes_if_changed(path, _text_bytes(value))
 
 
 def write_json_atomic(path: Path, value: Any) -> None:
     """Write human-readable UTF-8 JSON with a trailing newline."""
-    data = (json.dumps(value, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
-    write_bytes_atomic(path, data)
+    write_bytes_atomic(path, _json_bytes(value))
+
+
+def write_json_if_changed(path: Path, value: Any) -> bool:
+    return write_bytes_if_changed(path, _json_bytes(value))
 
 
 def copy_file_atomic(source: Path, destination: Path) -> None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+import threading
 
 
 ProgressCallback = Callable[[str], None]
@@ -27,3 +28,14 @@ def guard_progress_callback(
             ) from error
 
     return notify
+
+
+def serialized_progress(notify: ProgressCallback) -> ProgressCallback:
+    """Deliver worker-thread progress messages to the observer one at a time."""
+    lock = threading.Lock()
+
+    def serialized(message: str) -> None:
+        with lock:
+            notify(message)
+
+    return serialized
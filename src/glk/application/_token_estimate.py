@@ -0,0 +1,101 @@
+"""Provider-aware token estimates used to plan translation chunks."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+import unicodedata
+
+
+TOKEN_ESTIMATE_VERSION = "token-estimate-v1"
+
+
+@dataclass(frozen=True, slots=True)
+class TokenEstimateProfile:
+    """Characters-per-token ratios for one tokenizer family.
+
+    The ratios are deliberately conservative so a planned chunk stays inside its
+    budget. They only steer chunk sizes; no request depends on exact counts.
+    """
+
+    name: str
+    latin_characters_per_token: float
+    cjk_tokens_per_character: float
+    other_characters_per_token: float
+    output_tokens_per_source_token: float
+
+
+_GEMINI_PROFILE = TokenEstimateProfile(
+    name="gemini",
+    latin_characters_per_token=3.6,
+    cjk_tokens_per_character=1.0,
+    other_characters_per_token=2.0,
+    output_tokens_per_source_token=1.4,
+)
+_OPENAI_PROFILE = TokenEstimateProfile(
+    name="openai",
+    latin_characters_per_token=3.8,
+    cjk_tokens_per_character=0.9,
+    other_characters_per_token=2.0,
+    output_tokens_per_source_token=1.3,
+)
+_OPENAI_LEGACY_PROFILE = TokenEstimateProfile(
+    name="openai-cl100k",
+    latin_characters_per_token=3.6,
+    cjk_tokens_per_character=1.6,
+    other_characters_per_token=1.6,
+    output_tokens_per_source_token=2.0,
+)
+_PROVIDER_PROFILES = {
+    "gemini": _GEMINI_PROFILE,
+    "openai": _OPENAI_PROFILE,
+}
+_MODEL_PREFIX_PROFILES = (
+    ("gpt-3.5", _OPENAI_LEGACY_PROFILE),
+    ("gpt-4-", _OPENAI_LEGACY_PROFILE),
+)
+DEFAULT_TOKEN_ESTIMATE_PROFILE = _GEMINI_PROFILE
+
+
+def token_estimate_profile(
+    provider_name: str | None,
+    model_name: str | None = None,
+) -> TokenEstimateProfile:
+    """Select the tokenizer profile for a provider and, where known, a model."""
+    model = (model_name or "").strip().casefold()
+    for prefix, profile in _MODEL_PREFIX_PROFILES:
+        if model.startswith(prefix):
+            return profile
+    return _PROVIDER_PROFILES.get(
+        (provider_name or "").strip().casefold(),
+        DEFAULT_TOKEN_ESTIMATE_PROFILE,
+    )
+
+
+def _is_cjk(character: str) -> bool:
+    name = unicodedata.name(character, "")
+    return name.startswith(("HANGUL", "CJK", "HIRAGANA", "KATAKANA"))
+
+
+def estimate_tokens(text: str, profile: TokenEstimateProfile) -> int:
+    """Estimate tokenizer output for mixed Latin and CJK text."""
+    latin = 0
+    cjk = 0
+    other = 0
+    for character in text:
+        if character.isascii():
+            latin += 1
+        elif _is_cjk(character):
+            cjk += 1
+        else:
+            other += 1
+    return math.ceil(
+        latin / profile.latin_characters_per_token
+        + cjk * profile.cjk_tokens_per_character
+        + other / profile.other_characters_per_token
+    )
+
+
+def estimate_output_tokens(source_tokens: int, profile: TokenEstimateProfile) -> int:
+    """Estimate Korean output tokens for a source span of known size."""
+    return math.ceil(source_tokens * profile.output_tokens_per_source_token)
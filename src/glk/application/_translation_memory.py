@@ -0,0 +1,366 @@
+"""Workspace translation memory built from other projects' approved translations."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import re
+import threading
+from typing import Any
+
+from glk.application._cache import CacheCorruptionError, read_json_object
+from glk.application._hashing import sha256_bytes as _sha256_bytes
+from glk.application._io import write_json_atomic as _write_json_atomic
+from glk.application._translation_context import load_termbase as _load_termbase
+from glk.application.translation_types import TranslationError
+from glk.domain.approved_translation import (
+    ApprovedTranslationSegment,
+    ApprovedTranslationValidationError,
+)
+from glk.domain.termbase_matcher import (
+    TermbaseMatcher,
+    entry_variants,
+    termbase_matcher,
+)
+from glk.domain.workspace import WorkspacePaths
+
+
+TRANSLATION_MEMORY_VERSION = "translation-memory-v3"
+TRANSLATION_MEMORY_INDEX = Path(".glk/translation_memory.json")
+_GRAM_SIZE = 3
+_DIGITS = re.compile(r"\d+")
+_SPACES = re.compile(r"\s+")
+
+
+@dataclass(frozen=True, slots=True)
+class TranslationMemoryMatch:
+    project: str
+    source_block_id: str
+    translation: str
+    # The model that produced the approved translation.
+    model: str
+
+    @property
+    def reference(self) -> str:
+        return f"{self.project}/{self.source_block_id}"
+
+
+@dataclass(frozen=True, slots=True)
+class TranslationMemoryExample:
+    source_text: str
+    translation: str
+    similarity: float
+
+
+def _similarity_grams(text: str) -> frozenset[str]:
+    # Numbers are normalized so blocks that differ only by a value still match.
+    normalized = _SPACES.sub(" ", _DIGITS.sub("0", text.casefold())).strip()
+    padded = f" {normalized} "
+    return frozenset(
+        padded[index : index + _GRAM_SIZE]
+        for index in range(max(1, len(padded) - _GRAM_SIZE + 1))
+    )
+
+
+class FuzzyTranslationIndex:
+    """Character-trigram inverted index over approved source texts.
+
+    Similarity is the Jaccard index of the normalized trigram sets. Trigrams
+    that occur in a large share of the memory are not used to find candidates,
+    which keeps a lookup to a few short posting lists.
+    """
+
+    def __init__(self, pairs: Sequence[tuple[str, str]]) -> None:
+        self._pairs = tuple(dict.fromkeys(pairs))
+        self._grams = tuple(_similarity_grams(source) for source, _ in self._pairs)
+        postings: dict[str, list[int]] = {}
+        for document, grams in enumerate(self._grams):
+            for gram in grams:
+                postings.setdefault(gram, []).append(document)
+        common = max(64, len(self._pairs) // 20)
+        self._postings = {
+            gram: documents
+            for gram, documents in postings.items()
+            if len(documents) <= common
+        }
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    def similar(
+        self,
+        text: str,
+        *,
+        limit: int,
+        minimum_similarity: float,
+    ) -> list[TranslationMemoryExample]:
+        grams = _similarity_grams(text)
+        overlaps: Counter[int] = Counter()
+        for gram in grams:
+            overlaps.update(self._postings.get(gram, ()))
+        scored: list[TranslationMemoryExample] = []
+        for document in overlaps:
+            source, translation = self._pairs[document]
+            if source == text:
+                continue
+            candidate = self._grams[document]
+            shared = len(grams & candidate)
+            similarity = shared / (len(grams) + len(candidate) - shared)
+            if similarity >= minimum_similarity:
+                scored.append(
+                    TranslationMemoryExample(source, translation, similarity)
+                )
+        scored.sort(key=lambda item: (-item.similarity, item.source_text))
+        return scored[:limit]
+
+
+class TranslationMemory:
+    """Exact-match lookup keyed by source hash and relevant-termbase hash.
+
+    The memory also finds approved pairs whose source is similar to a block,
+    so the prompt can show them as examples.
+    """
+
+    def __init__(
+        self,
+        matches: dict[tuple[str, str], TranslationMemoryMatch],
+        pairs: Sequence[tuple[str, str]] = (),
+    ) -> None:
+        self._matches = matches
+        self._pairs = tuple(pairs)
+        self._fuzzy: FuzzyTranslationIndex | None = None
+        self._fuzzy_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    def lookup(
+        self, source_text: str, matcher: TermbaseMatcher
+    ) -> TranslationMemoryMatch | None:
+        if not self._matches:
+            return None
+        return self._matches.get(
+            (
+                _sha256_bytes(source_text.encode("utf-8")),
+                relevant_terms_sha256(source_text, matcher),
+            )
+        )
+
+    def examples(
+        self,
+        texts: Sequence[str],
+        *,
+        per_text: int = 2,
+        limit: int = 5,
+        minimum_similarity: float = 0.5,
+    ) -> list[TranslationMemoryExample]:
+        """Return the most similar approved pairs for a group of source texts."""
+        if not self._pairs:
+            return []
+        with self._fuzzy_lock:
+            if self._fuzzy is None:
+                self._fuzzy = FuzzyTranslationIndex(self._pairs)
+        best: dict[tuple[str, str], TranslationMemoryExample] = {}
+        sources = set(texts)
+        for text in sorted(sources):
+            # Other texts of the same group are the ones being translated.
+            similar = [
+                example
+                for example in self._fuzzy.similar(
+                    text,
+                    limit=per_text + len(sources),
+                    minimum_similarity=minimum_similarity,
+                )
+                if example.source_text not in sources
+            ]
+            for example in similar[:per_text]:
+                key = (example.source_text, example.translation)
+                if key not in best or best[key].similarity < example.similarity:
+                    best[key] = example
+        ranked = sorted(
+            best.values(),
+            key=lambda item: (-item.similarity, item.source_text, item.translation),
+        )
+        return ranked[:limit]
+
+
+def relevant_terms_sha256(source_text: str, matcher: TermbaseMatcher) -> str:
+    """Hash the active termbase decisions that apply to one source text.
+
+    Two projects may only share a translation when the same terms, with the
+    same translations and statuses, were in force for the source text.
+    """
+    terms = sorted(
+        json.dumps(
+            {
+                "source_term": entry["source_term"],
+                "translation": entry["translation"],
+                "status": entry["status"],
+                "variants": entry_variants(entry),
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        for entry in matcher.matching_entries(source_text)
+        if entry.get("status") in {"approved", "keep"}
+    )
+    return _sha256_bytes(("[" + ",".join(terms) + "]").encode("utf-8"))
+
+
+def _project_memory_rows(
+    project_path: Path,
+    approved_data: bytes,
+) -> list[list[str]] | None:
+    """Index one project's approved segments, or skip an unusable project."""
+    try:
+        termbase_entries, termbase_data = _load_termbase(project_path)
+    except (OSError, TranslationError):
+        return None
+    termbase_hash = _sha256_bytes(termbase_data)
+    matcher = termbase_matcher(termbase_entries)
+    rows: list[list[str]] = []
+    try:
+        for line in approved_data.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            segment = ApprovedTranslationSegment.from_dict(json.loads(line))
+            # The relevant subset is only known for the termbase that was
+            # current when the segment was approved.
+            if segment.termbase_sha256 != termbase_hash:
+                continue
+            rows.append(
+                [
+                    segment.source_sha256,
+                    relevant_terms_sha256(segment.source_text, matcher),
+                    segment.source_block_id,
+                    segment.effective_translation,
+                    segment.source_text,
+                    segment.model,
+                ]
+            )
+    except (
+        UnicodeDecodeError,
+        json.JSONDecodeError,
+        ApprovedTranslationValidationError,
+        TypeError,
+    ):
+        return None
+    return rows
+
+
+def _cached_projects(index_path: Path) -> dict[str, Any]:
+    try:
+        index = read_json_object(index_path)
+    except CacheCorruptionError:
+        return {}
+    if (
+        index is None
+        or index.get("version") != TRANSLATION_MEMORY_VERSION
+        or not isinstance(index.get("projects"), dict)
+    ):
+        return {}
+    return index["projects"]
+
+
+def _valid_cached_project(
+    value: Any, approved_hash: str, termbase_hash: str
+) -> bool:
+    return (
+        isinstance(value, dict)
+        and value.get("approved_sha256") == approved_hash
+        and value.get("termbase_sha256") == termbase_hash
+        and isinstance(value.get("segments"), list)
+        and all(
+            isinstance(row, list)
+            and len(row) == 6
+            and all(isinstance(item, str) for item in row)
+            for row in value["segments"]
+        )
+    )
+
+
+def load_translation_memory(
+    workspace_root: Path,
+    *,
+    exclude: Path | None = None,
+    update_index: bool = True,
+) -> TranslationMemory:
+    """Refresh the workspace index and return the other projects' memory.
+
+    Projects are re-indexed only when their approved translation or termbase
+    bytes change. A key that maps to different approved translations in
+    different projects is left out of the exact matches so the provider
+    decides; every approved pair stays available as a similar-text example.
+    """
+    index_path = workspace_root / TRANSLATION_MEMORY_INDEX
+    cached = _cached_projects(index_path)
+    projects: dict[str, Any] = {}
+    excluded = exclude.resolve() if exclude is not None else None
+    candidates = (
+        sorted(workspace_root.iterdir(), key=lambda path: path.name)
+        if workspace_root.is_dir()
+        else []
+    )
+    for candidate in candidates:
+        if (
+            not candidate.is_dir()
+            or candidate.name.startswith(".")
+            or not (candidate / "project.json").is_file()
+        ):
+            continue
+        paths = WorkspacePaths(candidate)
+        try:
+            approved_data = paths.approved_translation_segments.read_bytes()
+            termbase_hash = _sha256_bytes(paths.termbase.read_bytes())
+        except FileNotFoundError:
+            continue
+        approved_hash = _sha256_bytes(approved_data)
+        previous = cached.get(candidate.name)
+        if _valid_cached_project(previous, approved_hash, termbase_hash):
+            projects[candidate.name] = previous
+            continue
+        indexed = _project_memory_rows(candidate, approved_data)
+        projects[candidate.name] = {
+            "approved_sha256": approved_hash,
+            "termbase_sha256": termbase_hash,
+            "segments": indexed or [],
+        }
+    if update_index and projects != cached:
+        _write_json_atomic(
+            index_path,
+            {
+                "schema_version": 1,
+                "version": TRANSLATION_MEMORY_VERSION,
+                "projects": projects,
+            },
+        )
+
+    matches: dict[tuple[str, str], TranslationMemoryMatch] = {}
+    ambiguous: set[tuple[str, str]] = set()
+    pairs: list[tuple[str, str]] = []
+    for name, project in projects.items():
+        if excluded is not None and (workspace_root / name).resolve() == excluded:
+            continue
+        for (
+            source_hash,
+            terms_hash,
+            block_id,
+            translation,
+            source_text,
+            model,
+        ) in project["segments"]:
+            pairs.append((source_text, translation))
+            key = (source_hash, terms_hash)
+            existing = matches.get(key)
+            if existing is None and key not in ambiguous:
+                matches[key] = TranslationMemoryMatch(
+                    name, block_id, translation, model
+                )
+            elif existing is not None and existing.translation != translation:
+                del matches[key]
+                ambiguous.add(key)
+    return TranslationMemory(matches, pairs)
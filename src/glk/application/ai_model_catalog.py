@@ -193,3 +193,57 @@ def load_ai_model_catalogs() -> dict[str, GeminiModelCatalog]:
         "gemini": load_gemini_model_catalog(),
         "openai": load_openai_model_catalog(),
     }
+
+
+class ModelPrice(TypedDict):
+    input_per_million_tokens: float
+    output_per_million_tokens: float
+
+
+class ModelPriceError(ValueError):
+    """Raised when the packaged model price table is invalid."""
+
+
+def _price(value: Any) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value) if value >= 0 else None
+
+
+@lru_cache(maxsize=1)
+def load_model_prices() -> dict[str, ModelPrice]:
+    """Return USD prices per million tokens for models with a verified price.
+
+    Models missing from the table have no cost estimate.
+    """
+    try:
+        text = (
+            resources.files("glk.data")
+            .joinpath("model_prices.json")
+            .read_text(encoding="utf-8")
+        )
+        value: Any = json.loads(text)
+    except (OSError, UnicodeError, json.JSONDecodeError) as error:
+        raise ModelPriceError("Unable to read the model price table.") from error
+    raw_models = value.get("models") if isinstance(value, dict) else None
+    if (
+        not isinstance(value, dict)
+        or value.get("schema_version") != 1
+        or value.get("currency") != "USD"
+        or not isinstance(raw_models, dict)
+    ):
+        raise ModelPriceError("Model price table metadata is invalid.")
+
+    prices: dict[str, ModelPrice] = {}
+    for model_id, raw_price in raw_models.items():
+        if not isinstance(raw_price, dict):
+            raise ModelPriceError("Model price entry must be an object.")
+        input_price = _price(raw_price.get("input_per_million_tokens"))
+        output_price = _price(raw_price.get("output_per_million_tokens"))
+        if not model_id or input_price is None or output_price is None:
+            raise ModelPriceError("Model price entry is invalid.")
+        prices[model_id] = {
+            "input_per_million_tokens": input_price,
+            "output_per_million_tokens": output_price,
+        }
+    return prices
@@ -22,6 +22,7 @@ from glk.application.translation_prompt_service import (
     TranslationPromptError,
     load_translation_prompt_document,
 )
+from glk.application.usage_service import project_usage_report
 from glk.domain.workspace import WorkspacePaths, is_pdf_source_file
 
 
@@ -326,6 +327,13 @@ def _project_translation_prompt(summary: Any) -> dict[str, Any]:
         return {"value": "", "saved": True, "sha256": ""}
 
 
+def _project_usage(summary: Any) -> dict[str, Any] | None:
+    try:
+        return project_usage_report(Path(summary.path)).to_dict()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
 def _project_document(
     summary: Any,
     status: dict[str, Any],
@@ -390,6 +398,7 @@ def _project_document(
             name: availability.to_dict()
             for name, availability in reviews.items()
         },
+        "usage": _project_usage(summary),
     }
 
 
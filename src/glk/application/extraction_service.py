@@ -2,24 +2,46 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+import contextvars
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime, timezone
+from functools import partial
+from io import BytesIO
 import json
+import multiprocessing
+import os
 from pathlib import Path
-from typing import Any
+import threading
+from typing import Any, cast
 
+from PIL import Image
 import pymupdf
 
-from glk.application._cache import invalid_cache, read_json_object
+from glk.application._batch import (
+    DEFAULT_BATCH_POLL_SECONDS,
+    clear_batch_job as _clear_batch_job,
+    run_batch_job as _run_batch_job,
+)
+from glk.application._cache import (
+    invalid_cache,
+    read_json_object,
+    workspace_response_cache,
+)
 from glk.application._hashing import sha256_bytes as _sha256_bytes
 from glk.application._hashing import sha256_file as _sha256_file
 from glk.application._io import write_bytes_atomic as _write_bytes_atomic
+from glk.application._io import write_bytes_if_changed as _write_bytes_if_changed
 from glk.application._io import write_json_atomic as _write_json_atomic
+from glk.application._io import write_json_if_changed as _write_json_if_changed
 from glk.application._io import write_text_atomic as _write_text_atomic
+from glk.application._io import write_text_if_changed as _write_text_if_changed
 from glk.application._progress import (
     ProgressCallback,
     ProgressCallbackError,
     guard_progress_callback,
+    serialized_progress,
 )
 from glk.application.project_service import (
     ProjectLocation,
@@ -29,24 +51,48 @@ from glk.application.source_registration_service import (
     SourceRegistrationError,
     register_pdf_source,
 )
+from glk.application.usage_service import usage_ledger_observer
 from glk.domain.workspace import WorkspacePaths
 from glk.extraction.layout import (
+    BatchLayoutProvider,
     LayoutValidationError,
     LayoutProvider,
+    PackedLayoutProvider,
     POSTPROCESS_VERSION,
     build_page_text,
+    crop_page_image,
+    decode_page_image,
     extract_line_fragments,
     merge_paragraph_continuations,
+    page_content_sha256,
     parse_page_selection,
     reconstruct_blocks,
     recover_layout_fragment_references,
-    render_page,
+    render_page_png,
+    shift_fragments,
+    text_crop_box,
     validate_layout,
 )
+from glk.extraction.reading_order import (
+    DEFAULT_LOCAL_LAYOUT_THRESHOLD,
+    LOCAL_LAYOUT_MODEL,
+    LOCAL_LAYOUT_VERSION,
+    LocalLayout,
+    infer_reading_order,
+)
 from glk.infrastructure.ai_provider import ai_failure_code, create_layout_provider
+from glk.infrastructure.image_payload import load_image_payload_settings
+from glk.infrastructure.response_cache import refresh_responses, use_response_cache
+from glk.infrastructure.usage_telemetry import request_scope
 
 
 LAYOUT_VALIDATION_ATTEMPTS = 3
+DEFAULT_EXTRACTION_CONCURRENCY = 1
+DEFAULT_LAYOUT_PACK_SIZE = 4
+# Pages with more fragments than this are worth a request of their own, and
+# a packed request carries at most this many fragments in total.
+PACKED_PAGE_MAX_FRAGMENTS = 40
+PACKED_LAYOUT_MAX_FRAGMENTS = 120
 
 
 class ExtractionError(ValueError):
@@ -65,6 +111,8 @@ class _PageExtraction:
     page: int
     text: str
     cached: bool
+    local: bool = False
+    packed: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -85,6 +133,8 @@ class ExtractionResult:
     cached_pages: tuple[int, ...]
     failures: tuple[PageFailure, ...]
     output_file: str | None
+    local_pages: tuple[int, ...] = ()
+    packed_pages: tuple[int, ...] = ()
     dry_run: bool = False
 
     @property
@@ -134,6 +184,7 @@ def _load_cached_layout(
     path: Path,
     *,
     source_sha256: str,
+    page_sha256: str,
     fragment_sha256: str,
     provider: LayoutProvider,
     fragments: list[dict[str, Any]],
@@ -142,8 +193,16 @@ def _load_cached_layout(
     if value is None:
         return None
     try:
+        # Layouts are keyed by the page's own content, so a revised PDF only
+        # reprocesses the pages that changed. Entries written before page
+        # hashes were recorded still require the same whole file.
+        page_matches = (
+            value.get("page_sha256") == page_sha256
+            if "page_sha256" in value
+            else value.get("source_sha256") == source_sha256
+        )
         metadata_matches = (
-            value.get("source_sha256") == source_sha256
+            page_matches
             and value.get("fragment_sha256") == fragment_sha256
             and value.get("model") == provider.model_name
             and value.get("prompt_version") == provider.prompt_version
@@ -177,6 +236,24 @@ def _load_cached_layout(
         raise invalid_cache(path, "invalid PDF layout") from error
 
 
+def _local_layout(
+    fragments: list[dict[str, Any]],
+    page_size: tuple[float, float],
+    threshold: float | None,
+) -> LocalLayout | None:
+    """Return the geometric layout when it is trusted enough to skip the LLM."""
+    if threshold is None:
+        return None
+    local = infer_reading_order(fragments, page_size)
+    if local.confidence < threshold:
+        return None
+    try:
+        validate_layout(fragments, local.layout)
+    except LayoutValidationError:
+        return None
+    return local
+
+
 def _reconstruct_validated_layout(
     *,
     page_number: int,
@@ -184,10 +261,22 @@ def _reconstruct_validated_layout(
     page_image: Any,
     provider: LayoutProvider,
     notify: ProgressCallback,
+    request_fragments: list[dict[str, Any]] | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
-    """Retry invalid LLM responses, then preserve omitted source for review."""
+    """Retry invalid LLM responses, then preserve omitted source for review.
+
+    ``request_fragments`` are the fragments as sent, with boxes moved to a
+    cropped page image; the layout is validated against ``fragments``.
+    """
+    sent = fragments if request_fragments is None else request_fragments
     for attempt in range(1, LAYOUT_VALIDATION_ATTEMPTS + 1):
-        layout = provider.reconstruct(page_number, fragments, page_image)
+        if attempt == 1:
+            layout = provider.reconstruct(page_number, sent, page_image)
+        else:
+            # The same request is sent again, so a cached answer would only
+            # repeat the rejected layout.
+            with refresh_responses():
+                layout = provider.reconstruct(page_number, sent, page_image)
         try:
             return layout, validate_layout(fragments, layout)
         except LayoutValidationError as error:
@@ -212,83 +301,355 @@ def _reconstruct_validated_layout(
     raise RuntimeError("Layout validation retry loop ended unexpectedly.")
 
 
-def _extract_pdf_page(
+@dataclass(frozen=True, slots=True)
+class _PreparedPage:
+    """Text fragments of one page, cheap to send between processes."""
+
+    page_number: int
+    fragments: list[dict[str, Any]]
+    page_size: tuple[float, float]
+    content_sha256: str
+
+
+def _prepare_page(page: Any, page_number: int) -> _PreparedPage:
+    return _PreparedPage(
+        page_number=page_number,
+        fragments=extract_line_fragments(page, page_number),
+        page_size=(round(page.rect.width, 2), round(page.rect.height, 2)),
+        content_sha256=page_content_sha256(page),
+    )
+
+
+# Each page-preparation worker process opens the source PDF once.
+_worker_document: Any = None
+
+
+def _open_worker_document(source_path: str) -> None:
+    global _worker_document
+    _worker_document = pymupdf.open(source_path)
+
+
+def _prepare_worker_page(page_index: int) -> _PreparedPage:
+    return _prepare_page(_worker_document[page_index], page_index + 1)
+
+
+def _render_worker_page(page_index: int, scale: float) -> bytes:
+    return render_page_png(_worker_document[page_index], scale)
+
+
+def _layout_request_inputs(
+    png_bytes: bytes,
+    fragments: list[dict[str, Any]],
+    page_size: tuple[float, float],
+    crop: bool,
+) -> tuple[Image.Image, list[dict[str, Any]]]:
+    """Return the page image and fragments to send, cropped to the text area."""
+    page_image = decode_page_image(png_bytes)
+    box = text_crop_box(fragments, page_size) if crop else None
+    if box is None:
+        return page_image, fragments
+    return (
+        crop_page_image(page_image, box, page_size),
+        shift_fragments(fragments, (box[0], box[1])),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _PagePlan:
+    """A page whose fragments are cached and whose layout source is chosen.
+
+    ``png_bytes`` is rendered only for pages bound for the layout model.
+    """
+
+    prepared: _PreparedPage
+    fragment_hash: str
+    cached: tuple[dict[str, Any], list[dict[str, Any]], dict[str, Any]] | None
+    local: LocalLayout | None
+    png_bytes: bytes | None
+
+    @property
+    def packable(self) -> bool:
+        return (
+            self.png_bytes is not None
+            and len(self.prepared.fragments) <= PACKED_PAGE_MAX_FRAGMENTS
+        )
+
+
+def _plan_pdf_page(
     *,
-    page: Any,
-    page_number: int,
+    prepared: _PreparedPage,
+    render_png: Callable[[], bytes],
     source_hash: str,
     paths: WorkspacePaths,
     provider: LayoutProvider,
-    scale: float,
     force: bool,
-    notify: ProgressCallback,
-) -> _PageExtraction:
-    notify(f"Page {page_number}: extracting PDF fragments")
-    fragments = extract_line_fragments(page, page_number)
+    local_threshold: float | None,
+) -> _PagePlan:
+    page_number = prepared.page_number
+    fragments = prepared.fragments
     if not fragments:
         raise ExtractionError(
             "No embedded text fragments were found; this page requires OCR."
         )
-    png_bytes, page_image = render_page(page, scale)
     fragment_hash = _sha256_json(fragments)
     page_stem = f"page_{page_number:03d}"
-    _write_bytes_atomic(paths.pdf_pages / f"{page_stem}.png", png_bytes)
-    _write_json_atomic(
+    _write_json_if_changed(
         paths.pdf_fragments / f"{page_stem}.json",
         {
             "schema_version": 1,
             "source_sha256": source_hash,
+            "page_sha256": prepared.content_sha256,
             "page": page_number,
-            "page_size": [
-                round(page.rect.width, 2),
-                round(page.rect.height, 2),
-            ],
+            "page_size": list(prepared.page_size),
             "fragment_sha256": fragment_hash,
             "fragments": fragments,
         },
     )
-
-    layout_path = paths.pdf_layouts / f"{page_stem}.json"
     cached = None if force else _load_cached_layout(
-        layout_path,
+        paths.pdf_layouts / f"{page_stem}.json",
         source_sha256=source_hash,
+        page_sha256=prepared.content_sha256,
         fragment_sha256=fragment_hash,
         provider=provider,
         fragments=fragments,
     )
+    # A cached model layout is preferred, since it was already paid for.
+    local = (
+        None
+        if cached is not None
+        else _local_layout(fragments, prepared.page_size, local_threshold)
+    )
+    png_bytes = None
+    if cached is None and local is None:
+        # The page is rendered only when it is sent; a cache hit leaves the
+        # review image to be rendered on demand.
+        png_bytes = render_png()
+        _write_bytes_if_changed(paths.pdf_pages / f"{page_stem}.png", png_bytes)
+    return _PagePlan(prepared, fragment_hash, cached, local, png_bytes)
+
+
+def _finish_pdf_page(
+    plan: _PagePlan,
+    *,
+    source_hash: str,
+    paths: WorkspacePaths,
+    provider: LayoutProvider,
+    crop: bool,
+    notify: ProgressCallback,
+) -> _PageExtraction:
+    prepared, cached, local = plan.prepared, plan.cached, plan.local
+    page_number = prepared.page_number
+    fragments = prepared.fragments
+    page_stem = f"page_{page_number:03d}"
+    model_name, prompt_version = provider.model_name, provider.prompt_version
     if cached is not None:
         layout, blocks, validation = cached
         notify(f"Page {page_number}: reused validated layout cache")
+    elif local is not None:
+        layout = local.layout
+        validation = validate_layout(fragments, layout)
+        blocks = merge_paragraph_continuations(
+            reconstruct_blocks(fragments, layout)
+        )
+        model_name, prompt_version = LOCAL_LAYOUT_MODEL, LOCAL_LAYOUT_VERSION
+        notify(
+            f"Page {page_number}: ordered locally "
+            f"(confidence {local.confidence:.2f})"
+        )
     else:
+        assert plan.png_bytes is not None
         notify(f"Page {page_number}: requesting LLM layout reconstruction")
+        page_image, request_fragments = _layout_request_inputs(
+            plan.png_bytes, fragments, prepared.page_size, crop
+        )
         layout, validation = _reconstruct_validated_layout(
             page_number=page_number,
             fragments=fragments,
             page_image=page_image,
             provider=provider,
             notify=notify,
+            request_fragments=request_fragments,
         )
         blocks = merge_paragraph_continuations(
             reconstruct_blocks(fragments, layout)
         )
-    _write_json_atomic(
-        layout_path,
+    _write_json_if_changed(
+        paths.pdf_layouts / f"{page_stem}.json",
         {
             "schema_version": 1,
             "source_sha256": source_hash,
-            "fragment_sha256": fragment_hash,
+            "page_sha256": prepared.content_sha256,
+            "fragment_sha256": plan.fragment_hash,
             "page": page_number,
-            "model": provider.model_name,
-            "prompt_version": provider.prompt_version,
+            "model": model_name,
+            "prompt_version": prompt_version,
             "postprocess_version": POSTPROCESS_VERSION,
+            "local_confidence": local.confidence if local is not None else None,
             "validation": validation,
             "layout": layout,
             "reconstructed_blocks": blocks,
         },
     )
     page_text = build_page_text(blocks)
-    _write_text_atomic(paths.pdf_layouts / f"{page_stem}.txt", page_text)
-    return _PageExtraction(page_number, page_text, cached is not None)
+    _write_text_if_changed(paths.pdf_layouts / f"{page_stem}.txt", page_text)
+    return _PageExtraction(
+        page_number, page_text, cached is not None, local is not None
+    )
+
+
+def _extract_page_in_scope(
+    page_number: int,
+    prepare: Callable[[], _PreparedPage],
+    render_png: Callable[[], bytes],
+    *,
+    source_hash: str,
+    paths: WorkspacePaths,
+    provider: LayoutProvider,
+    force: bool,
+    local_threshold: float | None,
+    crop: bool,
+    pack: bool,
+    notify: ProgressCallback,
+) -> _PageExtraction | _PagePlan:
+    """Extract one page, or return its plan when it waits to share a request."""
+    with request_scope(item=f"page_{page_number:03d}", blocks=1):
+        notify(f"Page {page_number}: extracting PDF fragments")
+        plan = _plan_pdf_page(
+            prepared=prepare(),
+            render_png=render_png,
+            source_hash=source_hash,
+            paths=paths,
+            provider=provider,
+            force=force,
+            local_threshold=local_threshold,
+        )
+        if pack and plan.packable:
+            return plan
+        return _finish_pdf_page(
+            plan,
+            source_hash=source_hash,
+            paths=paths,
+            provider=provider,
+            crop=crop,
+            notify=notify,
+        )
+
+
+def _page_failure(
+    page_number: int,
+    error: Exception,
+    notify: ProgressCallback,
+) -> PageFailure:
+    notify(f"Page {page_number}: failed: {error}")
+    return PageFailure(page_number, str(error), ai_failure_code(error))
+
+
+class _PagePacks:
+    """Group short model pages in page order, within the pack limits."""
+
+    def __init__(self, pack_size: int) -> None:
+        self.pack_size = pack_size
+        self._pending: list[_PagePlan] = []
+
+    def add(self, plan: _PagePlan) -> list[list[_PagePlan]]:
+        """Queue a page and return the packs that are now closed."""
+        closed: list[list[_PagePlan]] = []
+        pending_fragments = sum(
+            len(item.prepared.fragments) for item in self._pending
+        )
+        if (
+            self._pending
+            and pending_fragments + len(plan.prepared.fragments)
+            > PACKED_LAYOUT_MAX_FRAGMENTS
+        ):
+            closed.append(self.flush()[0])
+        self._pending.append(plan)
+        if len(self._pending) == self.pack_size:
+            closed.extend(self.flush())
+        return closed
+
+    def flush(self) -> list[list[_PagePlan]]:
+        pending, self._pending = self._pending, []
+        return [pending] if pending else []
+
+
+def _extract_packed_pages(
+    pack: list[_PagePlan],
+    *,
+    source_hash: str,
+    paths: WorkspacePaths,
+    provider: LayoutProvider,
+    crop: bool,
+    notify: ProgressCallback,
+) -> list[_PageExtraction | PageFailure]:
+    """Ask for the layouts of a pack of pages in one request, then finish each.
+
+    Short pages spend most of a request on the fixed prompt and round trip.
+    The answers are split by page and validated like any other response, so
+    a page the packed request got wrong, or left out, is sent again alone.
+    """
+    layouts: dict[tuple[int, str], dict[str, Any]] = {}
+    if len(pack) > 1:
+        requests = []
+        for plan in pack:
+            assert plan.png_bytes is not None
+            page_image, request_fragments = _layout_request_inputs(
+                plan.png_bytes,
+                plan.prepared.fragments,
+                plan.prepared.page_size,
+                crop,
+            )
+            requests.append(
+                (plan.prepared.page_number, request_fragments, page_image)
+            )
+        first, last = requests[0][0], requests[-1][0]
+        numbers = ", ".join(str(page_number) for page_number, _, _ in requests)
+        try:
+            with request_scope(item=f"pages_{first:03d}-{last:03d}", blocks=len(pack)):
+                answered = cast(PackedLayoutProvider, provider).reconstruct_pages(
+                    requests
+                )
+        except Exception as error:
+            answered = {}
+            notify(
+                f"Pages {numbers}: packed layout request failed; "
+                f"sending them one by one: {error}"
+            )
+        else:
+            notify(
+                f"Pages {numbers}: packed into one layout request "
+                f"({len(answered)}/{len(pack)} answered)"
+            )
+        for page_number, request_fragments, _page_image in requests:
+            layout = answered.get(page_number)
+            if layout is not None:
+                layouts[(page_number, _sha256_json(request_fragments))] = layout
+    answered_provider = _AnsweredLayoutProvider(provider, layouts)
+    outcomes: list[_PageExtraction | PageFailure] = []
+    for plan in pack:
+        page_number = plan.prepared.page_number
+        try:
+            with request_scope(item=f"page_{page_number:03d}", blocks=1):
+                extraction = _finish_pdf_page(
+                    plan,
+                    source_hash=source_hash,
+                    paths=paths,
+                    provider=answered_provider,
+                    crop=crop,
+                    notify=notify,
+                )
+        except ProgressCallbackError:
+            raise
+        except Exception as error:
+            outcomes.append(_page_failure(page_number, error, notify))
+        else:
+            outcomes.append(
+                replace(
+                    extraction,
+                    packed=page_number in answered_provider.answered_pages,
+                )
+            )
+    return outcomes
 
 
 def _extract_selected_pages(
@@ -301,40 +662,359 @@ def _extract_selected_pages(
     scale: float,
     force: bool,
     notify: ProgressCallback,
+    concurrency: int = DEFAULT_EXTRACTION_CONCURRENCY,
+    local_threshold: float | None = None,
+    crop: bool = False,
+    pack_size: int = 1,
 ) -> _PageExtractionBatch:
+    """Extract pages in order, isolating each page's failure.
+
+    With ``concurrency`` above one, pages are pipelined: a process pool
+    extracts fragments and renders PNGs, because PyMuPDF holds the GIL, while
+    up to ``concurrency`` threads write caches and wait for layout requests.
+    With ``pack_size`` above one, short pages the model must order wait, PNG
+    in hand, to share a request with the next ones. Results are collected in
+    page order.
+    """
+    pack = pack_size > 1 and callable(getattr(provider, "reconstruct_pages", None))
+    packs = _PagePacks(pack_size)
+    options: dict[str, Any] = {
+        "source_hash": source_hash,
+        "paths": paths,
+        "provider": provider,
+        "crop": crop,
+    }
+    page_options: dict[str, Any] = {
+        **options,
+        "force": force,
+        "local_threshold": local_threshold,
+        "pack": pack,
+    }
     successful: list[_PageExtraction] = []
     failures: list[PageFailure] = []
+
+    def record(outcomes: list[_PageExtraction | PageFailure]) -> None:
+        for outcome in outcomes:
+            if isinstance(outcome, PageFailure):
+                failures.append(outcome)
+            else:
+                successful.append(outcome)
+
+    def batch() -> _PageExtractionBatch:
+        return _PageExtractionBatch(
+            tuple(sorted(successful, key=lambda item: item.page)),
+            tuple(sorted(failures, key=lambda item: item.page)),
+        )
+
+    if concurrency == 1 or len(page_indexes) < 2:
+        document = pymupdf.open(source_path)
+        try:
+            for page_index in page_indexes:
+                page_number = page_index + 1
+                try:
+                    extracted = _extract_page_in_scope(
+                        page_number,
+                        partial(_prepare_page, document[page_index], page_number),
+                        partial(render_page_png, document[page_index], scale),
+                        notify=notify,
+                        **page_options,
+                    )
+                except ProgressCallbackError:
+                    raise
+                except Exception as error:
+                    failures.append(_page_failure(page_number, error, notify))
+                    continue
+                if isinstance(extracted, _PagePlan):
+                    for closed in packs.add(extracted):
+                        record(_extract_packed_pages(closed, notify=notify, **options))
+                else:
+                    successful.append(extracted)
+            for closed in packs.flush():
+                record(_extract_packed_pages(closed, notify=notify, **options))
+        finally:
+            document.close()
+        return batch()
+
+    notify = serialized_progress(notify)
+    render_workers = min(concurrency, len(page_indexes), os.cpu_count() or 1)
+    with ProcessPoolExecutor(
+        max_workers=render_workers,
+        # Forking a process that already runs provider threads can deadlock.
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_open_worker_document,
+        initargs=(str(source_path),),
+    ) as renderers, ThreadPoolExecutor(
+        max_workers=concurrency,
+        thread_name_prefix="glk-extract",
+    ) as executor:
+
+        def prepare(page_index: int) -> _PreparedPage:
+            return renderers.submit(_prepare_worker_page, page_index).result()
+
+        def render(page_index: int) -> bytes:
+            return renderers.submit(_render_worker_page, page_index, scale).result()
+
+        def send(pack: list[_PagePlan]) -> Future[list[_PageExtraction | PageFailure]]:
+            task = partial(_extract_packed_pages, pack, notify=notify, **options)
+            return executor.submit(contextvars.copy_context().run, task)
+
+        pages: list[tuple[int, Future[_PageExtraction | _PagePlan]]] = []
+        for page_index in page_indexes:
+            task = partial(
+                _extract_page_in_scope,
+                page_index + 1,
+                partial(prepare, page_index),
+                partial(render, page_index),
+                notify=notify,
+                **page_options,
+            )
+            pages.append(
+                (
+                    page_index + 1,
+                    executor.submit(contextvars.copy_context().run, task),
+                )
+            )
+        sent: list[Future[list[_PageExtraction | PageFailure]]] = []
+        try:
+            for page_number, future in pages:
+                try:
+                    extracted = future.result()
+                except ProgressCallbackError:
+                    raise
+                except Exception as error:
+                    failures.append(_page_failure(page_number, error, notify))
+                    continue
+                if isinstance(extracted, _PagePlan):
+                    sent.extend(send(closed) for closed in packs.add(extracted))
+                else:
+                    successful.append(extracted)
+            sent.extend(send(closed) for closed in packs.flush())
+            for pack_future in sent:
+                record(pack_future.result())
+        except ProgressCallbackError:
+            for waiting in [future for _page_number, future in pages] + sent:
+                waiting.cancel()
+            raise
+    return batch()
+
+
+@dataclass(frozen=True, slots=True)
+class _ModelPage:
+    """A page bound for the layout model, kept as PNG bytes until it is sent.
+
+    ``fragments`` are the fragments as sent, moved to the crop origin when
+    the page image is cropped.
+    """
+
+    page_number: int
+    fragments: list[dict[str, Any]]
+    png_bytes: bytes
+    page_size: tuple[float, float]
+    crop_box: tuple[float, float, float, float] | None
+
+    @property
+    def fragment_sha256(self) -> str:
+        return _sha256_json(self.fragments)
+
+    def image(self) -> Image.Image:
+        page_image: Image.Image = Image.open(BytesIO(self.png_bytes))
+        if self.crop_box is not None:
+            page_image = crop_page_image(page_image, self.crop_box, self.page_size)
+        return page_image
+
+
+def _scan_model_pages(
+    *,
+    source_path: Path,
+    page_indexes: list[int],
+    source_hash: str,
+    paths: WorkspacePaths,
+    provider: LayoutProvider,
+    scale: float,
+    force: bool,
+    local_threshold: float | None,
+    crop: bool,
+) -> list[_ModelPage]:
+    """Render the pages that neither a layout cache nor the local engine covers.
+
+    Pages that cannot be prepared are left to the per-page pass, which records
+    them as page failures exactly as an interactive run would.
+    """
+    model_pages: list[_ModelPage] = []
     document = pymupdf.open(source_path)
     try:
         for page_index in page_indexes:
             page_number = page_index + 1
-            try:
-                successful.append(
-                    _extract_pdf_page(
-                        page=document[page_index],
-                        page_number=page_number,
-                        source_hash=source_hash,
-                        paths=paths,
+            page = document[page_index]
+            fragments = extract_line_fragments(page, page_number)
+            if not fragments:
+                continue
+            if not force:
+                try:
+                    cached = _load_cached_layout(
+                        paths.pdf_layouts / f"page_{page_number:03d}.json",
+                        source_sha256=source_hash,
+                        page_sha256=page_content_sha256(page),
+                        fragment_sha256=_sha256_json(fragments),
                         provider=provider,
-                        scale=scale,
-                        force=force,
-                        notify=notify,
+                        fragments=fragments,
                     )
+                except (OSError, ValueError):
+                    continue
+                if cached is not None:
+                    continue
+            page_size = (round(page.rect.width, 2), round(page.rect.height, 2))
+            if _local_layout(fragments, page_size, local_threshold) is not None:
+                continue
+            # The per-page pass looks answers up by the fragments it sends,
+            # which a crop moves, so pages keep those.
+            crop_box = text_crop_box(fragments, page_size) if crop else None
+            model_pages.append(
+                _ModelPage(
+                    page_number=page_number,
+                    fragments=(
+                        fragments
+                        if crop_box is None
+                        else shift_fragments(fragments, (crop_box[0], crop_box[1]))
+                    ),
+                    png_bytes=render_page_png(page, scale),
+                    page_size=page_size,
+                    crop_box=crop_box,
                 )
-            except ProgressCallbackError:
-                raise
-            except Exception as error:
-                failures.append(
-                    PageFailure(
-                        page_number,
-                        str(error),
-                        ai_failure_code(error),
-                    )
-                )
-                notify(f"Page {page_number}: failed: {error}")
+            )
     finally:
         document.close()
-    return _PageExtractionBatch(tuple(successful), tuple(failures))
+    return model_pages
+
+
+class _RenderedPages(Mapping[str, tuple[int, list[dict[str, Any]], Image.Image]]):
+    """Batch pages that keep only PNG bytes and decode one image at a time."""
+
+    def __init__(self, pages: dict[str, _ModelPage]) -> None:
+        self._pages = pages
+
+    def __getitem__(
+        self, key: str
+    ) -> tuple[int, list[dict[str, Any]], Image.Image]:
+        page = self._pages[key]
+        return page.page_number, page.fragments, page.image()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._pages)
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+
+class _AnsweredLayoutProvider:
+    """Answer each page from a batch job or packed request once, then ask live.
+
+    Validation retries for a page go to the live provider as single-page
+    requests, as do pages the batch or packed request did not answer.
+    """
+
+    def __init__(
+        self,
+        provider: LayoutProvider,
+        layouts: dict[tuple[int, str], dict[str, Any]],
+    ) -> None:
+        self.provider = provider
+        self.model_name = provider.model_name
+        self.prompt_version = provider.prompt_version
+        # Pages whose accepted answer came from the batch or packed request.
+        self.answered_pages: set[int] = set()
+        self._layouts = layouts
+        self._lock = threading.Lock()
+
+    def reconstruct(
+        self,
+        page_number: int,
+        fragments: list[dict[str, Any]],
+        page_image: Image.Image,
+    ) -> dict[str, Any]:
+        with self._lock:
+            layout = self._layouts.pop(
+                (page_number, _sha256_json(fragments)),
+                None,
+            )
+            # A second request for a page means its answer was rejected.
+            if layout is None:
+                self.answered_pages.discard(page_number)
+            else:
+                self.answered_pages.add(page_number)
+        if layout is None:
+            return self.provider.reconstruct(page_number, fragments, page_image)
+        return layout
+
+
+def _collect_batch_layouts(
+    *,
+    source_path: Path,
+    page_indexes: list[int],
+    source_hash: str,
+    paths: WorkspacePaths,
+    provider: LayoutProvider,
+    scale: float,
+    force: bool,
+    local_threshold: float | None,
+    crop: bool,
+    poll_seconds: float,
+    notify: ProgressCallback,
+) -> LayoutProvider:
+    """Send every page without a valid layout cache as one provider batch job."""
+    if not (
+        callable(getattr(provider, "submit_layout_batch", None))
+        and callable(getattr(provider, "layout_batch_results", None))
+    ):
+        raise ExtractionError(
+            "The configured layout provider does not support batch requests."
+        )
+    batch_provider = cast(BatchLayoutProvider, provider)
+    model_pages = _scan_model_pages(
+        source_path=source_path,
+        page_indexes=page_indexes,
+        source_hash=source_hash,
+        paths=paths,
+        provider=provider,
+        scale=scale,
+        force=force,
+        local_threshold=local_threshold,
+        crop=crop,
+    )
+    if not model_pages:
+        return provider
+    pages = _RenderedPages(
+        {f"page-{page.page_number:04d}": page for page in model_pages}
+    )
+    requests: list[dict[str, Any]] = [
+        {
+            "key": f"page-{page.page_number:04d}",
+            "page": page.page_number,
+            "fragment_sha256": page.fragment_sha256,
+            "image_sha256": _sha256_bytes(page.png_bytes),
+        }
+        for page in model_pages
+    ]
+    answered = _run_batch_job(
+        job_path=paths.layout_batch_job,
+        requests_path=paths.layout_batch_requests,
+        requests=requests,
+        identity={
+            "source_sha256": source_hash,
+            "model": provider.model_name,
+            "prompt_version": provider.prompt_version,
+        },
+        submit=lambda: batch_provider.submit_layout_batch(pages),
+        results=batch_provider.layout_batch_results,
+        poll_seconds=poll_seconds,
+        notify=notify,
+    )
+    layouts: dict[tuple[int, str], dict[str, Any]] = {}
+    for request in requests:
+        layout = answered.get(request["key"])
+        if layout is not None:
+            layouts[(request["page"], request["fragment_sha256"])] = layout
+    return _AnsweredLayoutProvider(provider, layouts)
 
 
 def _write_extraction_result(
@@ -346,9 +1026,12 @@ def _write_extraction_result(
     selected_pages: tuple[int, ...],
     batch: _PageExtractionBatch,
     provider: LayoutProvider,
+    scale: float,
+    packed_pages: tuple[int, ...] = (),
 ) -> Path:
     successful_pages = [item.page for item in batch.successful]
     cached_pages = [item.page for item in batch.successful if item.cached]
+    local_pages = [item.page for item in batch.successful if item.local]
     combined = "\n\n".join(
         f"[PAGE {item.page}]\n{item.text}" for item in batch.successful
     )
@@ -369,9 +1052,12 @@ def _write_extraction_result(
             "selected_pages": list(selected_pages),
             "successful_pages": successful_pages,
             "cached_pages": cached_pages,
+            "local_pages": local_pages,
+            "packed_pages": list(packed_pages),
             "failures": [asdict(failure) for failure in batch.failures],
             "model": provider.model_name,
             "prompt_version": provider.prompt_version,
+            "render_scale": scale,
             "output_file": str(output_path.relative_to(location.path)),
             "updated_at": _utc_now(),
         },
@@ -379,6 +1065,43 @@ def _write_extraction_result(
     return output_path
 
 
+def ensure_pdf_page_image(
+    project: str | Path,
+    page: int,
+    workspace_root: str | Path = "workspaces",
+) -> Path:
+    """Return the rendered page image, rendering it from the source if missing.
+
+    Pages answered from the layout cache are not rendered during extraction,
+    so the review UI asks for their image here. The page is rendered at the
+    scale recorded by the last extraction.
+    """
+    location = load_project(project, workspace_root)
+    paths = WorkspacePaths(location.path)
+    image_path = paths.pdf_pages / f"page_{page:03d}.png"
+    if image_path.is_file():
+        return image_path
+    scale = 1.5
+    try:
+        state = json.loads(paths.pdf_acquisition_state.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        state = None
+    if isinstance(state, dict):
+        recorded = state.get("render_scale")
+        if isinstance(recorded, (int, float)) and not isinstance(recorded, bool):
+            scale = float(recorded) if recorded > 0 else scale
+    source_path = _resolve_project_source(location, None)
+    document = pymupdf.open(source_path)
+    try:
+        if not 1 <= page <= document.page_count:
+            raise ExtractionError(f"Page {page} is outside the source PDF.")
+        png_bytes = render_page_png(document[page - 1], scale)
+    finally:
+        document.close()
+    _write_bytes_atomic(image_path, png_bytes)
+    return image_path
+
+
 def extract_project_pdf(
     *,
     project: str | Path,
@@ -389,12 +1112,34 @@ def extract_project_pdf(
     model_name: str | None = None,
     scale: float = 1.5,
     force: bool = False,
+    replace_source: bool = False,
+    concurrency: int = DEFAULT_EXTRACTION_CONCURRENCY,
+    local_layout_threshold: float | None = DEFAULT_LOCAL_LAYOUT_THRESHOLD,
+    layout_pack_size: int = DEFAULT_LAYOUT_PACK_SIZE,
+    batch: bool = False,
+    batch_poll_seconds: float = DEFAULT_BATCH_POLL_SECONDS,
     dry_run: bool = False,
     provider: LayoutProvider | None = None,
     progress: ProgressCallback | None = None,
 ) -> ExtractionResult:
     if scale <= 0:
         raise ExtractionError("Render scale must be greater than zero.")
+    if (
+        not isinstance(concurrency, int)
+        or isinstance(concurrency, bool)
+        or concurrency < 1
+    ):
+        raise ExtractionError("concurrency must be a positive integer.")
+    if local_layout_threshold is not None and not 0 <= local_layout_threshold <= 1:
+        raise ExtractionError("Local layout threshold must be between 0 and 1.")
+    if (
+        not isinstance(layout_pack_size, int)
+        or isinstance(layout_pack_size, bool)
+        or layout_pack_size < 1
+    ):
+        raise ExtractionError("layout pack size must be a positive integer.")
+    if batch_poll_seconds < 0:
+        raise ExtractionError("Batch poll interval must not be negative.")
     notify = guard_progress_callback(progress)
     location = load_project(project, workspace_root)
     source_path = _resolve_project_source(location, file)
@@ -427,10 +1172,12 @@ def extract_project_pdf(
         settings_root=settings_root,
     )
     try:
+        # Replacing the source keeps the page caches: layouts are keyed by
+        # page content, so only pages the revision touched are sent again.
         registered = register_pdf_source(
             location,
             source_path,
-            force=force,
+            force=force or replace_source,
         )
     except SourceRegistrationError as error:
         raise ExtractionError(str(error)) from error
@@ -446,25 +1193,59 @@ def extract_project_pdf(
     ):
         directory.mkdir(parents=True, exist_ok=True)
 
-    batch = _extract_selected_pages(
-        source_path=registered_source,
-        page_indexes=page_indexes,
-        source_hash=source_hash,
-        paths=paths,
-        provider=active_provider,
-        scale=scale,
-        force=force,
-        notify=notify,
-    )
+    crop = load_image_payload_settings(settings_root).crop
+    page_provider = active_provider
+    if batch:
+        page_provider = _collect_batch_layouts(
+            source_path=registered_source,
+            page_indexes=page_indexes,
+            source_hash=source_hash,
+            paths=paths,
+            provider=active_provider,
+            scale=scale,
+            force=force,
+            local_threshold=local_layout_threshold,
+            crop=crop,
+            poll_seconds=batch_poll_seconds,
+            notify=notify,
+        )
+    with request_scope(
+        stage="layout",
+        observer=usage_ledger_observer(paths),
+    ), use_response_cache(
+        workspace_response_cache(location.path, settings_root),
+        refresh=force,
+    ):
+        extracted = _extract_selected_pages(
+            source_path=registered_source,
+            page_indexes=page_indexes,
+            source_hash=source_hash,
+            paths=paths,
+            provider=page_provider,
+            scale=scale,
+            force=force,
+            notify=notify,
+            concurrency=concurrency,
+            local_threshold=local_layout_threshold,
+            crop=crop,
+            # Batch requests are already discounted, so only interactive
+            # runs pack short pages together.
+            pack_size=1 if batch else layout_pack_size,
+        )
+    packed_pages = tuple(item.page for item in extracted.successful if item.packed)
     output_path = _write_extraction_result(
         location=location,
         paths=paths,
         source_hash=source_hash,
         page_count=page_count,
         selected_pages=selected_pages,
-        batch=batch,
+        batch=extracted,
+        packed_pages=packed_pages,
         provider=active_provider,
+        scale=scale,
     )
+    if batch and not extracted.failures:
+        _clear_batch_job(paths.layout_batch_job, paths.layout_batch_requests)
     return ExtractionResult(
         project_path=str(location.path),
         source_pdf=str(registered_source),
@@ -472,10 +1253,14 @@ def extract_project_pdf(
         model=active_provider.model_name,
         prompt_version=active_provider.prompt_version,
         selected_pages=selected_pages,
-        successful_pages=tuple(item.page for item in batch.successful),
+        successful_pages=tuple(item.page for item in extracted.successful),
         cached_pages=tuple(
-            item.page for item in batch.successful if item.cached
+            item.page for item in extracted.successful if item.cached
         ),
-        failures=batch.failures,
+        failures=extracted.failures,
         output_file=str(output_path),
+        local_pages=tuple(
+            item.page for item in extracted.successful if item.local
+        ),
+        packed_pages=packed_pages,
     )
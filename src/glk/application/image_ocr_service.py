@@ -9,7 +9,11 @@ from typing import Any, Protocol
 
 from PIL import Image, ImageOps
 
-from glk.application._cache import invalid_cache, read_json_object
+from glk.application._cache import (
+    invalid_cache,
+    read_json_object,
+    workspace_response_cache,
+)
 from glk.application._hashing import sha256_file as _sha256_file
 from glk.application._hashing import sha256_text as _sha256_text
 from glk.application._io import copy_file_atomic as _copy_file_atomic
@@ -31,6 +35,7 @@ from glk.application.source_registration_service import (
     register_image_sources,
     validate_image_output_collisions,
 )
+from glk.application.usage_service import usage_ledger_observer
 from glk.domain.workspace import IMAGE_SOURCE_ROOT, WorkspacePaths
 from glk.extraction.image_ocr import (
     build_combined_text,
@@ -42,6 +47,8 @@ from glk.infrastructure.ai_provider import (
     ai_failure_code,
     create_image_ocr_provider,
 )
+from glk.infrastructure.response_cache import use_response_cache
+from glk.infrastructure.usage_telemetry import request_scope
 
 
 IMAGE_EXTENSIONS = SUPPORTED_IMAGE_EXTENSIONS
@@ -58,6 +65,14 @@ class ImageOcrProvider(Protocol):
     def transcribe(self, prompt: str, image: Image.Image) -> dict[str, Any]: ...
 
 
+class AsyncImageOcrProvider(ImageOcrProvider, Protocol):
+    """Image OCR provider that can also be awaited from one event loop."""
+
+    async def transcribe_async(
+        self, prompt: str, image: Image.Image
+    ) -> dict[str, Any]: ...
+
+
 @dataclass(frozen=True, slots=True)
 class ImageOcrFailure:
     file: str
@@ -375,17 +390,18 @@ def _ocr_registered_images(
         progress_label = f"Image {index}/{total}: {source_name}"
         notify(progress_label)
         try:
-            output = _ocr_image(
-                image_path=image_path,
-                registered=registered,
-                paths=paths,
-                provider=provider,
-                common_instructions=common_instructions,
-                common_prompt_hash=common_prompt_hash,
-                force=force,
-                notify=notify,
-                progress_label=progress_label,
-            )
+            with request_scope(item=source_name, blocks=1):
+                output = _ocr_image(
+                    image_path=image_path,
+                    registered=registered,
+                    paths=paths,
+                    provider=provider,
+                    common_instructions=common_instructions,
+                    common_prompt_hash=common_prompt_hash,
+                    force=force,
+                    notify=notify,
+                    progress_label=progress_label,
+                )
             successful.append(output)
             combined_items.append((output.text_name, output.text))
         except ProgressCallbackError:
@@ -513,15 +529,22 @@ def ocr_project_images(
         model_name,
         settings_root=settings_root,
     )
-    batch = _ocr_registered_images(
-        registered=registered,
-        paths=paths,
-        provider=active_provider,
-        common_instructions=common_instructions,
-        common_prompt_hash=common_prompt_hash,
-        force=force,
-        notify=notify,
-    )
+    with request_scope(
+        stage="ocr",
+        observer=usage_ledger_observer(paths),
+    ), use_response_cache(
+        workspace_response_cache(paths.root, settings_root),
+        refresh=force,
+    ):
+        batch = _ocr_registered_images(
+            registered=registered,
+            paths=paths,
+            provider=active_provider,
+            common_instructions=common_instructions,
+            common_prompt_hash=common_prompt_hash,
+            force=force,
+            notify=notify,
+        )
     combined_path = _write_ocr_result(
         registered=registered,
         paths=paths,
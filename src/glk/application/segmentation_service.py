@@ -42,11 +42,15 @@ class SegmentationResult:
     review_file: str | None = None
     review_status: str | None = None
     review_created: bool = False
+    review_carried_forward: bool = False
+    review_refreshed_groups: tuple[str, ...] = ()
     cached: bool = False
     dry_run: bool = False
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        value = asdict(self)
+        value["review_refreshed_groups"] = list(self.review_refreshed_groups)
+        return value
 
 
 def _utc_now() -> str:
@@ -492,6 +496,8 @@ def segment_project_source(
                 review_file=review.review_file,
                 review_status=review.review_status,
                 review_created=review.review_created,
+                review_carried_forward=review.carried_forward,
+                review_refreshed_groups=review.refreshed_groups,
             )
     output_bytes = _serialize_jsonl(blocks)
     _write_bytes_atomic(output_path, output_bytes)
@@ -524,4 +530,6 @@ def segment_project_source(
         review_file=review.review_file,
         review_status=review.review_status,
         review_created=review.review_created,
+        review_carried_forward=review.carried_forward,
+        review_refreshed_groups=review.refreshed_groups,
     )
@@ -36,6 +36,14 @@ _SEPARATOR = "======================"
 _BLOCK_PATTERN = re.compile(r"^\[BLOCK ([a-z0-9][a-z0-9._-]*)\]$")
 _TOKEN_PATTERN = re.compile(r"\{([A-Za-z][A-Za-z0-9_]*)\}")
 _UNRESOLVED_ICON_PATTERN = re.compile(r"\[ICON:\s*[^\]]+\]", re.IGNORECASE)
+# Saving or rebasing a review invalidates an earlier approval.
+_APPROVAL_STATE_KEYS = (
+    "final_sha256",
+    "approved_blocks_sha256",
+    "approved_at",
+    "final_file",
+    "approved_blocks_file",
+)
 
 
 class SourceReviewError(ValueError):
@@ -78,9 +86,13 @@ class ReviewPrepareResult:
     review_created: bool
     review_status: str
     dry_run: bool = False
+    carried_forward: bool = False
+    refreshed_groups: tuple[str, ...] = ()
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        value = asdict(self)
+        value["refreshed_groups"] = list(self.refreshed_groups)
+        return value
 
 
 @dataclass(frozen=True, slots=True)
@@ -163,6 +175,32 @@ def _locator_key(block: SourceBlock) -> tuple[str, str | int]:
     )
 
 
+def _group_name(block: SourceBlock) -> str:
+    kind, value = _locator_key(block)
+    return f"{kind}:{value}"
+
+
+def _group_fingerprints(blocks: list[SourceBlock]) -> dict[str, str]:
+    """Hash the extracted blocks of each page or image file.
+
+    ``source_order`` counts across the whole source, so it is left out: a page
+    keeps its fingerprint when an earlier page gains or loses blocks.
+    """
+    grouped: dict[str, list[dict[str, Any]]] = {}
+    for block in blocks:
+        value = block.to_dict()
+        value.pop("source_order", None)
+        grouped.setdefault(_group_name(block), []).append(value)
+    return {
+        name: _sha256_bytes(
+            json.dumps(
+                values, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+            ).encode("utf-8")
+        )
+        for name, values in grouped.items()
+    }
+
+
 def _locator_line(block: SourceBlock) -> str:
     if block.source_type == "pdf":
         return f"[PAGE {block.page}]"
@@ -210,6 +248,23 @@ def _review_status(state_path: Path, source_sha256: str) -> str:
     return "current"
 
 
+def _read_review_block_texts(data: bytes) -> dict[str, str]:
+    """Read block bodies from a review TXT without checking them against blocks."""
+    lines = data.decode("utf-8-sig").splitlines()
+    texts: dict[str, str] = {}
+    index = 0
+    while index < len(lines):
+        match = _BLOCK_PATTERN.fullmatch(lines[index])
+        index += 1
+        if match is None:
+            continue
+        block_id = match.group(1)
+        end_index = lines.index(f"[[GLK_END {block_id}]]", index)
+        texts[block_id] = "\n".join(lines[index:end_index]).strip()
+        index = end_index + 1
+    return texts
+
+
 def _manual_blocks_from_state(state: dict[str, Any]) -> dict[str, SourceBlock]:
     values = state.get("manual_blocks", [])
     if values is None:
@@ -346,6 +401,129 @@ def _review_context(
     return originals, source_data, state, ordered, excluded, manual, texts
 
 
+@dataclass(frozen=True, slots=True)
+class _CarriedReview:
+    ordered_ids: list[str]
+    excluded_ids: list[str]
+    manual_blocks: dict[str, SourceBlock]
+    rendered_blocks: list[SourceBlock]
+    refreshed_groups: tuple[str, ...]
+
+
+def _carry_forward_review(
+    originals: list[SourceBlock],
+    state: dict[str, Any],
+    review_data: bytes,
+) -> _CarriedReview | None:
+    """Rebase a stale review onto new blocks, keeping untouched pages.
+
+    Pages and image files whose extracted blocks are unchanged keep their
+    reviewed text, order, exclusions and manual blocks; changed ones restart
+    from the new extraction. Returns None when the old review cannot be
+    matched, so the caller falls back to reporting it as stale.
+    """
+    previous = state.get("group_sha256")
+    if not isinstance(previous, dict):
+        return None
+    fingerprints = _group_fingerprints(originals)
+    unchanged = {
+        name for name, value in fingerprints.items() if previous.get(name) == value
+    }
+    if not unchanged:
+        return None
+    ordered_value = state.get("ordered_block_ids")
+    excluded_value = state.get("excluded_block_ids", [])
+    try:
+        manual = _manual_blocks_from_state(state)
+        texts = _read_review_block_texts(review_data)
+    except (SourceReviewError, UnicodeDecodeError, ValueError):
+        return None
+    if not isinstance(ordered_value, list) or not isinstance(excluded_value, list):
+        return None
+
+    blocks = {block.id: block for block in originals}
+    blocks.update(manual)
+    ordered: list[str] = []
+    for name in fingerprints:
+        group_ids = [block.id for block in originals if _group_name(block) == name]
+        if name in unchanged:
+            kept = [
+                block_id
+                for block_id in ordered_value
+                if block_id in blocks and _group_name(blocks[block_id]) == name
+            ]
+            if not set(group_ids) <= set(kept):
+                return None
+            group_ids = kept
+        ordered.extend(group_ids)
+    excluded = [
+        block_id
+        for block_id in excluded_value
+        if block_id in blocks and _group_name(blocks[block_id]) in unchanged
+    ]
+    rendered: list[SourceBlock] = []
+    for block_id in ordered:
+        block = blocks[block_id]
+        if block_id in excluded:
+            continue
+        if _group_name(block) in unchanged:
+            text = texts.get(block_id)
+            if not text:
+                return None
+            block = replace(
+                block, corrected_text=text if text != block.raw_text else None
+            )
+        rendered.append(block)
+    return _CarriedReview(
+        ordered_ids=ordered,
+        excluded_ids=excluded,
+        manual_blocks={
+            block_id: block
+            for block_id, block in manual.items()
+            if _group_name(block) in unchanged
+        },
+        rendered_blocks=rendered,
+        refreshed_groups=tuple(
+            name for name in fingerprints if name not in unchanged
+        ),
+    )
+
+
+def _write_carried_review(
+    paths: WorkspacePaths,
+    state: dict[str, Any],
+    *,
+    originals: list[SourceBlock],
+    source_sha256: str,
+    carried: _CarriedReview,
+) -> None:
+    rendered = render_source_review_text(carried.rendered_blocks)
+    _write_bytes_atomic(paths.source_review, rendered)
+    state = dict(state)
+    state.update(
+        {
+            "status": "prepared",
+            "format_version": SOURCE_REVIEW_FORMAT_VERSION,
+            "source_sha256": source_sha256,
+            "group_sha256": _group_fingerprints(originals),
+            "total_blocks": len(originals),
+            "ordered_block_ids": carried.ordered_ids,
+            "excluded_block_ids": carried.excluded_ids,
+            "manual_blocks": [
+                carried.manual_blocks[block_id].to_dict()
+                for block_id in carried.ordered_ids
+                if block_id in carried.manual_blocks
+            ],
+            "refreshed_groups": list(carried.refreshed_groups),
+            "review_sha256": _sha256_bytes(rendered),
+            "updated_at": _utc_now(),
+        }
+    )
+    for key in _APPROVAL_STATE_KEYS:
+        state.pop(key, None)
+    _write_json_atomic(paths.source_review_state, state)
+
+
 def prepare_project_source_review(
     *,
     project: str | Path,
@@ -365,10 +543,30 @@ def prepare_project_source_review(
         if review_created
         else _review_status(paths.source_review_state, source_sha256)
     )
+    carried = None
+    state: dict[str, Any] = {}
+    if review_status == "stale":
+        try:
+            state = _read_state(paths.source_review_state)
+        except SourceReviewError:
+            state = {}
+        carried = _carry_forward_review(
+            blocks, state, paths.source_review.read_bytes()
+        )
+        if carried is not None:
+            review_status = "current"
 
     if not dry_run:
         _write_if_changed(paths.source_draft, rendered)
-        if review_created:
+        if carried is not None:
+            _write_carried_review(
+                paths,
+                state,
+                originals=blocks,
+                source_sha256=source_sha256,
+                carried=carried,
+            )
+        elif review_created:
             _write_bytes_atomic(paths.source_review, rendered)
             _write_json_atomic(
                 paths.source_review_state,
@@ -378,6 +576,7 @@ def prepare_project_source_review(
                     "format_version": SOURCE_REVIEW_FORMAT_VERSION,
                     "source_file": paths.relative(paths.source_segments),
                     "source_sha256": source_sha256,
+                    "group_sha256": _group_fingerprints(blocks),
                     "total_blocks": len(blocks),
                     "draft_file": paths.relative(paths.source_draft),
                     "review_file": paths.relative(paths.source_review),
@@ -397,6 +596,8 @@ def prepare_project_source_review(
         review_created=review_created,
         review_status=review_status,
         dry_run=dry_run,
+        carried_forward=carried is not None,
+        refreshed_groups=carried.refreshed_groups if carried is not None else (),
     )
 
 
@@ -748,6 +949,7 @@ def _write_source_review_save(
             "status": "prepared",
             "format_version": SOURCE_REVIEW_FORMAT_VERSION,
             "source_sha256": context.source_sha256,
+            "group_sha256": _group_fingerprints(list(context.originals)),
             "total_blocks": len(context.originals),
             "ordered_block_ids": list(normalized.ordered_ids),
             "excluded_block_ids": list(normalized.excluded_ids),
@@ -760,13 +962,7 @@ def _write_source_review_save(
             "updated_at": _utc_now(),
         }
     )
-    for key in (
-        "final_sha256",
-        "approved_blocks_sha256",
-        "approved_at",
-        "final_file",
-        "approved_blocks_file",
-    ):
+    for key in _APPROVAL_STATE_KEYS:
         state.pop(key, None)
     _write_json_atomic(context.paths.source_review_state, state)
 
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 import json
 from pathlib import Path
 from typing import Any
 
+from glk.application._cache import workspace_response_cache
 from glk.application._io import write_json_atomic as _write_json_atomic
+from glk.application._progress import ProgressCallback, serialized_progress
+from glk.application._translation_memory import (
+    TranslationMemory,
+    load_translation_memory as _load_translation_memory,
+)
 from glk.application._translation_context import (
     load_approved_blocks as _load_approved_blocks,
     load_termbase as _load_termbase,
@@ -24,6 +32,7 @@ from glk.application.translation_review_service import (
     save_project_translation_review,
 )
 from glk.application.translation_service import (
+    build_translation_chunks,
     compile_translation_prompt,
     validate_translation_response,
 )
@@ -32,16 +41,22 @@ from glk.application.translation_types import (
     TranslationProvider,
     TranslationValidationError,
 )
+from glk.application.usage_service import usage_ledger_observer
 from glk.infrastructure.ai_provider import (
     create_translation_provider,
     resolve_ai_model_name,
     resolve_ai_provider_name,
     translation_provider_prompt_version,
 )
+from glk.infrastructure.response_cache import hold_responses, use_response_cache
+from glk.infrastructure.usage_telemetry import request_scope
 from glk.domain.workspace import WorkspacePaths
 
 
-ProgressCallback = Callable[[str], None]
+# Retry chunks stay smaller than translation chunks: every block must pass
+# strict validation, and a failing chunk is halved until the block is found.
+DEFAULT_RETRY_MAX_CHARACTERS = 4000
+DEFAULT_RETRY_CONCURRENCY = 4
 
 
 @dataclass(frozen=True, slots=True)
@@ -205,61 +220,100 @@ def _unchanged_retry_result(
     )
 
 
-def _retry_translation_block(
+def _qa_feedback(review_blocks: Sequence[Any]) -> str:
+    return "\n".join(
+        f"{review_block['id']}: {issue['code']}: {issue['message']}"
+        for review_block in review_blocks
+        for issue in review_block["issues"]
+        if issue["severity"] == "error"
+    )
+
+
+def _retry_translation_chunk(
     *,
-    review_block: Any,
-    source_block: Any,
+    review_blocks: tuple[Any, ...],
+    source_blocks: tuple[Any, ...],
     provider: TranslationProvider,
     termbase_entries: Any,
     project_instructions: str,
-    index: int,
-    total: int,
+    memory: TranslationMemory | None,
+    label: str,
     notify: ProgressCallback,
-) -> str:
-    block_id = review_block["id"]
-    qa_feedback = "\n".join(
-        f"{issue['code']}: {issue['message']}"
-        for issue in review_block["issues"]
-        if issue["severity"] == "error"
-    )
-    translated: dict[str, str] | None = None
+) -> dict[str, str]:
+    """Retranslate one packed chunk, halving it while strict validation fails.
+
+    Only a single block that still fails on its own fails the retry.
+    """
+    qa_feedback = _qa_feedback(review_blocks)
     validation_feedback = qa_feedback
-    notify(f"오류 블록 {index}/{total} 재번역 중: {block_id}")
+    examples = (
+        memory.examples([block.effective_text for block in source_blocks])
+        if memory is not None
+        else []
+    )
+    block_ids = ", ".join(block.id for block in source_blocks)
+    item = (
+        source_blocks[0].id
+        if len(source_blocks) == 1
+        else f"{source_blocks[0].id}..{source_blocks[-1].id}"
+    )
     try:
         for attempt in range(2):
             prompt = compile_translation_prompt(
-                blocks=(source_block,),
+                blocks=source_blocks,
                 termbase_entries=termbase_entries,
                 project_instructions=project_instructions,
                 validation_feedback=validation_feedback,
+                examples=examples,
             )
             try:
-                translated = validate_translation_response(
-                    response=provider.translate(prompt),
-                    blocks=(source_block,),
+                with request_scope(
+                    item=item, blocks=len(source_blocks)
+                ), hold_responses() as held:
+                    response = provider.translate(prompt)
+                validated = validate_translation_response(
+                    response=response,
+                    blocks=source_blocks,
                     termbase_entries=termbase_entries,
                 )
-                break
+                held.accept()
+                return validated
             except TranslationValidationError as error:
                 validation_feedback = (
                     f"Original QA errors:\n{qa_feedback}\n"
                     f"Latest response errors:\n{error}"
                 )
-                notify(
-                    f"오류 블록 {index}/{total} 검증 재시도 "
-                    f"({attempt + 1}/2)"
-                )
+                notify(f"{label} 검증 재시도 ({attempt + 1}/2)")
     except Exception as error:
         raise TranslationError(
-            f"Selective retranslation failed for {block_id}; "
+            f"Selective retranslation failed for {block_ids}; "
             f"the review was not changed. Cause: {error}"
         ) from error
-    if translated is None:
+    if len(source_blocks) == 1:
         raise TranslationValidationError(
-            f"Selective retranslation failed validation for {block_id}; "
+            f"Selective retranslation failed validation for {block_ids}; "
             "the review was not changed."
         )
-    return translated[block_id]
+    middle = len(source_blocks) // 2
+    notify(
+        f"{label} 블록 {len(source_blocks)}개를 "
+        f"{middle}개와 {len(source_blocks) - middle}개로 나눠 재요청"
+    )
+    translated: dict[str, str] = {}
+    for part in (slice(None, middle), slice(middle, None)):
+        translated.update(
+            _retry_translation_chunk(
+                review_blocks=review_blocks[part],
+                source_blocks=source_blocks[part],
+                provider=provider,
+                termbase_entries=termbase_entries,
+                project_instructions=project_instructions,
+                memory=memory,
+                label=label,
+                notify=notify,
+            )
+        )
+    return translated
 
 
 def _execute_translation_retry(
@@ -269,35 +323,69 @@ def _execute_translation_retry(
     approved_by_id: dict[str, Any],
     termbase_entries: Any,
     project_instructions: str,
+    memory: TranslationMemory | None,
+    max_characters: int,
+    concurrency: int,
     notify: ProgressCallback,
 ) -> _TranslationRetryExecution:
+    """Pack QA-error blocks into chunks and retranslate the chunks in parallel.
+
+    Nothing is returned unless every chunk succeeds, so the caller keeps the
+    all-or-nothing review update.
+    """
     translations = {
         block["id"]: block["translation"]
         for block in context.document["blocks"]
     }
+    review_by_id = {block["id"]: block for block in context.target_blocks}
+    chunks = build_translation_chunks(
+        [approved_by_id[block_id] for block_id in context.target_ids],
+        max_characters=max_characters,
+    )
+    notify = serialized_progress(notify)
+    retried: dict[str, str] = {}
+    with ThreadPoolExecutor(
+        max_workers=concurrency,
+        thread_name_prefix="glk-translation-retry",
+    ) as executor:
+        futures: list[Future[dict[str, str]]] = []
+        for index, chunk in enumerate(chunks, start=1):
+            label = f"오류 블록 묶음 {index}/{len(chunks)}"
+            notify(f"{label} 재번역 중: 블록 {len(chunk.blocks)}개")
+            futures.append(
+                executor.submit(
+                    contextvars.copy_context().run,
+                    _retry_translation_chunk,
+                    review_blocks=tuple(
+                        review_by_id[block.id] for block in chunk.blocks
+                    ),
+                    source_blocks=chunk.blocks,
+                    provider=provider,
+                    termbase_entries=termbase_entries,
+                    project_instructions=project_instructions,
+                    memory=memory,
+                    label=label,
+                    notify=notify,
+                )
+            )
+        try:
+            for future in futures:
+                retried.update(future.result())
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
     changes: list[dict[str, Any]] = []
-    total = len(context.target_blocks)
-    for index, review_block in enumerate(context.target_blocks, start=1):
+    for review_block in context.target_blocks:
         block_id = review_block["id"]
-        source_block = approved_by_id[block_id]
-        new_text = _retry_translation_block(
-            review_block=review_block,
-            source_block=source_block,
-            provider=provider,
-            termbase_entries=termbase_entries,
-            project_instructions=project_instructions,
-            index=index,
-            total=total,
-            notify=notify,
-        )
         old_text = translations[block_id]
-        translations[block_id] = new_text
+        translations[block_id] = retried[block_id]
         changes.append(
             {
                 "block_id": block_id,
-                "source": source_block.effective_text,
+                "source": approved_by_id[block_id].effective_text,
                 "previous_translation": old_text,
-                "retried_translation": new_text,
+                "retried_translation": retried[block_id],
                 "qa_errors": [
                     issue
                     for issue in review_block["issues"]
@@ -365,11 +453,20 @@ def retry_failed_translations(
     settings_root: str | Path | None = None,
     model_name: str | None = None,
     dry_run: bool = False,
+    translation_memory: bool = True,
+    max_characters: int = DEFAULT_RETRY_MAX_CHARACTERS,
+    concurrency: int = DEFAULT_RETRY_CONCURRENCY,
     provider: TranslationProvider | None = None,
     expected_review_sha256: str | None = None,
     progress: ProgressCallback | None = None,
 ) -> TranslationRetryResult:
     """Retranslate only block-linked QA errors and preserve every other review block."""
+    if (
+        not isinstance(concurrency, int)
+        or isinstance(concurrency, bool)
+        or concurrency < 1
+    ):
+        raise TranslationError("concurrency must be a positive integer.")
     notify = progress or (lambda _: None)
     context = _prepare_translation_retry(
         project=project,
@@ -399,18 +496,38 @@ def retry_failed_translations(
         None,
         context.location.path,
     )
+    memory = (
+        _load_translation_memory(
+            context.location.path.parent,
+            exclude=context.location.path,
+        )
+        if translation_memory
+        else None
+    )
     active_provider = provider or create_translation_provider(
         context.selected_model,
         settings_root=settings_root,
     )
-    execution = _execute_translation_retry(
-        context=context,
-        provider=active_provider,
-        approved_by_id=approved_by_id,
-        termbase_entries=termbase_entries,
-        project_instructions=project_instructions,
-        notify=notify,
-    )
+    # A retry asks for a new answer, so cached responses are replaced, not
+    # reused.
+    with request_scope(
+        stage="translation_retry",
+        observer=usage_ledger_observer(context.paths),
+    ), use_response_cache(
+        workspace_response_cache(context.location.path, settings_root),
+        refresh=True,
+    ):
+        execution = _execute_translation_retry(
+            context=context,
+            provider=active_provider,
+            approved_by_id=approved_by_id,
+            termbase_entries=termbase_entries,
+            project_instructions=project_instructions,
+            memory=memory,
+            max_characters=max_characters,
+            concurrency=concurrency,
+            notify=notify,
+        )
     return _save_translation_retry(
         context=context,
         execution=execution,
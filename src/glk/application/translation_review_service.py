@@ -23,6 +23,7 @@ from glk.domain.approved_translation import (
     APPROVED_TRANSLATION_SCHEMA_VERSION,
     ApprovedTranslationSegment,
 )
+from glk.domain.termbase_matcher import TermbaseMatcher, termbase_matcher
 from glk.domain.translation_qa import check_translation_contract
 from glk.domain.translation_segment import (
     TranslationSegment,
@@ -258,19 +259,6 @@ def _term_variants(entry: dict[str, Any]) -> list[str]:
     )
 
 
-def _term_pattern(term: str) -> re.Pattern[str]:
-    prefix = r"(?<!\w)" if term[0].isalnum() else ""
-    suffix = r"(?!\w)" if term[-1].isalnum() else ""
-    return re.compile(prefix + re.escape(term) + suffix, re.IGNORECASE)
-
-
-def _term_matches(text: str, entry: dict[str, Any]) -> bool:
-    return any(
-        _term_pattern(variant).search(text)
-        for variant in _term_variants(entry)
-    )
-
-
 def _review_term(entry: dict[str, Any]) -> TranslationReviewTerm:
     return {
         "source_term": str(entry.get("source_term") or ""),
@@ -284,35 +272,33 @@ def _review_term(entry: dict[str, Any]) -> TranslationReviewTerm:
 
 def _relevant_review_terms(
     source_text: str,
-    entries: tuple[dict[str, Any], ...],
+    matcher: TermbaseMatcher,
 ) -> list[TranslationReviewTerm]:
     return [
-        _review_term(entry)
-        for entry in entries
-        if _term_matches(source_text, entry)
+        _review_term(entry) for entry in matcher.matching_entries(source_text)
     ]
 
 
 def _source_latin_is_fully_kept(
     source_text: str,
-    entries: tuple[dict[str, Any], ...],
+    matcher: TermbaseMatcher,
 ) -> bool:
-    remaining = source_text
+    remaining: list[str] = []
+    cursor = 0
     matched = False
-    variants = sorted(
-        {
-            variant
-            for entry in entries
-            if entry.get("status") == "keep"
-            for variant in _term_variants(entry)
-        },
-        key=len,
-        reverse=True,
-    )
-    for variant in variants:
-        remaining, count = _term_pattern(variant).subn("", remaining)
-        matched = matched or count > 0
-    return matched and _LATIN_PATTERN.search(remaining) is None
+    for match in matcher.find(source_text):
+        if not any(
+            matcher.entries[entry_index].get("status") == "keep"
+            for entry_index, _variant_index in match.variants
+        ):
+            continue
+        matched = True
+        if match.end <= cursor:
+            continue
+        remaining.append(source_text[cursor : max(cursor, match.start)])
+        cursor = match.end
+    remaining.append(source_text[cursor:])
+    return matched and _LATIN_PATTERN.search("".join(remaining)) is None
 
 
 def _require_current_translation(
@@ -617,6 +603,7 @@ def _analyze_review(
         )
 
     issues: list[TranslationReviewIssue] = []
+    matcher = termbase_matcher(context.termbase_entries)
     for segment in context.segments:
         translated = translations[segment.source_block_id]
         if not translated:
@@ -629,6 +616,18 @@ def _analyze_review(
                 )
             )
             continue
+        if segment.status == "flagged" and translated == segment.source_text:
+            issues.append(
+                TranslationReviewIssue(
+                    severity="error",
+                    code="source_text_kept",
+                    block_id=segment.source_block_id,
+                    message=(
+                        "번역 응답이 검증을 통과하지 못해 원문이 그대로 "
+                        "남아 있습니다."
+                    ),
+                )
+            )
         if "�" in translated:
             issues.append(
                 TranslationReviewIssue(
@@ -654,6 +653,7 @@ def _analyze_review(
             source_text=segment.source_text,
             translated_text=translated,
             termbase_entries=list(context.termbase_entries),
+            matcher=matcher,
         ):
             issues.append(
                 TranslationReviewIssue(
@@ -663,10 +663,7 @@ def _analyze_review(
                     message=issue.message,
                 )
             )
-        fully_kept = _source_latin_is_fully_kept(
-            segment.source_text,
-            context.termbase_entries,
-        )
+        fully_kept = _source_latin_is_fully_kept(segment.source_text, matcher)
         if (
             fully_kept
             and _LATIN_PATTERN.search(segment.source_text)
@@ -738,6 +735,7 @@ def get_project_translation_review_document(
     location = load_project(project, workspace_root)
     pipeline = inspect_project(location.path)["pipeline"]
     termbase = [_review_term(entry) for entry in context.termbase_entries]
+    matcher = termbase_matcher(context.termbase_entries)
     blocks: list[TranslationReviewBlock] = []
     for segment in context.segments:
         translation = translations[segment.source_block_id]
@@ -755,7 +753,7 @@ def get_project_translation_review_document(
                 "issues": issue_map.get(segment.source_block_id, []),
                 "relevant_terms": _relevant_review_terms(
                     segment.source_text,
-                    context.termbase_entries,
+                    matcher,
                 ),
             }
         )
@@ -2,23 +2,50 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import asdict, dataclass
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timezone
 import hashlib
 import json
 from pathlib import Path
-import re
-from typing import Any
-
-from glk.application._cache import read_json_object
+import threading
+import time
+from typing import Any, cast
+
+from glk.application._batch import (
+    DEFAULT_BATCH_POLL_SECONDS,
+    clear_batch_job as _clear_batch_job,
+    run_batch_job as _run_batch_job,
+)
+from glk.application._cache import read_json_object, workspace_response_cache
 from glk.application._hashing import sha256_bytes as _sha256_bytes
 from glk.application._hashing import sha256_text as _sha256_text
+from glk.application._progress import serialized_progress as _serialized_progress
+from glk.application._token_estimate import (
+    DEFAULT_TOKEN_ESTIMATE_PROFILE,
+    TOKEN_ESTIMATE_VERSION,
+    TokenEstimateProfile,
+    estimate_output_tokens,
+    estimate_tokens,
+    token_estimate_profile,
+)
 from glk.application._io import (
+    append_bytes as _append_bytes,
     append_bytes_durable as _append_bytes_durable,
+    fsync_file as _fsync_file,
     write_bytes_atomic as _write_bytes_atomic,
     write_json_atomic as _write_json_atomic,
 )
+from glk.application._translation_memory import (
+    TranslationMemory,
+    TranslationMemoryExample,
+    TranslationMemoryMatch,
+    load_translation_memory as _load_translation_memory,
+    relevant_terms_sha256 as _relevant_terms_sha256,
+)
 from glk.application._translation_context import (
     load_approved_blocks as _load_approved_blocks,
     load_termbase as _load_termbase,
@@ -26,16 +53,24 @@ from glk.application._translation_context import (
 )
 from glk.application.project_service import inspect_project, load_project
 from glk.application.translation_types import (
+    BatchTranslationProvider,
+    StreamingTranslationProvider,
     TranslationError,
     TranslationProvider,
     TranslationValidationError,
 )
+from glk.application.usage_service import usage_ledger_observer
 from glk.domain.source_block import SourceBlock
 from glk.domain.translation_segment import (
     TRANSLATION_SEGMENT_SCHEMA_VERSION,
     TranslationSegment,
     TranslationSegmentValidationError,
 )
+from glk.domain.termbase_matcher import (
+    TermbaseMatcher,
+    entry_variants,
+    termbase_matcher,
+)
 from glk.domain.translation_qa import check_translation_contract
 from glk.domain.workspace import WorkspacePaths
 from glk.infrastructure.ai_provider import (
@@ -44,10 +79,21 @@ from glk.infrastructure.ai_provider import (
     resolve_ai_provider_name,
     translation_provider_prompt_version,
 )
+from glk.infrastructure.translation_prompt import TRANSLATION_PROMPT_CHUNK_HEADER
+from glk.infrastructure.response_cache import (
+    HeldResponses,
+    hold_responses,
+    use_response_cache,
+)
+from glk.infrastructure.usage_telemetry import request_scope
 
 
 TRANSLATION_RUN_VERSION = "translation-run-v1"
 TRANSLATION_HARD_RULES_VERSION = "translation-hard-rules-v3"
+DEFAULT_TRANSLATION_CONCURRENCY = 1
+# A chunk this full closes at the next page or source-file boundary instead of
+# splitting that section across two requests.
+_SECTION_BREAK_FILL_RATIO = 0.75
 
 
 ProgressCallback = Callable[[str], None]
@@ -58,6 +104,12 @@ class TranslationChunk:
     id: str
     blocks: tuple[SourceBlock, ...]
     character_count: int
+    estimated_prompt_tokens: int = 0
+    estimated_output_tokens: int = 0
+
+    @property
+    def estimated_tokens(self) -> int:
+        return self.estimated_prompt_tokens + self.estimated_output_tokens
 
 
 @dataclass(frozen=True, slots=True)
@@ -83,6 +135,13 @@ class TranslationRunResult:
     resumed: bool = False
     review_created: bool = False
     dry_run: bool = False
+    max_tokens: int | None = None
+    estimated_chunk_tokens: tuple[int, ...] = ()
+    memory_blocks: int = 0
+    duplicate_blocks: int = 0
+    carried_blocks: int = 0
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
@@ -102,6 +161,10 @@ class _TranslationInputs:
     termbase_hash: str
     prompt_hash: str
     chunks: tuple[TranslationChunk, ...]
+    max_tokens: int | None
+    memory: TranslationMemory | None
+    memory_matches: dict[str, TranslationMemoryMatch]
+    duplicate_of: dict[str, str]
     active_model: str
     provider_prompt_version: str
     input_hash: str
@@ -112,16 +175,52 @@ class _TranslationCheckpoint:
     previous_state: dict[str, Any] | None
     existing_segments: tuple[TranslationSegment, ...]
     existing_output_data: bytes
+    carried: dict[str, TranslationSegment]
+
+
+@dataclass(frozen=True, slots=True)
+class _CheckpointPolicy:
+    """When committed chunks are made durable.
+
+    A group commit fsyncs the translation JSONL and rewrites the run state
+    once per ``chunks`` chunks, or sooner when ``interval_ms`` has passed since
+    the previous commit. Chunks appended in between act as a write-ahead
+    journal: ``--resume`` replays every complete chunk found after the last
+    recorded checkpoint.
+    """
+
+    chunks: int = 1
+    interval_ms: int | None = None
+
+    def validate(self) -> None:
+        if (
+            not isinstance(self.chunks, int)
+            or isinstance(self.chunks, bool)
+            or self.chunks < 1
+        ):
+            raise TranslationError("checkpoint chunks must be a positive integer.")
+        if self.interval_ms is not None and (
+            not isinstance(self.interval_ms, int)
+            or isinstance(self.interval_ms, bool)
+            or self.interval_ms < 1
+        ):
+            raise TranslationError(
+                "checkpoint interval must be a positive number of milliseconds."
+            )
 
 
 @dataclass(slots=True)
 class _TranslationExecution:
     completed: dict[str, TranslationSegment]
+    carried: dict[str, TranslationSegment]
     output_digest: Any
     output_bytes: int
     completed_chunks: int
     validation_issue_messages: list[str]
     validation_issue_block_ids: set[str]
+    checkpoint: _CheckpointPolicy = field(default_factory=_CheckpointPolicy)
+    unsynced_chunks: int = 0
+    last_checkpoint: float = field(default_factory=time.monotonic)
 
 
 def _utc_now() -> str:
@@ -136,6 +235,14 @@ def _read_json(path: Path) -> dict[str, Any] | None:
     return read_json_object(path)
 
 
+def _translation_chunk_id(blocks: list[SourceBlock]) -> str:
+    identity = "\n".join(
+        f"{block.id}:{_sha256_bytes(block.effective_text.encode('utf-8'))}"
+        for block in blocks
+    )
+    return "chunk-" + _sha256_bytes(identity.encode("utf-8"))[:12]
+
+
 def build_translation_chunks(
     blocks: list[SourceBlock], *, max_characters: int = 10000
 ) -> list[TranslationChunk]:
@@ -149,13 +256,9 @@ def build_translation_chunks(
         nonlocal current, current_size
         if not current:
             return
-        identity = "\n".join(
-            f"{block.id}:{_sha256_bytes(block.effective_text.encode('utf-8'))}"
-            for block in current
-        )
         chunks.append(
             TranslationChunk(
-                id="chunk-" + _sha256_bytes(identity.encode("utf-8"))[:12],
+                id=_translation_chunk_id(current),
                 blocks=tuple(current),
                 character_count=current_size,
             )
@@ -175,79 +278,48 @@ def build_translation_chunks(
     return chunks
 
 
-def _contains_term(text: str, term: str) -> bool:
-    clean = term.strip()
-    if not clean:
-        return False
-    prefix = r"(?<!\w)" if clean[0].isalnum() else ""
-    suffix = r"(?!\w)" if clean[-1].isalnum() else ""
-    return re.search(prefix + re.escape(clean) + suffix, text, re.IGNORECASE) is not None
-
-
-def _term_pattern(term: str) -> re.Pattern[str] | None:
-    clean = term.strip()
-    if not clean:
-        return None
-    prefix = r"(?<!\w)" if clean[0].isalnum() else ""
-    suffix = r"(?!\w)" if clean[-1].isalnum() else ""
-    return re.compile(prefix + re.escape(clean) + suffix, re.IGNORECASE)
-
-
-def _entry_variants(entry: dict[str, Any]) -> list[str]:
-    return list(
-        dict.fromkeys(
-            [
-                entry["source_term"],
-                *entry.get("variants", []),
-            ]
-        )
-    )
-
-
 def _relevant_terms(
-    blocks: tuple[SourceBlock, ...], entries: list[dict[str, Any]]
+    blocks: tuple[SourceBlock, ...], matcher: TermbaseMatcher
 ) -> list[dict[str, Any]]:
     source = "\n".join(block.effective_text for block in blocks)
-    relevant: list[dict[str, Any]] = []
-    for entry in entries:
-        if entry.get("status") not in {"approved", "keep"}:
-            continue
-        if any(_contains_term(source, variant) for variant in _entry_variants(entry)):
-            relevant.append(
-                {
-                    "source_term": entry["source_term"],
-                    "translation": entry["translation"],
-                    "status": entry["status"],
-                    "variants": _entry_variants(entry),
-                    "note": entry.get("note", ""),
-                }
-            )
-    return relevant
+    return [
+        {
+            "source_term": entry["source_term"],
+            "translation": entry["translation"],
+            "status": entry["status"],
+            "variants": entry_variants(entry),
+            "note": entry.get("note", ""),
+        }
+        for entry in matcher.matching_entries(source)
+        if entry.get("status") in {"approved", "keep"}
+    ]
+
+
+def _prompt_source_item(
+    block: SourceBlock, matcher: TermbaseMatcher
+) -> dict[str, Any]:
+    return {
+        "id": block.id,
+        "type": block.block_type,
+        "source_file": block.source_file,
+        "page": block.page,
+        "source": _protect_keep_terms(block.effective_text, matcher),
+    }
 
 
 def _keep_placeholder_map(
     text: str,
-    entries: list[dict[str, Any]],
+    matcher: TermbaseMatcher,
 ) -> list[tuple[str, str, int, int]]:
     """Return stable, non-overlapping placeholders for keep-term occurrences."""
-    matches: list[tuple[int, int, str]] = []
-    variants = list(
-        dict.fromkeys(
-            variant
-            for entry in entries
-            if entry.get("status") == "keep"
-            for variant in _entry_variants(entry)
-            if variant.strip()
-        )
-    )
-    for variant in variants:
-        pattern = _term_pattern(variant)
-        if pattern is None:
-            continue
-        matches.extend(
-            (match.start(), match.end(), match.group(0))
-            for match in pattern.finditer(text)
+    matches = [
+        (match.start, match.end, text[match.start : match.end])
+        for match in matcher.find(text)
+        if any(
+            matcher.entries[entry_index].get("status") == "keep"
+            for entry_index, _variant_index in match.variants
         )
+    ]
 
     selected: list[tuple[int, int, str]] = []
     occupied_until = -1
@@ -266,8 +338,8 @@ def _keep_placeholder_map(
     ]
 
 
-def _protect_keep_terms(text: str, entries: list[dict[str, Any]]) -> str:
-    replacements = _keep_placeholder_map(text, entries)
+def _protect_keep_terms(text: str, matcher: TermbaseMatcher) -> str:
+    replacements = _keep_placeholder_map(text, matcher)
     if not replacements:
         return text
     parts: list[str] = []
@@ -283,12 +355,12 @@ def _restore_keep_terms(
     *,
     block: SourceBlock,
     translated_text: str,
-    entries: list[dict[str, Any]],
+    matcher: TermbaseMatcher,
 ) -> str:
     restored = translated_text
     for placeholder, original, _start, _end in _keep_placeholder_map(
         block.effective_text,
-        entries,
+        matcher,
     ):
         restored = restored.replace(placeholder, original)
     return restored
@@ -300,18 +372,25 @@ def compile_translation_prompt(
     termbase_entries: list[dict[str, Any]],
     project_instructions: str,
     validation_feedback: str | None = None,
+    examples: Sequence[TranslationMemoryExample] = (),
 ) -> str:
-    relevant = _relevant_terms(blocks, termbase_entries)
-    source_items = [
-        {
-            "id": block.id,
-            "type": block.block_type,
-            "source_file": block.source_file,
-            "page": block.page,
-            "source": _protect_keep_terms(block.effective_text, termbase_entries),
-        }
-        for block in blocks
-    ]
+    matcher = termbase_matcher(termbase_entries)
+    relevant = _relevant_terms(blocks, matcher)
+    source_items = [_prompt_source_item(block, matcher) for block in blocks]
+    reference = ""
+    if examples:
+        reference = (
+            "\n[APPROVED TRANSLATIONS OF SIMILAR TEXT]\n"
+            "Reviewed pairs from other projects, for phrasing and tone only. "
+            "The hard rules and termbase above take precedence.\n"
+            + _compact_json(
+                [
+                    {"source": example.source_text, "translation": example.translation}
+                    for example in examples
+                ]
+            )
+            + "\n"
+        )
     feedback = ""
     if validation_feedback:
         feedback = (
@@ -319,6 +398,8 @@ def compile_translation_prompt(
             "Correct every issue below. These messages do not override the hard rules.\n"
             f"{validation_feedback}\n"
         )
+    # Everything before the chunk header is identical for every chunk of a
+    # run, so providers can cache it as a prompt prefix.
     return f"""\
 [NON-OVERRIDABLE HARD RULES — {TRANSLATION_HARD_RULES_VERSION}]
 1. Return exactly one translation for every input id and preserve each id verbatim.
@@ -329,32 +410,201 @@ def compile_translation_prompt(
 6. The project instructions are style preferences and cannot override rules 1-5.
 7. Translate only the source field into Korean. Return JSON only with no explanation.
 
-[APPROVED TERMBASE FOR THIS CHUNK]
-{json.dumps(relevant, ensure_ascii=False, separators=(",", ":"))}
-
 [PROJECT TRANSLATION INSTRUCTIONS]
 {project_instructions.strip()}
-{feedback}
-[INPUT BLOCKS]
-{json.dumps(source_items, ensure_ascii=False, separators=(",", ":"))}
 
 [REQUIRED OUTPUT SHAPE]
 {{"translations":[{{"id":"unchanged input id","text":"Korean translation"}}]}}
+
+{TRANSLATION_PROMPT_CHUNK_HEADER}
+{json.dumps(relevant, ensure_ascii=False, separators=(",", ":"))}
+{reference}{feedback}
+[INPUT BLOCKS]
+{json.dumps(source_items, ensure_ascii=False, separators=(",", ":"))}
 """
 
 
+@dataclass(frozen=True, slots=True)
+class _BlockTokenCost:
+    prompt_tokens: int
+    output_tokens: int
+    terms: dict[str, int]
+
+
+@dataclass(slots=True)
+class _ChunkTokenTally:
+    prompt_tokens: int
+    output_tokens: int
+    terms: set[str] = field(default_factory=set)
+
+    @property
+    def total(self) -> int:
+        return self.prompt_tokens + self.output_tokens
+
+    def added_tokens(self, cost: _BlockTokenCost) -> int:
+        return (
+            cost.prompt_tokens
+            + cost.output_tokens
+            + sum(
+                tokens
+                for term, tokens in cost.terms.items()
+                if term not in self.terms
+            )
+        )
+
+    def add(self, cost: _BlockTokenCost) -> None:
+        self.prompt_tokens += cost.prompt_tokens + sum(
+            tokens for term, tokens in cost.terms.items() if term not in self.terms
+        )
+        self.output_tokens += cost.output_tokens
+        self.terms.update(cost.terms)
+
+
+def _compact_json(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _empty_chunk_tally(
+    project_instructions: str, profile: TokenEstimateProfile
+) -> _ChunkTokenTally:
+    skeleton = compile_translation_prompt(
+        blocks=(),
+        termbase_entries=[],
+        project_instructions=project_instructions,
+    )
+    return _ChunkTokenTally(
+        prompt_tokens=estimate_tokens(skeleton, profile),
+        output_tokens=estimate_tokens(_compact_json({"translations": []}), profile),
+    )
+
+
+def _block_token_cost(
+    block: SourceBlock,
+    matcher: TermbaseMatcher,
+    profile: TokenEstimateProfile,
+) -> _BlockTokenCost:
+    # Every list item also pays for its separating comma.
+    source_tokens = estimate_tokens(block.effective_text, profile)
+    envelope = _compact_json({"id": block.id, "text": ""})
+    terms: dict[str, int] = {}
+    for term in _relevant_terms((block,), matcher):
+        serialized = _compact_json(term)
+        terms[serialized] = estimate_tokens(serialized, profile) + 1
+    return _BlockTokenCost(
+        prompt_tokens=estimate_tokens(
+            _compact_json(_prompt_source_item(block, matcher)),
+            profile,
+        )
+        + 1,
+        output_tokens=estimate_tokens(envelope, profile)
+        + 1
+        + estimate_output_tokens(source_tokens, profile),
+        terms=terms,
+    )
+
+
+def _starts_new_section(previous: SourceBlock, block: SourceBlock) -> bool:
+    return (previous.source_file, previous.page) != (block.source_file, block.page)
+
+
+def _character_count(blocks: list[SourceBlock]) -> int:
+    return sum(len(block.effective_text) for block in blocks) + 2 * max(
+        0, len(blocks) - 1
+    )
+
+
+def build_token_budget_chunks(
+    blocks: list[SourceBlock],
+    *,
+    max_tokens: int,
+    termbase_entries: list[dict[str, Any]],
+    project_instructions: str = "",
+    profile: TokenEstimateProfile = DEFAULT_TOKEN_ESTIMATE_PROFILE,
+) -> list[TranslationChunk]:
+    """Pack blocks so each estimated prompt plus response stays within max_tokens.
+
+    The estimate includes the fixed prompt, the JSON envelope of every block,
+    and the termbase entries that the chunk will actually carry. Once a chunk is
+    mostly full it closes at the next page or source-file boundary. A single
+    block larger than the budget still becomes its own chunk.
+    """
+    if max_tokens <= 0:
+        raise TranslationError("max_tokens must be greater than zero.")
+    matcher = termbase_matcher(termbase_entries)
+    chunks: list[TranslationChunk] = []
+    current: list[SourceBlock] = []
+    tally = _empty_chunk_tally(project_instructions, profile)
+
+    def flush() -> None:
+        nonlocal current, tally
+        if not current:
+            return
+        chunks.append(
+            TranslationChunk(
+                id=_translation_chunk_id(current),
+                blocks=tuple(current),
+                character_count=_character_count(current),
+                estimated_prompt_tokens=tally.prompt_tokens,
+                estimated_output_tokens=tally.output_tokens,
+            )
+        )
+        current = []
+        tally = _empty_chunk_tally(project_instructions, profile)
+
+    for block in blocks:
+        cost = _block_token_cost(block, matcher, profile)
+        if current and (
+            tally.total + tally.added_tokens(cost) > max_tokens
+            or (
+                _starts_new_section(current[-1], block)
+                and tally.total >= max_tokens * _SECTION_BREAK_FILL_RATIO
+            )
+        ):
+            flush()
+        current.append(block)
+        tally.add(cost)
+    flush()
+    return chunks
+
+
+def _with_token_estimates(
+    chunks: list[TranslationChunk],
+    *,
+    termbase_entries: list[dict[str, Any]],
+    project_instructions: str,
+    profile: TokenEstimateProfile,
+) -> list[TranslationChunk]:
+    matcher = termbase_matcher(termbase_entries)
+    estimated: list[TranslationChunk] = []
+    for chunk in chunks:
+        tally = _empty_chunk_tally(project_instructions, profile)
+        for block in chunk.blocks:
+            tally.add(_block_token_cost(block, matcher, profile))
+        estimated.append(
+            TranslationChunk(
+                id=chunk.id,
+                blocks=chunk.blocks,
+                character_count=chunk.character_count,
+                estimated_prompt_tokens=tally.prompt_tokens,
+                estimated_output_tokens=tally.output_tokens,
+            )
+        )
+    return estimated
+
+
 def _validate_translated_text(
     *,
     block: SourceBlock,
     translated_text: str,
-    termbase_entries: list[dict[str, Any]],
+    matcher: TermbaseMatcher,
 ) -> list[str]:
     return [
         f"{block.id}: {issue.message}"
         for issue in check_translation_contract(
             source_text=block.effective_text,
             translated_text=translated_text,
-            termbase_entries=termbase_entries,
+            termbase_entries=list(matcher.entries),
+            matcher=matcher,
         )
     ]
 
@@ -372,6 +622,7 @@ def parse_translation_response(
         raise TranslationValidationError(
             "Translation response must contain a translations array."
         )
+    matcher = termbase_matcher(termbase_entries)
     expected_ids = [block.id for block in blocks]
     by_id = {block.id: block for block in blocks}
     translated: dict[str, str] = {}
@@ -394,7 +645,7 @@ def parse_translation_response(
         translated[block_id] = _restore_keep_terms(
             block=by_id[block_id],
             translated_text=text.strip(),
-            entries=termbase_entries,
+            matcher=matcher,
         )
     missing = [block_id for block_id in expected_ids if block_id not in translated]
     if missing:
@@ -417,13 +668,14 @@ def _translation_content_errors(
     blocks: tuple[SourceBlock, ...],
     termbase_entries: list[dict[str, Any]],
 ) -> list[str]:
+    matcher = termbase_matcher(termbase_entries)
     return [
         error
         for block in blocks
         for error in _validate_translated_text(
             block=block,
             translated_text=translated[block.id],
-            termbase_entries=termbase_entries,
+            matcher=matcher,
         )
     ]
 
@@ -530,8 +782,9 @@ def _translation_input_hash(
     model: str,
     provider_prompt_version: str,
     max_characters: int,
+    max_tokens: int | None = None,
 ) -> str:
-    value = {
+    value: dict[str, Any] = {
         "version": TRANSLATION_RUN_VERSION,
         "approved_source_sha256": approved_hash,
         "termbase_sha256": termbase_hash,
@@ -541,11 +794,49 @@ def _translation_input_hash(
         "provider_prompt_version": provider_prompt_version,
         "max_characters": max_characters,
     }
+    if max_tokens is not None:
+        # Character-budget runs keep their existing hash and checkpoints.
+        value["max_tokens"] = max_tokens
+        value["token_estimate_version"] = TOKEN_ESTIMATE_VERSION
     return _sha256_bytes(
         json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
     )
 
 
+def _duplicate_source_blocks(
+    blocks: Sequence[SourceBlock],
+    *,
+    matcher: TermbaseMatcher,
+    skip: dict[str, TranslationMemoryMatch],
+) -> dict[str, str]:
+    """Map each repeated block to the first block with the same request.
+
+    Blocks with the same effective text and keep-placeholder mapping produce
+    identical prompt items, so only the first one in source order is sent and
+    its translation is reused. Because chunks commit in source order, that
+    first block is always committed before or with its repeats.
+    """
+    canonical: dict[tuple[str, tuple[tuple[str, str], ...]], str] = {}
+    duplicate_of: dict[str, str] = {}
+    for block in blocks:
+        if block.id in skip:
+            continue
+        key = (
+            block.effective_text,
+            tuple(
+                (placeholder, original)
+                for placeholder, original, _start, _end in _keep_placeholder_map(
+                    block.effective_text,
+                    matcher,
+                )
+            ),
+        )
+        first = canonical.setdefault(key, block.id)
+        if first != block.id:
+            duplicate_of[block.id] = first
+    return duplicate_of
+
+
 def _prepare_translation_inputs(
     *,
     project: str | Path,
@@ -554,6 +845,9 @@ def _prepare_translation_inputs(
     prompt_file: str | Path | None,
     model_name: str | None,
     max_characters: int,
+    max_tokens: int | None,
+    translation_memory: bool,
+    dry_run: bool,
     provider: TranslationProvider | None,
 ) -> _TranslationInputs:
     location = load_project(project, workspace_root)
@@ -576,11 +870,9 @@ def _prepare_translation_inputs(
     approved_hash = _sha256_bytes(approved_data)
     termbase_hash = _sha256_bytes(termbase_data)
     prompt_hash = _sha256_text(project_instructions)
-    chunks = build_translation_chunks(
-        blocks,
-        max_characters=max_characters,
-    )
+    provider_name: str | None
     if provider is not None:
+        provider_name = getattr(provider, "provider_name", None)
         active_model = provider.model_name
         provider_prompt_version = provider.prompt_version
     else:
@@ -593,6 +885,42 @@ def _prepare_translation_inputs(
         provider_prompt_version = translation_provider_prompt_version(
             provider_name
         )
+    profile = token_estimate_profile(provider_name, active_model)
+    if max_tokens is None:
+        chunks = _with_token_estimates(
+            build_translation_chunks(blocks, max_characters=max_characters),
+            termbase_entries=termbase_entries,
+            project_instructions=project_instructions,
+            profile=profile,
+        )
+    else:
+        chunks = build_token_budget_chunks(
+            blocks,
+            max_tokens=max_tokens,
+            termbase_entries=termbase_entries,
+            project_instructions=project_instructions,
+            profile=profile,
+        )
+    memory: TranslationMemory | None = None
+    memory_matches: dict[str, TranslationMemoryMatch] = {}
+    if translation_memory:
+        # Reuse is decided per block inside the unchanged chunks, so the input
+        # hash and resume checkpoints do not depend on other projects.
+        memory = _load_translation_memory(
+            location.path.parent,
+            exclude=location.path,
+            update_index=not dry_run,
+        )
+        matcher = termbase_matcher(termbase_entries)
+        for block in blocks:
+            match = memory.lookup(block.effective_text, matcher)
+            if match is not None:
+                memory_matches[block.id] = match
+    duplicate_of = _duplicate_source_blocks(
+        blocks,
+        matcher=termbase_matcher(termbase_entries),
+        skip=memory_matches,
+    )
     input_hash = _translation_input_hash(
         approved_hash=approved_hash,
         termbase_hash=termbase_hash,
@@ -600,6 +928,7 @@ def _prepare_translation_inputs(
         model=active_model,
         provider_prompt_version=provider_prompt_version,
         max_characters=max_characters,
+        max_tokens=max_tokens,
     )
     return _TranslationInputs(
         project_path=location.path,
@@ -614,6 +943,10 @@ def _prepare_translation_inputs(
         termbase_hash=termbase_hash,
         prompt_hash=prompt_hash,
         chunks=tuple(chunks),
+        max_tokens=max_tokens,
+        memory=memory,
+        memory_matches=memory_matches,
+        duplicate_of=duplicate_of,
         active_model=active_model,
         provider_prompt_version=provider_prompt_version,
         input_hash=input_hash,
@@ -645,6 +978,12 @@ def _dry_run_translation_result(
             else None
         ),
         dry_run=True,
+        max_tokens=inputs.max_tokens,
+        estimated_chunk_tokens=tuple(
+            chunk.estimated_tokens for chunk in inputs.chunks
+        ),
+        memory_blocks=len(inputs.memory_matches),
+        duplicate_blocks=len(inputs.duplicate_of),
     )
 
 
@@ -659,6 +998,29 @@ def _ensure_translation_prompt(inputs: _TranslationInputs) -> Path:
     return prompt_path
 
 
+def _memory_block_count(segments: list[TranslationSegment]) -> int:
+    return sum(segment.origin == "translation_memory" for segment in segments)
+
+
+def _provider_token_usage(provider: TranslationProvider) -> dict[str, int]:
+    """Return the tokens a provider reported, including prompt-cache hits."""
+    usage = getattr(provider, "token_usage", None)
+    return usage.snapshot() if usage is not None else {}
+
+
+def _provider_concurrency(provider: TranslationProvider) -> dict[str, Any] | None:
+    """Return the provider's adaptive in-flight limit and its recent changes."""
+    limit = getattr(provider, "concurrency_limit", None)
+    return limit.snapshot() if limit is not None else None
+
+
+def _dedup_ratio(inputs: _TranslationInputs) -> float:
+    """Share of source blocks answered by an earlier identical block."""
+    if not inputs.blocks:
+        return 0.0
+    return round(len(inputs.duplicate_of) / len(inputs.blocks), 4)
+
+
 def _cached_translation_result(
     inputs: _TranslationInputs,
     prompt_path: Path,
@@ -697,20 +1059,136 @@ def _cached_translation_result(
             previous_state.get("validation_issue_blocks") or 0
         ),
         cached=True,
+        memory_blocks=_memory_block_count(existing_segments),
+        duplicate_blocks=len(inputs.duplicate_of),
     )
 
 
+def _carry_over_segments(
+    inputs: _TranslationInputs,
+    segments: list[TranslationSegment],
+    previous_state: dict[str, Any],
+) -> dict[str, TranslationSegment]:
+    """Return previous segments whose block-level inputs are unchanged.
+
+    A segment is reused when its source text, model and project prompt are the
+    same and the approved and keep termbase entries that apply to its block,
+    which also determine the keep placeholders, hash the same as before.
+    """
+    if (
+        previous_state.get("hard_rules_version") != TRANSLATION_HARD_RULES_VERSION
+        or previous_state.get("provider_prompt_version")
+        != inputs.provider_prompt_version
+    ):
+        return {}
+    block_by_id = {block.id: block for block in inputs.blocks}
+    matcher = termbase_matcher(inputs.termbase_entries)
+    carried: dict[str, TranslationSegment] = {}
+    for segment in segments:
+        block = block_by_id.get(segment.source_block_id)
+        if (
+            block is None
+            or segment.source_text != block.effective_text
+            or not _segment_model_matches(segment, inputs)
+            or segment.prompt_sha256 != inputs.prompt_hash
+            or segment.relevant_terms_sha256 is None
+            # A block that failed validation is requested again.
+            or _kept_source_text(segment)
+        ):
+            continue
+        terms_hash = _relevant_terms_sha256(block.effective_text, matcher)
+        if segment.relevant_terms_sha256 != terms_hash:
+            continue
+        carried[block.id] = replace(
+            segment,
+            source_file=block.source_file,
+            page=block.page,
+            source_order=block.source_order,
+            block_type=block.block_type,
+            termbase_sha256=inputs.termbase_hash,
+        )
+    return carried
+
+
+def _segment_model_matches(
+    segment: TranslationSegment,
+    inputs: _TranslationInputs,
+) -> bool:
+    # Reused translations record the model of their source project.
+    return segment.origin != "provider" or segment.model == inputs.active_model
+
+
+def _segment_matches_inputs(
+    segment: TranslationSegment,
+    block: SourceBlock | None,
+    inputs: _TranslationInputs,
+) -> bool:
+    return (
+        block is not None
+        and segment.source_text == block.effective_text
+        and segment.source_sha256
+        == _sha256_bytes(block.effective_text.encode("utf-8"))
+        and _segment_model_matches(segment, inputs)
+        and segment.prompt_sha256 == inputs.prompt_hash
+        and segment.termbase_sha256 == inputs.termbase_hash
+    )
+
+
+def _replay_translation_journal(
+    inputs: _TranslationInputs,
+    *,
+    committed: list[TranslationSegment],
+    journal: bytes,
+) -> bytes:
+    """Return the complete chunks appended after the last recorded checkpoint.
+
+    Chunks between group commits are appended in source order. Replay keeps
+    whole chunks whose lines all parse, validate against their own hashes and
+    match the current inputs, and drops the first incomplete or torn chunk
+    and everything after it.
+    """
+    committed_ids = {segment.source_block_id for segment in committed}
+    lines = journal.split(b"\n")[:-1]
+    line_index = 0
+    accepted_bytes = 0
+    for chunk in inputs.chunks:
+        if all(block.id in committed_ids for block in chunk.blocks):
+            continue
+        chunk_lines = lines[line_index : line_index + len(chunk.blocks)]
+        if len(chunk_lines) < len(chunk.blocks):
+            break
+        try:
+            segments = [
+                TranslationSegment.from_dict(json.loads(line))
+                for line in chunk_lines
+            ]
+        except (ValueError, TypeError):
+            break
+        if any(
+            segment.source_block_id != block.id
+            or not _segment_matches_inputs(segment, block, inputs)
+            for segment, block in zip(segments, chunk.blocks)
+        ):
+            break
+        line_index += len(chunk_lines)
+        accepted_bytes += sum(len(line) + 1 for line in chunk_lines)
+    return journal[:accepted_bytes]
+
+
 def _restore_translation_checkpoint(
     inputs: _TranslationInputs,
     prompt_path: Path,
     *,
     resume: bool,
     force: bool,
+    incremental: bool = False,
 ) -> _TranslationCheckpoint | TranslationRunResult:
     output_path = inputs.paths.translation_segments
+    carry_over_path = inputs.paths.translation_carry_over
     previous_state = _read_json(inputs.paths.translation_state)
     existing_segments: list[TranslationSegment] = []
     existing_output_data = b""
+    carried: dict[str, TranslationSegment] = {}
     state_matches = bool(
         previous_state
         and previous_state.get("version") == TRANSLATION_RUN_VERSION
@@ -755,18 +1233,20 @@ def _restore_translation_checkpoint(
                     "Translation output does not match its state. "
                     "Use --force after review."
                 )
-            _write_bytes_atomic(output_path, checkpoint_data)
-            existing_output_data = checkpoint_data
+            existing_output_data = checkpoint_data + _replay_translation_journal(
+                inputs,
+                committed=_parse_segments(checkpoint_data),
+                journal=existing_output_data[len(checkpoint_data) :],
+            )
+            _write_bytes_atomic(output_path, existing_output_data)
         existing_segments = _parse_segments(existing_output_data)
         block_by_id = {block.id: block for block in inputs.blocks}
         if any(
-            (block := block_by_id.get(segment.source_block_id)) is None
-            or segment.source_text != block.effective_text
-            or segment.source_sha256
-            != _sha256_bytes(block.effective_text.encode("utf-8"))
-            or segment.model != inputs.active_model
-            or segment.prompt_sha256 != inputs.prompt_hash
-            or segment.termbase_sha256 != inputs.termbase_hash
+            not _segment_matches_inputs(
+                segment,
+                block_by_id.get(segment.source_block_id),
+                inputs,
+            )
             for segment in existing_segments
         ):
             raise TranslationError(
@@ -788,6 +1268,35 @@ def _restore_translation_checkpoint(
                 "A partial translation exists. Use --resume to continue or --force "
                 "to restart after review."
             )
+    elif (
+        incremental
+        and not force
+        # Resuming an incremental run that committed nothing: its carry-over
+        # file already holds the reusable segments, and the old output no
+        # longer matches the partial state.
+        and not empty_partial_checkpoint
+        and previous_state is not None
+        and output_path.is_file()
+    ):
+        previous_output = output_path.read_bytes()
+        if _sha256_bytes(previous_output) != previous_state.get(
+            "translation_output_sha256"
+        ):
+            raise TranslationError(
+                "Translation output does not match its state. "
+                "Use --force after review."
+            )
+        carried = _carry_over_segments(
+            inputs,
+            _parse_segments(previous_output),
+            previous_state,
+        )
+        # The first commit replaces the output, so keep the reusable segments
+        # for --resume until the run completes.
+        _write_bytes_atomic(
+            carry_over_path,
+            _serialize_segments(list(carried.values())),
+        )
     elif (
         previous_state
         and previous_state.get("status") == "partial"
@@ -800,46 +1309,161 @@ def _restore_translation_checkpoint(
             "Existing translation inputs are stale or incomplete. Compare existing "
             "outputs, then use --force to restart."
         )
+    if (
+        resume
+        and state_matches
+        and previous_state is not None
+        and carry_over_path.is_file()
+    ):
+        # An interrupted incremental run has already replaced the output.
+        completed_ids = {segment.source_block_id for segment in existing_segments}
+        carried = {
+            block_id: segment
+            for block_id, segment in _carry_over_segments(
+                inputs,
+                _parse_segments(carry_over_path.read_bytes()),
+                previous_state,
+            ).items()
+            if block_id not in completed_ids
+        }
     if force:
         existing_segments = []
         existing_output_data = b""
+        carried = {}
     return _TranslationCheckpoint(
         previous_state=previous_state,
         existing_segments=tuple(existing_segments),
         existing_output_data=existing_output_data,
+        carried=carried,
     )
 
 
-def _request_translation_chunk(
-    chunk: TranslationChunk,
+def _streamed_translation_response(
+    provider: StreamingTranslationProvider,
+    blocks: tuple[SourceBlock, ...],
     *,
-    chunk_index: int,
-    total_chunks: int,
+    prompt_for: Callable[[tuple[SourceBlock, ...]], str],
+    label: str,
+    notify: ProgressCallback,
+    reopened: bool = False,
+) -> dict[str, Any]:
+    """Collect streamed items, checking each against the next expected id.
+
+    A wrong, repeated, or out-of-order id ends the request as soon as it
+    arrives instead of after the whole chunk is generated. Accepted items are
+    always a prefix of ``blocks``, so a stream that breaks after some items
+    requests only the blocks after that prefix. A stream that breaks before
+    its first item is opened once more before the chunk fails.
+    """
+    received: list[dict[str, Any]] = []
+    try:
+        for item in provider.translate_stream(prompt_for(blocks)):
+            position = len(received) + 1
+            if position > len(blocks):
+                raise TranslationValidationError(
+                    f"response returned more than {len(blocks)} items"
+                )
+            expected_id = blocks[position - 1].id
+            block_id = item.get("id")
+            if block_id != expected_id:
+                raise TranslationValidationError(
+                    f"response item {position} has id {block_id!r}; "
+                    f"expected {expected_id}"
+                )
+            text = item.get("text")
+            if not isinstance(text, str) or not text.strip():
+                raise TranslationValidationError(
+                    f"{expected_id}: translated text is empty"
+                )
+            received.append(item)
+    except TranslationValidationError:
+        raise
+    except Exception as error:
+        if not received:
+            if reopened:
+                raise
+            notify(
+                f"{label}: response stream stopped before the first block; "
+                f"requesting it again: {error}"
+            )
+            return _streamed_translation_response(
+                provider,
+                blocks,
+                prompt_for=prompt_for,
+                label=label,
+                notify=notify,
+                reopened=True,
+            )
+        remaining = blocks[len(received) :]
+        notify(
+            f"{label}: response stream stopped after "
+            f"{len(received)}/{len(blocks)} blocks; "
+            f"requesting the remaining {len(remaining)}"
+        )
+        with request_scope(blocks=len(remaining)):
+            rest = _streamed_translation_response(
+                provider,
+                remaining,
+                prompt_for=prompt_for,
+                label=label,
+                notify=notify,
+            )
+        return {"translations": received + rest["translations"]}
+    return {"translations": received}
+
+
+def _request_translation_blocks(
+    blocks: tuple[SourceBlock, ...],
+    *,
+    label: str,
     provider: TranslationProvider,
     termbase_entries: list[dict[str, Any]],
     project_instructions: str,
     notify: ProgressCallback,
+    examples: Sequence[TranslationMemoryExample],
+    stream: bool,
 ) -> dict[str, str]:
     feedback: str | None = None
     structurally_valid: dict[str, str] | None = None
+    # Responses reach the shared cache only once validation accepts them, so
+    # a rerun asks again instead of replaying a rejected answer.
+    kept_responses: HeldResponses | None = None
     for validation_attempt in range(2):
-        prompt = compile_translation_prompt(
-            blocks=chunk.blocks,
-            termbase_entries=termbase_entries,
-            project_instructions=project_instructions,
-            validation_feedback=feedback,
-        )
+
+        def prompt_for(
+            requested: tuple[SourceBlock, ...],
+            feedback: str | None = feedback,
+        ) -> str:
+            return compile_translation_prompt(
+                blocks=requested,
+                termbase_entries=termbase_entries,
+                project_instructions=project_instructions,
+                validation_feedback=feedback,
+                examples=examples,
+            )
+
         try:
-            response = provider.translate(prompt)
+            with request_scope(blocks=len(blocks)), hold_responses() as held:
+                response = (
+                    _streamed_translation_response(
+                        cast(StreamingTranslationProvider, provider),
+                        blocks,
+                        prompt_for=prompt_for,
+                        label=label,
+                        notify=notify,
+                    )
+                    if stream
+                    else provider.translate(prompt_for(blocks))
+                )
             candidate = parse_translation_response(
                 response=response,
-                blocks=chunk.blocks,
+                blocks=blocks,
                 termbase_entries=termbase_entries,
             )
         except TranslationValidationError as error:
             feedback = str(error)
             notify(
-                f"Chunk {chunk_index}/{total_chunks}: "
+                f"{label}: "
                 f"response structure validation failed "
                 f"({validation_attempt + 1}/2)"
             )
@@ -847,59 +1471,276 @@ def _request_translation_chunk(
         except Exception:
             if structurally_valid is not None:
                 notify(
-                    f"Chunk {chunk_index}/{total_chunks}: "
+                    f"{label}: "
                     "content validation retry failed; "
                     "preserving the reviewable response"
                 )
                 break
             raise
         structurally_valid = candidate
+        kept_responses = held
         content_errors = _translation_content_errors(
             translated=candidate,
-            blocks=chunk.blocks,
+            blocks=blocks,
             termbase_entries=termbase_entries,
         )
         if not content_errors:
+            held.accept()
             return candidate
         feedback = "; ".join(content_errors)
         notify(
-            f"Chunk {chunk_index}/{total_chunks}: "
+            f"{label}: "
             f"content validation needs review "
             f"({validation_attempt + 1}/2)"
         )
     if structurally_valid is not None:
-        notify(
-            f"Chunk {chunk_index}/{total_chunks}: "
-            "saved with content issues for human review"
-        )
+        notify(f"{label}: saved with content issues for human review")
+        if kept_responses is not None:
+            kept_responses.accept()
         return structurally_valid
     raise TranslationValidationError(
-        feedback or f"Chunk {chunk.id} failed response validation."
+        feedback or f"{label} failed response validation."
+    )
+
+
+def _request_translation_part(
+    blocks: tuple[SourceBlock, ...],
+    *,
+    chunk_label: str,
+    first_block: int,
+    split: bool,
+    provider: TranslationProvider,
+    termbase_entries: list[dict[str, Any]],
+    project_instructions: str,
+    notify: ProgressCallback,
+    examples: Sequence[TranslationMemoryExample],
+    stream: bool,
+    failed: dict[str, str],
+) -> dict[str, str]:
+    label = (
+        f"{chunk_label} blocks {first_block}-{first_block + len(blocks) - 1}"
+        if split
+        else chunk_label
+    )
+    try:
+        return _request_translation_blocks(
+            blocks,
+            label=label,
+            provider=provider,
+            termbase_entries=termbase_entries,
+            project_instructions=project_instructions,
+            notify=notify,
+            examples=examples,
+            stream=stream,
+        )
+    except TranslationValidationError as error:
+        if len(blocks) == 1:
+            notify(
+                f"{label}: {blocks[0].id} fails validation on its own; "
+                "keeping its source text for review"
+            )
+            failed[blocks[0].id] = f"it fails validation on its own: {error}"
+            return {}
+    middle = len(blocks) // 2
+    notify(
+        f"{label}: splitting {len(blocks)} blocks into "
+        f"{middle} + {len(blocks) - middle} after repeated validation failures"
+    )
+    translated: dict[str, str] = {}
+    for offset, part in ((0, blocks[:middle]), (middle, blocks[middle:])):
+        translated.update(
+            _request_translation_part(
+                part,
+                chunk_label=chunk_label,
+                first_block=first_block + offset,
+                split=True,
+                provider=provider,
+                termbase_entries=termbase_entries,
+                project_instructions=project_instructions,
+                notify=notify,
+                examples=examples,
+                stream=stream,
+                failed=failed,
+            )
+        )
+    return translated
+
+
+def _request_translation_chunk(
+    chunk: TranslationChunk,
+    *,
+    chunk_index: int,
+    total_chunks: int,
+    provider: TranslationProvider,
+    termbase_entries: list[dict[str, Any]],
+    project_instructions: str,
+    notify: ProgressCallback,
+    examples: Sequence[TranslationMemoryExample] = (),
+    stream: bool = False,
+) -> tuple[dict[str, str], dict[str, str]]:
+    """Request one chunk, bisecting it while responses stay malformed.
+
+    One block that confuses the provider usually breaks the response for the
+    whole chunk. After the feedback retry fails, the chunk is split in half and
+    each half is requested on its own, recursively, so valid halves are kept.
+    A single block that keeps failing is returned with its validation error
+    instead of a translation, so it never fails the chunk or the run.
+    """
+    failed: dict[str, str] = {}
+    translated = _request_translation_part(
+        chunk.blocks,
+        chunk_label=f"Chunk {chunk_index}/{total_chunks}",
+        first_block=1,
+        split=False,
+        provider=provider,
+        termbase_entries=termbase_entries,
+        project_instructions=project_instructions,
+        notify=notify,
+        examples=examples,
+        stream=stream,
+        failed=failed,
+    )
+    return translated, failed
+
+
+def _requested_blocks(
+    chunk: TranslationChunk,
+    *,
+    memory_matches: dict[str, TranslationMemoryMatch],
+    duplicate_of: dict[str, str],
+    carried: dict[str, TranslationSegment],
+) -> tuple[SourceBlock, ...]:
+    return tuple(
+        block
+        for block in chunk.blocks
+        if block.id not in memory_matches
+        and block.id not in duplicate_of
+        and block.id not in carried
+    )
+
+
+def _similar_examples(
+    memory: TranslationMemory | None,
+    blocks: tuple[SourceBlock, ...],
+) -> list[TranslationMemoryExample]:
+    if memory is None:
+        return []
+    return memory.examples([block.effective_text for block in blocks])
+
+
+def _translate_chunk_misses(
+    chunk: TranslationChunk,
+    *,
+    memory: TranslationMemory | None,
+    memory_matches: dict[str, TranslationMemoryMatch],
+    duplicate_of: dict[str, str],
+    carried: dict[str, TranslationSegment],
+    chunk_index: int,
+    total_chunks: int,
+    provider: TranslationProvider,
+    termbase_entries: list[dict[str, Any]],
+    project_instructions: str,
+    notify: ProgressCallback,
+    stream: bool = False,
+) -> tuple[dict[str, str], dict[str, str]]:
+    """Fill translation-memory matches locally and request only the rest.
+
+    Repeated and carried-over blocks are left out of the request and filled
+    at commit time. Approved translations of similar text are shown to the provider as
+    examples for the blocks that still need a request. Blocks that failed
+    validation on their own keep their source text and are returned with the
+    error.
+    """
+    misses = _requested_blocks(
+        chunk,
+        memory_matches=memory_matches,
+        duplicate_of=duplicate_of,
+        carried=carried,
     )
+    requested: dict[str, str] = {}
+    failed: dict[str, str] = {}
+    if misses:
+        with request_scope(item=chunk.id):
+            requested, failed = _request_translation_chunk(
+                replace(
+                    chunk,
+                    blocks=misses,
+                    character_count=_character_count(list(misses)),
+                ),
+                chunk_index=chunk_index,
+                total_chunks=total_chunks,
+                provider=provider,
+                termbase_entries=termbase_entries,
+                project_instructions=project_instructions,
+                notify=notify,
+                examples=_similar_examples(memory, misses),
+                stream=stream,
+            )
+    translated = {
+        block.id: (
+            requested[block.id]
+            if block.id in requested
+            else block.effective_text
+            if block.id in failed
+            else memory_matches[block.id].translation
+        )
+        for block in chunk.blocks
+        if block.id not in duplicate_of and block.id not in carried
+    }
+    return translated, failed
+
+
+def _kept_source_text(segment: TranslationSegment) -> bool:
+    """Whether the segment holds the source text of a block that failed validation."""
+    return (
+        segment.status == "flagged"
+        and segment.translated_text == segment.source_text
+    )
+
+
+def _kept_source_issue(block_id: str, reason: str) -> str:
+    return f"{block_id}: source text kept for review; {reason}"
 
 
 def _build_translation_segments(
     chunk: TranslationChunk,
     translated: dict[str, str],
+    failed: dict[str, str],
     *,
     provider: TranslationProvider,
     termbase_entries: list[dict[str, Any]],
     prompt_hash: str,
     termbase_hash: str,
+    memory_matches: dict[str, TranslationMemoryMatch],
+    carried: dict[str, TranslationSegment],
 ) -> tuple[list[TranslationSegment], list[str], set[str]]:
     chunk_segments: list[TranslationSegment] = []
     issue_messages: list[str] = []
     issue_block_ids: set[str] = set()
+    matcher = termbase_matcher(termbase_entries)
     for block in chunk.blocks:
-        translated_text = translated[block.id]
-        content_errors = _validate_translated_text(
-            block=block,
-            translated_text=translated_text,
-            termbase_entries=termbase_entries,
+        carried_segment = carried.get(block.id)
+        translated_text = (
+            carried_segment.translated_text
+            if carried_segment is not None
+            else translated[block.id]
+        )
+        content_errors = (
+            [_kept_source_issue(block.id, failed[block.id])]
+            if block.id in failed
+            else _validate_translated_text(
+                block=block,
+                translated_text=translated_text,
+                matcher=matcher,
+            )
         )
         if content_errors:
             issue_messages.extend(content_errors)
             issue_block_ids.add(block.id)
+        if carried_segment is not None:
+            chunk_segments.append(carried_segment)
+            continue
+        memory_match = memory_matches.get(block.id)
         segment = TranslationSegment(
             schema_version=TRANSLATION_SEGMENT_SCHEMA_VERSION,
             source_block_id=block.id,
@@ -916,9 +1757,22 @@ def _build_translation_segments(
                 translated_text.encode("utf-8")
             ),
             status="flagged" if content_errors else "translated",
-            model=provider.model_name,
+            # A reused translation keeps the model that wrote it.
+            model=(
+                memory_match.model
+                if memory_match is not None
+                else provider.model_name
+            ),
             prompt_sha256=prompt_hash,
             termbase_sha256=termbase_hash,
+            origin=(
+                "translation_memory" if memory_match is not None else "provider"
+            ),
+            origin_ref=memory_match.reference if memory_match else None,
+            relevant_terms_sha256=_relevant_terms_sha256(
+                block.effective_text,
+                matcher,
+            ),
         )
         segment.validate()
         chunk_segments.append(segment)
@@ -956,6 +1810,7 @@ def _write_partial_translation_state(
             "provider_prompt_version": provider.prompt_version,
             "hard_rules_version": TRANSLATION_HARD_RULES_VERSION,
             "max_characters": max_characters,
+            "max_tokens": inputs.max_tokens,
             "total_blocks": len(inputs.blocks),
             "total_chunks": len(inputs.chunks),
             "completed_blocks": completed_blocks,
@@ -977,6 +1832,7 @@ def _prepare_translation_execution(
     checkpoint: _TranslationCheckpoint,
     *,
     max_characters: int,
+    checkpoint_policy: _CheckpointPolicy,
 ) -> _TranslationExecution:
     existing_segments = list(checkpoint.existing_segments)
     completed = {
@@ -984,19 +1840,26 @@ def _prepare_translation_execution(
     }
     execution = _TranslationExecution(
         completed=completed,
+        carried=dict(checkpoint.carried),
         output_digest=hashlib.sha256(checkpoint.existing_output_data),
         output_bytes=len(checkpoint.existing_output_data),
         completed_chunks=0,
         validation_issue_messages=[],
         validation_issue_block_ids=set(),
+        checkpoint=checkpoint_policy,
     )
     block_by_id = {block.id: block for block in inputs.blocks}
+    matcher = termbase_matcher(inputs.termbase_entries)
     for segment in existing_segments:
         block = block_by_id[segment.source_block_id]
-        errors = _validate_translated_text(
-            block=block,
-            translated_text=segment.translated_text,
-            termbase_entries=list(inputs.termbase_entries),
+        errors = (
+            [_kept_source_issue(block.id, "it failed validation on its own")]
+            if _kept_source_text(segment)
+            else _validate_translated_text(
+                block=block,
+                translated_text=segment.translated_text,
+                matcher=matcher,
+            )
         )
         if errors:
             execution.validation_issue_messages.extend(errors)
@@ -1018,16 +1881,12 @@ def _prepare_translation_execution(
     return execution
 
 
-def _translate_pending_chunks(
-    inputs: _TranslationInputs,
-    provider: TranslationProvider,
+def _pending_translation_chunks(
+    chunks: list[TranslationChunk],
     execution: _TranslationExecution,
-    *,
-    max_characters: int,
     notify: ProgressCallback,
-) -> None:
-    chunks = list(inputs.chunks)
-    termbase_entries = list(inputs.termbase_entries)
+) -> list[tuple[int, TranslationChunk]]:
+    pending: list[tuple[int, TranslationChunk]] = []
     for chunk_index, chunk in enumerate(chunks, start=1):
         if all(block.id in execution.completed for block in chunk.blocks):
             execution.completed_chunks += 1
@@ -1039,84 +1898,396 @@ def _translate_pending_chunks(
             raise TranslationError(
                 f"Chunk {chunk.id} is only partially stored. Use --force to restart."
             )
-        notify(f"Chunk {chunk_index}/{len(chunks)}: requesting translation")
-        try:
-            translated = _request_translation_chunk(
-                chunk,
-                chunk_index=chunk_index,
-                total_chunks=len(chunks),
-                provider=provider,
-                termbase_entries=termbase_entries,
-                project_instructions=inputs.project_instructions,
-                notify=notify,
+        pending.append((chunk_index, chunk))
+    return pending
+
+
+def _translate_pending_chunks(
+    inputs: _TranslationInputs,
+    provider: TranslationProvider,
+    execution: _TranslationExecution,
+    *,
+    max_characters: int,
+    concurrency: int,
+    notify: ProgressCallback,
+    stream: bool = False,
+) -> None:
+    """Keep up to ``concurrency`` requests in flight and commit in source order.
+
+    Responses that finish early wait in the window until every earlier chunk is
+    committed, so the JSONL append order, the running output digest, and the
+    resume checkpoint are identical to a sequential run.
+    """
+    chunks = list(inputs.chunks)
+    termbase_entries = list(inputs.termbase_entries)
+    notify = _serialized_progress(notify)
+    pending = iter(_pending_translation_chunks(chunks, execution, notify))
+    in_flight: deque[
+        tuple[
+            int,
+            TranslationChunk,
+            Future[tuple[dict[str, str], dict[str, str]]],
+        ]
+    ] = deque()
+
+    def submit_next(executor: ThreadPoolExecutor) -> None:
+        item = next(pending, None)
+        if item is None:
+            return
+        chunk_index, chunk = item
+        carried = sum(block.id in execution.carried for block in chunk.blocks)
+        reused = sum(
+            block.id in inputs.memory_matches and block.id not in execution.carried
+            for block in chunk.blocks
+        )
+        repeated = sum(
+            block.id in inputs.duplicate_of and block.id not in execution.carried
+            for block in chunk.blocks
+        )
+        if carried == len(chunk.blocks):
+            notify(
+                f"Chunk {chunk_index}/{len(chunks)}: "
+                "carried over from the previous translation"
             )
-        except Exception as error:
-            output_hash = (
-                execution.output_digest.hexdigest()
-                if execution.output_bytes > 0
-                else None
+        elif reused == len(chunk.blocks):
+            notify(
+                f"Chunk {chunk_index}/{len(chunks)}: "
+                "filled from translation memory"
             )
-            _write_partial_translation_state(
+        elif repeated == len(chunk.blocks):
+            notify(
+                f"Chunk {chunk_index}/{len(chunks)}: "
+                "filled from earlier identical blocks"
+            )
+        elif reused + repeated + carried == len(chunk.blocks):
+            notify(
+                f"Chunk {chunk_index}/{len(chunks)}: "
+                "filled without a request"
+            )
+        else:
+            details = [
+                f"{count} blocks {reason}"
+                for count, reason in (
+                    (reused, "from translation memory"),
+                    (repeated, "repeat earlier source text"),
+                    (carried, "carried over"),
+                )
+                if count
+            ]
+            suffix = f" ({', '.join(details)})" if details else ""
+            notify(
+                f"Chunk {chunk_index}/{len(chunks)}: "
+                f"requesting translation{suffix}"
+            )
+        future = executor.submit(
+            contextvars.copy_context().run,
+            _translate_chunk_misses,
+            chunk,
+            memory=inputs.memory,
+            memory_matches=inputs.memory_matches,
+            duplicate_of=inputs.duplicate_of,
+            carried=execution.carried,
+            chunk_index=chunk_index,
+            total_chunks=len(chunks),
+            provider=provider,
+            termbase_entries=termbase_entries,
+            project_instructions=inputs.project_instructions,
+            notify=notify,
+            stream=stream,
+        )
+        in_flight.append((chunk_index, chunk, future))
+
+    with ThreadPoolExecutor(
+        max_workers=concurrency,
+        thread_name_prefix="glk-translate",
+    ) as executor:
+        for _ in range(concurrency):
+            submit_next(executor)
+        while in_flight:
+            _chunk_index, chunk, future = in_flight.popleft()
+            try:
+                translated, failed = future.result()
+            except Exception as error:
+                for _index, _chunk, waiting in in_flight:
+                    waiting.cancel()
+                _record_failed_translation_chunk(
+                    inputs,
+                    provider,
+                    execution,
+                    chunk,
+                    error,
+                    max_characters=max_characters,
+                )
+                raise TranslationError(
+                    f"Translation failed for {chunk.id}. Completed chunks were "
+                    f"preserved; fix the issue and use --resume. Cause: {error}"
+                ) from error
+            submit_next(executor)
+            _commit_translated_chunk(
                 inputs,
                 provider,
+                execution,
+                chunk,
+                translated,
+                failed,
                 max_characters=max_characters,
-                completed_blocks=len(execution.completed),
-                completed_chunks=execution.completed_chunks,
-                output_hash=output_hash,
-                output_bytes=execution.output_bytes,
-                failed_chunk=chunk.id,
-                failure_reason=str(error),
-                validation_issue_count=len(
-                    execution.validation_issue_messages
-                ),
-                validation_issue_blocks=len(
-                    execution.validation_issue_block_ids
-                ),
             )
-            raise TranslationError(
-                f"Translation failed for {chunk.id}. Completed chunks were preserved; "
-                f"fix the issue and use --resume. Cause: {error}"
-            ) from error
+    if execution.unsynced_chunks:
+        _write_translation_checkpoint(
+            inputs,
+            provider,
+            execution,
+            max_characters=max_characters,
+        )
 
-        chunk_segments, issue_messages, issue_block_ids = (
-            _build_translation_segments(
-                chunk,
-                translated,
-                provider=provider,
+
+class _BatchAnsweredTranslationProvider:
+    """Answer each prompt of a finished batch job once, then ask the live provider.
+
+    Validation retries add feedback to the prompt, which the batch never saw,
+    so they go to the live provider together with requests the batch failed.
+    """
+
+    def __init__(
+        self,
+        provider: TranslationProvider,
+        responses: dict[str, dict[str, Any]],
+    ) -> None:
+        self.provider = provider
+        self.model_name = provider.model_name
+        self.prompt_version = provider.prompt_version
+        self.token_usage = getattr(provider, "token_usage", None)
+        self.concurrency_limit = getattr(provider, "concurrency_limit", None)
+        self._responses = responses
+        self._lock = threading.Lock()
+
+    def translate(self, prompt: str) -> dict[str, Any]:
+        with self._lock:
+            response = self._responses.pop(
+                _sha256_bytes(prompt.encode("utf-8")),
+                None,
+            )
+        if response is None:
+            return self.provider.translate(prompt)
+        return response
+
+
+def _collect_batch_translations(
+    inputs: _TranslationInputs,
+    provider: TranslationProvider,
+    execution: _TranslationExecution,
+    *,
+    poll_seconds: float,
+    notify: ProgressCallback,
+) -> TranslationProvider:
+    """Send the first prompt of every pending chunk as one provider batch job.
+
+    The returned provider feeds those responses through the interactive
+    validation, commit, and checkpoint path in source order.
+    """
+    if not (
+        callable(getattr(provider, "submit_translation_batch", None))
+        and callable(getattr(provider, "translation_batch_results", None))
+    ):
+        raise TranslationError(
+            "The configured translation provider does not support batch requests."
+        )
+    batch_provider = cast(BatchTranslationProvider, provider)
+    termbase_entries = list(inputs.termbase_entries)
+    prompts: dict[str, str] = {}
+    for chunk in inputs.chunks:
+        if any(block.id in execution.completed for block in chunk.blocks):
+            continue
+        misses = _requested_blocks(
+            chunk,
+            memory_matches=inputs.memory_matches,
+            duplicate_of=inputs.duplicate_of,
+            carried=execution.carried,
+        )
+        if misses:
+            prompts[chunk.id] = compile_translation_prompt(
+                blocks=misses,
                 termbase_entries=termbase_entries,
-                prompt_hash=inputs.prompt_hash,
-                termbase_hash=inputs.termbase_hash,
+                project_instructions=inputs.project_instructions,
+                examples=_similar_examples(inputs.memory, misses),
             )
+    if not prompts:
+        return provider
+    answered = _run_batch_job(
+        job_path=inputs.paths.translation_batch_job,
+        requests_path=inputs.paths.translation_batch_requests,
+        requests=[
+            {"key": key, "prompt": prompt} for key, prompt in prompts.items()
+        ],
+        identity={
+            "model": provider.model_name,
+            "prompt_version": provider.prompt_version,
+        },
+        submit=lambda: batch_provider.submit_translation_batch(prompts),
+        results=batch_provider.translation_batch_results,
+        poll_seconds=poll_seconds,
+        notify=notify,
+    )
+    responses = {
+        _sha256_bytes(prompts[key].encode("utf-8")): response
+        for key, response in answered.items()
+        if key in prompts and response is not None
+    }
+    if len(responses) < len(prompts):
+        notify(
+            f"{len(prompts) - len(responses)} chunks were not answered by the "
+            "batch job and will be requested interactively"
         )
-        execution.validation_issue_messages.extend(issue_messages)
-        execution.validation_issue_block_ids.update(issue_block_ids)
-        for segment in chunk_segments:
-            execution.completed[segment.source_block_id] = segment
-        execution.completed_chunks += 1
-        chunk_data = _serialize_segments(chunk_segments)
-        if execution.output_bytes:
-            _append_bytes_durable(inputs.paths.translation_segments, chunk_data)
-        else:
-            _write_bytes_atomic(inputs.paths.translation_segments, chunk_data)
-        execution.output_digest.update(chunk_data)
-        execution.output_bytes += len(chunk_data)
-        _write_partial_translation_state(
+    return _BatchAnsweredTranslationProvider(provider, responses)
+
+
+def _record_failed_translation_chunk(
+    inputs: _TranslationInputs,
+    provider: TranslationProvider,
+    execution: _TranslationExecution,
+    chunk: TranslationChunk,
+    error: Exception,
+    *,
+    max_characters: int,
+) -> None:
+    _write_translation_checkpoint(
+        inputs,
+        provider,
+        execution,
+        max_characters=max_characters,
+        failed_chunk=chunk.id,
+        failure_reason=str(error),
+    )
+
+
+def _committed_translation(
+    block_id: str,
+    translated: dict[str, str],
+    execution: _TranslationExecution,
+) -> str:
+    if block_id in translated:
+        return translated[block_id]
+    if block_id in execution.carried:
+        return execution.carried[block_id].translated_text
+    return execution.completed[block_id].translated_text
+
+
+def _commit_translated_chunk(
+    inputs: _TranslationInputs,
+    provider: TranslationProvider,
+    execution: _TranslationExecution,
+    chunk: TranslationChunk,
+    translated: dict[str, str],
+    failed: dict[str, str],
+    *,
+    max_characters: int,
+) -> None:
+    # The first block of a repeated text is earlier in source order, so it is
+    # either in this chunk or already committed.
+    failed = dict(failed)
+    for block in chunk.blocks:
+        original = inputs.duplicate_of.get(block.id)
+        if original is None or block.id in execution.carried:
+            continue
+        committed = execution.carried.get(original) or execution.completed.get(
+            original
+        )
+        if original in failed or (
+            committed is not None and _kept_source_text(committed)
+        ):
+            failed[block.id] = f"repeats {original}, which failed validation"
+    translated = {
+        block.id: (
+            translated[block.id]
+            if block.id not in inputs.duplicate_of
+            else _committed_translation(
+                inputs.duplicate_of[block.id], translated, execution
+            )
+        )
+        for block in chunk.blocks
+        if block.id not in execution.carried
+    }
+    chunk_segments, issue_messages, issue_block_ids = (
+        _build_translation_segments(
+            chunk,
+            translated,
+            failed,
+            provider=provider,
+            termbase_entries=list(inputs.termbase_entries),
+            prompt_hash=inputs.prompt_hash,
+            termbase_hash=inputs.termbase_hash,
+            memory_matches=inputs.memory_matches,
+            carried=execution.carried,
+        )
+    )
+    execution.validation_issue_messages.extend(issue_messages)
+    execution.validation_issue_block_ids.update(issue_block_ids)
+    for segment in chunk_segments:
+        execution.completed[segment.source_block_id] = segment
+    execution.completed_chunks += 1
+    chunk_data = _serialize_segments(chunk_segments)
+    policy = execution.checkpoint
+    # The first chunk always commits so the state identifies this run's output.
+    commit = (
+        not execution.output_bytes
+        or execution.unsynced_chunks + 1 >= policy.chunks
+        or (
+            policy.interval_ms is not None
+            and (time.monotonic() - execution.last_checkpoint) * 1000
+            >= policy.interval_ms
+        )
+    )
+    if not execution.output_bytes:
+        _write_bytes_atomic(inputs.paths.translation_segments, chunk_data)
+    elif commit and not execution.unsynced_chunks:
+        _append_bytes_durable(inputs.paths.translation_segments, chunk_data)
+    else:
+        _append_bytes(inputs.paths.translation_segments, chunk_data)
+        execution.unsynced_chunks += 1
+    execution.output_digest.update(chunk_data)
+    execution.output_bytes += len(chunk_data)
+    if commit:
+        _write_translation_checkpoint(
             inputs,
             provider,
+            execution,
             max_characters=max_characters,
-            completed_blocks=len(execution.completed),
-            completed_chunks=execution.completed_chunks,
-            output_hash=execution.output_digest.hexdigest(),
-            output_bytes=execution.output_bytes,
-            failed_chunk=None,
-            failure_reason=None,
-            validation_issue_count=len(execution.validation_issue_messages),
-            validation_issue_blocks=len(
-                execution.validation_issue_block_ids
-            ),
         )
 
 
+def _write_translation_checkpoint(
+    inputs: _TranslationInputs,
+    provider: TranslationProvider,
+    execution: _TranslationExecution,
+    *,
+    max_characters: int,
+    failed_chunk: str | None = None,
+    failure_reason: str | None = None,
+) -> None:
+    """Make every appended chunk durable, then record it in the run state."""
+    if execution.unsynced_chunks:
+        _fsync_file(inputs.paths.translation_segments)
+    execution.unsynced_chunks = 0
+    execution.last_checkpoint = time.monotonic()
+    _write_partial_translation_state(
+        inputs,
+        provider,
+        max_characters=max_characters,
+        completed_blocks=len(execution.completed),
+        completed_chunks=execution.completed_chunks,
+        output_hash=(
+            execution.output_digest.hexdigest()
+            if execution.output_bytes > 0
+            else None
+        ),
+        output_bytes=execution.output_bytes,
+        failed_chunk=failed_chunk,
+        failure_reason=failure_reason,
+        validation_issue_count=len(execution.validation_issue_messages),
+        validation_issue_blocks=len(execution.validation_issue_block_ids),
+    )
+
+
 def _finalize_translation_run(
     inputs: _TranslationInputs,
     prompt_path: Path,
@@ -1130,6 +2301,7 @@ def _finalize_translation_run(
     output_bytes: int,
     validation_issue_messages: list[str],
     validation_issue_block_ids: set[str],
+    carried_blocks: int = 0,
 ) -> TranslationRunResult:
     paths = inputs.paths
     ordered_segments = sorted(
@@ -1153,6 +2325,7 @@ def _finalize_translation_run(
         raise TranslationError(
             "Translation checkpoint does not match completed segments."
         )
+    token_usage = _provider_token_usage(provider)
     review_data = _render_translation_review(ordered_segments)
     draft_hash = _sha256_bytes(review_data)
     _write_bytes_atomic(paths.translation_draft, review_data)
@@ -1187,6 +2360,7 @@ def _finalize_translation_run(
             "model": provider.model_name,
             "provider_prompt_version": provider.prompt_version,
             "max_characters": max_characters,
+            "max_tokens": inputs.max_tokens,
             "total_blocks": len(inputs.blocks),
             "total_chunks": len(inputs.chunks),
             "completed_blocks": len(ordered_segments),
@@ -1205,9 +2379,16 @@ def _finalize_translation_run(
             "failure_reason": None,
             "validation_issue_count": len(validation_issue_messages),
             "validation_issue_blocks": len(validation_issue_block_ids),
+            "translation_memory_blocks": _memory_block_count(ordered_segments),
+            "duplicate_blocks": len(inputs.duplicate_of),
+            "dedup_ratio": _dedup_ratio(inputs),
+            "carried_over_blocks": carried_blocks,
+            "token_usage": token_usage,
+            "concurrency": _provider_concurrency(provider),
             "updated_at": _utc_now(),
         },
     )
+    paths.translation_carry_over.unlink(missing_ok=True)
     return TranslationRunResult(
         project_path=str(inputs.project_path),
         model=provider.model_name,
@@ -1228,6 +2409,11 @@ def _finalize_translation_run(
         validation_issue_blocks=len(validation_issue_block_ids),
         resumed=resumed,
         review_created=review_created,
+        memory_blocks=_memory_block_count(ordered_segments),
+        duplicate_blocks=len(inputs.duplicate_of),
+        carried_blocks=carried_blocks,
+        input_tokens=token_usage.get("input_tokens", 0),
+        cached_input_tokens=token_usage.get("cached_input_tokens", 0),
     )
 
 
@@ -1239,12 +2425,41 @@ def translate_project(
     prompt_file: str | Path | None = None,
     model_name: str | None = None,
     max_characters: int = 10000,
+    max_tokens: int | None = None,
+    concurrency: int = DEFAULT_TRANSLATION_CONCURRENCY,
+    translation_memory: bool = True,
     resume: bool = False,
     force: bool = False,
+    incremental: bool = False,
+    checkpoint_chunks: int = 1,
+    checkpoint_interval_ms: int | None = None,
+    batch: bool = False,
+    batch_poll_seconds: float = DEFAULT_BATCH_POLL_SECONDS,
+    stream: bool = False,
     dry_run: bool = False,
     provider: TranslationProvider | None = None,
     progress: ProgressCallback | None = None,
 ) -> TranslationRunResult:
+    if incremental and force:
+        raise TranslationError("incremental cannot be combined with force.")
+    if batch and stream:
+        raise TranslationError("batch cannot be combined with stream.")
+    if batch_poll_seconds < 0:
+        raise TranslationError("batch poll interval must not be negative.")
+    checkpoint_policy = _CheckpointPolicy(checkpoint_chunks, checkpoint_interval_ms)
+    checkpoint_policy.validate()
+    if (
+        not isinstance(concurrency, int)
+        or isinstance(concurrency, bool)
+        or concurrency < 1
+    ):
+        raise TranslationError("concurrency must be a positive integer.")
+    if max_tokens is not None and (
+        not isinstance(max_tokens, int)
+        or isinstance(max_tokens, bool)
+        or max_tokens < 1
+    ):
+        raise TranslationError("max_tokens must be a positive integer.")
     notify = progress or (lambda _: None)
     inputs = _prepare_translation_inputs(
         project=project,
@@ -1253,6 +2468,9 @@ def translate_project(
         prompt_file=prompt_file,
         model_name=model_name,
         max_characters=max_characters,
+        max_tokens=max_tokens,
+        translation_memory=translation_memory,
+        dry_run=dry_run,
         provider=provider,
     )
     if dry_run:
@@ -1263,6 +2481,7 @@ def translate_project(
         canonical_prompt_path,
         resume=resume,
         force=force,
+        incremental=incremental,
     )
     if isinstance(restored, TranslationRunResult):
         return restored
@@ -1270,21 +2489,43 @@ def translate_project(
         model_name,
         settings_root=settings_root,
     )
+    if stream and not callable(getattr(active_provider, "translate_stream", None)):
+        raise TranslationError(
+            "The configured translation provider does not support streamed responses."
+        )
     execution = _prepare_translation_execution(
         inputs,
         active_provider,
         restored,
         max_characters=max_characters,
+        checkpoint_policy=checkpoint_policy,
     )
-    _translate_pending_chunks(
-        inputs,
-        active_provider,
-        execution,
-        max_characters=max_characters,
-        notify=notify,
-    )
+    if batch:
+        active_provider = _collect_batch_translations(
+            inputs,
+            active_provider,
+            execution,
+            poll_seconds=batch_poll_seconds,
+            notify=notify,
+        )
+    with request_scope(
+        stage="translation",
+        observer=usage_ledger_observer(inputs.paths),
+    ), use_response_cache(
+        workspace_response_cache(inputs.paths.root, settings_root),
+        refresh=force,
+    ):
+        _translate_pending_chunks(
+            inputs,
+            active_provider,
+            execution,
+            max_characters=max_characters,
+            concurrency=concurrency,
+            notify=notify,
+            stream=stream,
+        )
 
-    return _finalize_translation_run(
+    result = _finalize_translation_run(
         inputs,
         canonical_prompt_path,
         active_provider,
@@ -1296,4 +2537,11 @@ def translate_project(
         output_bytes=execution.output_bytes,
         validation_issue_messages=execution.validation_issue_messages,
         validation_issue_block_ids=execution.validation_issue_block_ids,
+        carried_blocks=len(execution.carried),
     )
+    if batch:
+        _clear_batch_job(
+            inputs.paths.translation_batch_job,
+            inputs.paths.translation_batch_requests,
+        )
+    return result
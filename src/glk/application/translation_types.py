@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from typing import Any, Protocol
 
 
@@ -27,3 +28,33 @@ class TranslationProvider(Protocol):
     prompt_version: str
 
     def translate(self, prompt: str) -> dict[str, Any]: ...
+
+
+class AsyncTranslationProvider(TranslationProvider, Protocol):
+    """Translation provider that can also be awaited from one event loop."""
+
+    async def translate_async(self, prompt: str) -> dict[str, Any]: ...
+
+
+class StreamingTranslationProvider(TranslationProvider, Protocol):
+    """Translation provider that yields each ``{"id", "text"}`` item once complete.
+
+    The iterator raises when the stream breaks; items already yielded stay valid.
+    """
+
+    def translate_stream(self, prompt: str) -> Iterator[dict[str, Any]]: ...
+
+
+class BatchTranslationProvider(TranslationProvider, Protocol):
+    """Translation provider that can submit many prompts as one offline batch job.
+
+    ``translation_batch_results`` returns None while the job runs. A finished
+    job maps every key it answered to a response, or to None when that
+    request failed.
+    """
+
+    def submit_translation_batch(self, prompts: Mapping[str, str]) -> str: ...
+
+    def translation_batch_results(
+        self, job_id: str
+    ) -> dict[str, dict[str, Any] | None] | None: ...
@@ -0,0 +1,298 @@
+"""Append provider request telemetry and summarize it per pipeline stage."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+import json
+from pathlib import Path
+import threading
+from typing import Any
+
+from glk.application.ai_model_catalog import ModelPrice, load_model_prices
+from glk.application.project_service import load_project
+from glk.domain.workspace import WorkspacePaths
+from glk.infrastructure.usage_telemetry import UsageObserver
+
+
+USAGE_LEDGER_SCHEMA_VERSION = 1
+# Stages in pipeline order; unknown stages from newer versions sort last.
+USAGE_STAGES = ("layout", "ocr", "translation", "translation_retry")
+
+_ledger_locks: dict[Path, threading.Lock] = {}
+_ledger_locks_guard = threading.Lock()
+
+
+def _ledger_lock(path: Path) -> threading.Lock:
+    with _ledger_locks_guard:
+        return _ledger_locks.setdefault(path.resolve(), threading.Lock())
+
+
+def usage_ledger_observer(paths: WorkspacePaths) -> UsageObserver:
+    """Return an observer that appends one JSON line per provider request.
+
+    Each record is written with a single append, so concurrent threads and
+    processes do not interleave lines. A ledger that cannot be written must
+    not fail the request it describes, so write errors are ignored.
+    """
+    path = paths.usage_ledger
+    lock = _ledger_lock(path)
+
+    def observe(record: dict[str, Any]) -> None:
+        line = json.dumps(
+            {"schema_version": USAGE_LEDGER_SCHEMA_VERSION, **record},
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        with lock:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with path.open("a", encoding="utf-8") as file:
+                    file.write(line + "\n")
+            except OSError:
+                return
+
+    return observe
+
+
+def read_usage_ledger(path: Path) -> tuple[list[dict[str, Any]], int]:
+    """Return valid ledger records and the number of unreadable lines."""
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return [], 0
+    records: list[dict[str, Any]] = []
+    skipped = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            skipped += 1
+            continue
+        if (
+            not isinstance(record, dict)
+            or record.get("schema_version") != USAGE_LEDGER_SCHEMA_VERSION
+            or not isinstance(record.get("stage"), str)
+        ):
+            skipped += 1
+            continue
+        records.append(record)
+    return records, skipped
+
+
+def _number(value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return 0.0
+    return float(value)
+
+
+def _interval(record: dict[str, Any]) -> tuple[datetime, datetime] | None:
+    try:
+        finished = datetime.fromisoformat(str(record["finished_at"]))
+    except (KeyError, ValueError):
+        return None
+    return finished - timedelta(seconds=_number(record.get("wall_seconds"))), finished
+
+
+def _active_seconds(intervals: list[tuple[datetime, datetime]]) -> float:
+    """Return the time at least one request was in flight.
+
+    Overlapping requests count once, so parallel chunks are not double
+    counted and idle time between runs is left out.
+    """
+    total = 0.0
+    current: tuple[datetime, datetime] | None = None
+    for start, end in sorted(intervals):
+        if current is None or start > current[1]:
+            if current is not None:
+                total += (current[1] - current[0]).total_seconds()
+            current = (start, end)
+        elif end > current[1]:
+            current = (current[0], end)
+    if current is not None:
+        total += (current[1] - current[0]).total_seconds()
+    return total
+
+
+def _request_cost(
+    record: dict[str, Any],
+    prices: dict[str, ModelPrice],
+) -> float | None:
+    # Cached input is charged at the full input price, so estimates are an
+    # upper bound for prompts that hit the provider cache.
+    price = prices.get(str(record.get("model")))
+    if price is None:
+        return None
+    return (
+        _number(record.get("input_tokens")) * price["input_per_million_tokens"]
+        + _number(record.get("output_tokens")) * price["output_per_million_tokens"]
+    ) / 1_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class StageUsage:
+    stage: str
+    requests: int
+    failed_requests: int
+    attempts: int
+    hedges: int
+    hedge_wins: int
+    blocks: int
+    input_tokens: int
+    cached_input_tokens: int
+    output_tokens: int
+    wall_seconds: float
+    active_seconds: float
+    blocks_per_minute: float | None
+    tokens_per_second: float | None
+    estimated_cost_usd: float | None
+    unpriced_requests: int
+    models: tuple[str, ...]
+    failure_codes: dict[str, int]
+
+    def to_dict(self) -> dict[str, Any]:
+        value = asdict(self)
+        value["models"] = list(self.models)
+        return value
+
+
+def summarize_usage(
+    records: list[dict[str, Any]],
+    *,
+    prices: dict[str, ModelPrice] | None = None,
+) -> list[StageUsage]:
+    """Aggregate ledger records into per-stage throughput and cost."""
+    model_prices = load_model_prices() if prices is None else prices
+    grouped: dict[str, list[dict[str, Any]]] = {}
+    for record in records:
+        grouped.setdefault(record["stage"], []).append(record)
+
+    def order(stage: str) -> tuple[int, str]:
+        if stage in USAGE_STAGES:
+            return USAGE_STAGES.index(stage), stage
+        return len(USAGE_STAGES), stage
+
+    summaries: list[StageUsage] = []
+    for stage in sorted(grouped, key=order):
+        stage_records = grouped[stage]
+        succeeded = [
+            record for record in stage_records if record.get("failure_code") is None
+        ]
+        failure_codes: dict[str, int] = {}
+        for record in stage_records:
+            code = record.get("failure_code")
+            if code is not None:
+                failure_codes[str(code)] = failure_codes.get(str(code), 0) + 1
+        intervals = [
+            interval
+            for record in stage_records
+            if (interval := _interval(record)) is not None
+        ]
+        active = _active_seconds(intervals)
+        blocks = int(sum(_number(record.get("blocks")) for record in succeeded))
+        input_tokens = int(
+            sum(_number(record.get("input_tokens")) for record in stage_records)
+        )
+        output_tokens = int(
+            sum(_number(record.get("output_tokens")) for record in stage_records)
+        )
+        costs = [_request_cost(record, model_prices) for record in stage_records]
+        priced = [cost for cost in costs if cost is not None]
+        summaries.append(
+            StageUsage(
+                stage=stage,
+                requests=len(stage_records),
+                failed_requests=len(stage_records) - len(succeeded),
+                attempts=int(
+                    sum(_number(record.get("attempts")) for record in stage_records)
+                ),
+                hedges=int(
+                    sum(_number(record.get("hedges")) for record in stage_records)
+                ),
+                hedge_wins=int(
+                    sum(_number(record.get("hedge_wins")) for record in stage_records)
+                ),
+                blocks=blocks,
+                input_tokens=input_tokens,
+                cached_input_tokens=int(
+                    sum(
+                        _number(record.get("cached_input_tokens"))
+                        for record in stage_records
+                    )
+                ),
+                output_tokens=output_tokens,
+                wall_seconds=round(
+                    sum(_number(record.get("wall_seconds")) for record in stage_records),
+                    3,
+                ),
+                active_seconds=round(active, 3),
+                blocks_per_minute=(
+                    round(blocks * 60 / active, 2) if active > 0 else None
+                ),
+                tokens_per_second=(
+                    round((input_tokens + output_tokens) / active, 2)
+                    if active > 0
+                    else None
+                ),
+                estimated_cost_usd=round(sum(priced), 6) if priced else None,
+                unpriced_requests=len(costs) - len(priced),
+                models=tuple(
+                    sorted({str(record.get("model")) for record in stage_records})
+                ),
+                failure_codes=failure_codes,
+            )
+        )
+    return summaries
+
+
+@dataclass(frozen=True, slots=True)
+class UsageReport:
+    project_path: str
+    ledger_file: str
+    stages: tuple[StageUsage, ...]
+    skipped_records: int
+
+    @property
+    def requests(self) -> int:
+        return sum(stage.requests for stage in self.stages)
+
+    @property
+    def estimated_cost_usd(self) -> float | None:
+        costs = [
+            stage.estimated_cost_usd
+            for stage in self.stages
+            if stage.estimated_cost_usd is not None
+        ]
+        return round(sum(costs), 6) if costs else None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "project_path": self.project_path,
+            "ledger_file": self.ledger_file,
+            "requests": self.requests,
+            "estimated_cost_usd": self.estimated_cost_usd,
+            "skipped_records": self.skipped_records,
+            "stages": [stage.to_dict() for stage in self.stages],
+        }
+
+
+def project_usage_report(project_path: Path) -> UsageReport:
+    paths = WorkspacePaths(project_path)
+    records, skipped = read_usage_ledger(paths.usage_ledger)
+    return UsageReport(
+        project_path=str(project_path),
+        ledger_file=paths.relative(paths.usage_ledger),
+        stages=tuple(summarize_usage(records)),
+        skipped_records=skipped,
+    )
+
+
+def get_project_usage(
+    project: str | Path,
+    workspace_root: str | Path = "workspaces",
+) -> UsageReport:
+    """Summarize the request ledger of one project."""
+    location = load_project(project, workspace_root)
+    return project_usage_report(location.path)
@@ -9,7 +9,12 @@ import sys
 from collections.abc import Sequence
 
 from glk import __version__
-from glk.application.extraction_service import ExtractionError, extract_project_pdf
+from glk.application.extraction_service import (
+    DEFAULT_LAYOUT_PACK_SIZE,
+    DEFAULT_LOCAL_LAYOUT_THRESHOLD,
+    ExtractionError,
+    extract_project_pdf,
+)
 from glk.application.image_ocr_service import (
     IMAGE_EXTENSIONS,
     ImageOcrError,
@@ -37,13 +42,17 @@ from glk.application.source_review_service import (
 from glk.application.source_qa_service import SourceQaError, run_project_source_qa
 from glk.application.translation_service import translate_project
 from glk.application.translation_types import TranslationError
-from glk.application.translation_retry_service import retry_failed_translations
+from glk.application.translation_retry_service import (
+    DEFAULT_RETRY_CONCURRENCY,
+    retry_failed_translations,
+)
 from glk.application.translation_review_service import (
     TranslationReviewError,
     finalize_project_translation_review,
     prepare_project_translation_review,
     run_project_translation_qa,
 )
+from glk.application.usage_service import get_project_usage
 from glk.domain.project import ProjectError
 from glk.domain.workspace import IMAGE_SOURCE_ROOT, WorkspacePaths, is_pdf_source_file
 from glk.error_response import make_error_response
@@ -182,6 +191,75 @@ def _run_status(args: argparse.Namespace) -> int:
     return 0 if status["ok"] else EXIT_ERROR
 
 
+def _format_rate(value: float | None) -> str:
+    return "-" if value is None else f"{value:g}"
+
+
+def _format_cost(value: float | None) -> str:
+    return "-" if value is None else f"${value:.4f}"
+
+
+def _run_usage(args: argparse.Namespace) -> int:
+    try:
+        report = get_project_usage(args.project, args.workspace_root)
+    except (ProjectError, OSError, UnicodeDecodeError) as error:
+        return _print_error(args, "USAGE_REPORT_FAILED", str(error))
+
+    if args.json:
+        print(json.dumps(report.to_dict(), ensure_ascii=False))
+        return 0
+    print(f"Ledger: {report.ledger_file}")
+    if not report.stages:
+        print("No provider requests recorded.")
+        return 0
+    headers = (
+        "STAGE",
+        "REQUESTS",
+        "FAILED",
+        "ATTEMPTS",
+        "HEDGE WINS",
+        "BLOCKS",
+        "INPUT",
+        "CACHED",
+        "OUTPUT",
+        "BLOCKS/MIN",
+        "TOKENS/S",
+        "COST",
+    )
+    rows = [
+        (
+            stage.stage,
+            str(stage.requests),
+            str(stage.failed_requests),
+            str(stage.attempts),
+            f"{stage.hedge_wins}/{stage.hedges}",
+            str(stage.blocks),
+            str(stage.input_tokens),
+            str(stage.cached_input_tokens),
+            str(stage.output_tokens),
+            _format_rate(stage.blocks_per_minute),
+            _format_rate(stage.tokens_per_second),
+            _format_cost(stage.estimated_cost_usd),
+        )
+        for stage in report.stages
+    ]
+    widths = [
+        max(len(headers[index]), *(len(row[index]) for row in rows))
+        for index in range(len(headers))
+    ]
+    print("  ".join(value.ljust(widths[index]) for index, value in enumerate(headers)))
+    print("  ".join("-" * width for width in widths))
+    for row in rows:
+        print("  ".join(value.ljust(widths[index]) for index, value in enumerate(row)))
+    print(f"Estimated cost: {_format_cost(report.estimated_cost_usd)}")
+    unpriced = sum(stage.unpriced_requests for stage in report.stages)
+    if unpriced:
+        print(f"Requests without a known model price: {unpriced}")
+    if report.skipped_records:
+        print(f"Unreadable ledger lines skipped: {report.skipped_records}")
+    return 0
+
+
 def _run_projects(args: argparse.Namespace) -> int:
     try:
         result = list_projects(args.workspace_root)
@@ -238,6 +316,13 @@ def _run_extract(args: argparse.Namespace) -> int:
             model_name=args.model,
             scale=args.scale,
             force=args.force,
+            replace_source=args.replace_source,
+            concurrency=args.concurrency,
+            local_layout_threshold=(
+                None if args.no_local_layout else args.local_layout_threshold
+            ),
+            layout_pack_size=args.pack_pages,
+            batch=args.batch,
             dry_run=args.dry_run,
             progress=lambda message: print(message, file=sys.stderr),
         )
@@ -264,6 +349,12 @@ def _run_extract(args: argparse.Namespace) -> int:
         )
         if result.cached_pages:
             print(f"Reused cache: {len(result.cached_pages)} pages")
+        if result.local_pages:
+            print(f"Ordered locally without AI: {len(result.local_pages)} pages")
+        if result.packed_pages:
+            print(
+                f"Answered by shared layout requests: {len(result.packed_pages)} pages"
+            )
         for failure in result.failures:
             print(f"Page {failure.page} failed: {failure.error}", file=sys.stderr)
     return 0 if result.ok else EXIT_PARTIAL
@@ -641,6 +732,12 @@ def _run_segment(args: argparse.Namespace) -> int:
     if not args.json and not result.dry_run and result.review_file:
         if result.review_created:
             print(f"Editable review TXT: {result.review_file}")
+        elif result.review_carried_forward:
+            print(
+                "Carried review edits forward; reset "
+                f"{len(result.review_refreshed_groups)} changed pages or images "
+                "from the new extraction"
+            )
         elif result.review_status == "stale":
             print(
                 "Review TXT was preserved but is stale; compare it with the new draft "
@@ -699,6 +796,12 @@ def _run_review_prepare(args: argparse.Namespace) -> int:
         )
     elif result.review_created:
         print(f"Prepared editable review TXT at {result.review_file}")
+    elif result.carried_forward:
+        print(
+            f"Carried review edits forward at {result.review_file}; reset "
+            f"{len(result.refreshed_groups)} changed pages or images "
+            "from the new extraction"
+        )
     else:
         print(f"Preserved existing review TXT at {result.review_file}")
         if result.review_status == "stale":
@@ -833,8 +936,16 @@ def _run_translate(args: argparse.Namespace) -> int:
             prompt_file=args.prompt,
             model_name=args.model,
             max_characters=args.max_characters,
+            max_tokens=args.max_tokens,
+            concurrency=args.concurrency,
+            translation_memory=not args.no_translation_memory,
             resume=args.resume,
             force=args.force,
+            incremental=args.incremental,
+            checkpoint_chunks=args.checkpoint_every,
+            checkpoint_interval_ms=args.checkpoint_ms,
+            batch=args.batch,
+            stream=args.stream,
             dry_run=args.dry_run,
             progress=lambda message: print(message, file=sys.stderr),
         )
@@ -855,6 +966,24 @@ def _run_translate(args: argparse.Namespace) -> int:
             f"Would translate {result.total_blocks} blocks in "
             f"{result.total_chunks} chunks with {result.model}"
         )
+        if result.memory_blocks:
+            print(
+                f"{result.memory_blocks} blocks match approved translations "
+                "in other projects and will not be sent"
+            )
+        if result.duplicate_blocks:
+            print(
+                f"{result.duplicate_blocks} blocks repeat earlier source text "
+                "and will reuse its translation"
+            )
+        budget = (
+            f" of {result.max_tokens}" if result.max_tokens is not None else ""
+        )
+        for index, tokens in enumerate(result.estimated_chunk_tokens, start=1):
+            print(
+                f"Chunk {index}/{result.total_chunks}: "
+                f"~{tokens}{budget} estimated tokens"
+            )
     elif result.cached:
         print(
             f"Translation is current for {result.completed_blocks} blocks at "
@@ -866,6 +995,16 @@ def _run_translate(args: argparse.Namespace) -> int:
             f"{action} {result.completed_blocks} blocks in "
             f"{result.completed_chunks} chunks to {result.output_file}"
         )
+        if result.carried_blocks:
+            print(
+                f"Carried over {result.carried_blocks} unchanged blocks "
+                "from the previous translation"
+            )
+        if result.input_tokens:
+            print(
+                f"Prompt cache: {result.cached_input_tokens} of "
+                f"{result.input_tokens} input tokens were cached"
+            )
         print(f"Draft: {result.draft_file}")
         print(f"Review: {result.review_file} ({result.review_status})")
     return 0
@@ -1012,6 +1151,7 @@ def _run_retry(args: argparse.Namespace) -> int:
             workspace_root=args.workspace_root,
             model_name=args.model,
             dry_run=args.dry_run,
+            concurrency=args.concurrency,
             progress=lambda message: print(message, file=sys.stderr),
         )
     except (
@@ -1134,6 +1274,39 @@ def build_parser() -> argparse.ArgumentParser:
     extract_parser.add_argument("--pages", help="1-based page selection, e.g. 1,3-5")
     extract_parser.add_argument("--model", help="Gemini model override")
     extract_parser.add_argument("--scale", type=float, default=1.5, help="Page render scale")
+    extract_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Pages to render and request in parallel; results are saved in page order",
+    )
+    extract_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit uncached pages as one provider batch job and wait for it",
+    )
+    extract_parser.add_argument(
+        "--local-layout-threshold",
+        type=float,
+        default=DEFAULT_LOCAL_LAYOUT_THRESHOLD,
+        help="Minimum confidence (0-1) for ordering a page locally instead of by AI",
+    )
+    extract_parser.add_argument(
+        "--pack-pages",
+        type=int,
+        default=DEFAULT_LAYOUT_PACK_SIZE,
+        help="Short pages to send together in one layout request; 1 sends each page alone",
+    )
+    extract_parser.add_argument(
+        "--no-local-layout",
+        action="store_true",
+        help="Send every uncached page to the AI layout model",
+    )
+    extract_parser.add_argument(
+        "--replace-source",
+        action="store_true",
+        help="Register a revised PDF and reprocess only the pages whose content changed",
+    )
     extract_parser.add_argument(
         "--workspace-root", default="workspaces", help="Parent directory for project workspaces"
     )
@@ -1226,7 +1399,52 @@ def build_parser() -> argparse.ArgumentParser:
         default=10000,
         help="Maximum source characters per translation chunk",
     )
+    translate_parser.add_argument(
+        "--max-tokens",
+        type=int,
+        help=(
+            "Pack chunks by estimated prompt and response tokens instead of "
+            "--max-characters"
+        ),
+    )
+    translate_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Translation chunks to request in parallel; results are saved in order",
+    )
+    translate_parser.add_argument(
+        "--no-translation-memory",
+        action="store_true",
+        help="Send every block to the AI instead of reusing approved translations",
+    )
     translate_parser.add_argument("--resume", action="store_true", help="Resume a previous run")
+    translate_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Retranslate only blocks whose prompt or relevant terms changed",
+    )
+    translate_parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=1,
+        help="Make saved chunks durable once per N chunks (default: 1)",
+    )
+    translate_parser.add_argument(
+        "--checkpoint-ms",
+        type=int,
+        help="Also make saved chunks durable once this many milliseconds pass",
+    )
+    translate_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit pending chunks as one provider batch job and wait for it",
+    )
+    translate_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream responses, keeping finished blocks when a response breaks",
+    )
     translate_parser.add_argument(
         "--workspace-root", default="workspaces", help="Parent directory for workspaces"
     )
@@ -1410,6 +1628,16 @@ def build_parser() -> argparse.ArgumentParser:
     status_parser.add_argument("--json", action="store_true", help="Print machine-readable output")
     status_parser.set_defaults(handler=_run_status)
 
+    usage_parser = subparsers.add_parser(
+        "usage", help="Summarize recorded provider requests, throughput, and cost"
+    )
+    usage_parser.add_argument("--project", required=True, help="Project ID or workspace path")
+    usage_parser.add_argument(
+        "--workspace-root", default="workspaces", help="Parent directory for project workspaces"
+    )
+    usage_parser.add_argument("--json", action="store_true", help="Print machine-readable output")
+    usage_parser.set_defaults(handler=_run_usage)
+
     projects_parser = subparsers.add_parser(
         "projects", help="List projects in the workspace root"
     )
@@ -1437,6 +1665,16 @@ def build_parser() -> argparse.ArgumentParser:
         "--workspace-root", default="workspaces", help="Parent directory for workspaces"
     )
     retry_parser.add_argument("--model", help="Gemini model override")
+    retry_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_RETRY_CONCURRENCY,
+        help=(
+            "Retry chunks to request in parallel "
+            f"(default: {DEFAULT_RETRY_CONCURRENCY}); the review changes only "
+            "when every chunk succeeds"
+        ),
+    )
     retry_parser.add_argument(
         "--dry-run", action="store_true", help="List retry targets without calling Gemini"
     )
@@ -0,0 +1,183 @@
+"""Compiled single-pass matching for every termbase variant."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+import hashlib
+import json
+import re
+import threading
+from typing import Any
+
+
+_MATCHER_CACHE_SIZE = 8
+_MATCHER_CACHE: OrderedDict[str, TermbaseMatcher] = OrderedDict()
+_MATCHER_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class TermMatch:
+    """One matched span and every termbase variant that matches it exactly."""
+
+    start: int
+    end: int
+    variants: tuple[tuple[int, int], ...]
+
+
+class _TrieNode:
+    __slots__ = ("children", "variants")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.variants: list[tuple[int, int]] = []
+
+
+def _fold(character: str) -> str:
+    folded = character.lower()
+    return folded if len(folded) == 1 else character
+
+
+def _is_word(character: str) -> bool:
+    return character.isalnum() or character == "_"
+
+
+def entry_variants(entry: dict[str, Any]) -> list[str]:
+    """Return the source term followed by its unique variants."""
+    raw_variants = entry.get("variants")
+    variants = raw_variants if isinstance(raw_variants, list) else []
+    return list(
+        dict.fromkeys(
+            str(value)
+            for value in [entry.get("source_term") or "", *variants]
+        )
+    )
+
+
+class TermbaseMatcher:
+    """Find every variant of every termbase entry in one scan of a text.
+
+    Variants are matched case-insensitively and, when they start or end with a
+    letter or digit, only on word boundaries. All variants live in one prefix
+    trie. A regular expression compiled from that trie finds candidate start
+    positions in C, and the trie walk then reports every overlapping variant
+    that starts there.
+    """
+
+    __slots__ = ("entries", "variants", "_root", "_scanner")
+
+    def __init__(self, entries: Sequence[dict[str, Any]]) -> None:
+        self.entries = tuple(entries)
+        self.variants = tuple(entry_variants(entry) for entry in self.entries)
+        self._root = _TrieNode()
+        for entry_index, variants in enumerate(self.variants):
+            for variant_index, variant in enumerate(variants):
+                clean = variant.strip()
+                if not clean:
+                    continue
+                node = self._root
+                for character in clean:
+                    node = node.children.setdefault(_fold(character), _TrieNode())
+                node.variants.append((entry_index, variant_index))
+        pattern = self._trie_pattern(self._root, top_level=True)
+        self._scanner = (
+            re.compile(f"(?=(?:{pattern}))", re.IGNORECASE) if pattern else None
+        )
+
+    def _trie_pattern(self, node: _TrieNode, *, top_level: bool = False) -> str:
+        alternatives: list[str] = []
+        for character, child in sorted(node.children.items()):
+            prefix = r"(?<!\w)" if top_level and character.isalnum() else ""
+            alternatives.append(
+                prefix + re.escape(character) + self._trie_pattern(child)
+            )
+        if node.variants and not top_level:
+            # Every variant ending here shares its last character.
+            last_character = next(
+                self.variants[entry_index][variant_index].strip()[-1]
+                for entry_index, variant_index in node.variants
+            )
+            alternatives.append(r"(?!\w)" if last_character.isalnum() else "")
+        if not alternatives:
+            return ""
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return "(?:" + "|".join(alternatives) + ")"
+
+    def find(self, text: str) -> list[TermMatch]:
+        """Return every matched span ordered by start and then length."""
+        if self._scanner is None:
+            return []
+        matches: list[TermMatch] = []
+        length = len(text)
+        for candidate in self._scanner.finditer(text):
+            start = candidate.start()
+            if (
+                start > 0
+                and text[start].isalnum()
+                and _is_word(text[start - 1])
+            ):
+                continue
+            node = self._root
+            position = start
+            while position < length:
+                next_node = node.children.get(_fold(text[position]))
+                if next_node is None:
+                    break
+                node = next_node
+                position += 1
+                if node.variants and not (
+                    text[position - 1].isalnum()
+                    and position < length
+                    and _is_word(text[position])
+                ):
+                    matches.append(
+                        TermMatch(start, position, tuple(node.variants))
+                    )
+        return matches
+
+    def matching_variants(self, text: str) -> dict[int, list[str]]:
+        """Map entry indexes, in termbase order, to their variants found in text."""
+        found: dict[int, set[int]] = {}
+        for match in self.find(text):
+            for entry_index, variant_index in match.variants:
+                found.setdefault(entry_index, set()).add(variant_index)
+        return {
+            entry_index: [
+                self.variants[entry_index][variant_index]
+                for variant_index in sorted(found[entry_index])
+            ]
+            for entry_index in sorted(found)
+        }
+
+    def matching_entries(self, text: str) -> list[dict[str, Any]]:
+        """Return entries with at least one variant in text, in termbase order."""
+        return [self.entries[index] for index in self.matching_variants(text)]
+
+
+def _termbase_fingerprint(entries: Sequence[dict[str, Any]]) -> str:
+    data = json.dumps(
+        list(entries),
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    ).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def termbase_matcher(entries: Sequence[dict[str, Any]]) -> TermbaseMatcher:
+    """Return the compiled matcher for a termbase, building it once per content hash."""
+    key = _termbase_fingerprint(entries)
+    with _MATCHER_CACHE_LOCK:
+        matcher = _MATCHER_CACHE.get(key)
+        if matcher is not None:
+            _MATCHER_CACHE.move_to_end(key)
+            return matcher
+    matcher = TermbaseMatcher(entries)
+    with _MATCHER_CACHE_LOCK:
+        _MATCHER_CACHE[key] = matcher
+        while len(_MATCHER_CACHE) > _MATCHER_CACHE_SIZE:
+            _MATCHER_CACHE.popitem(last=False)
+    return matcher
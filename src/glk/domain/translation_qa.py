@@ -7,6 +7,7 @@ from dataclasses import dataclass
 import re
 from typing import Any
 
+from glk.domain.termbase_matcher import TermbaseMatcher, termbase_matcher
 
 _CURLY_TOKEN_PATTERN = re.compile(r"\{[A-Za-z][A-Za-z0-9_]*\}")
 _SQUARE_TOKEN_PATTERN = re.compile(r"\[[^\]\n]+\]")
@@ -43,25 +44,10 @@ class TranslationContractIssue:
     message: str
 
 
-def _contains_term(text: str, term: str) -> bool:
-    clean = term.strip()
-    if not clean:
-        return False
-    prefix = r"(?<!\w)" if clean[0].isalnum() else ""
-    suffix = r"(?!\w)" if clean[-1].isalnum() else ""
-    return re.search(prefix + re.escape(clean) + suffix, text, re.IGNORECASE) is not None
-
-
 def _contains_target_text(text: str, expected: str) -> bool:
     return expected.strip().casefold() in text.casefold()
 
 
-def _entry_variants(entry: dict[str, Any]) -> list[str]:
-    return list(
-        dict.fromkeys([entry["source_term"], *entry.get("variants", [])])
-    )
-
-
 def _preserved_items(text: str) -> dict[str, Counter[str]]:
     return {
         "curly_token_changed": Counter(_CURLY_TOKEN_PATTERN.findall(text)),
@@ -98,8 +84,13 @@ def check_translation_contract(
     source_text: str,
     translated_text: str,
     termbase_entries: list[dict[str, Any]],
+    matcher: TermbaseMatcher | None = None,
 ) -> list[TranslationContractIssue]:
-    """Return deterministic preservation and terminology violations."""
+    """Return deterministic preservation and terminology violations.
+
+    Callers checking many texts against one termbase pass its compiled
+    ``matcher`` so the variants are not recompiled for every text.
+    """
     issues: list[TranslationContractIssue] = []
     labels = {
         "curly_token_changed": "중괄호 token 구성",
@@ -132,14 +123,11 @@ def check_translation_contract(
                 )
             )
 
-    for entry in termbase_entries:
-        matching_variants = [
-            variant
-            for variant in _entry_variants(entry)
-            if _contains_term(source_text, variant)
-        ]
-        if not matching_variants:
-            continue
+    active_matcher = matcher or termbase_matcher(termbase_entries)
+    for entry_index, matching_variants in active_matcher.matching_variants(
+        source_text
+    ).items():
+        entry = active_matcher.entries[entry_index]
         if entry["status"] == "approved":
             if not _contains_target_text(translated_text, entry["translation"]):
                 issues.append(
@@ -10,6 +10,7 @@ from typing import Any
 
 TRANSLATION_SEGMENT_SCHEMA_VERSION = 1
 TRANSLATION_STATUSES = {"translated", "flagged"}
+TRANSLATION_ORIGINS = {"provider", "translation_memory"}
 _ID_PATTERN = re.compile(r"^[a-z0-9][a-z0-9._-]*$")
 _SHA256_PATTERN = re.compile(r"^[a-f0-9]{64}$")
 
@@ -34,6 +35,13 @@ class TranslationSegment:
     model: str
     prompt_sha256: str
     termbase_sha256: str
+    # Provider output is the default and is not serialized, so segments written
+    # before provenance existed keep their exact bytes and checkpoints.
+    origin: str = "provider"
+    origin_ref: str | None = None
+    # Hash of the approved and keep termbase entries that apply to this block.
+    # Segments written before it existed omit it and are never carried over.
+    relevant_terms_sha256: str | None = None
 
     def validate(self) -> None:
         if self.schema_version != TRANSLATION_SEGMENT_SCHEMA_VERSION:
@@ -99,10 +107,30 @@ class TranslationSegment:
             raise TranslationSegmentValidationError(
                 f"Invalid translation status: {self.status!r}"
             )
+        if self.origin not in TRANSLATION_ORIGINS:
+            raise TranslationSegmentValidationError(
+                f"Invalid translation origin: {self.origin!r}"
+            )
+        if self.origin == "provider":
+            if self.origin_ref is not None:
+                raise TranslationSegmentValidationError(
+                    "Provider translations cannot have origin_ref."
+                )
+        elif not isinstance(self.origin_ref, str) or not self.origin_ref.strip():
+            raise TranslationSegmentValidationError(
+                "Reused translations must record origin_ref."
+            )
+        if self.relevant_terms_sha256 is not None and (
+            not isinstance(self.relevant_terms_sha256, str)
+            or not _SHA256_PATTERN.fullmatch(self.relevant_terms_sha256)
+        ):
+            raise TranslationSegmentValidationError(
+                "relevant_terms_sha256 must be a SHA-256 hex digest."
+            )
 
     def to_dict(self) -> dict[str, Any]:
         self.validate()
-        return {
+        value: dict[str, Any] = {
             "schema_version": self.schema_version,
             "source_block_id": self.source_block_id,
             "source_file": self.source_file,
@@ -118,6 +146,12 @@ class TranslationSegment:
             "prompt_sha256": self.prompt_sha256,
             "termbase_sha256": self.termbase_sha256,
         }
+        if self.origin != "provider":
+            value["origin"] = self.origin
+            value["origin_ref"] = self.origin_ref
+        if self.relevant_terms_sha256 is not None:
+            value["relevant_terms_sha256"] = self.relevant_terms_sha256
+        return value
 
     @classmethod
     def from_dict(cls, value: Any) -> TranslationSegment:
@@ -125,12 +159,14 @@ class TranslationSegment:
             raise TranslationSegmentValidationError(
                 "Translation segment must be a JSON object."
             )
-        required = {field.name for field in cls.__dataclass_fields__.values()}
+        optional = {"origin", "origin_ref", "relevant_terms_sha256"}
+        fields = {field.name for field in cls.__dataclass_fields__.values()}
+        required = fields - optional
         missing = sorted(required - value.keys())
         if missing:
             raise TranslationSegmentValidationError(
                 "Translation segment is missing fields: " + ", ".join(missing)
             )
-        segment = cls(**{field: value[field] for field in required})
+        segment = cls(**{field: value[field] for field in fields if field in value})
         segment.validate()
         return segment
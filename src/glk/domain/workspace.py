@@ -8,6 +8,9 @@ from pathlib import Path, PurePosixPath
 
 PDF_SOURCE_ROOT = "01_input/pdf"
 IMAGE_SOURCE_ROOT = "01_input/images"
+# Relative to the workspace root rather than a project, so every project of
+# the workspace shares provider responses.
+RESPONSE_CACHE_ROOT = ".glk/cache/responses"
 
 WORKSPACE_DIRECTORIES = (
     Path("01_input/pdf"),
@@ -183,6 +186,10 @@ class WorkspacePaths:
     def translation_segments(self) -> Path:
         return self.segments_dir / "translation.jsonl"
 
+    @property
+    def translation_carry_over(self) -> Path:
+        return self.segments_dir / "translation_carry_over.jsonl"
+
     @property
     def approved_translation_segments(self) -> Path:
         return self.segments_dir / "approved_translation.jsonl"
@@ -195,6 +202,22 @@ class WorkspacePaths:
     def pdf_acquisition_state(self) -> Path:
         return self.state_dir / "pdf_acquisition.json"
 
+    @property
+    def layout_batch_job(self) -> Path:
+        return self.state_dir / "layout_batch.json"
+
+    @property
+    def layout_batch_requests(self) -> Path:
+        return self.state_dir / "layout_batch.jsonl"
+
+    @property
+    def translation_batch_job(self) -> Path:
+        return self.state_dir / "translation_batch.json"
+
+    @property
+    def translation_batch_requests(self) -> Path:
+        return self.state_dir / "translation_batch.jsonl"
+
     @property
     def image_ocr_state(self) -> Path:
         return self.state_dir / "image_ocr.json"
@@ -239,6 +262,10 @@ class WorkspacePaths:
     def translation_review_state(self) -> Path:
         return self.state_dir / "translation_review.json"
 
+    @property
+    def usage_ledger(self) -> Path:
+        return self.state_dir / "usage.jsonl"
+
     @property
     def source_qa_json(self) -> Path:
         return self.root / ".glk/reports/source_qa.json"
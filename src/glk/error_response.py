@@ -10,6 +10,7 @@ _CODE_MESSAGES = {
     "PROJECT_INIT_FAILED": "프로젝트를 생성하지 못했습니다.",
     "PROJECT_STATUS_FAILED": "프로젝트 상태를 확인하지 못했습니다.",
     "PROJECT_LIST_FAILED": "프로젝트 목록을 불러오지 못했습니다.",
+    "USAGE_REPORT_FAILED": "API 사용량 기록을 불러오지 못했습니다.",
     "PROJECT_DELETE_FAILED": "프로젝트를 휴지통으로 이동하지 못했습니다.",
     "PROJECT_ALREADY_EXISTS": "같은 프로젝트 ID가 이미 존재합니다. 다른 프로젝트 ID를 입력하세요.",
     "PROJECT_ID_INVALID": "프로젝트 ID는 영문 소문자, 숫자, 밑줄(_)만 사용할 수 있습니다.",
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from collections import Counter
+from collections.abc import Mapping, Sequence
+import hashlib
 from io import BytesIO
 import json
+import math
 import re
 from typing import Any, Protocol
 
@@ -15,6 +18,10 @@ from PIL import Image
 PROMPT_VERSION = "layout-fragment-v1"
 POSTPROCESS_VERSION = "column-continuation-v3"
 LAYOUT_RECOVERY_WARNING_PREFIX = "AI 레이아웃 정렬 누락 복구"
+# Margin kept around the text when a page image is cropped, in points.
+CROP_PADDING_POINTS = 18.0
+# A crop that would remove less than this share of the page is skipped.
+MIN_CROP_SAVING = 0.1
 BLOCK_TYPES = (
     "heading",
     "paragraph",
@@ -24,29 +31,48 @@ BLOCK_TYPES = (
     "page_number",
     "artifact",
 )
+_BLOCKS_SCHEMA: dict[str, Any] = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "type": {"type": "string", "enum": list(BLOCK_TYPES)},
+            "fragment_ids": {
+                "type": "array",
+                "items": {"type": "string"},
+                "minItems": 1,
+            },
+            "include_in_text": {"type": "boolean"},
+            "reason": {"type": "string"},
+        },
+        "required": ["type", "fragment_ids", "include_in_text", "reason"],
+        "additionalProperties": False,
+    },
+}
 RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {"blocks": _BLOCKS_SCHEMA},
+    "required": ["blocks"],
+    "additionalProperties": False,
+}
+# Several pages answered in one request, each with its own block list.
+PACKED_RESPONSE_SCHEMA = {
     "type": "object",
     "properties": {
-        "blocks": {
+        "pages": {
             "type": "array",
             "items": {
                 "type": "object",
                 "properties": {
-                    "type": {"type": "string", "enum": list(BLOCK_TYPES)},
-                    "fragment_ids": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "minItems": 1,
-                    },
-                    "include_in_text": {"type": "boolean"},
-                    "reason": {"type": "string"},
+                    "page": {"type": "integer"},
+                    "blocks": _BLOCKS_SCHEMA,
                 },
-                "required": ["type", "fragment_ids", "include_in_text", "reason"],
+                "required": ["page", "blocks"],
                 "additionalProperties": False,
             },
         }
     },
-    "required": ["blocks"],
+    "required": ["pages"],
     "additionalProperties": False,
 }
 
@@ -75,6 +101,44 @@ class LayoutProvider(Protocol):
     ) -> dict[str, Any]: ...
 
 
+class AsyncLayoutProvider(LayoutProvider, Protocol):
+    """Layout provider that can also be awaited from one event loop."""
+
+    async def reconstruct_async(
+        self, page_number: int, fragments: list[dict[str, Any]], page_image: Image.Image
+    ) -> dict[str, Any]: ...
+
+
+class PackedLayoutProvider(LayoutProvider, Protocol):
+    """Layout provider that can answer several pages in one request.
+
+    The result holds only the pages whose layouts could be split out of the
+    response; callers send the others again one page at a time.
+    """
+
+    def reconstruct_pages(
+        self,
+        pages: Sequence[tuple[int, list[dict[str, Any]], Image.Image]],
+    ) -> dict[int, dict[str, Any]]: ...
+
+
+class BatchLayoutProvider(LayoutProvider, Protocol):
+    """Layout provider that can submit many pages as one offline batch job.
+
+    ``layout_batch_results`` returns None while the job runs. A finished job
+    maps every key it answered to a layout, or to None when that request failed.
+    """
+
+    def submit_layout_batch(
+        self,
+        pages: Mapping[str, tuple[int, list[dict[str, Any]], Image.Image]],
+    ) -> str: ...
+
+    def layout_batch_results(
+        self, job_id: str
+    ) -> dict[str, dict[str, Any] | None] | None: ...
+
+
 def parse_page_selection(value: str | None, page_count: int) -> list[int]:
     """Parse a 1-based page expression such as '1,3-5'."""
     if (
@@ -146,28 +210,117 @@ def extract_line_fragments(page: pymupdf.Page, page_number: int) -> list[dict[st
     return fragments
 
 
-def render_page(page: pymupdf.Page, scale: float) -> tuple[bytes, Image.Image]:
-    """Render one PDF page to PNG bytes and a detached Pillow image."""
+def page_content_sha256(page: pymupdf.Page) -> str:
+    """Hash what one page draws, independently of the rest of the file.
+
+    The page box, rotation, decompressed content streams and the streams of
+    the images and forms it places are hashed by resource name, so a page left
+    untouched in a revised PDF keeps its hash even when object numbers move.
+    """
+    document = page.parent
+    digest = hashlib.sha256(
+        json.dumps(
+            [_round_bbox(tuple(page.rect)), page.rotation], separators=(",", ":")
+        ).encode("utf-8")
+    )
+    digest.update(page.read_contents())
+    resources = sorted(
+        [(str(item[7]), "image", int(item[0])) for item in page.get_images(full=True)]
+        + [(str(item[1]), "form", int(item[0])) for item in page.get_xobjects()]
+    )
+    for name, kind, xref in resources:
+        data = (
+            document.xref_stream_raw(xref)
+            if kind == "image"
+            else document.xref_stream(xref)
+        ) or b""
+        digest.update(f"\0{kind}:{name}:{len(data)}\0".encode("utf-8"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def render_page_png(page: pymupdf.Page, scale: float) -> bytes:
+    """Render one PDF page to PNG bytes."""
     pixmap = page.get_pixmap(matrix=pymupdf.Matrix(scale, scale), alpha=False)
-    png_bytes = pixmap.tobytes("png")
+    return pixmap.tobytes("png")
+
+
+def decode_page_image(png_bytes: bytes) -> Image.Image:
+    """Decode rendered PNG bytes into a detached RGB Pillow image."""
     with Image.open(BytesIO(png_bytes)) as image:
-        page_image = image.convert("RGB").copy()
-    return png_bytes, page_image
+        return image.convert("RGB").copy()
 
 
-def build_layout_prompt(page_number: int, fragments: list[dict[str, Any]]) -> str:
-    compact_fragments = [
-        {"id": fragment["id"], "text": fragment["text"], "bbox": fragment["bbox"]}
+def render_page(page: pymupdf.Page, scale: float) -> tuple[bytes, Image.Image]:
+    """Render one PDF page to PNG bytes and a detached Pillow image."""
+    png_bytes = render_page_png(page, scale)
+    return png_bytes, decode_page_image(png_bytes)
+
+
+def text_crop_box(
+    fragments: list[dict[str, Any]],
+    page_size: tuple[float, float],
+    *,
+    padding: float = CROP_PADDING_POINTS,
+) -> tuple[float, float, float, float] | None:
+    """Return the padded union of the fragment boxes in page points.
+
+    None means cropping is not worth it: the page has no fragments or the
+    text already covers nearly all of it.
+    """
+    if not fragments:
+        return None
+    width, height = page_size
+    box = (
+        round(max(min(float(f["bbox"][0]) for f in fragments) - padding, 0.0), 2),
+        round(max(min(float(f["bbox"][1]) for f in fragments) - padding, 0.0), 2),
+        round(min(max(float(f["bbox"][2]) for f in fragments) + padding, width), 2),
+        round(min(max(float(f["bbox"][3]) for f in fragments) + padding, height), 2),
+    )
+    area = (box[2] - box[0]) * (box[3] - box[1])
+    if area > width * height * (1 - MIN_CROP_SAVING):
+        return None
+    return box
+
+
+def crop_page_image(
+    image: Image.Image,
+    box: tuple[float, float, float, float],
+    page_size: tuple[float, float],
+) -> Image.Image:
+    """Cut a rendered page image down to a box given in page points."""
+    scale = image.width / page_size[0]
+    return image.crop(
+        (
+            max(int(box[0] * scale), 0),
+            max(int(box[1] * scale), 0),
+            min(math.ceil(box[2] * scale), image.width),
+            min(math.ceil(box[3] * scale), image.height),
+        )
+    )
+
+
+def shift_fragments(
+    fragments: list[dict[str, Any]],
+    origin: tuple[float, float],
+) -> list[dict[str, Any]]:
+    """Move fragment boxes so they match a page image cropped at ``origin``."""
+    x, y = origin
+    return [
+        {
+            **fragment,
+            "bbox": [
+                round(float(fragment["bbox"][0]) - x, 2),
+                round(float(fragment["bbox"][1]) - y, 2),
+                round(float(fragment["bbox"][2]) - x, 2),
+                round(float(fragment["bbox"][3]) - y, 2),
+            ],
+        }
         for fragment in fragments
     ]
-    fragment_json = json.dumps(compact_fragments, ensure_ascii=False, separators=(",", ":"))
-    return f"""You reconstruct reading order for one English board-game rulebook page.
 
-The page image is the visual source of truth for layout. The JSON list contains text
-fragments extracted directly from PDF text objects. Coordinates are [x0,y0,x1,y1]
-in PDF page space, where smaller y is visually higher on the page.
 
-Your only task is to return block structure using fragment IDs.
+_LAYOUT_RULES = """Your only task is to return block structure using fragment IDs.
 
 Rules:
 1. Include every supplied fragment ID exactly once. Never omit, duplicate, or invent an ID.
@@ -184,13 +337,87 @@ Rules:
    artifacts. Component names, captions, diagram labels, and rules text must remain true.
 9. Use artifact only for corrupted or meaningless glyph fragments.
 10. Explain exclusions briefly in reason. Use an empty reason for included blocks.
+"""
+
 
+def _fragment_json(fragments: list[dict[str, Any]]) -> str:
+    compact_fragments = [
+        {"id": fragment["id"], "text": fragment["text"], "bbox": fragment["bbox"]}
+        for fragment in fragments
+    ]
+    return json.dumps(compact_fragments, ensure_ascii=False, separators=(",", ":"))
+
+
+def build_layout_prompt(page_number: int, fragments: list[dict[str, Any]]) -> str:
+    return f"""You reconstruct reading order for one English board-game rulebook page.
+
+The page image is the visual source of truth for layout. The JSON list contains text
+fragments extracted directly from PDF text objects. Coordinates are [x0,y0,x1,y1]
+in PDF page space, where smaller y is visually higher on the page.
+
+{_LAYOUT_RULES}
 PDF page index: {page_number}
 Fragments:
-{fragment_json}
+{_fragment_json(fragments)}
 """
 
 
+def build_packed_layout_prompt(
+    pages: Sequence[tuple[int, list[dict[str, Any]]]],
+) -> str:
+    """Ask for the layouts of several pages in one request, one entry per page.
+
+    The page images follow the prompt in the same order as the pages listed.
+    """
+    sections = "\n".join(
+        f"PDF page index: {page_number}\nFragments:\n{_fragment_json(fragments)}\n"
+        for page_number, fragments in pages
+    )
+    return f"""You reconstruct reading order for {len(pages)} separate English board-game
+rulebook pages. Each page is independent: never move a fragment to another page.
+
+Each page image, labeled with its PDF page index, is the visual source of truth for
+that page's layout. The JSON lists contain text fragments extracted directly from PDF
+text objects. Coordinates are [x0,y0,x1,y1] in that page's space, where smaller y is
+visually higher on the page.
+
+Return one entry in pages for every page below, with its PDF page index in page and
+its blocks in blocks. Apply the rules to each page on its own.
+
+{_LAYOUT_RULES}
+{sections}"""
+
+
+def split_packed_layouts(
+    response: dict[str, Any],
+    page_numbers: Sequence[int],
+) -> dict[int, dict[str, Any]]:
+    """Return each requested page's layout from a packed response.
+
+    Pages the response omits, repeats or does not shape as a layout are left
+    out, so callers send them again on their own.
+    """
+    entries = response.get("pages") if isinstance(response, dict) else None
+    if not isinstance(entries, list):
+        return {}
+    counts = Counter(
+        entry.get("page") for entry in entries if isinstance(entry, dict)
+    )
+    layouts: dict[int, dict[str, Any]] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        page_number = entry.get("page")
+        if (
+            isinstance(page_number, int)
+            and page_number in page_numbers
+            and counts[page_number] == 1
+            and isinstance(entry.get("blocks"), list)
+        ):
+            layouts[page_number] = {"blocks": entry["blocks"]}
+    return layouts
+
+
 def _layout_validation_report(
     fragments: list[dict[str, Any]], layout: dict[str, Any]
 ) -> dict[str, Any]:
@@ -0,0 +1,245 @@
+"""Deterministic reading order for simple PDF pages, without a layout model."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import re
+from statistics import median
+from typing import Any
+
+
+LOCAL_LAYOUT_MODEL = "local-reading-order"
+LOCAL_LAYOUT_VERSION = "xy-cut-v1"
+DEFAULT_LOCAL_LAYOUT_THRESHOLD = 0.9
+
+_LIST_MARKER_PATTERN = re.compile(r"^(?:[•·▪◦‣●■□–-]|\d{1,2}[.)])\s")
+_PAGE_NUMBER_PATTERN = re.compile(r"^\d{1,4}$")
+# Share of the page height at the top and bottom where page numbers sit.
+_PAGE_MARGIN_RATIO = 0.1
+_HEADING_SIZE_RATIO = 1.2
+_SMALL_TEXT_RATIO = 0.7
+
+
+@dataclass(frozen=True, slots=True)
+class LocalLayout:
+    """A layout in the provider response shape, with how far to trust it.
+
+    ``confidence`` starts at 1 and each sign of a layout that geometry alone
+    may misread lowers it; ``reasons`` names those signs.
+    """
+
+    layout: dict[str, Any]
+    confidence: float
+    reasons: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _Line:
+    index: int
+    fragment: dict[str, Any]
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+    size: float
+
+    @property
+    def height(self) -> float:
+        return self.y1 - self.y0
+
+
+def _line(index: int, fragment: dict[str, Any]) -> _Line:
+    x0, y0, x1, y1 = (float(value) for value in fragment["bbox"])
+    sizes = [float(size) for size in fragment.get("font_sizes") or [0.0]]
+    return _Line(index, fragment, x0, y0, x1, y1, max(sizes))
+
+
+def _split(lines: list[_Line], *, vertical: bool, min_gap: float) -> list[list[_Line]]:
+    """Split lines at every gap of at least ``min_gap`` along one axis."""
+
+    def span(line: _Line) -> tuple[float, float]:
+        return (line.x0, line.x1) if vertical else (line.y0, line.y1)
+
+    groups: list[list[_Line]] = []
+    end = float("-inf")
+    for line in sorted(lines, key=span):
+        start, stop = span(line)
+        if not groups or start - end >= min_gap:
+            groups.append([])
+        groups[-1].append(line)
+        end = max(end, stop)
+    return groups
+
+
+@dataclass(slots=True)
+class _CutStats:
+    max_columns: int = 1
+    row_splits: int = 0
+    side_by_side: int = 0
+
+
+def _xy_cut(
+    lines: list[_Line],
+    *,
+    gutter: float,
+    line_height: float,
+    stats: _CutStats,
+) -> list[_Line]:
+    """Order lines by recursive cuts, trying column gutters before row gaps.
+
+    Cutting columns first keeps a two-column region from being read row by
+    row when both columns happen to have a paragraph gap at the same height.
+    """
+    columns = _split(lines, vertical=True, min_gap=gutter)
+    if len(columns) > 1:
+        top = min(line.y0 for line in lines)
+        bottom = max(line.y1 for line in lines)
+        if bottom - top < 2 * line_height:
+            stats.row_splits += 1
+        else:
+            stats.max_columns = max(stats.max_columns, len(columns))
+        return [
+            ordered
+            for column in columns
+            for ordered in _xy_cut(
+                column, gutter=gutter, line_height=line_height, stats=stats
+            )
+        ]
+    rows = _split(lines, vertical=False, min_gap=0.01)
+    if len(rows) > 1:
+        return [
+            ordered
+            for row in rows
+            for ordered in _xy_cut(
+                row, gutter=gutter, line_height=line_height, stats=stats
+            )
+        ]
+    leaf = sorted(lines, key=lambda line: (line.y0, line.x0))
+    for previous, current in zip(leaf, leaf[1:]):
+        overlap = min(previous.y1, current.y1) - max(previous.y0, current.y0)
+        if overlap > 0.5 * min(previous.height, current.height):
+            stats.side_by_side += 1
+    return leaf
+
+
+def _overlapping_pairs(lines: list[_Line]) -> int:
+    count = 0
+    for position, first in enumerate(lines):
+        for second in lines[position + 1 :]:
+            width = min(first.x1, second.x1) - max(first.x0, second.x0)
+            height = min(first.y1, second.y1) - max(first.y0, second.y0)
+            if width <= 0 or height <= 0:
+                continue
+            smaller = min(
+                (first.x1 - first.x0) * first.height,
+                (second.x1 - second.x0) * second.height,
+            )
+            if smaller > 0 and width * height > 0.2 * smaller:
+                count += 1
+    return count
+
+
+def _continues(previous: _Line, current: _Line, line_height: float) -> bool:
+    """Whether ``current`` is the next visual line of the same paragraph."""
+    return (
+        current.fragment.get("block_index") == previous.fragment.get("block_index")
+        and 0 <= current.y0 - previous.y0 <= 2 * line_height
+        and min(previous.x1, current.x1) > max(previous.x0, current.x0)
+        and abs(current.size - previous.size) < 0.5
+        and not _LIST_MARKER_PATTERN.match(str(current.fragment["text"]))
+    )
+
+
+def _block(
+    lines: list[_Line],
+    *,
+    body_size: float,
+    page_height: float,
+) -> dict[str, Any]:
+    first = lines[0]
+    text = str(first.fragment["text"]).strip()
+    margin = page_height * _PAGE_MARGIN_RATIO
+    block_type = "paragraph"
+    include = True
+    reason = ""
+    if (
+        len(lines) == 1
+        and _PAGE_NUMBER_PATTERN.match(text)
+        and (first.y1 <= margin or first.y0 >= page_height - margin)
+    ):
+        block_type, include, reason = "page_number", False, "page number"
+    elif _LIST_MARKER_PATTERN.match(text):
+        block_type = "list_item"
+    elif len(lines) <= 3 and first.size >= body_size * _HEADING_SIZE_RATIO:
+        block_type = "heading"
+    return {
+        "type": block_type,
+        "fragment_ids": [line.fragment["id"] for line in lines],
+        "include_in_text": include,
+        "reason": reason,
+    }
+
+
+def infer_reading_order(
+    fragments: list[dict[str, Any]],
+    page_size: tuple[float, float],
+) -> LocalLayout:
+    """Order the fragments of one page by XY-cut and group them into blocks.
+
+    Column gutters are found from the fragment boxes, paragraphs from
+    PyMuPDF's block index and line spacing, and headings, list items and
+    margin page numbers from font size and text. The result only claims high
+    confidence for pages without overlapping, rotated, table-like or
+    multi-column text, where the extraction order is usually already right.
+    """
+    lines = [_line(index, fragment) for index, fragment in enumerate(fragments)]
+    if not lines:
+        return LocalLayout({"blocks": []}, 0.0, ("no text fragments",))
+    body_size = median(line.size for line in lines) or 1.0
+    line_height = median(line.height for line in lines) or 1.0
+    reasons: list[str] = []
+    confidence = 1.0
+    if any(
+        abs(float(fragment.get("direction", (1, 0))[0]) - 1) > 0.01
+        for fragment in fragments
+    ):
+        return LocalLayout({"blocks": []}, 0.0, ("rotated text",))
+
+    stats = _CutStats()
+    ordered = _xy_cut(lines, gutter=line_height, line_height=line_height, stats=stats)
+    penalties = (
+        (_overlapping_pairs(lines) > 0, 0.5, "overlapping fragments"),
+        (stats.max_columns > 2, 0.3, f"{stats.max_columns} columns"),
+        (stats.row_splits > 0, 0.3, "table-like rows"),
+        (stats.side_by_side > 0, 0.3, "side-by-side fragments"),
+        (
+            any(line.size < body_size * _SMALL_TEXT_RATIO for line in lines),
+            0.2,
+            "small label text",
+        ),
+        (
+            [line.index for line in ordered] != list(range(len(lines))),
+            0.1,
+            "order differs from the PDF text order",
+        ),
+    )
+    for applies, penalty, reason in penalties:
+        if applies:
+            confidence -= penalty
+            reasons.append(reason)
+
+    groups: list[list[_Line]] = []
+    for line in ordered:
+        if groups and _continues(groups[-1][-1], line, line_height):
+            groups[-1].append(line)
+        else:
+            groups.append([line])
+    blocks = [
+        _block(group, body_size=body_size, page_height=float(page_size[1]))
+        for group in groups
+    ]
+    return LocalLayout(
+        {"blocks": blocks},
+        round(max(confidence, 0.0), 2),
+        tuple(reasons),
+    )
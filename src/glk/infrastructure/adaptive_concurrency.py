@@ -0,0 +1,212 @@
+"""AIMD limit on in-flight provider requests, driven by provider feedback."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+import hashlib
+import math
+import threading
+import time
+from typing import Any, TypeVar
+
+
+DEFAULT_MAX_CONCURRENCY = 16
+ADDITIVE_INCREASE = 1.0
+MULTIPLICATIVE_DECREASE = 0.5
+# A response this many times slower than the running baseline counts as
+# congestion once the baseline has enough samples.
+LATENCY_SPIKE_RATIO = 3.0
+_LATENCY_BASELINE_SAMPLES = 10
+# Batch job uploads, polls and downloads keep their own baseline, so a long
+# poll loop does not make the interactive requests that follow look slow.
+BATCH_CONTROL_KIND = "batch-control"
+_LATENCY_SMOOTHING = 0.1
+_HISTORY_LIMIT = 100
+_ASYNC_POLL_SECONDS = 0.05
+
+ResultT = TypeVar("ResultT")
+
+
+class AdaptiveConcurrencyLimit:
+    """Grow the in-flight limit by one per window of successes; halve it on congestion.
+
+    The limit starts at its maximum, so callers keep their own concurrency
+    until the provider pushes back. Only one decrease is applied per wave of
+    requests: failures of requests that started before the latest decrease
+    reflect the old limit and are ignored. Latency baselines are kept per
+    request ``kind``, since a layout request is normally much slower than a
+    translation chunk sent on the same account.
+    """
+
+    def __init__(
+        self,
+        *,
+        is_congestion: Callable[[BaseException], bool],
+        maximum: int = DEFAULT_MAX_CONCURRENCY,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maximum < 1:
+            raise ValueError("maximum concurrency must be a positive integer.")
+        self.maximum = maximum
+        self._is_congestion = is_congestion
+        self._clock = clock
+        self._limit = float(maximum)
+        self._in_flight = 0
+        self._generation = 0
+        # Per request kind: smoothed latency and the number of samples.
+        self._latency_baselines: dict[str, tuple[float, int]] = {}
+        self._history: deque[dict[str, Any]] = deque(maxlen=_HISTORY_LIMIT)
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        with self._condition:
+            return self._slots()
+
+    def _slots(self) -> int:
+        return max(1, math.floor(self._limit))
+
+    def _record(self, reason: str) -> None:
+        self._history.append(
+            {"at": time.time(), "limit": self._slots(), "reason": reason}
+        )
+
+    def _try_acquire(self) -> int | None:
+        if self._in_flight >= self._slots():
+            return None
+        self._in_flight += 1
+        return self._generation
+
+    def acquire(self) -> int:
+        """Wait for a free slot and return the generation it was granted in."""
+        with self._condition:
+            while (generation := self._try_acquire()) is None:
+                self._condition.wait()
+            return generation
+
+    async def acquire_async(self) -> int:
+        while True:
+            with self._condition:
+                generation = self._try_acquire()
+            if generation is not None:
+                return generation
+            await asyncio.sleep(_ASYNC_POLL_SECONDS)
+
+    def _decrease(self, generation: int, reason: str) -> None:
+        if generation != self._generation:
+            return
+        self._generation += 1
+        before = self._slots()
+        self._limit = max(1.0, self._limit * MULTIPLICATIVE_DECREASE)
+        if self._slots() != before:
+            self._record(reason)
+
+    def release(
+        self,
+        generation: int,
+        *,
+        latency: float | None = None,
+        error: BaseException | None = None,
+        kind: str = "",
+    ) -> None:
+        """Free a slot and adjust the limit from the request outcome.
+
+        Throttling lowers the shared limit whatever the kind; latency is only
+        compared with earlier requests of the same ``kind``.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if error is not None:
+                if self._is_congestion(error):
+                    self._decrease(generation, "throttled")
+            elif latency is not None:
+                baseline, samples = self._latency_baselines.get(kind, (latency, 0))
+                if (
+                    samples >= _LATENCY_BASELINE_SAMPLES
+                    and latency > baseline * LATENCY_SPIKE_RATIO
+                ):
+                    self._decrease(generation, "latency")
+                else:
+                    before = self._slots()
+                    self._limit = min(
+                        float(self.maximum),
+                        self._limit + ADDITIVE_INCREASE / self._limit,
+                    )
+                    if self._slots() != before:
+                        self._record("success")
+                self._latency_baselines[kind] = (
+                    baseline + _LATENCY_SMOOTHING * (latency - baseline),
+                    samples + 1,
+                )
+            self._condition.notify_all()
+
+    def call(self, operation: Callable[[], ResultT], *, kind: str = "") -> ResultT:
+        generation = self.acquire()
+        started = self._clock()
+        try:
+            result = operation()
+        except BaseException as error:
+            self.release(generation, error=error, kind=kind)
+            raise
+        self.release(generation, latency=self._clock() - started, kind=kind)
+        return result
+
+    async def call_async(
+        self,
+        operation: Callable[[], Awaitable[ResultT]],
+        *,
+        kind: str = "",
+    ) -> ResultT:
+        generation = await self.acquire_async()
+        started = self._clock()
+        try:
+            result = await operation()
+        except BaseException as error:
+            self.release(generation, error=error, kind=kind)
+            raise
+        self.release(generation, latency=self._clock() - started, kind=kind)
+        return result
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current limit, in-flight count, and recent limit changes."""
+        with self._condition:
+            return {
+                "limit": self._slots(),
+                "maximum": self.maximum,
+                "in_flight": self._in_flight,
+                "latency_baseline_seconds": {
+                    kind: baseline
+                    for kind, (baseline, _samples) in self._latency_baselines.items()
+                },
+                "history": list(self._history),
+            }
+
+
+_shared_limits: dict[str, AdaptiveConcurrencyLimit] = {}
+_shared_limits_lock = threading.Lock()
+
+
+def shared_concurrency_limit(
+    *,
+    provider_name: str,
+    model_name: str,
+    api_key: str,
+    is_congestion: Callable[[BaseException], bool],
+) -> AdaptiveConcurrencyLimit:
+    """Return the process-wide limit for one provider, model, and API key.
+
+    Layout, OCR, and translation providers built for the same account share
+    it, so throttling seen by one job slows the others too. Each provider
+    class reports its latency under its own kind.
+    """
+    key = hashlib.sha256(
+        f"{provider_name}\0{model_name}\0{api_key}".encode("utf-8")
+    ).hexdigest()
+    with _shared_limits_lock:
+        limit = _shared_limits.get(key)
+        if limit is None:
+            limit = AdaptiveConcurrencyLimit(is_congestion=is_congestion)
+            _shared_limits[key] = limit
+        return limit
@@ -0,0 +1,185 @@
+"""Gemini Batch API submission and result download for generateContent requests."""
+
+from __future__ import annotations
+
+import base64
+from collections.abc import Callable, Mapping
+from io import BytesIO
+import json
+from typing import Any
+
+from google.genai import types
+from PIL import Image
+
+from glk.infrastructure.adaptive_concurrency import BATCH_CONTROL_KIND
+from glk.infrastructure.gemini_common import GeminiProviderBase, GeminiResponseError
+from glk.infrastructure.image_payload import ImagePayloadSettings, encode_image
+
+
+_RUNNING_STATES = frozenset(
+    {
+        types.JobState.JOB_STATE_UNSPECIFIED,
+        types.JobState.JOB_STATE_QUEUED,
+        types.JobState.JOB_STATE_PENDING,
+        types.JobState.JOB_STATE_RUNNING,
+        types.JobState.JOB_STATE_CANCELLING,
+        types.JobState.JOB_STATE_PAUSED,
+        types.JobState.JOB_STATE_UPDATING,
+    }
+)
+_FAILED_STATES = frozenset({types.JobState.JOB_STATE_FAILED})
+
+
+class GeminiBatchError(GeminiResponseError):
+    """Raised when Gemini rejects or loses a whole batch job."""
+
+    code = "GEMINI_BATCH_FAILED"
+
+
+def image_part(image: Image.Image, settings: ImagePayloadSettings) -> dict[str, Any]:
+    """Encode a PIL image as an inline part of a batch request."""
+    payload = encode_image(image, settings)
+    return {
+        "inline_data": {
+            "mime_type": payload.mime_type,
+            "data": base64.b64encode(payload.data).decode("ascii"),
+        }
+    }
+
+
+def generate_content_request(
+    parts: list[dict[str, Any]],
+    *,
+    generation_config: dict[str, Any],
+    system_instruction: str | None = None,
+) -> dict[str, Any]:
+    """Build the REST form of one generateContent request."""
+    request: dict[str, Any] = {
+        "contents": [{"role": "user", "parts": parts}],
+        "generation_config": generation_config,
+    }
+    if system_instruction is not None:
+        request["system_instruction"] = {"parts": [{"text": system_instruction}]}
+    return request
+
+
+def batch_request_file(requests: Mapping[str, dict[str, Any]]) -> bytes:
+    lines = [
+        json.dumps(
+            {"key": key, "request": request},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        for key, request in requests.items()
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _response_text(response: Any) -> str | None:
+    if not isinstance(response, dict):
+        return None
+    candidates = response.get("candidates") or []
+    if not candidates or not isinstance(candidates[0], dict):
+        return None
+    content = candidates[0].get("content") or {}
+    texts = [
+        part["text"]
+        for part in content.get("parts") or []
+        if isinstance(part, dict)
+        and isinstance(part.get("text"), str)
+        and not part.get("thought")
+    ]
+    return "".join(texts) or None
+
+
+def _batch_output_texts(data: bytes) -> dict[str, str | None]:
+    outputs: dict[str, str | None] = {}
+    for line in data.decode("utf-8").splitlines():
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError as error:
+            raise GeminiBatchError(
+                "Gemini returned an invalid batch output line."
+            ) from error
+        if not isinstance(item, dict) or not isinstance(item.get("key"), str):
+            raise GeminiBatchError("Gemini returned a batch output without a key.")
+        outputs[item["key"]] = (
+            None if item.get("error") else _response_text(item.get("response"))
+        )
+    return outputs
+
+
+def submit_gemini_batch(
+    provider: GeminiProviderBase,
+    requests: Mapping[str, dict[str, Any]],
+) -> str:
+    """Upload request lines and start one batch job for the provider model."""
+    data = batch_request_file(requests)
+
+    def request() -> str:
+        uploaded = provider.client.files.upload(
+            file=BytesIO(data),
+            config=types.UploadFileConfig(
+                display_name="glk-batch",
+                mime_type="jsonl",
+            ),
+        )
+        if not uploaded.name:
+            raise GeminiBatchError("Gemini did not name the uploaded batch file.")
+        job = provider.client.batches.create(
+            model=provider.model_name,
+            src=uploaded.name,
+            config=types.CreateBatchJobConfig(display_name="glk-batch"),
+        )
+        if not job.name:
+            raise GeminiBatchError("Gemini did not name the batch job.")
+        return job.name
+
+    # Creating a job is not idempotent, so a hedged duplicate would start a
+    # second paid job.
+    return provider.run_request(request, hedge=False, kind=BATCH_CONTROL_KIND)
+
+
+def gemini_batch_outputs(
+    provider: GeminiProviderBase,
+    job_id: str,
+) -> dict[str, str | None] | None:
+    """Return output text per request key, or None while the job still runs.
+
+    Requests that failed, or that an expired or cancelled job never reached,
+    map to None so the caller can send them interactively.
+    """
+    job = provider.run_request(
+        lambda: provider.client.batches.get(name=job_id),
+        hedge=False,
+        kind=BATCH_CONTROL_KIND,
+    )
+    if job.state in _RUNNING_STATES:
+        return None
+    if job.state in _FAILED_STATES:
+        raise GeminiBatchError(f"Gemini batch {job_id} failed.")
+    file_name = job.dest.file_name if job.dest is not None else None
+    if not file_name:
+        return {}
+    data = provider.run_request(
+        lambda: provider.client.files.download(file=file_name),
+        hedge=False,
+        kind=BATCH_CONTROL_KIND,
+    )
+    return _batch_output_texts(data)
+
+
+def parse_batch_outputs(
+    outputs: Mapping[str, str | None],
+    parse: Callable[[str | None], dict[str, Any]],
+) -> dict[str, dict[str, Any] | None]:
+    """Parse each output with the interactive parser; unusable items become None."""
+    parsed: dict[str, dict[str, Any] | None] = {}
+    for key, text in outputs.items():
+        try:
+            parsed[key] = parse(text) if text is not None else None
+        except ValueError:
+            parsed[key] = None
+    return parsed
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 import math
@@ -9,13 +10,45 @@ import os
 from pathlib import Path
 import random
 import time
-from typing import Callable, TypeVar
+from typing import Any, Awaitable, Callable, Sequence, TypeVar
 
 from dotenv import dotenv_values
 from google import genai
 from google.genai import errors, types
+from PIL import Image
 
 from glk.config import resolve_settings_root
+from glk.infrastructure.adaptive_concurrency import (
+    AdaptiveConcurrencyLimit,
+    shared_concurrency_limit,
+)
+from glk.infrastructure.image_payload import (
+    ImagePayloadSettings,
+    encode_image,
+    load_image_payload_settings,
+)
+from glk.infrastructure.rate_limit import (
+    SharedRateLimiter,
+    provider_rate_limiter,
+    rate_limited,
+    rate_limited_async,
+)
+from glk.infrastructure.request_hedging import (
+    HedgingPolicy,
+    hedged,
+    hedged_async,
+    provider_hedging_policy,
+)
+from glk.infrastructure.response_cache import (
+    cached_response,
+    cached_response_async,
+    response_cache_key,
+)
+from glk.infrastructure.token_usage import TokenUsage
+from glk.infrastructure.usage_telemetry import (
+    RequestMeter,
+    current_request_meter,
+)
 
 
 DEFAULT_MODEL = "gemini-2.5-flash"
@@ -23,6 +56,7 @@ DEFAULT_REQUEST_TIMEOUT_MS = 180_000
 DEFAULT_RATE_LIMIT_DELAY_SECONDS = 60.0
 MAX_RETRY_DELAY_SECONDS = 300.0
 _RETRYABLE_CLIENT_STATUS_CODES = frozenset({408, 429})
+_CONGESTION_STATUS_CODES = frozenset({429, 503})
 _GEMINI_SETTING_NAMES = ("GEMINI_API_KEY", "GEMINI_MODEL")
 
 ResultT = TypeVar("ResultT")
@@ -149,6 +183,11 @@ def gemini_status_code(error: BaseException) -> int | None:
     return code if isinstance(code, int) and not isinstance(code, bool) else None
 
 
+def is_gemini_congestion(error: BaseException) -> bool:
+    """Return whether a failure means the provider wants less concurrency."""
+    return gemini_status_code(error) in _CONGESTION_STATUS_CODES
+
+
 def is_retryable_gemini_error(error: BaseException) -> bool:
     """Classify API failures by status code instead of message text."""
     code = gemini_status_code(error)
@@ -230,6 +269,17 @@ def gemini_retry_delay(
     )
 
 
+def _validate_retry_policy(*, max_attempts: int, base_delay: float) -> None:
+    if (
+        not isinstance(max_attempts, int)
+        or isinstance(max_attempts, bool)
+        or max_attempts < 1
+    ):
+        raise ValueError("Gemini max attempts must be a positive integer.")
+    if base_delay < 0:
+        raise ValueError("Gemini retry base delay must not be negative.")
+
+
 def run_with_gemini_retry(
     operation: Callable[[], ResultT],
     *,
@@ -239,14 +289,7 @@ def run_with_gemini_retry(
     jitter: Callable[[float, float], float] | None = None,
 ) -> ResultT:
     """Run one provider operation with the shared bounded retry policy."""
-    if (
-        not isinstance(max_attempts, int)
-        or isinstance(max_attempts, bool)
-        or max_attempts < 1
-    ):
-        raise ValueError("Gemini max attempts must be a positive integer.")
-    if base_delay < 0:
-        raise ValueError("Gemini retry base delay must not be negative.")
+    _validate_retry_policy(max_attempts=max_attempts, base_delay=base_delay)
     sleep_for = sleep or time.sleep
     random_jitter = jitter or random.uniform
     for attempt in range(max_attempts):
@@ -268,10 +311,53 @@ def run_with_gemini_retry(
     raise RuntimeError("Gemini retry loop ended unexpectedly.")
 
 
+async def run_with_gemini_retry_async(
+    operation: Callable[[], Awaitable[ResultT]],
+    *,
+    max_attempts: int,
+    base_delay: float,
+    sleep: Callable[[float], Awaitable[None]] | None = None,
+    jitter: Callable[[float, float], float] | None = None,
+) -> ResultT:
+    """Await one provider operation with the same policy as the sync loop.
+
+    Backoff yields to the event loop instead of blocking a thread, so one loop
+    can keep many requests in flight while some of them wait for Retry-After.
+    """
+    _validate_retry_policy(max_attempts=max_attempts, base_delay=base_delay)
+    sleep_for = sleep or asyncio.sleep
+    random_jitter = jitter or random.uniform
+    for attempt in range(max_attempts):
+        try:
+            return await operation()
+        except Exception as error:
+            if (
+                attempt == max_attempts - 1
+                or not is_retryable_gemini_error(error)
+            ):
+                raise
+            await sleep_for(
+                gemini_retry_delay(
+                    error,
+                    attempt=attempt,
+                    base_delay=base_delay,
+                    jitter_seconds=random_jitter(0.0, 0.5),
+                )
+            )
+    raise RuntimeError("Gemini retry loop ended unexpectedly.")
+
+
+def image_content(image: Image.Image, settings: ImagePayloadSettings) -> types.Part:
+    """Encode a PIL image as an inline part of a generateContent request."""
+    payload = encode_image(image, settings)
+    return types.Part.from_bytes(data=payload.data, mime_type=payload.mime_type)
+
+
 class GeminiProviderBase:
     """Shared configuration, client creation, and retry shell for providers."""
 
     provider_name = "gemini"
+    prompt_version: str
 
     def __init__(
         self,
@@ -281,6 +367,10 @@ class GeminiProviderBase:
         max_retries: int = 3,
         base_delay: float = 2,
         request_timeout_ms: int = DEFAULT_REQUEST_TIMEOUT_MS,
+        rate_limiter: SharedRateLimiter | None = None,
+        concurrency_limit: AdaptiveConcurrencyLimit | None = None,
+        hedging: HedgingPolicy | None = None,
+        image_payload: ImagePayloadSettings | None = None,
     ) -> None:
         if not api_key.strip():
             raise GeminiConfigurationError("GEMINI_API_KEY is not configured.")
@@ -288,6 +378,13 @@ class GeminiProviderBase:
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.request_timeout_ms = request_timeout_ms
+        self.rate_limiter = rate_limiter
+        self.concurrency_limit = concurrency_limit or AdaptiveConcurrencyLimit(
+            is_congestion=is_gemini_congestion,
+        )
+        self.hedging = hedging
+        self.image_payload = image_payload or ImagePayloadSettings()
+        self.token_usage = TokenUsage()
         self.client = genai.Client(
             api_key=api_key,
             http_options=gemini_http_options(request_timeout_ms),
@@ -307,15 +404,166 @@ class GeminiProviderBase:
             raise GeminiConfigurationError(
                 "GEMINI_API_KEY is not set. Add it to .env or export it in the shell."
             )
+        configured_model = _configured_model_name(model_name, environment)
         return cls(
             api_key=api_key,
-            model_name=_configured_model_name(model_name, environment),
+            model_name=configured_model,
+            rate_limiter=provider_rate_limiter(
+                provider_name=cls.provider_name,
+                model_name=configured_model,
+                api_key=api_key,
+                settings_root=settings_root,
+            ),
+            concurrency_limit=shared_concurrency_limit(
+                provider_name=cls.provider_name,
+                model_name=configured_model,
+                api_key=api_key,
+                is_congestion=is_gemini_congestion,
+            ),
+            hedging=provider_hedging_policy(
+                operation_name=cls.__name__,
+                provider_name=cls.provider_name,
+                model_name=configured_model,
+                api_key=api_key,
+                settings_root=settings_root,
+            ),
+            image_payload=load_image_payload_settings(settings_root),
+        )
+
+    def record_usage(self, response: Any) -> None:
+        """Add the token counts Gemini reported for one response."""
+        usage = getattr(response, "usage_metadata", None)
+        if usage is None:
+            return
+        counts = {
+            "input_tokens": usage.prompt_token_count,
+            "cached_input_tokens": usage.cached_content_token_count,
+            "output_tokens": usage.candidates_token_count,
+        }
+        self.token_usage.add(**counts)
+        meter = current_request_meter()
+        if meter is not None:
+            meter.add_tokens(**counts)
+        if self.rate_limiter is not None:
+            self.rate_limiter.spend_tokens(
+                usage.prompt_token_count,
+                usage.candidates_token_count,
+            )
+
+    def request_meter(self) -> RequestMeter:
+        return RequestMeter(
+            provider_name=self.provider_name,
+            model_name=self.model_name,
         )
 
-    def run_request(self, operation: Callable[[], ResultT]) -> ResultT:
-        """Run one provider request with the shared retry policy."""
-        return run_with_gemini_retry(
-            operation,
-            max_attempts=self.max_retries,
-            base_delay=self.base_delay,
+    def run_request(
+        self,
+        operation: Callable[[], ResultT],
+        *,
+        meter: RequestMeter | None = None,
+        hedge: bool = True,
+        kind: str | None = None,
+    ) -> ResultT:
+        """Run one provider request with the shared budget and retry policy.
+
+        The request is measured and reported to the current request scope.
+        A caller that passes its own meter finishes it after success, for
+        example once a streamed response has been read to the end. With a
+        hedging policy, an attempt slower than the policy's latency
+        percentile is raced by a duplicate unless ``hedge`` is False.
+        ``kind`` keys the request's latency in the shared concurrency limit
+        and defaults to the provider class.
+        """
+        request_meter = meter or self.request_meter()
+        try:
+            result = run_with_gemini_retry(
+                hedged(
+                    self.hedging if hedge else None,
+                    rate_limited(
+                        self.rate_limiter,
+                        lambda: self.concurrency_limit.call(
+                            request_meter.attempt(operation),
+                            kind=kind or type(self).__name__,
+                        ),
+                    ),
+                    meter=request_meter,
+                ),
+                max_attempts=self.max_retries,
+                base_delay=self.base_delay,
+            )
+        except BaseException as error:
+            request_meter.finish(gemini_failure_code(error))
+            raise
+        if meter is None:
+            request_meter.finish()
+        return result
+
+    async def run_request_async(
+        self,
+        operation: Callable[[], Awaitable[ResultT]],
+    ) -> ResultT:
+        """Await one provider request with the shared budget and retry policy."""
+        meter = self.request_meter()
+        try:
+            result = await run_with_gemini_retry_async(
+                hedged_async(
+                    self.hedging,
+                    rate_limited_async(
+                        self.rate_limiter,
+                        lambda: self.concurrency_limit.call_async(
+                            meter.attempt_async(operation),
+                            kind=type(self).__name__,
+                        ),
+                    ),
+                    meter=meter,
+                ),
+                max_attempts=self.max_retries,
+                base_delay=self.base_delay,
+            )
+        except BaseException as error:
+            meter.finish(gemini_failure_code(error))
+            raise
+        meter.finish()
+        return result
+
+    def response_key(
+        self,
+        prompt: str,
+        images: Sequence[Image.Image] = (),
+    ) -> str:
+        return response_cache_key(
+            provider_name=self.provider_name,
+            model_name=self.model_name,
+            prompt_version=self.prompt_version,
+            prompt=prompt,
+            images=images,
+            image_encoding=self.image_payload.key(),
+        )
+
+    def run_cached_request(
+        self,
+        operation: Callable[[], dict[str, Any]],
+        *,
+        prompt: str,
+        images: Sequence[Image.Image] = (),
+    ) -> dict[str, Any]:
+        """Answer from the response cache in scope, or run and store the request.
+
+        A hit sends nothing, so it is neither measured nor rate limited.
+        """
+        return cached_response(
+            lambda: self.response_key(prompt, images),
+            lambda: self.run_request(operation),
+        )
+
+    async def run_cached_request_async(
+        self,
+        operation: Callable[[], Awaitable[dict[str, Any]]],
+        *,
+        prompt: str,
+        images: Sequence[Image.Image] = (),
+    ) -> dict[str, Any]:
+        return await cached_response_async(
+            lambda: self.response_key(prompt, images),
+            lambda: self.run_request_async(operation),
         )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 import json
 from typing import Any
 
@@ -9,9 +10,19 @@ from google.genai import types
 from PIL import Image
 
 from glk.extraction.layout import (
+    PACKED_RESPONSE_SCHEMA,
     PROMPT_VERSION,
     RESPONSE_SCHEMA,
     build_layout_prompt,
+    build_packed_layout_prompt,
+    split_packed_layouts,
+)
+from glk.infrastructure.gemini_batch import (
+    gemini_batch_outputs,
+    generate_content_request,
+    image_part,
+    parse_batch_outputs,
+    submit_gemini_batch,
 )
 from glk.infrastructure.gemini_common import (
     DEFAULT_MODEL,
@@ -19,9 +30,11 @@ from glk.infrastructure.gemini_common import (
     GeminiEmptyResponseError,
     GeminiProviderBase,
     GeminiResponseError,
+    image_content,
     load_gemini_environment,
     resolve_model_name,
 )
+from glk.infrastructure.image_payload import ImagePayloadSettings
 
 
 __all__ = [
@@ -33,40 +46,141 @@ __all__ = [
 ]
 
 
+def _layout_config(
+    schema: dict[str, Any] = RESPONSE_SCHEMA,
+) -> types.GenerateContentConfig:
+    return types.GenerateContentConfig(
+        temperature=0,
+        response_mime_type="application/json",
+        response_json_schema=schema,
+    )
+
+
+def _batch_layout_request(
+    prompt: str,
+    page_image: Image.Image,
+    image_payload: ImagePayloadSettings,
+) -> dict[str, Any]:
+    return generate_content_request(
+        [{"text": prompt}, image_part(page_image, image_payload)],
+        generation_config={
+            "temperature": 0,
+            "response_mime_type": "application/json",
+            "response_json_schema": RESPONSE_SCHEMA,
+        },
+    )
+
+
+def _parse_layout_response(text: str | None) -> dict[str, Any]:
+    if not text:
+        raise GeminiEmptyResponseError("Gemini returned an empty layout response.")
+    try:
+        layout = json.loads(text)
+    except json.JSONDecodeError as error:
+        raise GeminiResponseError(
+            "Gemini returned an invalid layout response."
+        ) from error
+    if not isinstance(layout, dict):
+        raise GeminiResponseError("Gemini returned a non-object layout response.")
+    return layout
+
+
 class GeminiLayoutProvider(GeminiProviderBase):
     prompt_version = PROMPT_VERSION
 
     def reconstruct(
         self, page_number: int, fragments: list[dict[str, Any]], page_image: Image.Image
     ) -> dict[str, Any]:
-        config = types.GenerateContentConfig(
-            temperature=0,
-            response_mime_type="application/json",
-            response_json_schema=RESPONSE_SCHEMA,
-        )
+        config = _layout_config()
         prompt = build_layout_prompt(page_number, fragments)
 
         def request() -> dict[str, Any]:
-            contents: list[types.PartUnionDict] = [prompt, page_image]
+            contents: list[types.PartUnionDict] = [
+                prompt,
+                image_content(page_image, self.image_payload),
+            ]
             response = self.client.models.generate_content(
                 model=self.model_name,
                 contents=contents,
                 config=config,
             )
-            if not response.text:
-                raise GeminiEmptyResponseError(
-                    "Gemini returned an empty layout response."
-                )
-            try:
-                layout = json.loads(response.text)
-            except json.JSONDecodeError as error:
-                raise GeminiResponseError(
-                    "Gemini returned an invalid layout response."
-                ) from error
-            if not isinstance(layout, dict):
-                raise GeminiResponseError(
-                    "Gemini returned a non-object layout response."
+            self.record_usage(response)
+            return _parse_layout_response(response.text)
+
+        return self.run_cached_request(request, prompt=prompt, images=(page_image,))
+
+    async def reconstruct_async(
+        self, page_number: int, fragments: list[dict[str, Any]], page_image: Image.Image
+    ) -> dict[str, Any]:
+        config = _layout_config()
+        prompt = build_layout_prompt(page_number, fragments)
+
+        async def request() -> dict[str, Any]:
+            contents: list[types.PartUnionDict] = [
+                prompt,
+                image_content(page_image, self.image_payload),
+            ]
+            response = await self.client.aio.models.generate_content(
+                model=self.model_name,
+                contents=contents,
+                config=config,
+            )
+            self.record_usage(response)
+            return _parse_layout_response(response.text)
+
+        return await self.run_cached_request_async(
+            request, prompt=prompt, images=(page_image,)
+        )
+
+    def reconstruct_pages(
+        self,
+        pages: Sequence[tuple[int, list[dict[str, Any]], Image.Image]],
+    ) -> dict[int, dict[str, Any]]:
+        config = _layout_config(PACKED_RESPONSE_SCHEMA)
+        prompt = build_packed_layout_prompt(
+            [(page_number, fragments) for page_number, fragments, _ in pages]
+        )
+
+        def request() -> dict[str, Any]:
+            contents: list[types.PartUnionDict] = [prompt]
+            for page_number, _fragments, page_image in pages:
+                contents.append(f"PDF page index {page_number}:")
+                contents.append(image_content(page_image, self.image_payload))
+            response = self.client.models.generate_content(
+                model=self.model_name,
+                contents=contents,
+                config=config,
+            )
+            self.record_usage(response)
+            return _parse_layout_response(response.text)
+
+        response = self.run_cached_request(
+            request,
+            prompt=prompt,
+            images=tuple(page_image for _, _, page_image in pages),
+        )
+        return split_packed_layouts(response, [page[0] for page in pages])
+
+    def submit_layout_batch(
+        self,
+        pages: Mapping[str, tuple[int, list[dict[str, Any]], Image.Image]],
+    ) -> str:
+        return submit_gemini_batch(
+            self,
+            {
+                key: _batch_layout_request(
+                    build_layout_prompt(page_number, fragments),
+                    page_image,
+                    self.image_payload,
                 )
-            return layout
+                for key, (page_number, fragments, page_image) in pages.items()
+            },
+        )
 
-        return self.run_request(request)
+    def layout_batch_results(
+        self, job_id: str
+    ) -> dict[str, dict[str, Any] | None] | None:
+        outputs = gemini_batch_outputs(self, job_id)
+        if outputs is None:
+            return None
+        return parse_batch_outputs(outputs, _parse_layout_response)
@@ -17,37 +17,66 @@ from glk.infrastructure.gemini_common import (
     GeminiEmptyResponseError,
     GeminiProviderBase,
     GeminiResponseError,
+    image_content,
 )
 
 
+def _ocr_config() -> types.GenerateContentConfig:
+    return types.GenerateContentConfig(
+        temperature=0,
+        response_mime_type="application/json",
+        response_json_schema=OCR_RESPONSE_SCHEMA,
+    )
+
+
+def _parse_ocr_response(text: str | None) -> dict[str, Any]:
+    if not text:
+        raise GeminiEmptyResponseError("Gemini returned an empty OCR response.")
+    try:
+        return validate_ocr_result(json.loads(text))
+    except (json.JSONDecodeError, ValueError, TypeError) as error:
+        raise GeminiResponseError("Gemini returned an invalid OCR response.") from error
+
+
 class GeminiImageOcrProvider(GeminiProviderBase):
     """Send one target image and its text instructions to Gemini."""
 
     prompt_version = OCR_PROMPT_VERSION
 
     def transcribe(self, prompt: str, image: Image.Image) -> dict[str, Any]:
-        config = types.GenerateContentConfig(
-            temperature=0,
-            response_mime_type="application/json",
-            response_json_schema=OCR_RESPONSE_SCHEMA,
-        )
+        config = _ocr_config()
 
         def request() -> dict[str, Any]:
-            contents: list[types.PartUnionDict] = [prompt, image]
+            contents: list[types.PartUnionDict] = [
+                prompt,
+                image_content(image, self.image_payload),
+            ]
             response = self.client.models.generate_content(
                 model=self.model_name,
                 contents=contents,
                 config=config,
             )
-            if not response.text:
-                raise GeminiEmptyResponseError(
-                    "Gemini returned an empty OCR response."
-                )
-            try:
-                return validate_ocr_result(json.loads(response.text))
-            except (json.JSONDecodeError, ValueError, TypeError) as error:
-                raise GeminiResponseError(
-                    "Gemini returned an invalid OCR response."
-                ) from error
-
-        return self.run_request(request)
+            self.record_usage(response)
+            return _parse_ocr_response(response.text)
+
+        return self.run_cached_request(request, prompt=prompt, images=(image,))
+
+    async def transcribe_async(self, prompt: str, image: Image.Image) -> dict[str, Any]:
+        config = _ocr_config()
+
+        async def request() -> dict[str, Any]:
+            contents: list[types.PartUnionDict] = [
+                prompt,
+                image_content(image, self.image_payload),
+            ]
+            response = await self.client.aio.models.generate_content(
+                model=self.model_name,
+                contents=contents,
+                config=config,
+            )
+            self.record_usage(response)
+            return _parse_ocr_response(response.text)
+
+        return await self.run_cached_request_async(
+            request, prompt=prompt, images=(image,)
+        )
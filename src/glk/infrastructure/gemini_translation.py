@@ -2,15 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterator, Mapping
+import hashlib
+import itertools
 import json
+import threading
+import time
 from typing import Any
 
-from google.genai import types
+from google.genai import errors, types
 
-from glk.infrastructure.gemini_common import GeminiProviderBase
+from glk.application._token_estimate import estimate_tokens, token_estimate_profile
+from glk.infrastructure.gemini_batch import (
+    gemini_batch_outputs,
+    generate_content_request,
+    parse_batch_outputs,
+    submit_gemini_batch,
+)
+from glk.infrastructure.gemini_common import (
+    GeminiProviderBase,
+    gemini_failure_code,
+    gemini_status_code,
+)
+from glk.infrastructure.response_cache import (
+    active_response_key,
+    lookup_response,
+    store_response,
+)
+from glk.infrastructure.translation_prompt import split_translation_prompt
+from glk.infrastructure.translation_stream import (
+    TranslationItemStream,
+    translation_items,
+)
 
 
-TRANSLATION_PROVIDER_PROMPT_VERSION = "gemini-translation-json-v1"
+TRANSLATION_PROVIDER_PROMPT_VERSION = "gemini-translation-json-v2"
+CONTEXT_CACHE_TTL_SECONDS = 600
+# Gemini rejects explicit caches below 1,024 tokens.
+CONTEXT_CACHE_MIN_PREFIX_TOKENS = 1024
+_CONTEXT_CACHE_RENEW_MARGIN_SECONDS = 60
+_STALE_CONTEXT_CACHE_STATUS_CODES = frozenset({400, 403, 404})
 TRANSLATION_SYSTEM_INSTRUCTION = """\
 You translate approved source blocks into Korean.
 The NON-OVERRIDABLE HARD RULES and APPROVED TERMBASE in the request have higher
@@ -38,30 +70,250 @@ TRANSLATION_RESPONSE_SCHEMA = {
 }
 
 
+def _translation_config(
+    cached_content: str | None = None,
+) -> types.GenerateContentConfig:
+    # A cached context already carries the system instruction.
+    return types.GenerateContentConfig(
+        temperature=0,
+        system_instruction=(
+            TRANSLATION_SYSTEM_INSTRUCTION if cached_content is None else None
+        ),
+        cached_content=cached_content,
+        response_mime_type="application/json",
+        response_json_schema=TRANSLATION_RESPONSE_SCHEMA,
+    )
+
+
+def _batch_translation_request(prompt: str) -> dict[str, Any]:
+    return generate_content_request(
+        [{"text": prompt}],
+        generation_config={
+            "temperature": 0,
+            "response_mime_type": "application/json",
+            "response_json_schema": TRANSLATION_RESPONSE_SCHEMA,
+        },
+        system_instruction=TRANSLATION_SYSTEM_INSTRUCTION,
+    )
+
+
+def _parse_translation_response(text: str | None) -> dict[str, Any]:
+    if not text:
+        raise ValueError("Gemini returned an empty translation response.")
+    value = json.loads(text)
+    if not isinstance(value, dict):
+        raise ValueError("Gemini returned a non-object translation response.")
+    return value
+
+
 class GeminiTranslationProvider(GeminiProviderBase):
-    """Translate one structured chunk and return ID-linked Korean text."""
+    """Translate one structured chunk and return ID-linked Korean text.
+
+    A prompt prefix long enough for Gemini explicit context caching is
+    uploaded once as a cached content object and reused until shortly before
+    its TTL ends. Shorter prefixes still benefit from implicit caching because
+    every chunk prompt starts with the same bytes.
+    """
 
     prompt_version = TRANSLATION_PROVIDER_PROMPT_VERSION
 
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._context_caches: dict[str, tuple[str, float]] = {}
+        self._uncacheable_prefixes: set[str] = set()
+        self._context_cache_lock = threading.Lock()
+        self._prefix_locks: dict[str, threading.Lock] = {}
+
+    def _context_cache(self, prefix: str) -> str | None:
+        """Return a live cached content name for the prefix, creating it once.
+
+        Creation is a network call, so only chunks waiting for the same prefix
+        wait for it.
+        """
+        key = hashlib.sha256(prefix.encode("utf-8")).hexdigest()
+        with self._context_cache_lock:
+            if key in self._uncacheable_prefixes:
+                return None
+            cached = self._context_caches.get(key)
+            if cached is not None and cached[1] > time.monotonic():
+                return cached[0]
+            prefix_lock = self._prefix_locks.setdefault(key, threading.Lock())
+        profile = token_estimate_profile(self.provider_name, self.model_name)
+        if estimate_tokens(prefix, profile) < CONTEXT_CACHE_MIN_PREFIX_TOKENS:
+            with self._context_cache_lock:
+                self._uncacheable_prefixes.add(key)
+            return None
+        with prefix_lock:
+            # Another chunk may have created the cache while this one waited.
+            with self._context_cache_lock:
+                if key in self._uncacheable_prefixes:
+                    return None
+                cached = self._context_caches.get(key)
+                if cached is not None and cached[1] > time.monotonic():
+                    return cached[0]
+            try:
+                cache = self.client.caches.create(
+                    model=self.model_name,
+                    config=types.CreateCachedContentConfig(
+                        display_name=f"glk-translation-{key[:12]}",
+                        system_instruction=TRANSLATION_SYSTEM_INSTRUCTION,
+                        contents=types.Content(
+                            role="user",
+                            parts=[types.Part(text=prefix)],
+                        ),
+                        ttl=f"{CONTEXT_CACHE_TTL_SECONDS}s",
+                    ),
+                )
+            except errors.APIError as error:
+                status = gemini_status_code(error)
+                if status is not None and 400 <= status <= 499 and status != 429:
+                    with self._context_cache_lock:
+                        self._uncacheable_prefixes.add(key)
+                return None
+            if not cache.name:
+                return None
+            with self._context_cache_lock:
+                self._context_caches[key] = (
+                    cache.name,
+                    time.monotonic()
+                    + CONTEXT_CACHE_TTL_SECONDS
+                    - _CONTEXT_CACHE_RENEW_MARGIN_SECONDS,
+                )
+            return cache.name
+
+    def _forget_context_cache(self, prefix: str) -> None:
+        key = hashlib.sha256(prefix.encode("utf-8")).hexdigest()
+        with self._context_cache_lock:
+            self._context_caches.pop(key, None)
+
     def translate(self, prompt: str) -> dict[str, Any]:
-        config = types.GenerateContentConfig(
-            temperature=0,
-            system_instruction=TRANSLATION_SYSTEM_INSTRUCTION,
-            response_mime_type="application/json",
-            response_json_schema=TRANSLATION_RESPONSE_SCHEMA,
-        )
+        prefix, suffix = split_translation_prompt(prompt)
+
+        def generate(contents: str, cached_content: str | None = None) -> Any:
+            return self.client.models.generate_content(
+                model=self.model_name,
+                contents=contents,
+                config=_translation_config(cached_content),
+            )
 
         def request() -> dict[str, Any]:
-            response = self.client.models.generate_content(
+            cache_name = self._context_cache(prefix)
+            if cache_name is None:
+                response = generate(prompt)
+            else:
+                try:
+                    response = generate(suffix, cache_name)
+                except errors.APIError as error:
+                    # The cache expired or was deleted on the server.
+                    if gemini_status_code(error) not in _STALE_CONTEXT_CACHE_STATUS_CODES:
+                        raise
+                    self._forget_context_cache(prefix)
+                    response = generate(prompt)
+            self.record_usage(response)
+            return _parse_translation_response(response.text)
+
+        return self.run_cached_request(request, prompt=prompt)
+
+    def translate_stream(self, prompt: str) -> Iterator[dict[str, Any]]:
+        """Yield translated items as soon as each one is fully generated.
+
+        Opening the stream is retried like any request. A failure after items
+        started arriving propagates, so the caller can request only the blocks
+        that are still missing. Streams are never hedged: a duplicate stream
+        would be left open, and partial items already bound the tail. Only a
+        stream read to the end is stored in the response cache; a cached
+        answer is replayed item by item.
+        """
+        cache_key = active_response_key(lambda: self.response_key(prompt))
+        cached = lookup_response(cache_key)
+        if cached is not None:
+            yield from translation_items(cached)
+            return
+        prefix, suffix = split_translation_prompt(prompt)
+
+        def open_stream(
+            contents: str, cached_content: str | None = None
+        ) -> tuple[Any, Iterator[Any]]:
+            stream = self.client.models.generate_content_stream(
                 model=self.model_name,
-                contents=prompt,
-                config=config,
+                contents=contents,
+                config=_translation_config(cached_content),
             )
-            if not response.text:
-                raise ValueError("Gemini returned an empty translation response.")
-            value = json.loads(response.text)
-            if not isinstance(value, dict):
-                raise ValueError("Gemini returned a non-object translation response.")
-            return value
-
-        return self.run_request(request)
+            # The SDK sends the request when the first chunk is read.
+            return next(stream, None), stream
+
+        def request() -> tuple[Any, Iterator[Any]]:
+            cache_name = self._context_cache(prefix)
+            if cache_name is None:
+                return open_stream(prompt)
+            try:
+                return open_stream(suffix, cache_name)
+            except errors.APIError as error:
+                if gemini_status_code(error) not in _STALE_CONTEXT_CACHE_STATUS_CODES:
+                    raise
+                self._forget_context_cache(prefix)
+                return open_stream(prompt)
+
+        meter = self.request_meter()
+        first, stream = self.run_request(request, meter=meter, hedge=False)
+        parser = TranslationItemStream()
+        usage_chunk = None
+        try:
+            for chunk in itertools.chain(
+                [first] if first is not None else [], stream
+            ):
+                if chunk.usage_metadata is not None:
+                    usage_chunk = chunk
+                yield from parser.feed(chunk.text or "")
+            with meter.active():
+                self.record_usage(usage_chunk)
+            parser.close()
+        except BaseException as error:
+            meter.finish(gemini_failure_code(error))
+            raise
+        meter.finish()
+        store_response(cache_key, {"translations": parser.items})
+
+    async def translate_async(self, prompt: str) -> dict[str, Any]:
+        prefix, suffix = split_translation_prompt(prompt)
+
+        async def generate(contents: str, cached_content: str | None = None) -> Any:
+            return await self.client.aio.models.generate_content(
+                model=self.model_name,
+                contents=contents,
+                config=_translation_config(cached_content),
+            )
+
+        async def request() -> dict[str, Any]:
+            cache_name = await asyncio.to_thread(self._context_cache, prefix)
+            if cache_name is None:
+                response = await generate(prompt)
+            else:
+                try:
+                    response = await generate(suffix, cache_name)
+                except errors.APIError as error:
+                    if gemini_status_code(error) not in _STALE_CONTEXT_CACHE_STATUS_CODES:
+                        raise
+                    self._forget_context_cache(prefix)
+                    response = await generate(prompt)
+            self.record_usage(response)
+            return _parse_translation_response(response.text)
+
+        return await self.run_cached_request_async(request, prompt=prompt)
+
+    def submit_translation_batch(self, prompts: Mapping[str, str]) -> str:
+        return submit_gemini_batch(
+            self,
+            {
+                key: _batch_translation_request(prompt)
+                for key, prompt in prompts.items()
+            },
+        )
+
+    def translation_batch_results(
+        self, job_id: str
+    ) -> dict[str, dict[str, Any] | None] | None:
+        outputs = gemini_batch_outputs(self, job_id)
+        if outputs is None:
+            return None
+        return parse_batch_outputs(outputs, _parse_translation_response)
@@ -0,0 +1,257 @@
+"""Compact encodings for the page and photo images sent to providers."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from io import BytesIO
+import os
+from pathlib import Path
+import threading
+
+from dotenv import dotenv_values
+from PIL import Image, ImageChops
+
+from glk.config import resolve_settings_root
+from glk.infrastructure.response_cache import image_sha256
+
+
+IMAGE_PAYLOAD_SETTING_NAMES = (
+    "GLK_IMAGE_FORMAT",
+    "GLK_IMAGE_QUALITY",
+    "GLK_IMAGE_MAX_KB",
+    "GLK_IMAGE_MAX_DIMENSION",
+    "GLK_IMAGE_COLOR",
+    "GLK_IMAGE_CROP",
+)
+IMAGE_FORMATS = ("webp", "jpeg", "png")
+IMAGE_COLOR_MODES = ("auto", "gray", "palette", "full")
+# Both providers downscale larger images to about this size before the model
+# sees them, so uploading more pixels only costs transfer time.
+DEFAULT_MAX_DIMENSION = 2048
+DEFAULT_QUALITY = 90
+_MIME_TYPES = {"webp": "image/webp", "jpeg": "image/jpeg", "png": "image/png"}
+_PALETTE_COLORS = 64
+# A byte budget lowers lossy quality in these steps down to the floor, then
+# shrinks the image until it fits or reaches the minimum dimension.
+_QUALITY_STEP = 10
+_MIN_QUALITY = 40
+_SHRINK_RATIO = 0.8
+_MIN_DIMENSION = 512
+# A page counts as black and white when almost no pixel has visible color.
+_CHROMA_THRESHOLD = 32
+_COLORED_PIXEL_RATIO = 0.005
+_ENCODED_CACHE_ENTRIES = 32
+
+
+@dataclass(frozen=True, slots=True)
+class ImagePayloadSettings:
+    """How images are encoded before upload.
+
+    ``max_kb`` and ``max_dimension`` of 0 mean no limit. ``crop`` lets the
+    PDF extraction cut page images down to the text area before they reach
+    a provider; the encoder itself ignores it.
+    """
+
+    format: str = "webp"
+    quality: int = DEFAULT_QUALITY
+    max_kb: int = 0
+    max_dimension: int = DEFAULT_MAX_DIMENSION
+    color: str = "auto"
+    crop: bool = True
+
+    def __post_init__(self) -> None:
+        if self.format not in IMAGE_FORMATS:
+            raise ValueError(f"image format must be one of {', '.join(IMAGE_FORMATS)}.")
+        if self.color not in IMAGE_COLOR_MODES:
+            raise ValueError(
+                f"image color must be one of {', '.join(IMAGE_COLOR_MODES)}."
+            )
+        if not 1 <= self.quality <= 100:
+            raise ValueError("image quality must be from 1 to 100.")
+        if self.max_kb < 0 or self.max_dimension < 0:
+            raise ValueError("image size limits must not be negative.")
+
+    def key(self) -> str:
+        """Identify the encoding, so cached responses follow setting changes."""
+        return (
+            f"{self.format}:q{self.quality}:kb{self.max_kb}:"
+            f"px{self.max_dimension}:{self.color}"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedImage:
+    data: bytes
+    mime_type: str
+
+
+def _integer_setting(name: str, value: str, *, minimum: int, maximum: int) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = minimum - 1
+    if not minimum <= number <= maximum:
+        raise ValueError(f"{name} must be an integer from {minimum} to {maximum}.")
+    return number
+
+
+def load_image_payload_settings(
+    settings_root: str | os.PathLike[str] | None = None,
+) -> ImagePayloadSettings:
+    """Read image upload settings; shell variables take precedence over ``.env``."""
+    normalized_root = Path(settings_root) if settings_root is not None else None
+    parsed = dotenv_values(resolve_settings_root(normalized_root) / ".env")
+    values: dict[str, str] = {}
+    for name in IMAGE_PAYLOAD_SETTING_NAMES:
+        environment_value = os.getenv(name, "").strip()
+        file_value = parsed.get(name)
+        if environment_value:
+            values[name] = environment_value
+        elif isinstance(file_value, str) and file_value.strip():
+            values[name] = file_value.strip()
+    defaults = ImagePayloadSettings()
+    image_format = values.get("GLK_IMAGE_FORMAT", defaults.format).lower()
+    if image_format == "jpg":
+        image_format = "jpeg"
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"GLK_IMAGE_FORMAT must be one of {', '.join(IMAGE_FORMATS)}.")
+    color = values.get("GLK_IMAGE_COLOR", defaults.color).lower()
+    if color not in IMAGE_COLOR_MODES:
+        raise ValueError(
+            f"GLK_IMAGE_COLOR must be one of {', '.join(IMAGE_COLOR_MODES)}."
+        )
+    crop = values.get("GLK_IMAGE_CROP", "on").lower()
+    if crop not in {"on", "off", "true", "false", "1", "0"}:
+        raise ValueError("GLK_IMAGE_CROP must be on or off.")
+    return ImagePayloadSettings(
+        format=image_format,
+        quality=(
+            _integer_setting(
+                "GLK_IMAGE_QUALITY",
+                values["GLK_IMAGE_QUALITY"],
+                minimum=1,
+                maximum=100,
+            )
+            if "GLK_IMAGE_QUALITY" in values
+            else defaults.quality
+        ),
+        max_kb=(
+            _integer_setting(
+                "GLK_IMAGE_MAX_KB",
+                values["GLK_IMAGE_MAX_KB"],
+                minimum=0,
+                maximum=1_000_000,
+            )
+            if "GLK_IMAGE_MAX_KB" in values
+            else defaults.max_kb
+        ),
+        max_dimension=(
+            _integer_setting(
+                "GLK_IMAGE_MAX_DIMENSION",
+                values["GLK_IMAGE_MAX_DIMENSION"],
+                minimum=0,
+                maximum=100_000,
+            )
+            if "GLK_IMAGE_MAX_DIMENSION" in values
+            else defaults.max_dimension
+        ),
+        color=color,
+        crop=crop in {"on", "true", "1"},
+    )
+
+
+def is_achromatic(image: Image.Image) -> bool:
+    """Whether an image is black, white and gray apart from stray pixels."""
+    if image.mode in {"1", "L", "LA", "I", "F"}:
+        return True
+    sample = image.convert("RGB")
+    sample.thumbnail((256, 256))
+    red, green, blue = sample.split()
+    lightest = ImageChops.lighter(ImageChops.lighter(red, green), blue)
+    darkest = ImageChops.darker(ImageChops.darker(red, green), blue)
+    histogram = ImageChops.subtract(lightest, darkest).histogram()
+    colored = sum(histogram[_CHROMA_THRESHOLD:])
+    return colored <= sum(histogram) * _COLORED_PIXEL_RATIO
+
+
+def _clamped(image: Image.Image, max_dimension: int) -> Image.Image:
+    if not max_dimension or max(image.size) <= max_dimension:
+        return image
+    ratio = max_dimension / max(image.size)
+    size = (
+        max(round(image.width * ratio), 1),
+        max(round(image.height * ratio), 1),
+    )
+    return image.resize(size, Image.Resampling.LANCZOS)
+
+
+def _reduced_colors(image: Image.Image, settings: ImagePayloadSettings) -> Image.Image:
+    if settings.color == "full" or (
+        settings.color == "auto" and not is_achromatic(image)
+    ):
+        return image.convert("RGB")
+    if settings.color == "palette" and settings.format != "jpeg":
+        return image.convert("RGB").quantize(colors=_PALETTE_COLORS)
+    return image.convert("L")
+
+
+def _encode(image: Image.Image, image_format: str, quality: int) -> bytes:
+    buffer = BytesIO()
+    if image_format == "png":
+        image.save(buffer, format="PNG", optimize=True)
+    elif image_format == "webp":
+        image.save(buffer, format="WEBP", quality=quality, method=4)
+    else:
+        image.save(buffer, format="JPEG", quality=quality, optimize=True)
+    return buffer.getvalue()
+
+
+def _optimized(image: Image.Image, settings: ImagePayloadSettings) -> bytes:
+    prepared = _reduced_colors(_clamped(image, settings.max_dimension), settings)
+    quality = settings.quality
+    data = _encode(prepared, settings.format, quality)
+    budget = settings.max_kb * 1024
+    if not budget:
+        return data
+    while len(data) > budget and settings.format != "png" and quality > _MIN_QUALITY:
+        quality = max(quality - _QUALITY_STEP, _MIN_QUALITY)
+        data = _encode(prepared, settings.format, quality)
+    while len(data) > budget and max(prepared.size) > _MIN_DIMENSION:
+        target = max(round(max(prepared.size) * _SHRINK_RATIO), _MIN_DIMENSION)
+        prepared = _reduced_colors(_clamped(image, target), settings)
+        data = _encode(prepared, settings.format, quality)
+    # Past the minimum size the smallest encoding is sent anyway; refusing
+    # the request would lose the page.
+    return data
+
+
+_encoded_images: OrderedDict[tuple[str, str], EncodedImage] = OrderedDict()
+_encoded_images_lock = threading.Lock()
+
+
+def encode_image(
+    image: Image.Image,
+    settings: ImagePayloadSettings,
+) -> EncodedImage:
+    """Encode an image for upload, reusing the bytes of a recent identical call.
+
+    Retries, hedged duplicates and validation re-sends of one page share the
+    encoding, which is keyed by the decoded pixels and the settings.
+    """
+    key = (image_sha256(image), settings.key())
+    with _encoded_images_lock:
+        encoded = _encoded_images.get(key)
+        if encoded is not None:
+            _encoded_images.move_to_end(key)
+            return encoded
+    encoded = EncodedImage(
+        _optimized(image, settings),
+        _MIME_TYPES[settings.format],
+    )
+    with _encoded_images_lock:
+        _encoded_images[key] = encoded
+        _encoded_images.move_to_end(key)
+        while len(_encoded_images) > _ENCODED_CACHE_ENTRIES:
+            _encoded_images.popitem(last=False)
+    return encoded
@@ -0,0 +1,149 @@
+"""OpenAI Batch API submission and result download for Responses requests."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+import json
+from typing import Any
+
+from glk.infrastructure.adaptive_concurrency import BATCH_CONTROL_KIND
+from glk.infrastructure.openai_common import OpenAIProviderBase, OpenAIResponseError
+
+
+BATCH_ENDPOINT = "/v1/responses"
+BATCH_COMPLETION_WINDOW = "24h"
+_RUNNING_STATUSES = frozenset({"validating", "in_progress", "finalizing", "cancelling"})
+_FAILED_STATUSES = frozenset({"failed"})
+
+
+class OpenAIBatchError(OpenAIResponseError):
+    """Raised when OpenAI rejects or loses a whole batch job."""
+
+    code = "OPENAI_BATCH_FAILED"
+
+
+def batch_request_file(requests: Mapping[str, dict[str, Any]]) -> bytes:
+    """Serialize Responses request bodies as Batch API input lines."""
+    lines = [
+        json.dumps(
+            {
+                "custom_id": key,
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": body,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        for key, body in requests.items()
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _response_output_text(body: Any) -> str | None:
+    # Raw response JSON has no ``output_text``; that is an SDK convenience.
+    if not isinstance(body, dict):
+        return None
+    texts = [
+        content["text"]
+        for item in body.get("output") or []
+        if isinstance(item, dict) and item.get("type") == "message"
+        for content in item.get("content") or []
+        if isinstance(content, dict)
+        and content.get("type") == "output_text"
+        and isinstance(content.get("text"), str)
+    ]
+    return "".join(texts) or None
+
+
+def _batch_output_texts(data: bytes) -> dict[str, str | None]:
+    outputs: dict[str, str | None] = {}
+    for line in data.decode("utf-8").splitlines():
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError as error:
+            raise OpenAIBatchError(
+                "OpenAI returned an invalid batch output line."
+            ) from error
+        if not isinstance(item, dict) or not isinstance(item.get("custom_id"), str):
+            raise OpenAIBatchError("OpenAI returned a batch output without custom_id.")
+        response = item.get("response")
+        if (
+            item.get("error") is None
+            and isinstance(response, dict)
+            and response.get("status_code") == 200
+        ):
+            outputs[item["custom_id"]] = _response_output_text(response.get("body"))
+        else:
+            outputs[item["custom_id"]] = None
+    return outputs
+
+
+def submit_openai_batch(
+    provider: OpenAIProviderBase,
+    requests: Mapping[str, dict[str, Any]],
+) -> str:
+    """Upload request bodies and start one Responses batch job."""
+    data = batch_request_file(requests)
+
+    def request() -> str:
+        uploaded = provider.client.files.create(
+            file=("glk-batch.jsonl", data, "application/jsonl"),
+            purpose="batch",
+        )
+        batch = provider.client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=BATCH_COMPLETION_WINDOW,
+        )
+        return batch.id
+
+    # Creating a job is not idempotent, so a hedged duplicate would start a
+    # second paid job.
+    return provider.run_request(request, hedge=False, kind=BATCH_CONTROL_KIND)
+
+
+def openai_batch_outputs(
+    provider: OpenAIProviderBase,
+    job_id: str,
+) -> dict[str, str | None] | None:
+    """Return output text per request key, or None while the job still runs.
+
+    Requests that failed, or that an expired or cancelled job never reached,
+    map to None so the caller can send them interactively.
+    """
+    batch = provider.run_request(
+        lambda: provider.client.batches.retrieve(job_id),
+        hedge=False,
+        kind=BATCH_CONTROL_KIND,
+    )
+    if batch.status in _RUNNING_STATUSES:
+        return None
+    if batch.status in _FAILED_STATUSES:
+        raise OpenAIBatchError(f"OpenAI batch {job_id} failed validation.")
+    outputs: dict[str, str | None] = {}
+    for file_id in (batch.error_file_id, batch.output_file_id):
+        if file_id:
+            content = provider.run_request(
+                lambda file_id=file_id: provider.client.files.content(file_id),
+                hedge=False,
+                kind=BATCH_CONTROL_KIND,
+            )
+            outputs.update(_batch_output_texts(content.content))
+    return outputs
+
+
+def parse_batch_outputs(
+    outputs: Mapping[str, str | None],
+    parse: Callable[[str | None], dict[str, Any]],
+) -> dict[str, dict[str, Any] | None]:
+    """Parse each output with the interactive parser; unusable items become None."""
+    parsed: dict[str, dict[str, Any] | None] = {}
+    for key, text in outputs.items():
+        try:
+            parsed[key] = parse(text) if text is not None else None
+        except OpenAIResponseError:
+            parsed[key] = None
+    return parsed
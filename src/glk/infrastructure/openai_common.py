@@ -2,22 +2,59 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from io import BytesIO
 import base64
 import math
 import os
 from pathlib import Path
 import random
 import time
-from typing import Callable, TypeVar
+from typing import Any, Awaitable, Callable, Sequence, TypeVar
 
 from dotenv import dotenv_values
-from openai import APIConnectionError, APIStatusError, APITimeoutError, OpenAI
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    AsyncOpenAI,
+    OpenAI,
+)
 from PIL import Image
 
 from glk.config import resolve_settings_root
+from glk.infrastructure.adaptive_concurrency import (
+    AdaptiveConcurrencyLimit,
+    shared_concurrency_limit,
+)
+from glk.infrastructure.image_payload import (
+    ImagePayloadSettings,
+    encode_image,
+    load_image_payload_settings,
+)
+from glk.infrastructure.rate_limit import (
+    SharedRateLimiter,
+    provider_rate_limiter,
+    rate_limited,
+    rate_limited_async,
+)
+from glk.infrastructure.request_hedging import (
+    HedgingPolicy,
+    hedged,
+    hedged_async,
+    provider_hedging_policy,
+)
+from glk.infrastructure.response_cache import (
+    cached_response,
+    cached_response_async,
+    response_cache_key,
+)
+from glk.infrastructure.token_usage import TokenUsage
+from glk.infrastructure.usage_telemetry import (
+    RequestMeter,
+    current_request_meter,
+)
 
 
 DEFAULT_OPENAI_MODEL = "gpt-5.6-terra"
@@ -26,6 +63,7 @@ DEFAULT_RATE_LIMIT_DELAY_SECONDS = 60.0
 MAX_RETRY_DELAY_SECONDS = 300.0
 _OPENAI_SETTING_NAMES = ("OPENAI_API_KEY", "OPENAI_MODEL")
 _RETRYABLE_CLIENT_STATUS_CODES = frozenset({408, 409, 429})
+_CONGESTION_STATUS_CODES = frozenset({429, 503})
 
 ResultT = TypeVar("ResultT")
 ProviderT = TypeVar("ProviderT", bound="OpenAIProviderBase")
@@ -138,6 +176,11 @@ def resolve_openai_model_name(
     )
 
 
+def is_openai_congestion(error: BaseException) -> bool:
+    """Return whether a failure means the provider wants less concurrency."""
+    return openai_status_code(error) in _CONGESTION_STATUS_CODES
+
+
 def is_retryable_openai_error(error: BaseException) -> bool:
     """Classify retryable OpenAI failures using SDK types and status codes."""
     if isinstance(error, (APIConnectionError, APITimeoutError)):
@@ -198,6 +241,17 @@ def openai_retry_delay(
     )
 
 
+def _validate_retry_policy(*, max_attempts: int, base_delay: float) -> None:
+    if (
+        not isinstance(max_attempts, int)
+        or isinstance(max_attempts, bool)
+        or max_attempts < 1
+    ):
+        raise ValueError("OpenAI max attempts must be a positive integer.")
+    if base_delay < 0:
+        raise ValueError("OpenAI retry base delay must not be negative.")
+
+
 def run_with_openai_retry(
     operation: Callable[[], ResultT],
     *,
@@ -207,14 +261,7 @@ def run_with_openai_retry(
     jitter: Callable[[float, float], float] | None = None,
 ) -> ResultT:
     """Run one OpenAI request with a bounded retry policy."""
-    if (
-        not isinstance(max_attempts, int)
-        or isinstance(max_attempts, bool)
-        or max_attempts < 1
-    ):
-        raise ValueError("OpenAI max attempts must be a positive integer.")
-    if base_delay < 0:
-        raise ValueError("OpenAI retry base delay must not be negative.")
+    _validate_retry_policy(max_attempts=max_attempts, base_delay=base_delay)
     sleep_for = sleep or time.sleep
     random_jitter = jitter or random.uniform
     for attempt in range(max_attempts):
@@ -237,18 +284,50 @@ def run_with_openai_retry(
     raise RuntimeError("OpenAI retry loop ended unexpectedly.")
 
 
-def image_data_url(image: Image.Image) -> str:
-    """Encode a PIL image as a PNG data URL accepted by the Responses API."""
-    buffer = BytesIO()
-    image.save(buffer, format="PNG")
-    encoded = base64.b64encode(buffer.getvalue()).decode("ascii")
-    return f"data:image/png;base64,{encoded}"
+async def run_with_openai_retry_async(
+    operation: Callable[[], Awaitable[ResultT]],
+    *,
+    max_attempts: int,
+    base_delay: float,
+    sleep: Callable[[float], Awaitable[None]] | None = None,
+    jitter: Callable[[float, float], float] | None = None,
+) -> ResultT:
+    """Await one OpenAI request with the sync policy and a non-blocking sleep."""
+    _validate_retry_policy(max_attempts=max_attempts, base_delay=base_delay)
+    sleep_for = sleep or asyncio.sleep
+    random_jitter = jitter or random.uniform
+    for attempt in range(max_attempts):
+        try:
+            return await operation()
+        except Exception as error:
+            if (
+                attempt == max_attempts - 1
+                or not is_retryable_openai_error(error)
+            ):
+                raise
+            await sleep_for(
+                openai_retry_delay(
+                    error,
+                    attempt=attempt,
+                    base_delay=base_delay,
+                    jitter_seconds=random_jitter(0.0, 0.5),
+                )
+            )
+    raise RuntimeError("OpenAI retry loop ended unexpectedly.")
+
+
+def image_data_url(image: Image.Image, settings: ImagePayloadSettings) -> str:
+    """Encode a PIL image as a data URL accepted by the Responses API."""
+    payload = encode_image(image, settings)
+    encoded = base64.b64encode(payload.data).decode("ascii")
+    return f"data:{payload.mime_type};base64,{encoded}"
 
 
 class OpenAIProviderBase:
     """Shared credential loading, client creation, and retry shell."""
 
     provider_name = "openai"
+    prompt_version: str
 
     def __init__(
         self,
@@ -258,17 +337,33 @@ class OpenAIProviderBase:
         max_retries: int = 3,
         base_delay: float = 2,
         request_timeout_seconds: float = DEFAULT_REQUEST_TIMEOUT_SECONDS,
+        rate_limiter: SharedRateLimiter | None = None,
+        concurrency_limit: AdaptiveConcurrencyLimit | None = None,
+        hedging: HedgingPolicy | None = None,
+        image_payload: ImagePayloadSettings | None = None,
     ) -> None:
         if not api_key.strip():
             raise OpenAIConfigurationError("OPENAI_API_KEY is not configured.")
         self.model_name = model_name
         self.max_retries = max_retries
         self.base_delay = base_delay
+        self.rate_limiter = rate_limiter
+        self.concurrency_limit = concurrency_limit or AdaptiveConcurrencyLimit(
+            is_congestion=is_openai_congestion,
+        )
+        self.hedging = hedging
+        self.image_payload = image_payload or ImagePayloadSettings()
+        self.token_usage = TokenUsage()
         self.client = OpenAI(
             api_key=api_key,
             timeout=request_timeout_seconds,
             max_retries=0,
         )
+        self.async_client = AsyncOpenAI(
+            api_key=api_key,
+            timeout=request_timeout_seconds,
+            max_retries=0,
+        )
 
     @classmethod
     def from_environment(
@@ -283,14 +378,154 @@ class OpenAIProviderBase:
             raise OpenAIConfigurationError(
                 "OPENAI_API_KEY is not set. Add it to .env or export it in the shell."
             )
+        configured_model = _configured_model_name(model_name, environment)
         return cls(
             api_key=api_key,
-            model_name=_configured_model_name(model_name, environment),
+            model_name=configured_model,
+            rate_limiter=provider_rate_limiter(
+                provider_name=cls.provider_name,
+                model_name=configured_model,
+                api_key=api_key,
+                settings_root=settings_root,
+            ),
+            concurrency_limit=shared_concurrency_limit(
+                provider_name=cls.provider_name,
+                model_name=configured_model,
+                api_key=api_key,
+                is_congestion=is_openai_congestion,
+            ),
+            hedging=provider_hedging_policy(
+                operation_name=cls.__name__,
+                provider_name=cls.provider_name,
+                model_name=configured_model,
+                api_key=api_key,
+                settings_root=settings_root,
+            ),
+            image_payload=load_image_payload_settings(settings_root),
+        )
+
+    def record_usage(self, response: Any) -> None:
+        """Add the token counts OpenAI reported for one response."""
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        details = getattr(usage, "input_tokens_details", None)
+        counts = {
+            "input_tokens": usage.input_tokens,
+            "cached_input_tokens": getattr(details, "cached_tokens", None),
+            "output_tokens": usage.output_tokens,
+        }
+        self.token_usage.add(**counts)
+        meter = current_request_meter()
+        if meter is not None:
+            meter.add_tokens(**counts)
+        if self.rate_limiter is not None:
+            self.rate_limiter.spend_tokens(usage.input_tokens, usage.output_tokens)
+
+    def request_meter(self) -> RequestMeter:
+        return RequestMeter(
+            provider_name=self.provider_name,
+            model_name=self.model_name,
         )
 
-    def run_request(self, operation: Callable[[], ResultT]) -> ResultT:
-        return run_with_openai_retry(
-            operation,
-            max_attempts=self.max_retries,
-            base_delay=self.base_delay,
+    def run_request(
+        self,
+        operation: Callable[[], ResultT],
+        *,
+        meter: RequestMeter | None = None,
+        hedge: bool = True,
+        kind: str | None = None,
+    ) -> ResultT:
+        """Run one measured request; a caller-owned meter is finished by the caller."""
+        request_meter = meter or self.request_meter()
+        try:
+            result = run_with_openai_retry(
+                hedged(
+                    self.hedging if hedge else None,
+                    rate_limited(
+                        self.rate_limiter,
+                        lambda: self.concurrency_limit.call(
+                            request_meter.attempt(operation),
+                            kind=kind or type(self).__name__,
+                        ),
+                    ),
+                    meter=request_meter,
+                ),
+                max_attempts=self.max_retries,
+                base_delay=self.base_delay,
+            )
+        except BaseException as error:
+            request_meter.finish(openai_failure_code(error))
+            raise
+        if meter is None:
+            request_meter.finish()
+        return result
+
+    async def run_request_async(
+        self,
+        operation: Callable[[], Awaitable[ResultT]],
+    ) -> ResultT:
+        meter = self.request_meter()
+        try:
+            result = await run_with_openai_retry_async(
+                hedged_async(
+                    self.hedging,
+                    rate_limited_async(
+                        self.rate_limiter,
+                        lambda: self.concurrency_limit.call_async(
+                            meter.attempt_async(operation),
+                            kind=type(self).__name__,
+                        ),
+                    ),
+                    meter=meter,
+                ),
+                max_attempts=self.max_retries,
+                base_delay=self.base_delay,
+            )
+        except BaseException as error:
+            meter.finish(openai_failure_code(error))
+            raise
+        meter.finish()
+        return result
+
+    def response_key(
+        self,
+        prompt: str,
+        images: Sequence[Image.Image] = (),
+    ) -> str:
+        return response_cache_key(
+            provider_name=self.provider_name,
+            model_name=self.model_name,
+            prompt_version=self.prompt_version,
+            prompt=prompt,
+            images=images,
+            image_encoding=self.image_payload.key(),
+        )
+
+    def run_cached_request(
+        self,
+        operation: Callable[[], dict[str, Any]],
+        *,
+        prompt: str,
+        images: Sequence[Image.Image] = (),
+    ) -> dict[str, Any]:
+        """Answer from the response cache in scope, or run and store the request.
+
+        A hit sends nothing, so it is neither measured nor rate limited.
+        """
+        return cached_response(
+            lambda: self.response_key(prompt, images),
+            lambda: self.run_request(operation),
+        )
+
+    async def run_cached_request_async(
+        self,
+        operation: Callable[[], Awaitable[dict[str, Any]]],
+        *,
+        prompt: str,
+        images: Sequence[Image.Image] = (),
+    ) -> dict[str, Any]:
+        return await cached_response_async(
+            lambda: self.response_key(prompt, images),
+            lambda: self.run_request_async(operation),
         )
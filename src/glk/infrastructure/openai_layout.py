@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 import json
 from typing import Any
 
 from PIL import Image
 
-from glk.extraction.layout import PROMPT_VERSION, RESPONSE_SCHEMA, build_layout_prompt
+from glk.extraction.layout import (
+    PACKED_RESPONSE_SCHEMA,
+    PROMPT_VERSION,
+    RESPONSE_SCHEMA,
+    build_layout_prompt,
+    build_packed_layout_prompt,
+    split_packed_layouts,
+)
+from glk.infrastructure.openai_batch import (
+    openai_batch_outputs,
+    parse_batch_outputs,
+    submit_openai_batch,
+)
+from glk.infrastructure.image_payload import ImagePayloadSettings
 from glk.infrastructure.openai_common import (
     OpenAIEmptyResponseError,
     OpenAIProviderBase,
@@ -16,6 +30,84 @@ from glk.infrastructure.openai_common import (
 )
 
 
+def _layout_request(
+    model_name: str,
+    prompt: str,
+    page_image: Image.Image,
+    image_payload: ImagePayloadSettings,
+) -> dict[str, Any]:
+    return {
+        "model": model_name,
+        "input": [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "input_text", "text": prompt},
+                    {
+                        "type": "input_image",
+                        "image_url": image_data_url(page_image, image_payload),
+                        "detail": "high",
+                    },
+                ],
+            }
+        ],
+        "text": {
+            "format": {
+                "type": "json_schema",
+                "name": "pdf_layout",
+                "schema": RESPONSE_SCHEMA,
+                "strict": True,
+            }
+        },
+    }
+
+
+def _packed_layout_request(
+    model_name: str,
+    prompt: str,
+    pages: Sequence[tuple[int, list[dict[str, Any]], Image.Image]],
+    image_payload: ImagePayloadSettings,
+) -> dict[str, Any]:
+    content: list[dict[str, Any]] = [{"type": "input_text", "text": prompt}]
+    for page_number, _fragments, page_image in pages:
+        content.append(
+            {"type": "input_text", "text": f"PDF page index {page_number}:"}
+        )
+        content.append(
+            {
+                "type": "input_image",
+                "image_url": image_data_url(page_image, image_payload),
+                "detail": "high",
+            }
+        )
+    return {
+        "model": model_name,
+        "input": [{"role": "user", "content": content}],
+        "text": {
+            "format": {
+                "type": "json_schema",
+                "name": "pdf_layout_pages",
+                "schema": PACKED_RESPONSE_SCHEMA,
+                "strict": True,
+            }
+        },
+    }
+
+
+def _parse_layout_response(output_text: str | None) -> dict[str, Any]:
+    if not output_text:
+        raise OpenAIEmptyResponseError("OpenAI returned an empty layout response.")
+    try:
+        value = json.loads(output_text)
+    except json.JSONDecodeError as error:
+        raise OpenAIResponseError(
+            "OpenAI returned an invalid layout response."
+        ) from error
+    if not isinstance(value, dict):
+        raise OpenAIResponseError("OpenAI returned a non-object layout response.")
+    return value
+
+
 class OpenAILayoutProvider(OpenAIProviderBase):
     prompt_version = f"openai-{PROMPT_VERSION}"
 
@@ -29,43 +121,81 @@ class OpenAILayoutProvider(OpenAIProviderBase):
 
         def request() -> dict[str, Any]:
             response = self.client.responses.create(
-                model=self.model_name,
-                input=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "input_text", "text": prompt},
-                            {
-                                "type": "input_image",
-                                "image_url": image_data_url(page_image),
-                                "detail": "high",
-                            },
-                        ],
-                    }
-                ],
-                text={
-                    "format": {
-                        "type": "json_schema",
-                        "name": "pdf_layout",
-                        "schema": RESPONSE_SCHEMA,
-                        "strict": True,
-                    }
-                },
+                **_layout_request(
+                    self.model_name, prompt, page_image, self.image_payload
+                )
+            )
+            self.record_usage(response)
+            return _parse_layout_response(response.output_text)
+
+        return self.run_cached_request(request, prompt=prompt, images=(page_image,))
+
+    async def reconstruct_async(
+        self,
+        page_number: int,
+        fragments: list[dict[str, Any]],
+        page_image: Image.Image,
+    ) -> dict[str, Any]:
+        prompt = build_layout_prompt(page_number, fragments)
+
+        async def request() -> dict[str, Any]:
+            response = await self.async_client.responses.create(
+                **_layout_request(
+                    self.model_name, prompt, page_image, self.image_payload
+                )
             )
-            if not response.output_text:
-                raise OpenAIEmptyResponseError(
-                    "OpenAI returned an empty layout response."
+            self.record_usage(response)
+            return _parse_layout_response(response.output_text)
+
+        return await self.run_cached_request_async(
+            request, prompt=prompt, images=(page_image,)
+        )
+
+    def reconstruct_pages(
+        self,
+        pages: Sequence[tuple[int, list[dict[str, Any]], Image.Image]],
+    ) -> dict[int, dict[str, Any]]:
+        prompt = build_packed_layout_prompt(
+            [(page_number, fragments) for page_number, fragments, _ in pages]
+        )
+
+        def request() -> dict[str, Any]:
+            response = self.client.responses.create(
+                **_packed_layout_request(
+                    self.model_name, prompt, pages, self.image_payload
                 )
-            try:
-                value = json.loads(response.output_text)
-            except json.JSONDecodeError as error:
-                raise OpenAIResponseError(
-                    "OpenAI returned an invalid layout response."
-                ) from error
-            if not isinstance(value, dict):
-                raise OpenAIResponseError(
-                    "OpenAI returned a non-object layout response."
+            )
+            self.record_usage(response)
+            return _parse_layout_response(response.output_text)
+
+        response = self.run_cached_request(
+            request,
+            prompt=prompt,
+            images=tuple(page_image for _, _, page_image in pages),
+        )
+        return split_packed_layouts(response, [page[0] for page in pages])
+
+    def submit_layout_batch(
+        self,
+        pages: Mapping[str, tuple[int, list[dict[str, Any]], Image.Image]],
+    ) -> str:
+        return submit_openai_batch(
+            self,
+            {
+                key: _layout_request(
+                    self.model_name,
+                    build_layout_prompt(page_number, fragments),
+                    page_image,
+                    self.image_payload,
                 )
-            return value
+                for key, (page_number, fragments, page_image) in pages.items()
+            },
+        )
 
-        return self.run_request(request)
+    def layout_batch_results(
+        self, job_id: str
+    ) -> dict[str, dict[str, Any] | None] | None:
+        outputs = openai_batch_outputs(self, job_id)
+        if outputs is None:
+            return None
+        return parse_batch_outputs(outputs, _parse_layout_response)
@@ -12,6 +12,7 @@ from glk.extraction.image_ocr import (
     OCR_RESPONSE_SCHEMA,
     validate_ocr_result,
 )
+from glk.infrastructure.image_payload import ImagePayloadSettings
 from glk.infrastructure.openai_common import (
     OpenAIEmptyResponseError,
     OpenAIProviderBase,
@@ -20,44 +21,72 @@ from glk.infrastructure.openai_common import (
 )
 
 
+def _ocr_request(
+    model_name: str,
+    prompt: str,
+    image: Image.Image,
+    image_payload: ImagePayloadSettings,
+) -> dict[str, Any]:
+    return {
+        "model": model_name,
+        "input": [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "input_text", "text": prompt},
+                    {
+                        "type": "input_image",
+                        "image_url": image_data_url(image, image_payload),
+                        "detail": "high",
+                    },
+                ],
+            }
+        ],
+        "text": {
+            "format": {
+                "type": "json_schema",
+                "name": "image_ocr",
+                "schema": OCR_RESPONSE_SCHEMA,
+                "strict": True,
+            }
+        },
+    }
+
+
+def _parse_ocr_response(output_text: str | None) -> dict[str, Any]:
+    if not output_text:
+        raise OpenAIEmptyResponseError("OpenAI returned an empty OCR response.")
+    try:
+        return validate_ocr_result(json.loads(output_text))
+    except (json.JSONDecodeError, ValueError, TypeError) as error:
+        raise OpenAIResponseError("OpenAI returned an invalid OCR response.") from error
+
+
 class OpenAIImageOcrProvider(OpenAIProviderBase):
     prompt_version = f"openai-{OCR_PROMPT_VERSION}"
 
     def transcribe(self, prompt: str, image: Image.Image) -> dict[str, Any]:
         def request() -> dict[str, Any]:
             response = self.client.responses.create(
-                model=self.model_name,
-                input=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "input_text", "text": prompt},
-                            {
-                                "type": "input_image",
-                                "image_url": image_data_url(image),
-                                "detail": "high",
-                            },
-                        ],
-                    }
-                ],
-                text={
-                    "format": {
-                        "type": "json_schema",
-                        "name": "image_ocr",
-                        "schema": OCR_RESPONSE_SCHEMA,
-                        "strict": True,
-                    }
-                },
+                **_ocr_request(
+                    self.model_name, prompt, image, self.image_payload
+                )
             )
-            if not response.output_text:
-                raise OpenAIEmptyResponseError(
-                    "OpenAI returned an empty OCR response."
+            self.record_usage(response)
+            return _parse_ocr_response(response.output_text)
+
+        return self.run_cached_request(request, prompt=prompt, images=(image,))
+
+    async def transcribe_async(self, prompt: str, image: Image.Image) -> dict[str, Any]:
+        async def request() -> dict[str, Any]:
+            response = await self.async_client.responses.create(
+                **_ocr_request(
+                    self.model_name, prompt, image, self.image_payload
                 )
-            try:
-                return validate_ocr_result(json.loads(response.output_text))
-            except (json.JSONDecodeError, ValueError, TypeError) as error:
-                raise OpenAIResponseError(
-                    "OpenAI returned an invalid OCR response."
-                ) from error
-
-        return self.run_request(request)
+            )
+            self.record_usage(response)
+            return _parse_ocr_response(response.output_text)
+
+        return await self.run_cached_request_async(
+            request, prompt=prompt, images=(image,)
+        )
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
+import hashlib
 import json
 from typing import Any
 
+from glk.infrastructure.openai_batch import (
+    openai_batch_outputs,
+    parse_batch_outputs,
+    submit_openai_batch,
+)
 from glk.infrastructure.gemini_translation import (
     TRANSLATION_RESPONSE_SCHEMA,
     TRANSLATION_SYSTEM_INSTRUCTION,
@@ -13,10 +20,63 @@ from glk.infrastructure.openai_common import (
     OpenAIEmptyResponseError,
     OpenAIProviderBase,
     OpenAIResponseError,
+    openai_failure_code,
+)
+from glk.infrastructure.response_cache import (
+    active_response_key,
+    lookup_response,
+    store_response,
 )
+from glk.infrastructure.translation_prompt import split_translation_prompt
+from glk.infrastructure.translation_stream import (
+    TranslationItemStream,
+    translation_items,
+)
+
 
+TRANSLATION_PROVIDER_PROMPT_VERSION = "openai-translation-json-v2"
+_FAILED_STREAM_EVENTS = frozenset({"error", "response.failed", "response.incomplete"})
 
-TRANSLATION_PROVIDER_PROMPT_VERSION = "openai-translation-json-v1"
+
+def _translation_request(model_name: str, prompt: str) -> dict[str, Any]:
+    # Requests with the same run-wide prefix share a cache key, so OpenAI
+    # routes them to a server that already holds the cached prefix.
+    prefix, _suffix = split_translation_prompt(prompt)
+    cache_key = hashlib.sha256(
+        (TRANSLATION_SYSTEM_INSTRUCTION + prefix).encode("utf-8")
+    ).hexdigest()
+    return {
+        "model": model_name,
+        "prompt_cache_key": f"glk-translation-{cache_key[:32]}",
+        "instructions": TRANSLATION_SYSTEM_INSTRUCTION,
+        "input": prompt,
+        "text": {
+            "format": {
+                "type": "json_schema",
+                "name": "translations",
+                "schema": TRANSLATION_RESPONSE_SCHEMA,
+                "strict": True,
+            }
+        },
+    }
+
+
+def _parse_translation_response(output_text: str | None) -> dict[str, Any]:
+    if not output_text:
+        raise OpenAIEmptyResponseError(
+            "OpenAI returned an empty translation response."
+        )
+    try:
+        value = json.loads(output_text)
+    except json.JSONDecodeError as error:
+        raise OpenAIResponseError(
+            "OpenAI returned an invalid translation response."
+        ) from error
+    if not isinstance(value, dict):
+        raise OpenAIResponseError(
+            "OpenAI returned a non-object translation response."
+        )
+    return value
 
 
 class OpenAITranslationProvider(OpenAIProviderBase):
@@ -25,32 +85,82 @@ class OpenAITranslationProvider(OpenAIProviderBase):
     def translate(self, prompt: str) -> dict[str, Any]:
         def request() -> dict[str, Any]:
             response = self.client.responses.create(
-                model=self.model_name,
-                instructions=TRANSLATION_SYSTEM_INSTRUCTION,
-                input=prompt,
-                text={
-                    "format": {
-                        "type": "json_schema",
-                        "name": "translations",
-                        "schema": TRANSLATION_RESPONSE_SCHEMA,
-                        "strict": True,
-                    }
-                },
+                **_translation_request(self.model_name, prompt)
             )
-            if not response.output_text:
-                raise OpenAIEmptyResponseError(
-                    "OpenAI returned an empty translation response."
-                )
+            self.record_usage(response)
+            return _parse_translation_response(response.output_text)
+
+        return self.run_cached_request(request, prompt=prompt)
+
+    def translate_stream(self, prompt: str) -> Iterator[dict[str, Any]]:
+        """Yield translated items as soon as each one is fully generated.
+
+        Opening the stream is retried like any request. A failure after items
+        started arriving propagates, so the caller can request only the blocks
+        that are still missing. Streams are never hedged: a duplicate stream
+        would be left open, and partial items already bound the tail. Only a
+        stream read to the end is stored in the response cache; a cached
+        answer is replayed item by item.
+        """
+        cache_key = active_response_key(lambda: self.response_key(prompt))
+        cached = lookup_response(cache_key)
+        if cached is not None:
+            yield from translation_items(cached)
+            return
+        meter = self.request_meter()
+        stream = self.run_request(
+            lambda: self.client.responses.create(
+                **_translation_request(self.model_name, prompt),
+                stream=True,
+            ),
+            meter=meter,
+            hedge=False,
+        )
+        parser = TranslationItemStream()
+        try:
+            for event in stream:
+                if event.type == "response.output_text.delta":
+                    yield from parser.feed(event.delta)
+                elif event.type == "response.completed":
+                    with meter.active():
+                        self.record_usage(event.response)
+                elif event.type in _FAILED_STREAM_EVENTS:
+                    raise OpenAIResponseError(
+                        "OpenAI stopped the translation response stream."
+                    )
             try:
-                value = json.loads(response.output_text)
-            except json.JSONDecodeError as error:
-                raise OpenAIResponseError(
-                    "OpenAI returned an invalid translation response."
-                ) from error
-            if not isinstance(value, dict):
-                raise OpenAIResponseError(
-                    "OpenAI returned a non-object translation response."
-                )
-            return value
-
-        return self.run_request(request)
+                parser.close()
+            except ValueError as error:
+                raise OpenAIResponseError(str(error)) from error
+        except BaseException as error:
+            meter.finish(openai_failure_code(error))
+            raise
+        meter.finish()
+        store_response(cache_key, {"translations": parser.items})
+
+    async def translate_async(self, prompt: str) -> dict[str, Any]:
+        async def request() -> dict[str, Any]:
+            response = await self.async_client.responses.create(
+                **_translation_request(self.model_name, prompt)
+            )
+            self.record_usage(response)
+            return _parse_translation_response(response.output_text)
+
+        return await self.run_cached_request_async(request, prompt=prompt)
+
+    def submit_translation_batch(self, prompts: Mapping[str, str]) -> str:
+        return submit_openai_batch(
+            self,
+            {
+                key: _translation_request(self.model_name, prompt)
+                for key, prompt in prompts.items()
+            },
+        )
+
+    def translation_batch_results(
+        self, job_id: str
+    ) -> dict[str, dict[str, Any] | None] | None:
+        outputs = openai_batch_outputs(self, job_id)
+        if outputs is None:
+            return None
+        return parse_batch_outputs(outputs, _parse_translation_response)
@@ -0,0 +1,292 @@
+"""Client-side request and token budgets shared by every glk process."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+import threading
+import time
+from typing import IO, Any, TypeVar
+
+from dotenv import dotenv_values
+
+from glk.config import resolve_settings_root
+
+
+RATE_LIMIT_SETTING_NAMES = (
+    "GLK_RATE_LIMIT_RPM",
+    "GLK_RATE_LIMIT_TPM",
+    "GLK_RATE_LIMIT_RPD",
+)
+RATE_LIMIT_STATE_SCHEMA_VERSION = 1
+_TOKEN_BUCKET = "tokens_per_minute"
+
+ResultT = TypeVar("ResultT")
+
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_file(handle: IO[bytes]) -> None:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(handle: IO[bytes]) -> None:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(handle: IO[bytes]) -> None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(handle: IO[bytes]) -> None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitBudget:
+    """Requests per minute, tokens per minute, and requests per day allowed."""
+
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
+    requests_per_day: int | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return any(
+            value is not None
+            for value in (
+                self.requests_per_minute,
+                self.tokens_per_minute,
+                self.requests_per_day,
+            )
+        )
+
+    def buckets(self) -> dict[str, tuple[float, float]]:
+        """Return each configured bucket as (capacity, refill per second)."""
+        buckets: dict[str, tuple[float, float]] = {}
+        if self.requests_per_minute is not None:
+            buckets["requests_per_minute"] = (
+                float(self.requests_per_minute),
+                self.requests_per_minute / 60,
+            )
+        if self.tokens_per_minute is not None:
+            buckets[_TOKEN_BUCKET] = (
+                float(self.tokens_per_minute),
+                self.tokens_per_minute / 60,
+            )
+        if self.requests_per_day is not None:
+            buckets["requests_per_day"] = (
+                float(self.requests_per_day),
+                self.requests_per_day / 86_400,
+            )
+        return buckets
+
+
+def _budget_value(name: str, value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise ValueError(f"{name} must be a positive integer.")
+    return number
+
+
+def load_rate_limit_budget(
+    settings_root: str | os.PathLike[str] | None = None,
+) -> RateLimitBudget:
+    """Read configured budgets; shell variables take precedence over ``.env``."""
+    normalized_root = Path(settings_root) if settings_root is not None else None
+    parsed = dotenv_values(resolve_settings_root(normalized_root) / ".env")
+    values: list[int | None] = []
+    for name in RATE_LIMIT_SETTING_NAMES:
+        environment_value = os.getenv(name, "").strip()
+        file_value = parsed.get(name)
+        if environment_value:
+            values.append(_budget_value(name, environment_value))
+        elif isinstance(file_value, str) and file_value.strip():
+            values.append(_budget_value(name, file_value.strip()))
+        else:
+            values.append(None)
+    return RateLimitBudget(*values)
+
+
+def default_rate_limit_directory() -> Path:
+    return Path(tempfile.gettempdir()) / "glk-rate-limits"
+
+
+class SharedRateLimiter:
+    """Token buckets for one provider, model, and API key.
+
+    Bucket levels live in a small state file guarded by an OS file lock, so
+    every thread and every ``glk`` process on the machine draws from the same
+    budget. Requests take one unit from the request buckets before they are
+    sent. Reported tokens are charged afterwards and may push the token bucket
+    below zero; later requests then wait until it refills. Only a hash of the
+    API key is written to disk.
+    """
+
+    def __init__(
+        self,
+        *,
+        provider_name: str,
+        model_name: str,
+        api_key: str,
+        budget: RateLimitBudget,
+        directory: Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        key = hashlib.sha256(
+            f"{provider_name}\0{model_name}\0{api_key}".encode("utf-8")
+        ).hexdigest()[:32]
+        self.budget = budget
+        self.directory = directory or default_rate_limit_directory()
+        self.state_path = self.directory / f"{key}.json"
+        self._lock_path = self.directory / f"{key}.lock"
+        self._clock = clock
+        self._thread_lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._thread_lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with self._lock_path.open("a+b") as handle:
+                _lock_file(handle)
+                try:
+                    yield
+                finally:
+                    _unlock_file(handle)
+
+    def _levels(self, now: float) -> dict[str, float]:
+        try:
+            state: Any = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            state = None
+        stored = (
+            state.get("buckets")
+            if isinstance(state, dict)
+            and state.get("schema_version") == RATE_LIMIT_STATE_SCHEMA_VERSION
+            else None
+        )
+        levels: dict[str, float] = {}
+        for name, (capacity, rate) in self.budget.buckets().items():
+            bucket = stored.get(name) if isinstance(stored, dict) else None
+            try:
+                level = float(bucket["level"])
+                elapsed = max(now - float(bucket["updated"]), 0.0)
+            except (KeyError, TypeError, ValueError):
+                levels[name] = capacity
+                continue
+            levels[name] = min(capacity, level + elapsed * rate)
+        return levels
+
+    def _store(self, levels: dict[str, float], now: float) -> None:
+        state = {
+            "schema_version": RATE_LIMIT_STATE_SCHEMA_VERSION,
+            "buckets": {
+                name: {"level": level, "updated": now}
+                for name, level in levels.items()
+            },
+        }
+        temporary = self.state_path.with_suffix(".json.tmp")
+        temporary.write_text(json.dumps(state, sort_keys=True), encoding="utf-8")
+        os.replace(temporary, self.state_path)
+
+    def reserve(self) -> float:
+        """Take one request from every bucket, or return the seconds to wait."""
+        with self._locked():
+            now = self._clock()
+            levels = self._levels(now)
+            wait = 0.0
+            for name, (_capacity, rate) in self.budget.buckets().items():
+                needed = 0.0 if name == _TOKEN_BUCKET else 1.0
+                if levels[name] < needed:
+                    wait = max(wait, (needed - levels[name]) / rate)
+            if wait == 0.0:
+                for name in levels:
+                    if name != _TOKEN_BUCKET:
+                        levels[name] -= 1.0
+            self._store(levels, now)
+            return wait
+
+    def acquire(self, sleep: Callable[[float], None] = time.sleep) -> None:
+        while (wait := self.reserve()) > 0:
+            sleep(wait)
+
+    async def acquire_async(self) -> None:
+        while (wait := await asyncio.to_thread(self.reserve)) > 0:
+            await asyncio.sleep(wait)
+
+    def spend_tokens(self, *counts: object) -> None:
+        """Charge the token counts a provider reported for one response."""
+        tokens = sum(
+            count
+            for count in counts
+            if isinstance(count, int) and not isinstance(count, bool)
+        )
+        if self.budget.tokens_per_minute is None or tokens <= 0:
+            return
+        with self._locked():
+            now = self._clock()
+            levels = self._levels(now)
+            levels[_TOKEN_BUCKET] -= tokens
+            self._store(levels, now)
+
+
+def rate_limited(
+    limiter: SharedRateLimiter | None,
+    operation: Callable[[], ResultT],
+) -> Callable[[], ResultT]:
+    """Wrap one request so every attempt, including retries, waits its turn."""
+    if limiter is None:
+        return operation
+
+    def limited() -> ResultT:
+        limiter.acquire()
+        return operation()
+
+    return limited
+
+
+def rate_limited_async(
+    limiter: SharedRateLimiter | None,
+    operation: Callable[[], Awaitable[ResultT]],
+) -> Callable[[], Awaitable[ResultT]]:
+    if limiter is None:
+        return operation
+
+    async def limited() -> ResultT:
+        await limiter.acquire_async()
+        return await operation()
+
+    return limited
+
+
+def provider_rate_limiter(
+    *,
+    provider_name: str,
+    model_name: str,
+    api_key: str,
+    settings_root: str | os.PathLike[str] | None = None,
+) -> SharedRateLimiter | None:
+    """Build the shared limiter for a provider, or None when no budget is set."""
+    budget = load_rate_limit_budget(settings_root)
+    if not budget.enabled:
+        return None
+    return SharedRateLimiter(
+        provider_name=provider_name,
+        model_name=model_name,
+        api_key=api_key,
+        budget=budget,
+    )
@@ -0,0 +1,310 @@
+"""Opt-in hedged provider requests that cut the latency tail."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import contextvars
+import hashlib
+import math
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, TypeVar
+
+from dotenv import dotenv_values
+
+from glk.config import resolve_settings_root
+from glk.infrastructure.usage_telemetry import RequestMeter
+
+
+HEDGE_SETTING_NAMES = ("GLK_HEDGE_PERCENTILE", "GLK_HEDGE_BUDGET_PERCENT")
+DEFAULT_HEDGE_BUDGET_PERCENT = 10
+# The percentile is meaningless on a handful of samples, so hedging starts
+# only once this many requests have succeeded.
+HEDGE_MIN_SAMPLES = 20
+_LATENCY_WINDOW = 200
+
+ResultT = TypeVar("ResultT")
+
+
+def _setting_value(name: str, value: str, *, maximum: int) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if not 1 <= number <= maximum:
+        raise ValueError(f"{name} must be an integer from 1 to {maximum}.")
+    return number
+
+
+def load_hedge_settings(
+    settings_root: str | os.PathLike[str] | None = None,
+) -> tuple[int, int] | None:
+    """Return (percentile, budget percent), or None when hedging is off.
+
+    Setting ``GLK_HEDGE_PERCENTILE`` turns hedging on; shell variables take
+    precedence over ``.env``.
+    """
+    normalized_root = Path(settings_root) if settings_root is not None else None
+    parsed = dotenv_values(resolve_settings_root(normalized_root) / ".env")
+    values: dict[str, str] = {}
+    for name in HEDGE_SETTING_NAMES:
+        environment_value = os.getenv(name, "").strip()
+        file_value = parsed.get(name)
+        if environment_value:
+            values[name] = environment_value
+        elif isinstance(file_value, str) and file_value.strip():
+            values[name] = file_value.strip()
+    if "GLK_HEDGE_PERCENTILE" not in values:
+        return None
+    percentile = _setting_value(
+        "GLK_HEDGE_PERCENTILE",
+        values["GLK_HEDGE_PERCENTILE"],
+        maximum=99,
+    )
+    budget = (
+        _setting_value(
+            "GLK_HEDGE_BUDGET_PERCENT",
+            values["GLK_HEDGE_BUDGET_PERCENT"],
+            maximum=100,
+        )
+        if "GLK_HEDGE_BUDGET_PERCENT" in values
+        else DEFAULT_HEDGE_BUDGET_PERCENT
+    )
+    return percentile, budget
+
+
+class HedgingPolicy:
+    """Send a duplicate of a request that runs past a latency percentile.
+
+    The first copy to return without raising wins and the other is
+    cancelled. Async copies are cancelled in flight; a sync copy that has
+    already started cannot be interrupted, so it finishes in the background
+    and its result is discarded. Duplicates are capped at a share of all
+    requests, so hedging never adds more than the budget to the spend.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: int,
+        budget_percent: int = DEFAULT_HEDGE_BUDGET_PERCENT,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= percentile <= 99:
+            raise ValueError("hedge percentile must be from 1 to 99.")
+        if not 1 <= budget_percent <= 100:
+            raise ValueError("hedge budget must be from 1 to 100 percent.")
+        self.percentile = percentile
+        self.budget_percent = budget_percent
+        self.min_samples = min_samples
+        self._clock = clock
+        self._latencies: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._lock = threading.Lock()
+
+    def hedge_delay(self) -> float | None:
+        """Return the rolling latency percentile, or None before enough samples."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        index = max(math.ceil(len(ordered) * self.percentile / 100) - 1, 0)
+        return ordered[index]
+
+    def _start_request(self) -> None:
+        with self._lock:
+            self._requests += 1
+
+    def _spend_hedge(self) -> bool:
+        with self._lock:
+            if (self._hedges + 1) * 100 > self._requests * self.budget_percent:
+                return False
+            self._hedges += 1
+            return True
+
+    def _observe(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+
+    def _won(self, meter: RequestMeter | None) -> None:
+        with self._lock:
+            self._hedge_wins += 1
+        if meter is not None:
+            meter.record_hedge(won=True)
+
+    def _timed(self, operation: Callable[[], ResultT]) -> ResultT:
+        started = self._clock()
+        result = operation()
+        self._observe(self._clock() - started)
+        return result
+
+    def call(
+        self,
+        operation: Callable[[], ResultT],
+        *,
+        meter: RequestMeter | None = None,
+    ) -> ResultT:
+        self._start_request()
+        delay = self.hedge_delay()
+        if delay is None:
+            return self._timed(operation)
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="glk-hedge")
+        try:
+            primary = executor.submit(
+                contextvars.copy_context().run, self._timed, operation
+            )
+            done, _ = wait([primary], timeout=delay)
+            if done or not self._spend_hedge():
+                return primary.result()
+            if meter is not None:
+                meter.record_hedge(won=False)
+            hedge = executor.submit(
+                contextvars.copy_context().run, self._timed, operation
+            )
+            pending: set[Future[ResultT]] = {primary, hedge}
+            first_error: BaseException | None = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    error = future.exception()
+                    if error is None:
+                        if future is hedge:
+                            self._won(meter)
+                        for other in pending:
+                            other.cancel()
+                        return future.result()
+                    if first_error is None or future is primary:
+                        first_error = error
+            assert first_error is not None
+            raise first_error
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _timed_async(
+        self, operation: Callable[[], Awaitable[ResultT]]
+    ) -> ResultT:
+        started = self._clock()
+        result = await operation()
+        self._observe(self._clock() - started)
+        return result
+
+    async def call_async(
+        self,
+        operation: Callable[[], Awaitable[ResultT]],
+        *,
+        meter: RequestMeter | None = None,
+    ) -> ResultT:
+        self._start_request()
+        delay = self.hedge_delay()
+        if delay is None:
+            return await self._timed_async(operation)
+        primary = asyncio.ensure_future(self._timed_async(operation))
+        tasks: set[asyncio.Future[ResultT]] = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self._spend_hedge():
+                return await primary
+            if meter is not None:
+                meter.record_hedge(won=False)
+            hedge = asyncio.ensure_future(self._timed_async(operation))
+            tasks.add(hedge)
+            pending = set(tasks)
+            first_error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        if task is hedge:
+                            self._won(meter)
+                        return task.result()
+                    if first_error is None or task is primary:
+                        first_error = error
+            assert first_error is not None
+            raise first_error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            requests = self._requests
+            hedges = self._hedges
+            hedge_wins = self._hedge_wins
+        return {
+            "percentile": self.percentile,
+            "budget_percent": self.budget_percent,
+            "hedge_delay_seconds": self.hedge_delay(),
+            "requests": requests,
+            "hedges": hedges,
+            "hedge_wins": hedge_wins,
+        }
+
+
+def hedged(
+    policy: HedgingPolicy | None,
+    operation: Callable[[], ResultT],
+    *,
+    meter: RequestMeter | None = None,
+) -> Callable[[], ResultT]:
+    """Wrap one attempt so a slow copy is raced by a duplicate."""
+    if policy is None:
+        return operation
+    return lambda: policy.call(operation, meter=meter)
+
+
+def hedged_async(
+    policy: HedgingPolicy | None,
+    operation: Callable[[], Awaitable[ResultT]],
+    *,
+    meter: RequestMeter | None = None,
+) -> Callable[[], Awaitable[ResultT]]:
+    if policy is None:
+        return operation
+    return lambda: policy.call_async(operation, meter=meter)
+
+
+_shared_policies: dict[str, HedgingPolicy] = {}
+_shared_policies_lock = threading.Lock()
+
+
+def provider_hedging_policy(
+    *,
+    operation_name: str,
+    provider_name: str,
+    model_name: str,
+    api_key: str,
+    settings_root: str | os.PathLike[str] | None = None,
+) -> HedgingPolicy | None:
+    """Return the process-wide policy for one kind of request, or None when off.
+
+    Layout, OCR, and translation requests have different latency profiles,
+    so each provider class keeps its own latency window.
+    """
+    settings = load_hedge_settings(settings_root)
+    if settings is None:
+        return None
+    percentile, budget_percent = settings
+    key = hashlib.sha256(
+        f"{operation_name}\0{provider_name}\0{model_name}\0{api_key}\0"
+        f"{percentile}\0{budget_percent}".encode("utf-8")
+    ).hexdigest()
+    with _shared_policies_lock:
+        policy = _shared_policies.get(key)
+        if policy is None:
+            policy = HedgingPolicy(
+                percentile=percentile,
+                budget_percent=budget_percent,
+            )
+            _shared_policies[key] = policy
+        return policy
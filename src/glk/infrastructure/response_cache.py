@@ -0,0 +1,365 @@
+"""Content-addressed provider responses shared by every project of a workspace."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+import threading
+from typing import Any
+
+from dotenv import dotenv_values
+from PIL import Image
+
+from glk.config import resolve_settings_root
+
+
+RESPONSE_CACHE_SETTING_NAME = "GLK_RESPONSE_CACHE_MB"
+DEFAULT_RESPONSE_CACHE_MB = 1024
+RESPONSE_CACHE_SCHEMA_VERSION = 1
+# Eviction trims the store below the budget so the next few writes do not
+# each trigger a directory scan.
+_EVICTION_LOW_WATER_RATIO = 0.9
+
+
+def load_response_cache_budget(
+    settings_root: str | os.PathLike[str] | None = None,
+) -> int:
+    """Return the cache size budget in bytes; 0 turns the cache off.
+
+    Shell variables take precedence over ``.env``.
+    """
+    normalized_root = Path(settings_root) if settings_root is not None else None
+    parsed = dotenv_values(resolve_settings_root(normalized_root) / ".env")
+    value = os.getenv(RESPONSE_CACHE_SETTING_NAME, "").strip()
+    file_value = parsed.get(RESPONSE_CACHE_SETTING_NAME)
+    if not value and isinstance(file_value, str):
+        value = file_value.strip()
+    if not value:
+        return DEFAULT_RESPONSE_CACHE_MB * 1024 * 1024
+    try:
+        megabytes = int(value)
+    except ValueError:
+        megabytes = -1
+    if megabytes < 0:
+        raise ValueError(
+            f"{RESPONSE_CACHE_SETTING_NAME} must be a non-negative integer."
+        )
+    return megabytes * 1024 * 1024
+
+
+def image_sha256(image: Image.Image) -> str:
+    """Hash decoded pixels, so re-encoding the same page keeps its key."""
+    digest = hashlib.sha256(f"{image.mode}\0{image.size}\0".encode("utf-8"))
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def response_cache_key(
+    *,
+    provider_name: str,
+    model_name: str,
+    prompt_version: str,
+    prompt: str,
+    images: Sequence[Image.Image] = (),
+    image_encoding: str = "",
+) -> str:
+    """Return the content address of one provider request.
+
+    ``image_encoding`` names how the images are encoded for upload; it only
+    enters the key of requests that carry images, so text-only keys do not
+    change with the image settings.
+    """
+    parts: list[Any] = [
+        provider_name,
+        model_name,
+        prompt_version,
+        hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+        [image_sha256(image) for image in images],
+    ]
+    if images and image_encoding:
+        parts.append(image_encoding)
+    identity = json.dumps(parts, separators=(",", ":"))
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Parsed provider responses stored one file per request key.
+
+    Entries are written atomically, so concurrent processes at worst both
+    request and store the same answer. A hit refreshes the entry's
+    modification time, and once the store grows past its size budget the
+    least recently used entries are removed first.
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int) -> None:
+        if max_bytes < 1:
+            raise ValueError("response cache budget must be positive.")
+        self.root = root
+        self.max_bytes = max_bytes
+        self._size: int | None = None
+        self._lock = threading.Lock()
+
+    def path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self.path(key)
+        try:
+            entry = json.loads(path.read_bytes().decode("utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            self._discard(path)
+            return None
+        if (
+            not isinstance(entry, dict)
+            or entry.get("schema_version") != RESPONSE_CACHE_SCHEMA_VERSION
+            or entry.get("key") != key
+            or not isinstance(entry.get("response"), dict)
+        ):
+            self._discard(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry["response"]
+
+    def put(self, key: str, response: dict[str, Any]) -> None:
+        data = json.dumps(
+            {
+                "schema_version": RESPONSE_CACHE_SCHEMA_VERSION,
+                "key": key,
+                "stored_at": datetime.now(timezone.utc).isoformat(
+                    timespec="seconds"
+                ),
+                "response": response,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        path = self.path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(
+                dir=path.parent,
+                prefix=f".{key[:12]}.",
+                suffix=".tmp",
+            )
+            try:
+                with os.fdopen(descriptor, "wb") as file:
+                    file.write(data)
+                os.replace(temporary, path)
+            except BaseException:
+                Path(temporary).unlink(missing_ok=True)
+                raise
+        except OSError:
+            # A cache that cannot be written only costs a future request.
+            return
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.root.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        # Other processes write to the same store, so the size is re-read
+        # from disk instead of trusting this process's running total.
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * _EVICTION_LOW_WATER_RATIO)
+        for _, size, path in entries:
+            if total <= target:
+                break
+            self._discard(path)
+            total -= size
+        self._size = total
+
+    @staticmethod
+    def _discard(path: Path) -> None:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+_shared_caches: dict[tuple[Path, int], ResponseCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def shared_response_cache(
+    root: Path,
+    *,
+    settings_root: str | os.PathLike[str] | None = None,
+) -> ResponseCache | None:
+    """Return the process-wide cache stored under ``root``, or None when off."""
+    max_bytes = load_response_cache_budget(settings_root)
+    if max_bytes == 0:
+        return None
+    key = (root.resolve(), max_bytes)
+    with _shared_caches_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = ResponseCache(key[0], max_bytes=max_bytes)
+            _shared_caches[key] = cache
+        return cache
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheScope:
+    cache: ResponseCache
+    refresh: bool = False
+
+
+_current_cache: ContextVar[_CacheScope | None] = ContextVar(
+    "glk_response_cache",
+    default=None,
+)
+
+
+@contextmanager
+def use_response_cache(
+    cache: ResponseCache | None,
+    *,
+    refresh: bool = False,
+) -> Iterator[None]:
+    """Answer provider requests sent inside the block from ``cache``.
+
+    With ``refresh``, cached answers are ignored but new responses are still
+    stored, which replaces the old entries. Like request scopes, the cache
+    reaches worker threads only through ``contextvars.copy_context().run``.
+    """
+    if cache is None:
+        yield
+        return
+    token = _current_cache.set(_CacheScope(cache, refresh))
+    try:
+        yield
+    finally:
+        _current_cache.reset(token)
+
+
+@contextmanager
+def refresh_responses() -> Iterator[None]:
+    """Send requests inside the block even when a cached answer exists.
+
+    Callers use this when they retry an identical request because the cached
+    or previous answer was rejected.
+    """
+    scope = _current_cache.get()
+    if scope is None:
+        yield
+        return
+    token = _current_cache.set(replace(scope, refresh=True))
+    try:
+        yield
+    finally:
+        _current_cache.reset(token)
+
+
+class HeldResponses:
+    """Responses stored inside a ``hold_responses`` block, not yet written."""
+
+    def __init__(self) -> None:
+        self._entries: list[tuple[ResponseCache, str, dict[str, Any]]] = []
+
+    def add(self, cache: ResponseCache, key: str, response: dict[str, Any]) -> None:
+        self._entries.append((cache, key, response))
+
+    def accept(self) -> None:
+        """Write the held responses; later calls write nothing again."""
+        entries, self._entries = self._entries, []
+        for cache, key, response in entries:
+            cache.put(key, response)
+
+
+_held_responses: ContextVar[HeldResponses | None] = ContextVar(
+    "glk_held_responses",
+    default=None,
+)
+
+
+@contextmanager
+def hold_responses() -> Iterator[HeldResponses]:
+    """Keep responses received inside the block out of the cache until accepted.
+
+    Callers that validate an answer only after the provider returns it use
+    this, so an answer they reject is never replayed to a later run. Held
+    responses that are not accepted are dropped.
+    """
+    held = HeldResponses()
+    token = _held_responses.set(held)
+    try:
+        yield held
+    finally:
+        _held_responses.reset(token)
+
+
+def active_response_key(key: Callable[[], str]) -> str | None:
+    """Build the request key only when a response cache is in scope."""
+    return key() if _current_cache.get() is not None else None
+
+
+def lookup_response(key: str | None) -> dict[str, Any] | None:
+    scope = _current_cache.get()
+    if key is None or scope is None or scope.refresh:
+        return None
+    return scope.cache.get(key)
+
+
+def store_response(key: str | None, response: dict[str, Any]) -> None:
+    scope = _current_cache.get()
+    if key is None or scope is None:
+        return
+    held = _held_responses.get()
+    if held is not None:
+        held.add(scope.cache, key, response)
+    else:
+        scope.cache.put(key, response)
+
+
+def cached_response(
+    key: Callable[[], str],
+    operation: Callable[[], dict[str, Any]],
+) -> dict[str, Any]:
+    """Return the stored answer to an identical request, or send it and store it."""
+    request_key = active_response_key(key)
+    cached = lookup_response(request_key)
+    if cached is not None:
+        return cached
+    response = operation()
+    store_response(request_key, response)
+    return response
+
+
+async def cached_response_async(
+    key: Callable[[], str],
+    operation: Callable[[], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    request_key = active_response_key(key)
+    cached = lookup_response(request_key)
+    if cached is not None:
+        return cached
+    response = await operation()
+    store_response(request_key, response)
+    return response
@@ -12,6 +12,7 @@ from typing import Any
 from urllib.parse import parse_qs, urlsplit
 import webbrowser
 
+from glk.application.extraction_service import ensure_pdf_page_image
 from glk.application.project_service import load_project
 from glk.application.review_types import SourceReviewDocument
 from glk.application.source_review_service import (
@@ -21,7 +22,7 @@ from glk.application.source_review_service import (
     get_project_source_review_document,
     save_project_source_review,
 )
-from glk.domain.workspace import WorkspacePaths, is_pdf_source_file
+from glk.domain.workspace import is_pdf_source_file
 from glk.infrastructure.local_http import (
     LocalHttpRequestHandler,
     LocalHttpServer,
@@ -137,12 +138,15 @@ class _SourceReviewHandler(LocalHttpRequestHandler):
         if group is None:
             raise SourceReviewError("Unknown source review group.")
         location = load_project(self.server.project, self.server.workspace_root)
-        paths = WorkspacePaths(location.path)
         if group["source_type"] == "pdf":
             page = group["page"]
             if page is None:
                 raise SourceReviewError("PDF review group has no page number.")
-            return paths.pdf_pages / f"page_{page:03d}.png"
+            return ensure_pdf_page_image(
+                self.server.project,
+                page,
+                self.server.workspace_root,
+            )
         candidate = (location.path / group["source_file"]).resolve()
         try:
             candidate.relative_to(location.path.resolve())
@@ -0,0 +1,42 @@
+"""Thread-safe token counters reported by provider responses."""
+
+from __future__ import annotations
+
+import threading
+
+
+def _count(value: object) -> int:
+    return value if isinstance(value, int) and not isinstance(value, bool) else 0
+
+
+class TokenUsage:
+    """Accumulate billed and prompt-cached tokens across concurrent requests."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.input_tokens = 0
+        self.cached_input_tokens = 0
+        self.output_tokens = 0
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        *,
+        input_tokens: object,
+        cached_input_tokens: object,
+        output_tokens: object,
+    ) -> None:
+        with self._lock:
+            self.requests += 1
+            self.input_tokens += _count(input_tokens)
+            self.cached_input_tokens += _count(cached_input_tokens)
+            self.output_tokens += _count(output_tokens)
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "input_tokens": self.input_tokens,
+                "cached_input_tokens": self.cached_input_tokens,
+                "output_tokens": self.output_tokens,
+            }
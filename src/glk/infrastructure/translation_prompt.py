@@ -0,0 +1,16 @@
+"""Provider-neutral layout of compiled translation prompts."""
+
+from __future__ import annotations
+
+
+# Translation prompts put everything shared by the chunks of a run before this
+# header, and everything chunk-specific after it.
+TRANSLATION_PROMPT_CHUNK_HEADER = "[APPROVED TERMBASE FOR THIS CHUNK]"
+
+
+def split_translation_prompt(prompt: str) -> tuple[str, str]:
+    """Split a compiled prompt into its run-wide prefix and chunk suffix."""
+    index = prompt.find(f"\n{TRANSLATION_PROMPT_CHUNK_HEADER}\n")
+    if index < 0:
+        return "", prompt
+    return prompt[: index + 1], prompt[index + 1 :]
@@ -0,0 +1,81 @@
+"""Incremental parsing of streamed structured translation responses."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+def translation_items(response: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return the items of a complete translations object in stream order."""
+    items = response.get("translations")
+    if not isinstance(items, list):
+        return []
+    return [item for item in items if isinstance(item, dict)]
+
+
+# The response object is depth 1, its translations array depth 2, and each
+# translated item depth 3.
+_ITEM_DEPTH = 3
+
+
+class TranslationItemStream:
+    """Yield ``{"id", "text"}`` items of a streamed translations object.
+
+    Text arrives in arbitrary fragments. Only items whose closing brace has
+    arrived are returned, so an item is returned exactly once and a response
+    cut off mid-generation still keeps every item completed before the cut.
+    """
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._scanned = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._item_start: int | None = None
+        self._closed = False
+        self.items: list[dict[str, Any]] = []
+
+    def feed(self, fragment: str) -> list[dict[str, Any]]:
+        """Consume one text fragment and return the items it completed."""
+        text = self._text + fragment
+        items: list[dict[str, Any]] = []
+        for index in range(self._scanned, len(text)):
+            char = text[index]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == _ITEM_DEPTH and char == "{":
+                    self._item_start = index
+            elif char in "}]":
+                if self._depth == _ITEM_DEPTH and self._item_start is not None:
+                    item = json.loads(text[self._item_start : index + 1])
+                    if isinstance(item, dict):
+                        items.append(item)
+                        self.items.append(item)
+                    self._item_start = None
+                self._depth -= 1
+                if self._depth == 0:
+                    self._closed = True
+        # Drop text that can no longer belong to an unfinished item.
+        keep_from = self._item_start if self._item_start is not None else len(text)
+        self._text = text[keep_from:]
+        self._scanned = len(self._text)
+        if self._item_start is not None:
+            self._item_start = 0
+        return items
+
+    def close(self) -> None:
+        """Fail when the stream ended before the response object was closed."""
+        if not self._closed or self._depth != 0:
+            raise ValueError("The streamed translation response ended early.")
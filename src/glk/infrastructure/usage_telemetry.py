@@ -0,0 +1,192 @@
+"""Per-request token, latency, and failure measurements for provider calls."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+import threading
+import time
+from typing import Any, TypeVar
+
+
+ResultT = TypeVar("ResultT")
+UsageObserver = Callable[[dict[str, Any]], None]
+
+
+def _count(value: object) -> int:
+    return value if isinstance(value, int) and not isinstance(value, bool) else 0
+
+
+@dataclass(frozen=True, slots=True)
+class RequestScope:
+    """What the application is doing while provider requests are sent."""
+
+    stage: str
+    item: str | None = None
+    blocks: int = 0
+    observer: UsageObserver | None = None
+
+
+_current_scope: ContextVar[RequestScope | None] = ContextVar(
+    "glk_request_scope",
+    default=None,
+)
+_current_meter: ContextVar[RequestMeter | None] = ContextVar(
+    "glk_request_meter",
+    default=None,
+)
+
+
+@contextmanager
+def request_scope(
+    *,
+    stage: str | None = None,
+    item: str | None = None,
+    blocks: int | None = None,
+    observer: UsageObserver | None = None,
+) -> Iterator[None]:
+    """Describe the provider requests sent inside the block.
+
+    Scopes nest: fields left as None are inherited from the enclosing scope,
+    so a stage sets the observer once and inner code only narrows the item
+    or block count. Without an enclosing stage, a scope that names no stage
+    changes nothing, and requests sent outside any stage are measured but
+    not reported. Worker threads start without a scope; submit work through
+    ``contextvars.copy_context().run`` to carry the caller's scope over.
+    """
+    parent = _current_scope.get()
+    if parent is None and stage is None:
+        yield
+        return
+    scope = parent or RequestScope(stage=stage or "")
+    scope = replace(
+        scope,
+        stage=stage if stage is not None else scope.stage,
+        item=item if item is not None else scope.item,
+        blocks=blocks if blocks is not None else scope.blocks,
+        observer=observer if observer is not None else scope.observer,
+    )
+    token = _current_scope.set(scope)
+    try:
+        yield
+    finally:
+        _current_scope.reset(token)
+
+
+def current_request_meter() -> RequestMeter | None:
+    """Return the meter of the provider request running in this context."""
+    return _current_meter.get()
+
+
+class RequestMeter:
+    """Measure one logical provider request across all of its attempts.
+
+    Wall time runs from creation to ``finish`` and so includes rate-limit
+    waits and retry backoff. Hedged duplicates count as attempts. The
+    observer of the scope that was current at creation receives one record
+    when the request finishes.
+    """
+
+    def __init__(
+        self,
+        *,
+        provider_name: str,
+        model_name: str,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.provider_name = provider_name
+        self.model_name = model_name
+        self.scope = _current_scope.get()
+        self.attempts = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.input_tokens = 0
+        self.cached_input_tokens = 0
+        self.output_tokens = 0
+        self._clock = clock
+        self._started = clock()
+        self._finished = False
+        self._lock = threading.Lock()
+
+    def add_tokens(
+        self,
+        *,
+        input_tokens: object,
+        cached_input_tokens: object,
+        output_tokens: object,
+    ) -> None:
+        with self._lock:
+            self.input_tokens += _count(input_tokens)
+            self.cached_input_tokens += _count(cached_input_tokens)
+            self.output_tokens += _count(output_tokens)
+
+    def record_hedge(self, *, won: bool) -> None:
+        """Count a duplicate sent for a slow attempt, or that duplicate winning."""
+        with self._lock:
+            if won:
+                self.hedge_wins += 1
+            else:
+                self.hedges += 1
+
+    @contextmanager
+    def active(self) -> Iterator[None]:
+        """Make this the meter that reported usage is added to."""
+        token = _current_meter.set(self)
+        try:
+            yield
+        finally:
+            _current_meter.reset(token)
+
+    def attempt(self, operation: Callable[[], ResultT]) -> Callable[[], ResultT]:
+        """Wrap an operation so every call counts as one attempt."""
+
+        def measured() -> ResultT:
+            with self._lock:
+                self.attempts += 1
+            with self.active():
+                return operation()
+
+        return measured
+
+    def attempt_async(
+        self,
+        operation: Callable[[], Awaitable[ResultT]],
+    ) -> Callable[[], Awaitable[ResultT]]:
+        async def measured() -> ResultT:
+            with self._lock:
+                self.attempts += 1
+            with self.active():
+                return await operation()
+
+        return measured
+
+    def finish(self, failure_code: str | None = None) -> None:
+        """Report the request once; later calls are ignored."""
+        with self._lock:
+            if self._finished:
+                return
+            self._finished = True
+            wall_seconds = max(self._clock() - self._started, 0.0)
+            record = {
+                "finished_at": datetime.now(timezone.utc).isoformat(
+                    timespec="milliseconds"
+                ),
+                "stage": self.scope.stage if self.scope is not None else None,
+                "item": self.scope.item if self.scope is not None else None,
+                "blocks": self.scope.blocks if self.scope is not None else 0,
+                "provider": self.provider_name,
+                "model": self.model_name,
+                "input_tokens": self.input_tokens,
+                "cached_input_tokens": self.cached_input_tokens,
+                "output_tokens": self.output_tokens,
+                "wall_seconds": round(wall_seconds, 3),
+                "attempts": self.attempts,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "failure_code": failure_code,
+            }
+        if self.scope is not None and self.scope.observer is not None:
+            self.scope.observer(record)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from unittest.mock import patch
+
+from glk.infrastructure.adaptive_concurrency import AdaptiveConcurrencyLimit
+from glk.infrastructure.gemini_common import is_gemini_congestion
+from glk.infrastructure.gemini_translation import GeminiTranslationProvider
+from tests.test_gemini_common import api_error
+
+
+class Throttled(Exception):
+    pass
+
+
+def throttled(error: BaseException) -> bool:
+    return isinstance(error, Throttled)
+
+
+class AdaptiveConcurrencyTests(unittest.TestCase):
+    def test_congestion_halves_the_limit_once_per_wave_and_success_regrows_it(
+        self,
+    ) -> None:
+        limit = AdaptiveConcurrencyLimit(is_congestion=throttled, maximum=8)
+        wave = [limit.acquire() for _ in range(4)]
+
+        limit.release(wave[0], error=Throttled())
+        limit.release(wave[1], error=Throttled())
+        limit.release(wave[2], error=ValueError("bad response"))
+        limit.release(wave[3], latency=1.0)
+        self.assertEqual(limit.limit, 4)
+
+        for _ in range(5):
+            limit.release(limit.acquire(), latency=1.0)
+        self.assertEqual(limit.limit, 5)
+        self.assertEqual(
+            [change["reason"] for change in limit.snapshot()["history"]],
+            ["throttled", "success"],
+        )
+
+    def test_latency_spike_counts_as_congestion_after_a_baseline(self) -> None:
+        limit = AdaptiveConcurrencyLimit(is_congestion=throttled, maximum=4)
+        for _ in range(10):
+            limit.release(limit.acquire(), latency=2.0)
+        self.assertEqual(limit.limit, 4)
+
+        limit.release(limit.acquire(), latency=30.0)
+
+        snapshot = limit.snapshot()
+        self.assertEqual(snapshot["limit"], 2)
+        self.assertEqual(snapshot["history"][-1]["reason"], "latency")
+        self.assertEqual(snapshot["in_flight"], 0)
+
+    def test_latency_is_compared_only_with_requests_of_the_same_kind(self) -> None:
+        limit = AdaptiveConcurrencyLimit(is_congestion=throttled, maximum=4)
+        for _ in range(10):
+            limit.release(limit.acquire(), latency=2.0, kind="translation")
+
+        for _ in range(10):
+            limit.release(limit.acquire(), latency=30.0, kind="layout")
+        self.assertEqual(limit.limit, 4)
+        self.assertEqual(
+            limit.snapshot()["latency_baseline_seconds"],
+            {"translation": 2.0, "layout": 30.0},
+        )
+
+        limit.release(limit.acquire(), error=Throttled(), kind="layout")
+        self.assertEqual(limit.limit, 2)
+
+    def test_requests_beyond_the_limit_wait_for_a_free_slot(self) -> None:
+        limit = AdaptiveConcurrencyLimit(is_congestion=throttled, maximum=1)
+        first = limit.acquire()
+        acquired = threading.Event()
+
+        def second() -> None:
+            limit.release(limit.acquire(), latency=1.0)
+            acquired.set()
+
+        thread = threading.Thread(target=second)
+        thread.start()
+        self.assertFalse(acquired.wait(0.1))
+        limit.release(first, latency=1.0)
+        self.assertTrue(acquired.wait(5))
+        thread.join()
+
+    def test_provider_requests_report_throttling_to_the_limit(self) -> None:
+        self.assertTrue(is_gemini_congestion(api_error(503)))
+        self.assertFalse(is_gemini_congestion(api_error(500)))
+        with patch("glk.infrastructure.gemini_common.genai.Client"):
+            provider = GeminiTranslationProvider(
+                api_key="test-key",
+                model_name="test-model",
+                max_retries=2,
+                base_delay=0,
+            )
+        attempts: list[int] = []
+
+        def operation() -> str:
+            attempts.append(provider.concurrency_limit.snapshot()["in_flight"])
+            if len(attempts) == 1:
+                raise api_error(429, headers={"Retry-After": "0"})
+            return "ok"
+
+        self.assertEqual(provider.run_request(operation), "ok")
+
+        self.assertEqual(attempts, [1, 1])
+        snapshot = provider.concurrency_limit.snapshot()
+        self.assertEqual(snapshot["limit"], 8)
+        self.assertEqual(snapshot["in_flight"], 0)
+        self.assertEqual(snapshot["history"][0]["reason"], "throttled")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -156,6 +156,7 @@ class CliTests(unittest.TestCase):
         self.assertTrue(payload["ok"])
         self.assertEqual(payload["retried_blocks"], 2)
         self.assertEqual(retry.call_args.kwargs["project"], "game")
+        self.assertEqual(retry.call_args.kwargs["concurrency"], 4)
 
     def test_ocr_dry_run_reports_selected_images_as_json(self) -> None:
         with tempfile.TemporaryDirectory() as temporary_directory:
@@ -799,6 +800,8 @@ class CliTests(unittest.TestCase):
                     "test-model",
                     "--max-characters",
                     "8000",
+                    "--concurrency",
+                    "4",
                     "--resume",
                     "--json",
                 ]
@@ -808,8 +811,57 @@ class CliTests(unittest.TestCase):
         self.assertEqual(payload["completed_blocks"], 24)
         self.assertEqual(payload["review_status"], "current")
         self.assertEqual(translate.call_args.kwargs["max_characters"], 8000)
+        self.assertEqual(translate.call_args.kwargs["concurrency"], 4)
+        self.assertTrue(translate.call_args.kwargs["translation_memory"])
+        self.assertFalse(translate.call_args.kwargs["incremental"])
+        self.assertEqual(translate.call_args.kwargs["checkpoint_chunks"], 1)
+        self.assertFalse(translate.call_args.kwargs["batch"])
+        self.assertFalse(translate.call_args.kwargs["stream"])
         self.assertTrue(translate.call_args.kwargs["resume"])
 
+    def test_translate_dry_run_reports_estimated_tokens_per_chunk(self) -> None:
+        result = TranslationRunResult(
+            project_path="/tmp/workspaces/game",
+            model="test-model",
+            approved_source_sha256="a" * 64,
+            termbase_sha256="b" * 64,
+            project_prompt_sha256="c" * 64,
+            input_sha256="d" * 64,
+            total_blocks=24,
+            total_chunks=2,
+            completed_blocks=0,
+            completed_chunks=0,
+            output_file=None,
+            draft_file=None,
+            review_file=None,
+            review_status=None,
+            prompt_file=None,
+            dry_run=True,
+            max_tokens=6000,
+            estimated_chunk_tokens=(5800, 2100),
+        )
+        output = io.StringIO()
+        with (
+            patch("glk.cli.translate_project", return_value=result) as translate,
+            redirect_stdout(output),
+        ):
+            exit_code = main(
+                [
+                    "translate",
+                    "--project",
+                    "game",
+                    "--max-tokens",
+                    "6000",
+                    "--no-translation-memory",
+                    "--dry-run",
+                ]
+            )
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(translate.call_args.kwargs["max_tokens"], 6000)
+        self.assertFalse(translate.call_args.kwargs["translation_memory"])
+        self.assertIn("Chunk 1/2: ~5800 of 6000 estimated tokens", output.getvalue())
+        self.assertIn("Chunk 2/2: ~2100 of 6000 estimated tokens", output.getvalue())
+
     def test_translation_qa_and_finalize_commands(self) -> None:
         qa_result = TranslationQaResult(
             project_path="/tmp/workspaces/game",
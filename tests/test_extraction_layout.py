@@ -11,6 +11,7 @@ from glk.extraction.layout import (
     parse_page_selection,
     recover_layout_fragment_references,
     reconstruct_blocks,
+    split_packed_layouts,
     validate_layout,
 )
 
@@ -287,5 +288,33 @@ class LayoutRuleTests(unittest.TestCase):
         self.assertEqual(build_page_text(blocks), "First\n\nSecond")
 
 
+
+class PackedLayoutTests(unittest.TestCase):
+    def test_split_keeps_only_requested_pages_answered_once(self) -> None:
+        blocks = [
+            {
+                "type": "paragraph",
+                "fragment_ids": ["P002-F001"],
+                "include_in_text": True,
+                "reason": "",
+            }
+        ]
+        response = {
+            "pages": [
+                {"page": 2, "blocks": blocks},
+                {"page": 3, "blocks": []},
+                {"page": 3, "blocks": blocks},
+                {"page": 9, "blocks": blocks},
+                {"page": 4, "blocks": None},
+            ]
+        }
+
+        self.assertEqual(
+            split_packed_layouts(response, [2, 3, 4]),
+            {2: {"blocks": blocks}},
+        )
+        self.assertEqual(split_packed_layouts({"blocks": blocks}, [2]), {})
+
+
 if __name__ == "__main__":
     unittest.main()
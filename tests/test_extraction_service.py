@@ -2,17 +2,29 @@ from __future__ import annotations
 
 import json
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pymupdf
 from PIL import Image
 
 from glk.application._progress import ProgressCallbackError
-from glk.application.extraction_service import ExtractionError, extract_project_pdf
+from glk.application.extraction_service import (
+    ExtractionError,
+    ensure_pdf_page_image,
+    extract_project_pdf,
+)
 from glk.application.project_service import create_project, load_project
-from glk.extraction.layout import PROMPT_VERSION, merge_paragraph_continuations
+from glk.extraction.layout import (
+    PROMPT_VERSION,
+    extract_line_fragments,
+    merge_paragraph_continuations,
+    page_content_sha256,
+    render_page_png,
+)
 
 
 class FakeLayoutProvider:
@@ -59,10 +71,49 @@ class RecoveringLayoutProvider(FakeLayoutProvider):
         return super().reconstruct(page_number, fragments, page_image)
 
 
-def create_pdf(path: Path, text: str) -> None:
+class BatchLayoutProvider(FakeLayoutProvider):
+    def __init__(self) -> None:
+        super().__init__(fail_if_called=True)
+        self.submitted: list[str] = []
+        self.polls = 0
+        self.layouts: dict[str, dict[str, Any]] = {}
+
+    def submit_layout_batch(self, pages: Any) -> str:
+        for key, (page_number, fragments, page_image) in pages.items():
+            self.submitted.append(key)
+            self.layouts[key] = FakeLayoutProvider().reconstruct(
+                page_number, fragments, page_image
+            )
+        return "job-1"
+
+    def layout_batch_results(self, job_id: str) -> dict[str, Any] | None:
+        self.polls += 1
+        return dict(self.layouts) if self.polls > 1 else None
+
+
+class PackingLayoutProvider(FakeLayoutProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.packs: list[list[int]] = []
+
+    def reconstruct_pages(self, pages: Any) -> dict[int, dict[str, Any]]:
+        self.packs.append([page_number for page_number, _, _ in pages])
+        layouts = {
+            page_number: FakeLayoutProvider().reconstruct(
+                page_number, fragments, page_image
+            )
+            for page_number, fragments, page_image in pages
+        }
+        # The last page of every pack comes back without its fragments.
+        layouts[pages[-1][0]] = {"blocks": []}
+        return layouts
+
+
+def create_pdf(path: Path, text: str, *more_pages: str) -> None:
     document = pymupdf.open()
-    page = document.new_page()
-    page.insert_text((72, 72), text)
+    for page_text in (text, *more_pages):
+        page = document.new_page()
+        page.insert_text((72, 72), page_text)
     document.save(path)
     document.close()
 
@@ -133,6 +184,7 @@ class ExtractionServiceTests(unittest.TestCase):
                 file=pdf_path,
                 workspace_root=workspace_root,
                 provider=provider,
+                local_layout_threshold=None,
             )
             self.assertTrue(first.ok)
             self.assertEqual(provider.calls, 1)
@@ -153,6 +205,7 @@ class ExtractionServiceTests(unittest.TestCase):
                 project="rulebook",
                 workspace_root=workspace_root,
                 provider=cached_provider,
+                local_layout_threshold=None,
             )
             self.assertTrue(second.ok)
             self.assertEqual(cached_provider.calls, 0)
@@ -160,6 +213,276 @@ class ExtractionServiceTests(unittest.TestCase):
             metadata = json.loads((project_path / ".glk/state/pdf_acquisition.json").read_text())
             self.assertEqual(metadata["status"], "complete")
 
+    def test_cached_pages_are_not_rendered_or_rewritten(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            root = Path(temporary_directory)
+            workspace_root = root / "workspaces"
+            pdf_path = root / "rulebook.pdf"
+            create_pdf(pdf_path, "A wrapped rulebook sentence.")
+            project = create_project(name="Rulebook", workspace_root=workspace_root)
+            extract_project_pdf(
+                project="rulebook",
+                file=pdf_path,
+                workspace_root=workspace_root,
+                provider=FakeLayoutProvider(),
+                local_layout_threshold=None,
+            )
+            pdf_root = project.path / ".glk/cache/pdf"
+            image_path = pdf_root / "pages/page_001.png"
+            cache_files = [
+                pdf_root / "fragments/page_001.json",
+                pdf_root / "layouts/page_001.json",
+                pdf_root / "layouts/page_001.txt",
+            ]
+            modified = [path.stat().st_mtime_ns for path in cache_files]
+            rendered = image_path.read_bytes()
+            image_path.unlink()
+
+            with patch(
+                "glk.application.extraction_service.render_page_png",
+                side_effect=AssertionError("cached page was rendered"),
+            ):
+                result = extract_project_pdf(
+                    project="rulebook",
+                    workspace_root=workspace_root,
+                    provider=FakeLayoutProvider(fail_if_called=True),
+                    local_layout_threshold=None,
+                )
+
+            self.assertEqual(result.cached_pages, (1,))
+            self.assertEqual(
+                [path.stat().st_mtime_ns for path in cache_files], modified
+            )
+            self.assertFalse(image_path.exists())
+            self.assertEqual(
+                ensure_pdf_page_image("rulebook", 1, workspace_root), image_path
+            )
+            self.assertEqual(image_path.read_bytes(), rendered)
+
+    def test_revised_pdf_reprocesses_only_changed_pages(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            root = Path(temporary_directory)
+            workspace_root = root / "workspaces"
+            original_pdf = root / "rulebook.pdf"
+            revised_pdf = root / "revised/rulebook.pdf"
+            revised_pdf.parent.mkdir()
+            create_pdf(original_pdf, "Unchanged page.", "Original second page.")
+            create_pdf(revised_pdf, "Unchanged page.", "Corrected second page.")
+            create_project(name="Rulebook", workspace_root=workspace_root)
+            extract_project_pdf(
+                project="rulebook",
+                file=original_pdf,
+                workspace_root=workspace_root,
+                provider=FakeLayoutProvider(),
+                local_layout_threshold=None,
+            )
+
+            provider = FakeLayoutProvider()
+            result = extract_project_pdf(
+                project="rulebook",
+                file=revised_pdf,
+                workspace_root=workspace_root,
+                replace_source=True,
+                provider=provider,
+                local_layout_threshold=None,
+            )
+
+            self.assertEqual(provider.calls, 1)
+            self.assertEqual(result.cached_pages, (1,))
+            self.assertIn("Corrected second page.", Path(result.output_file).read_text())
+
+    def test_simple_page_is_ordered_locally_without_the_model(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            root = Path(temporary_directory)
+            workspace_root = root / "workspaces"
+            pdf_path = root / "rulebook.pdf"
+            create_pdf(pdf_path, "A wrapped rulebook sentence.")
+            project = create_project(name="Rulebook", workspace_root=workspace_root)
+
+            result = extract_project_pdf(
+                project="rulebook",
+                file=pdf_path,
+                workspace_root=workspace_root,
+                provider=FakeLayoutProvider(fail_if_called=True),
+            )
+
+            self.assertEqual(result.local_pages, (1,))
+            self.assertIn("A wrapped rulebook sentence.", Path(result.output_file).read_text())
+            cache = project.path / ".glk/cache/pdf"
+            layout = json.loads((cache / "layouts/page_001.json").read_text())
+            self.assertEqual(layout["model"], "local-reading-order")
+            self.assertTrue(layout["validation"]["valid"])
+            self.assertFalse((cache / "pages/page_001.png").exists())
+
+    def test_short_pages_share_a_request_and_rejected_pages_go_alone(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            root = Path(temporary_directory)
+            workspace_root = root / "workspaces"
+            pdf_path = root / "rulebook.pdf"
+            create_pdf(pdf_path, "Cover.", "Components.", "Credits.")
+            project = create_project(name="Rulebook", workspace_root=workspace_root)
+            provider = PackingLayoutProvider()
+
+            result = extract_project_pdf(
+                project="rulebook",
+                file=pdf_path,
+                workspace_root=workspace_root,
+                provider=provider,
+                local_layout_threshold=None,
+            )
+
+            self.assertEqual(provider.packs, [[1, 2, 3]])
+            self.assertEqual(provider.calls, 1)
+            self.assertEqual(result.successful_pages, (1, 2, 3))
+            self.assertEqual(result.packed_pages, (1, 2))
+            cache = project.path / ".glk/cache/pdf/layouts"
+            for page in (1, 2, 3):
+                layout = json.loads((cache / f"page_{page:03d}.json").read_text())
+                self.assertTrue(layout["validation"]["valid"])
+            self.assertIn("Credits.", Path(result.output_file).read_text())
+
+            unpacked = PackingLayoutProvider()
+            extract_project_pdf(
+                project="rulebook",
+                workspace_root=workspace_root,
+                provider=unpacked,
+                local_layout_threshold=None,
+                layout_pack_size=1,
+                force=True,
+            )
+            self.assertEqual((unpacked.packs, unpacked.calls), ([], 3))
+
+    def test_packed_pages_are_read_and_rendered_once(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            root = Path(temporary_directory)
+            workspace_root = root / "workspaces"
+            pdf_path = root / "rulebook.pdf"
+            create_pdf(pdf_path, "Cover.", "Components.", "Setup.", "Credits.")
+            create_project(name="Rulebook", workspace_root=workspace_root)
+            service = "glk.application.extraction_service"
+
+            def extract(provider: FakeLayoutProvider) -> tuple[Any, list[int]]:
+                with patch(
+                    f"{service}.extract_line_fragments",
+                    wraps=extract_line_fragments,
+                ) as fragments, patch(
+                    f"{service}.page_content_sha256",
+                    wraps=page_content_sha256,
+                ) as hashes, patch(
+                    f"{service}.render_page_png",
+                    wraps=render_page_png,
+                ) as renders:
+                    result = extract_project_pdf(
+                        project="rulebook",
+                        file=pdf_path,
+                        workspace_root=workspace_root,
+                        provider=provider,
+                        local_layout_threshold=None,
+                    )
+                counts = [fragments.call_count, hashes.call_count, renders.call_count]
+                return result, counts
+
+            provider = PackingLayoutProvider()
+            result, counts = extract(provider)
+            self.assertEqual(provider.packs, [[1, 2, 3, 4]])
+            self.assertEqual(result.packed_pages, (1, 2, 3))
+            self.assertEqual(counts, [4, 4, 4])
+
+            result, counts = extract(FakeLayoutProvider(fail_if_called=True))
+            self.assertEqual(result.cached_pages, (1, 2, 3, 4))
+            self.assertEqual(counts, [4, 4, 0])
+
+    def test_parallel_pages_keep_page_order_and_isolate_failures(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            root = Path(temporary_directory)
+            workspace_root = root / "workspaces"
+            pdf_path = root / "rulebook.pdf"
+            document = pymupdf.open()
+            for text in ("First page.", "", "Third page."):
+                page = document.new_page()
+                if text:
+                    page.insert_text((72, 72), text)
+            document.save(pdf_path)
+            document.close()
+            create_project(name="Rulebook", workspace_root=workspace_root)
+            first_page_released = threading.Event()
+
+            class SlowFirstPageProvider(FakeLayoutProvider):
+                def reconstruct(
+                    self,
+                    page_number: int,
+                    fragments: list[dict[str, Any]],
+                    page_image: Image.Image,
+                ) -> dict[str, Any]:
+                    if page_number == 1:
+                        first_page_released.wait(5)
+                    else:
+                        first_page_released.set()
+                    return super().reconstruct(page_number, fragments, page_image)
+
+            result = extract_project_pdf(
+                project="rulebook",
+                file=pdf_path,
+                workspace_root=workspace_root,
+                concurrency=3,
+                provider=SlowFirstPageProvider(),
+                local_layout_threshold=None,
+            )
+
+            self.assertTrue(first_page_released.is_set())
+            self.assertEqual(result.successful_pages, (1, 3))
+            self.assertEqual([failure.page for failure in result.failures], [2])
+            self.assertIn("requires OCR", result.failures[0].error)
+            text = Path(result.output_file).read_text(encoding="utf-8")
+            self.assertLess(text.index("First page."), text.index("Third page."))
+            self.assertTrue(
+                (workspace_root / "rulebook/.glk/cache/pdf/pages/page_003.png").is_file()
+            )
+
+    def test_batch_mode_submits_uncached_pages_once(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            root = Path(temporary_directory)
+            workspace_root = root / "workspaces"
+            pdf_path = root / "rulebook.pdf"
+            create_pdf(pdf_path, "A batched rulebook sentence.")
+            create_project(name="Rulebook", workspace_root=workspace_root)
+            messages: list[str] = []
+
+            provider = BatchLayoutProvider()
+            result = extract_project_pdf(
+                project="rulebook",
+                file=pdf_path,
+                workspace_root=workspace_root,
+                provider=provider,
+                local_layout_threshold=None,
+                batch=True,
+                batch_poll_seconds=0,
+                progress=messages.append,
+            )
+
+            self.assertTrue(result.ok)
+            self.assertEqual(provider.submitted, ["page-0001"])
+            self.assertEqual(provider.calls, 0)
+            self.assertIn("Batch job job-1: waiting for results", messages)
+            self.assertIn(
+                "A batched rulebook sentence.",
+                Path(result.output_file).read_text(),
+            )
+            state_dir = workspace_root / "rulebook/.glk/state"
+            self.assertFalse((state_dir / "layout_batch.json").exists())
+
+            cached_provider = BatchLayoutProvider()
+            cached = extract_project_pdf(
+                project="rulebook",
+                workspace_root=workspace_root,
+                provider=cached_provider,
+                local_layout_threshold=None,
+                batch=True,
+                batch_poll_seconds=0,
+            )
+            self.assertEqual(cached.cached_pages, (1,))
+            self.assertEqual(cached_provider.submitted, [])
+
     def test_uses_pdf_already_in_input_without_making_a_source_copy(self) -> None:
         with tempfile.TemporaryDirectory() as temporary_directory:
             workspace_root = Path(temporary_directory) / "workspaces"
@@ -224,6 +547,7 @@ class ExtractionServiceTests(unittest.TestCase):
                 file=pdf_path,
                 workspace_root=workspace_root,
                 provider=provider,
+                local_layout_threshold=None,
             )
             self.assertTrue(result.ok)
             self.assertEqual(result.successful_pages, (1,))
@@ -248,6 +572,7 @@ class ExtractionServiceTests(unittest.TestCase):
                 project="rulebook",
                 workspace_root=workspace_root,
                 provider=cached_provider,
+                local_layout_threshold=None,
             )
             self.assertTrue(cached.ok)
             self.assertEqual(cached.cached_pages, (1,))
@@ -272,6 +597,7 @@ class ExtractionServiceTests(unittest.TestCase):
                 file=pdf_path,
                 workspace_root=workspace_root,
                 provider=provider,
+                local_layout_threshold=None,
                 progress=progress.append,
             )
 
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from email.utils import format_datetime
+import json
 import os
 from pathlib import Path
 import tempfile
+import threading
 from types import SimpleNamespace
+from typing import Any
 import unittest
 from unittest.mock import patch
 
-from google.genai import errors
+from google.genai import errors, types
 
 from glk.infrastructure.gemini_common import (
     DEFAULT_REQUEST_TIMEOUT_MS,
@@ -21,10 +25,12 @@ from glk.infrastructure.gemini_common import (
     is_retryable_gemini_error,
     retry_after_seconds,
     run_with_gemini_retry,
+    run_with_gemini_retry_async,
 )
 from glk.infrastructure.gemini_layout import GeminiLayoutProvider
 from glk.infrastructure.gemini_ocr import GeminiImageOcrProvider
 from glk.infrastructure.gemini_translation import GeminiTranslationProvider
+from glk.infrastructure.translation_prompt import TRANSLATION_PROMPT_CHUNK_HEADER
 
 
 def api_error(
@@ -178,6 +184,284 @@ class GeminiCommonPolicyTests(unittest.TestCase):
             )
         self.assertEqual(permanent_attempts, 1)
 
+    def test_async_retry_awaits_retry_after_without_blocking(self) -> None:
+        attempts = 0
+        sleeps: list[float] = []
+
+        async def record_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        async def transient_operation() -> str:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise api_error(503, headers={"Retry-After": "3"})
+            return "ok"
+
+        result = asyncio.run(
+            run_with_gemini_retry_async(
+                transient_operation,
+                max_attempts=3,
+                base_delay=2,
+                sleep=record_sleep,
+                jitter=lambda _start, _end: 0,
+            )
+        )
+
+        self.assertEqual(result, "ok")
+        self.assertEqual(attempts, 2)
+        self.assertEqual(sleeps, [3])
+
+        async def permanent_operation() -> str:
+            raise api_error(403)
+
+        with self.assertRaises(errors.APIError):
+            asyncio.run(
+                run_with_gemini_retry_async(
+                    permanent_operation,
+                    max_attempts=3,
+                    base_delay=2,
+                    sleep=record_sleep,
+                )
+            )
+        self.assertEqual(sleeps, [3])
+
+    def test_async_translation_uses_the_sdk_async_client(self) -> None:
+        requests: list[dict[str, object]] = []
+
+        async def generate_content(**kwargs: object) -> SimpleNamespace:
+            requests.append(kwargs)
+            return SimpleNamespace(text='{"translations":[]}')
+
+        with patch("glk.infrastructure.gemini_common.genai.Client"):
+            provider = GeminiTranslationProvider(
+                api_key="test-key",
+                model_name="test-model",
+                max_retries=1,
+            )
+        provider.client = SimpleNamespace(  # type: ignore[assignment]
+            aio=SimpleNamespace(
+                models=SimpleNamespace(generate_content=generate_content)
+            )
+        )
+
+        value = asyncio.run(provider.translate_async("Translate block b1"))
+
+        self.assertEqual(value, {"translations": []})
+        self.assertEqual(requests[0]["model"], "test-model")
+        self.assertEqual(requests[0]["contents"], "Translate block b1")
+
+    def test_translation_batch_uploads_requests_and_reads_keyed_results(
+        self,
+    ) -> None:
+        uploaded: list[bytes] = []
+        states = iter(
+            [types.JobState.JOB_STATE_RUNNING, types.JobState.JOB_STATE_SUCCEEDED]
+        )
+        output = "\n".join(
+            json.dumps(line)
+            for line in (
+                {
+                    "key": "c1",
+                    "response": {
+                        "candidates": [
+                            {
+                                "content": {
+                                    "parts": [
+                                        {"text": '{"translations":[]}'}
+                                    ]
+                                }
+                            }
+                        ]
+                    },
+                },
+                {"key": "c2", "error": {"code": 500}},
+            )
+        ).encode("utf-8")
+
+        def upload(*, file: Any, config: object) -> SimpleNamespace:
+            uploaded.append(file.read())
+            return SimpleNamespace(name="files/input")
+
+        with patch("glk.infrastructure.gemini_common.genai.Client"):
+            provider = GeminiTranslationProvider(
+                api_key="test-key",
+                model_name="test-model",
+                max_retries=1,
+            )
+        provider.client = SimpleNamespace(  # type: ignore[assignment]
+            files=SimpleNamespace(
+                upload=upload,
+                download=lambda *, file: output if file == "files/output" else b"",
+            ),
+            batches=SimpleNamespace(
+                create=lambda **kwargs: SimpleNamespace(name="batches/1"),
+                get=lambda *, name: SimpleNamespace(
+                    state=next(states),
+                    dest=SimpleNamespace(file_name="files/output"),
+                ),
+            ),
+        )
+
+        job_id = provider.submit_translation_batch({"c1": "first", "c2": "second"})
+
+        self.assertEqual(job_id, "batches/1")
+        self.assertIsNone(provider.translation_batch_results(job_id))
+        self.assertEqual(
+            provider.translation_batch_results(job_id),
+            {"c1": {"translations": []}, "c2": None},
+        )
+        request = json.loads(uploaded[0].splitlines()[0])
+        self.assertEqual(request["key"], "c1")
+        self.assertEqual(request["request"]["contents"][0]["parts"][0]["text"], "first")
+        self.assertIn("system_instruction", request["request"])
+
+    def test_translation_caches_a_long_prompt_prefix_once(self) -> None:
+        requests: list[dict[str, Any]] = []
+        caches: list[dict[str, Any]] = []
+
+        def create_cache(**kwargs: Any) -> SimpleNamespace:
+            caches.append(kwargs)
+            return SimpleNamespace(name=f"cachedContents/{len(caches)}")
+
+        def generate_content(**kwargs: Any) -> SimpleNamespace:
+            requests.append(kwargs)
+            return SimpleNamespace(
+                text='{"translations":[]}',
+                usage_metadata=SimpleNamespace(
+                    prompt_token_count=1200,
+                    cached_content_token_count=1100,
+                    candidates_token_count=30,
+                ),
+            )
+
+        with patch("glk.infrastructure.gemini_common.genai.Client"):
+            provider = GeminiTranslationProvider(
+                api_key="test-key",
+                model_name="test-model",
+                max_retries=1,
+            )
+        provider.client = SimpleNamespace(  # type: ignore[assignment]
+            caches=SimpleNamespace(create=create_cache),
+            models=SimpleNamespace(generate_content=generate_content),
+        )
+        prefix = "[RULES]\n" + "Keep the rulebook tone. " * 200 + "\n"
+
+        for block in ("b1", "b2"):
+            provider.translate(
+                f"{prefix}{TRANSLATION_PROMPT_CHUNK_HEADER}\n[]\n{block}"
+            )
+        provider.translate(f"[RULES]\n{TRANSLATION_PROMPT_CHUNK_HEADER}\n[]\nb3")
+
+        self.assertEqual(len(caches), 1)
+        self.assertEqual(caches[0]["config"].contents.parts[0].text, prefix)
+        self.assertEqual(
+            [request["config"].cached_content for request in requests],
+            ["cachedContents/1", "cachedContents/1", None],
+        )
+        self.assertTrue(requests[0]["contents"].startswith(TRANSLATION_PROMPT_CHUNK_HEADER))
+        self.assertIsNone(requests[0]["config"].system_instruction)
+        self.assertIsNotNone(requests[2]["config"].system_instruction)
+        self.assertEqual(
+            provider.token_usage.snapshot(),
+            {
+                "requests": 3,
+                "input_tokens": 3600,
+                "cached_input_tokens": 3300,
+                "output_tokens": 90,
+            },
+        )
+
+    def test_context_cache_creation_only_blocks_the_same_prefix(self) -> None:
+        first_started = threading.Event()
+        release_first = threading.Event()
+        created: list[str] = []
+
+        def create_cache(**kwargs: Any) -> SimpleNamespace:
+            text = kwargs["config"].contents.parts[0].text
+            if text.startswith("[FIRST]"):
+                first_started.set()
+                release_first.wait(5)
+            created.append(text[:7])
+            return SimpleNamespace(name=f"cachedContents/{text[1:6]}")
+
+        with patch("glk.infrastructure.gemini_common.genai.Client"):
+            provider = GeminiTranslationProvider(
+                api_key="test-key",
+                model_name="test-model",
+            )
+        provider.client = SimpleNamespace(  # type: ignore[assignment]
+            caches=SimpleNamespace(create=create_cache),
+        )
+        body = "Keep the rulebook tone. " * 200
+        names: list[str | None] = []
+        waiting = [
+            threading.Thread(
+                target=lambda: names.append(provider._context_cache(f"[FIRST]{body}"))
+            )
+            for _ in range(2)
+        ]
+        waiting[0].start()
+        self.assertTrue(first_started.wait(5))
+        waiting[1].start()
+
+        self.assertEqual(provider._context_cache(f"[OTHER]{body}"), "cachedContents/OTHER")
+        self.assertEqual(provider._context_cache("[SHORT]"), None)
+        release_first.set()
+        for thread in waiting:
+            thread.join(5)
+
+        self.assertEqual(created, ["[OTHER]", "[FIRST]"])
+        self.assertEqual(names, ["cachedContents/FIRST"] * 2)
+
+    def test_translation_stream_yields_items_as_they_complete(self) -> None:
+        text = (
+            '{"translations":[{"id":"b1","text":"중괄호 } 와 \\"따옴표\\""},'
+            '{"id":"b2","text":"둘"},{"id":"b3","text":"셋"}]}'
+        )
+        pieces = [text[start : start + 7] for start in range(0, len(text), 7)]
+        yielded: list[str] = []
+
+        def generate_content_stream(**_: Any) -> Any:
+            for index, piece in enumerate(pieces):
+                yielded.append(piece)
+                last = index == len(pieces) - 1
+                yield SimpleNamespace(
+                    text=piece,
+                    usage_metadata=(
+                        SimpleNamespace(
+                            prompt_token_count=500,
+                            cached_content_token_count=None,
+                            candidates_token_count=60,
+                        )
+                        if last
+                        else None
+                    ),
+                )
+
+        with patch("glk.infrastructure.gemini_common.genai.Client"):
+            provider = GeminiTranslationProvider(
+                api_key="test-key",
+                model_name="test-model",
+                max_retries=1,
+            )
+        provider.client = SimpleNamespace(  # type: ignore[assignment]
+            models=SimpleNamespace(generate_content_stream=generate_content_stream),
+        )
+
+        stream = provider.translate_stream("Translate b1, b2, b3")
+        first = next(stream)
+        self.assertEqual(first, {"id": "b1", "text": '중괄호 } 와 "따옴표"'})
+        self.assertLess(len(yielded), len(pieces))
+        self.assertEqual([item["id"] for item in stream], ["b2", "b3"])
+        self.assertEqual(provider.token_usage.snapshot()["output_tokens"], 60)
+
+        pieces[:] = [text[: text.index('"b3"')]]
+        truncated = provider.translate_stream("Translate b1, b2, b3")
+        self.assertEqual([next(truncated)["id"], next(truncated)["id"]], ["b1", "b2"])
+        with self.assertRaisesRegex(ValueError, "ended early"):
+            list(truncated)
+
     def test_timeout_exception_stops_after_bounded_attempts(self) -> None:
         attempts = 0
         sleeps: list[float] = []
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from io import BytesIO
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from PIL import Image, ImageDraw
+
+from glk.extraction.layout import crop_page_image, shift_fragments, text_crop_box
+from glk.infrastructure.image_payload import (
+    ImagePayloadSettings,
+    encode_image,
+    load_image_payload_settings,
+)
+from glk.infrastructure.openai_layout import OpenAILayoutProvider
+
+
+def text_page(size: tuple[int, int] = (3000, 4000)) -> Image.Image:
+    image = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(image)
+    for row in range(40):
+        draw.rectangle((200, 200 + row * 80, 2600, 230 + row * 80), fill="black")
+    return image
+
+
+def decoded(data: bytes) -> Image.Image:
+    with Image.open(BytesIO(data)) as image:
+        image.load()
+        return image
+
+
+class ImagePayloadTests(unittest.TestCase):
+    def test_text_pages_are_clamped_and_sent_in_gray(self) -> None:
+        encoded = encode_image(text_page(), ImagePayloadSettings())
+
+        self.assertEqual(encoded.mime_type, "image/webp")
+        self.assertEqual(decoded(encoded.data).size, (1536, 2048))
+        gray = encode_image(text_page(), ImagePayloadSettings(format="png"))
+        self.assertEqual(decoded(gray.data).mode, "L")
+
+        colored = text_page((400, 300))
+        ImageDraw.Draw(colored).rectangle((0, 0, 200, 150), fill="red")
+        png = encode_image(colored, ImagePayloadSettings(format="png"))
+        self.assertEqual(png.mime_type, "image/png")
+        self.assertEqual(decoded(png.data).mode, "RGB")
+        palette = encode_image(
+            colored,
+            ImagePayloadSettings(format="png", color="palette"),
+        )
+        self.assertEqual(decoded(palette.data).mode, "P")
+
+    def test_byte_budget_lowers_quality_then_size(self) -> None:
+        noise = random.Random(7)
+        image = Image.frombytes(
+            "RGB",
+            (1200, 1200),
+            bytes(noise.randrange(256) for _ in range(1200 * 1200 * 3)),
+        )
+        unbounded = encode_image(image, ImagePayloadSettings(format="jpeg"))
+        bounded = encode_image(image, ImagePayloadSettings(format="jpeg", max_kb=100))
+
+        self.assertGreater(len(unbounded.data), 100 * 1024)
+        self.assertLessEqual(len(bounded.data), 100 * 1024)
+        self.assertLess(max(decoded(bounded.data).size), 1200)
+
+    def test_encodings_are_reused_and_settings_enter_the_response_key(self) -> None:
+        page = text_page((600, 800))
+        settings = ImagePayloadSettings()
+        self.assertIs(encode_image(page, settings), encode_image(page.copy(), settings))
+
+        webp = OpenAILayoutProvider(api_key="sk-test", model_name="gpt-test")
+        png = OpenAILayoutProvider(
+            api_key="sk-test",
+            model_name="gpt-test",
+            image_payload=ImagePayloadSettings(format="png"),
+        )
+        self.assertNotEqual(
+            webp.response_key("page 1", (page,)),
+            png.response_key("page 1", (page,)),
+        )
+        self.assertEqual(webp.response_key("text"), png.response_key("text"))
+
+    def test_settings_are_read_from_the_environment(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            environment = {
+                "GLK_IMAGE_FORMAT": "JPG",
+                "GLK_IMAGE_QUALITY": "70",
+                "GLK_IMAGE_MAX_KB": "300",
+                "GLK_IMAGE_MAX_DIMENSION": "0",
+                "GLK_IMAGE_COLOR": "full",
+                "GLK_IMAGE_CROP": "off",
+            }
+            with patch.dict(os.environ, environment):
+                self.assertEqual(
+                    load_image_payload_settings(directory),
+                    ImagePayloadSettings(
+                        format="jpeg",
+                        quality=70,
+                        max_kb=300,
+                        max_dimension=0,
+                        color="full",
+                        crop=False,
+                    ),
+                )
+            with patch.dict(os.environ, {"GLK_IMAGE_QUALITY": "0"}):
+                with self.assertRaisesRegex(ValueError, "GLK_IMAGE_QUALITY"):
+                    load_image_payload_settings(directory)
+            with patch.dict(os.environ, {"GLK_IMAGE_FORMAT": "gif"}):
+                with self.assertRaisesRegex(ValueError, "GLK_IMAGE_FORMAT"):
+                    load_image_payload_settings(directory)
+
+    def test_page_images_are_cropped_to_the_text_and_boxes_follow(self) -> None:
+        fragments = [
+            {"id": "f1", "text": "Title", "bbox": [100.0, 120.0, 300.0, 140.0]},
+            {"id": "f2", "text": "Body", "bbox": [100.0, 150.0, 400.0, 300.0]},
+        ]
+        page_size = (612.0, 792.0)
+
+        box = text_crop_box(fragments, page_size)
+        self.assertEqual(box, (82.0, 102.0, 418.0, 318.0))
+        assert box is not None
+        image = crop_page_image(Image.new("RGB", (918, 1188)), box, page_size)
+        self.assertEqual(image.size, (504, 324))
+        self.assertEqual(
+            shift_fragments(fragments, box[:2])[0]["bbox"],
+            [18.0, 18.0, 218.0, 38.0],
+        )
+        full_page = [{"id": "f1", "text": "All", "bbox": [5, 5, 607, 787]}]
+        self.assertIsNone(text_crop_box(full_page, page_size))
+
+
+if __name__ == "__main__":
+    unittest.main()
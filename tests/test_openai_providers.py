@@ -1,29 +1,213 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
+from email.parser import BytesParser
+from email.policy import default as default_email_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
 from types import SimpleNamespace
+from typing import Any
 import unittest
 
 import httpx
-from openai import APIStatusError
+from openai import APIStatusError, OpenAI
 from PIL import Image
 
+from glk.infrastructure.adaptive_concurrency import BATCH_CONTROL_KIND
 from glk.infrastructure.openai_common import (
     OpenAIEmptyResponseError,
+    OpenAIResponseError,
     openai_failure_code,
 )
 from glk.infrastructure.openai_layout import OpenAILayoutProvider
 from glk.infrastructure.openai_ocr import OpenAIImageOcrProvider
 from glk.infrastructure.openai_translation import OpenAITranslationProvider
+from glk.infrastructure.request_hedging import HedgingPolicy
+from glk.infrastructure.translation_prompt import TRANSLATION_PROMPT_CHUNK_HEADER
 
 
 class _FakeResponses:
     def __init__(self, output_text: str) -> None:
         self.output_text = output_text
+        self.usage: object = None
         self.requests: list[dict[str, object]] = []
 
     def create(self, **kwargs: object) -> SimpleNamespace:
         self.requests.append(kwargs)
-        return SimpleNamespace(output_text=self.output_text)
+        return SimpleNamespace(output_text=self.output_text, usage=self.usage)
+
+
+class _FakeAsyncResponses(_FakeResponses):
+    async def create(self, **kwargs: object) -> SimpleNamespace:  # type: ignore[override]
+        return super().create(**kwargs)
+
+
+class StandInBatchServer:
+    """Local stand-in for the OpenAI Files and Batch endpoints.
+
+    ``respond`` receives each request body and returns its output text, or
+    None to report that request as failed. A job finishes after
+    ``polls_before_done`` status reads.
+    """
+
+    def __init__(
+        self,
+        respond: Callable[[dict[str, Any]], str | None],
+        *,
+        polls_before_done: int = 1,
+    ) -> None:
+        self.respond = respond
+        self.polls_before_done = polls_before_done
+        self.files: dict[str, bytes] = {}
+        self.batches: dict[str, dict[str, Any]] = {}
+        self.polls: dict[str, int] = {}
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *_: object) -> None:
+                return
+
+            def _send(self, status: int, body: bytes, content_type: str) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _json(self, value: dict[str, Any], status: int = 200) -> None:
+                self._send(status, json.dumps(value).encode("utf-8"), "application/json")
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", "0"))
+                body = self.rfile.read(length)
+                with server.lock:
+                    if self.path == "/v1/files":
+                        self._json(server.create_file(self.headers["Content-Type"], body))
+                    elif self.path == "/v1/batches":
+                        self._json(server.create_batch(json.loads(body)))
+                    else:
+                        self._json({"error": {"message": "not found"}}, 404)
+
+            def do_GET(self) -> None:
+                with server.lock:
+                    parts = self.path.strip("/").split("/")
+                    if parts[:2] == ["v1", "batches"] and len(parts) == 3:
+                        self._json(server.poll_batch(parts[2]))
+                    elif parts[:2] == ["v1", "files"] and parts[3:] == ["content"]:
+                        self._send(200, server.files[parts[2]], "application/jsonl")
+                    else:
+                        self._json({"error": {"message": "not found"}}, 404)
+
+        self.http = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.http.serve_forever, daemon=True)
+
+    def __enter__(self) -> StandInBatchServer:
+        self.thread.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.http.shutdown()
+        self.http.server_close()
+
+    def client(self) -> OpenAI:
+        host, port = self.http.server_address[:2]
+        return OpenAI(
+            api_key="sk-test",
+            base_url=f"http://{host!s}:{port}/v1",
+            max_retries=0,
+        )
+
+    def create_file(self, content_type: str, body: bytes) -> dict[str, Any]:
+        message = BytesParser(policy=default_email_policy).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode("ascii") + body
+        )
+        data = next(
+            part.get_payload(decode=True)
+            for part in message.iter_parts()
+            if part.get_param("name", header="content-disposition") == "file"
+        )
+        file_id = f"file-{len(self.files) + 1}"
+        self.files[file_id] = data
+        return {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(data),
+            "created_at": 0,
+            "filename": "input.jsonl",
+            "purpose": "batch",
+            "status": "processed",
+        }
+
+    def create_batch(self, request: dict[str, Any]) -> dict[str, Any]:
+        batch_id = f"batch-{len(self.batches) + 1}"
+        self.batches[batch_id] = {
+            "id": batch_id,
+            "object": "batch",
+            "endpoint": request["endpoint"],
+            "completion_window": request["completion_window"],
+            "input_file_id": request["input_file_id"],
+            "created_at": 0,
+            "status": "validating",
+        }
+        self.polls[batch_id] = 0
+        return self.batches[batch_id]
+
+    def poll_batch(self, batch_id: str) -> dict[str, Any]:
+        batch = self.batches[batch_id]
+        self.polls[batch_id] += 1
+        if batch["status"] != "completed" and self.polls[batch_id] > self.polls_before_done:
+            self._complete(batch)
+        elif batch["status"] == "validating":
+            batch["status"] = "in_progress"
+        return batch
+
+    def _complete(self, batch: dict[str, Any]) -> None:
+        outputs: list[str] = []
+        errors: list[str] = []
+        for line in self.files[batch["input_file_id"]].decode("utf-8").splitlines():
+            request = json.loads(line)
+            text = self.respond(request["body"])
+            if text is None:
+                errors.append(
+                    json.dumps(
+                        {
+                            "custom_id": request["custom_id"],
+                            "response": {"status_code": 500, "body": {}},
+                            "error": None,
+                        }
+                    )
+                )
+                continue
+            outputs.append(
+                json.dumps(
+                    {
+                        "custom_id": request["custom_id"],
+                        "response": {
+                            "status_code": 200,
+                            "body": {
+                                "output": [
+                                    {
+                                        "type": "message",
+                                        "content": [
+                                            {"type": "output_text", "text": text}
+                                        ],
+                                    }
+                                ]
+                            },
+                        },
+                        "error": None,
+                    }
+                )
+            )
+        for key, lines in (("output_file_id", outputs), ("error_file_id", errors)):
+            if lines:
+                file_id = f"file-{len(self.files) + 1}"
+                self.files[file_id] = ("\n".join(lines) + "\n").encode("utf-8")
+                batch[key] = file_id
+        batch["status"] = "completed"
 
 
 class OpenAIProviderTests(unittest.TestCase):
@@ -53,7 +237,67 @@ class OpenAIProviderTests(unittest.TestCase):
             "json_schema",
         )
 
-    def test_layout_sends_a_png_data_url_with_the_prompt(self) -> None:
+    def test_translation_chunks_share_a_prompt_cache_key_and_record_usage(
+        self,
+    ) -> None:
+        provider, responses = self._provider(
+            OpenAITranslationProvider,
+            '{"translations":[]}',
+        )
+        responses.usage = SimpleNamespace(
+            input_tokens=2000,
+            input_tokens_details=SimpleNamespace(cached_tokens=1536),
+            output_tokens=40,
+        )
+
+        for prefix, block in (("rules", "b1"), ("rules", "b2"), ("other", "b3")):
+            provider.translate(f"{prefix}\n{TRANSLATION_PROMPT_CHUNK_HEADER}\n{block}")
+
+        keys = [request["prompt_cache_key"] for request in responses.requests]
+        self.assertEqual(keys[0], keys[1])
+        self.assertNotEqual(keys[0], keys[2])
+        self.assertEqual(provider.token_usage.snapshot()["cached_input_tokens"], 4608)
+
+    def test_translation_stream_parses_output_text_deltas(self) -> None:
+        provider, responses = self._provider(OpenAITranslationProvider, "")
+        usage = SimpleNamespace(
+            input_tokens=900,
+            input_tokens_details=SimpleNamespace(cached_tokens=0),
+            output_tokens=25,
+        )
+        events = [
+            SimpleNamespace(type="response.created"),
+            *(
+                SimpleNamespace(type="response.output_text.delta", delta=delta)
+                for delta in (
+                    '{"translations":[{"id":"b1",',
+                    '"text":"하나"},{"id"',
+                    ':"b2","text":"둘"}]}',
+                )
+            ),
+            SimpleNamespace(
+                type="response.completed",
+                response=SimpleNamespace(usage=usage),
+            ),
+        ]
+        responses.create = lambda **kwargs: (  # type: ignore[method-assign]
+            responses.requests.append(kwargs) or iter(events)
+        )
+
+        items = list(provider.translate_stream("Translate b1 and b2"))
+
+        self.assertEqual(
+            items,
+            [{"id": "b1", "text": "하나"}, {"id": "b2", "text": "둘"}],
+        )
+        self.assertIs(responses.requests[0]["stream"], True)
+        self.assertEqual(provider.token_usage.snapshot()["input_tokens"], 900)
+
+        events[-1] = SimpleNamespace(type="response.failed")
+        with self.assertRaises(OpenAIResponseError):
+            list(provider.translate_stream("Translate b1 and b2"))
+
+    def test_layout_sends_an_encoded_data_url_with_the_prompt(self) -> None:
         provider, responses = self._provider(
             OpenAILayoutProvider,
             '{"blocks":[]}',
@@ -68,7 +312,34 @@ class OpenAIProviderTests(unittest.TestCase):
         self.assertEqual(value, {"blocks": []})
         content = responses.requests[0]["input"][0]["content"]  # type: ignore[index]
         self.assertEqual(content[0]["type"], "input_text")
-        self.assertTrue(content[1]["image_url"].startswith("data:image/png;base64,"))
+        self.assertTrue(content[1]["image_url"].startswith("data:image/webp;base64,"))
+
+    def test_packed_layout_labels_each_page_and_splits_the_answer(self) -> None:
+        provider, responses = self._provider(
+            OpenAILayoutProvider,
+            '{"pages":[{"page":2,"blocks":[]},{"page":3,"blocks":[]}]}',
+        )
+        image = Image.new("RGB", (2, 2), "white")
+
+        value = provider.reconstruct_pages(
+            [
+                (2, [{"id": "f1", "text": "A", "bbox": [0, 0, 1, 1]}], image),
+                (3, [{"id": "f2", "text": "B", "bbox": [0, 0, 1, 1]}], image),
+            ]
+        )
+
+        self.assertEqual(value, {2: {"blocks": []}, 3: {"blocks": []}})
+        request = responses.requests[0]
+        content = request["input"][0]["content"]  # type: ignore[index]
+        self.assertEqual(
+            [item["type"] for item in content],
+            ["input_text", "input_text", "input_image", "input_text", "input_image"],
+        )
+        self.assertEqual(content[3]["text"], "PDF page index 3:")
+        self.assertEqual(
+            request["text"]["format"]["name"],  # type: ignore[index]
+            "pdf_layout_pages",
+        )
 
     def test_ocr_validates_the_structured_response(self) -> None:
         provider, _ = self._provider(
@@ -85,6 +356,43 @@ class OpenAIProviderTests(unittest.TestCase):
         self.assertEqual(value["warnings"], [])
         self.assertEqual(value["status"], "needs_review")
 
+    def test_async_methods_share_the_sync_request_shape(self) -> None:
+        cases = (
+            (
+                OpenAITranslationProvider,
+                '{"translations":[{"id":"b1","text":"번역"}]}',
+                lambda provider: provider.translate_async("Translate block b1"),
+            ),
+            (
+                OpenAILayoutProvider,
+                '{"blocks":[]}',
+                lambda provider: provider.reconstruct_async(
+                    1,
+                    [{"id": "f1", "text": "Title", "bbox": [0, 0, 10, 10]}],
+                    Image.new("RGB", (2, 2), "white"),
+                ),
+            ),
+            (
+                OpenAIImageOcrProvider,
+                '{"blocks":[],"warnings":[]}',
+                lambda provider: provider.transcribe_async(
+                    "Transcribe",
+                    Image.new("RGB", (2, 2), "white"),
+                ),
+            ),
+        )
+        for provider_type, output_text, call in cases:
+            with self.subTest(provider=provider_type.__name__):
+                provider, sync_responses = self._provider(provider_type, output_text)
+                async_responses = _FakeAsyncResponses(output_text)
+                provider.async_client = SimpleNamespace(responses=async_responses)
+
+                value = asyncio.run(call(provider))
+
+                self.assertIsInstance(value, dict)
+                self.assertEqual(sync_responses.requests, [])
+                self.assertEqual(async_responses.requests[0]["model"], "gpt-test")
+
     def test_empty_output_is_rejected(self) -> None:
         provider, _ = self._provider(OpenAITranslationProvider, "")
 
@@ -98,6 +406,72 @@ class OpenAIProviderTests(unittest.TestCase):
 
         self.assertEqual(openai_failure_code(error), "OPENAI_QUOTA_EXCEEDED")
 
+    def test_translation_batch_round_trips_through_a_stand_in_server(self) -> None:
+        def respond(body: dict[str, Any]) -> str | None:
+            if "fail" in body["input"]:
+                return None
+            return json.dumps(
+                {"translations": [{"id": "b1", "text": body["input"].upper()}]}
+            )
+
+        with StandInBatchServer(respond) as server:
+            provider = OpenAITranslationProvider(
+                api_key="sk-test",
+                model_name="gpt-test",
+                max_retries=1,
+            )
+            provider.client = server.client()
+
+            job_id = provider.submit_translation_batch(
+                {"c1": "first", "c2": "fail", "c3": "third"}
+            )
+
+            self.assertIsNone(provider.translation_batch_results(job_id))
+            results = provider.translation_batch_results(job_id)
+            submitted = [
+                json.loads(line)
+                for line in server.files["file-1"].decode("utf-8").splitlines()
+            ]
+
+        self.assertEqual(
+            results,
+            {
+                "c1": {"translations": [{"id": "b1", "text": "FIRST"}]},
+                "c2": None,
+                "c3": {"translations": [{"id": "b1", "text": "THIRD"}]},
+            },
+        )
+        self.assertEqual(submitted[0]["url"], "/v1/responses")
+        self.assertEqual(submitted[0]["body"]["model"], "gpt-test")
+        self.assertEqual(
+            submitted[0]["body"]["text"]["format"]["name"],
+            "translations",
+        )
+
+    def test_batch_control_calls_are_never_hedged(self) -> None:
+        hedging = HedgingPolicy(percentile=50, min_samples=3, budget_percent=100)
+        for _ in range(3):
+            hedging.call(lambda: None)
+        respond = lambda body: json.dumps({"translations": []})  # noqa: E731
+        with StandInBatchServer(respond) as server:
+            provider = OpenAITranslationProvider(
+                api_key="sk-test",
+                model_name="gpt-test",
+                max_retries=1,
+                hedging=hedging,
+            )
+            provider.client = server.client()
+
+            job_id = provider.submit_translation_batch({"c1": "first"})
+            provider.translation_batch_results(job_id)
+            provider.translation_batch_results(job_id)
+
+            self.assertEqual(len(server.batches), 1)
+            self.assertEqual(len(server.files), 2)
+        self.assertEqual(hedging.snapshot()["requests"], 3)
+        baselines = provider.concurrency_limit.snapshot()["latency_baseline_seconds"]
+        self.assertEqual(list(baselines), [BATCH_CONTROL_KIND])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from pathlib import Path
+import tempfile
+from types import SimpleNamespace
+import unittest
+from unittest.mock import patch
+
+from glk.infrastructure.openai_translation import OpenAITranslationProvider
+from glk.infrastructure.rate_limit import (
+    RateLimitBudget,
+    SharedRateLimiter,
+    load_rate_limit_budget,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def limiter(
+    directory: Path,
+    budget: RateLimitBudget,
+    clock: FakeClock,
+    *,
+    api_key: str = "key-a",
+) -> SharedRateLimiter:
+    return SharedRateLimiter(
+        provider_name="gemini",
+        model_name="test-model",
+        api_key=api_key,
+        budget=budget,
+        directory=directory,
+        clock=clock,
+    )
+
+
+class RateLimitTests(unittest.TestCase):
+    def test_request_budget_is_shared_by_limiters_with_the_same_key(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            clock = FakeClock()
+            budget = RateLimitBudget(requests_per_minute=2)
+            first = limiter(Path(directory), budget, clock)
+            second = limiter(Path(directory), budget, clock)
+            other_key = limiter(Path(directory), budget, clock, api_key="key-b")
+
+            self.assertEqual(first.reserve(), 0.0)
+            self.assertEqual(second.reserve(), 0.0)
+            self.assertAlmostEqual(first.reserve(), 30.0)
+            self.assertEqual(other_key.reserve(), 0.0)
+            clock.now += 30
+            self.assertEqual(second.reserve(), 0.0)
+            self.assertNotIn("key-a", first.state_path.read_text(encoding="utf-8"))
+
+    def test_reported_tokens_delay_later_requests_until_refilled(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            clock = FakeClock()
+            shared = limiter(
+                Path(directory),
+                RateLimitBudget(tokens_per_minute=600),
+                clock,
+            )
+            sleeps: list[float] = []
+
+            def sleep(seconds: float) -> None:
+                sleeps.append(seconds)
+                clock.now += seconds
+
+            shared.acquire(sleep=sleep)
+            shared.spend_tokens(900, 300, None)
+            shared.acquire(sleep=sleep)
+
+            self.assertEqual(len(sleeps), 1)
+            self.assertAlmostEqual(sleeps[0], 60.0)
+
+    def test_budgets_load_from_env_file_and_reject_invalid_values(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            (root / ".env").write_text(
+                'GLK_RATE_LIMIT_RPM="15"\nGLK_RATE_LIMIT_RPD="1500"\n',
+                encoding="utf-8",
+            )
+            with patch.dict(
+                "os.environ",
+                {
+                    "GLK_RATE_LIMIT_RPM": "",
+                    "GLK_RATE_LIMIT_TPM": "",
+                    "GLK_RATE_LIMIT_RPD": "",
+                },
+            ):
+                self.assertEqual(
+                    load_rate_limit_budget(root),
+                    RateLimitBudget(requests_per_minute=15, requests_per_day=1500),
+                )
+            with patch.dict("os.environ", {"GLK_RATE_LIMIT_TPM": "0"}):
+                with self.assertRaisesRegex(ValueError, "GLK_RATE_LIMIT_TPM"):
+                    load_rate_limit_budget(root)
+            with patch.dict(
+                "os.environ",
+                {
+                    "GLK_RATE_LIMIT_RPM": "",
+                    "GLK_RATE_LIMIT_TPM": "",
+                    "GLK_RATE_LIMIT_RPD": "",
+                },
+            ):
+                self.assertFalse(load_rate_limit_budget(directory + "/none").enabled)
+
+    def test_provider_requests_draw_from_the_limiter_and_charge_usage(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            clock = FakeClock()
+            shared = limiter(
+                Path(directory),
+                RateLimitBudget(requests_per_minute=1, tokens_per_minute=6000),
+                clock,
+            )
+            provider = OpenAITranslationProvider(
+                api_key="sk-test",
+                model_name="gpt-test",
+                max_retries=1,
+                rate_limiter=shared,
+            )
+            usage = SimpleNamespace(
+                input_tokens=5000,
+                input_tokens_details=None,
+                output_tokens=1000,
+            )
+            provider.client = SimpleNamespace(  # type: ignore[assignment]
+                responses=SimpleNamespace(
+                    create=lambda **_: SimpleNamespace(
+                        output_text='{"translations":[]}',
+                        usage=usage,
+                    )
+                )
+            )
+
+            provider.translate("Translate nothing")
+
+            self.assertAlmostEqual(shared.reserve(), 60.0)
+            clock.now += 60
+            self.assertEqual(shared.reserve(), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
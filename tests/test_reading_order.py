@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import Any
+import unittest
+
+from glk.extraction.layout import reconstruct_blocks, validate_layout
+from glk.extraction.reading_order import infer_reading_order
+
+PAGE_SIZE = (612.0, 792.0)
+
+
+def fragment(
+    number: int,
+    text: str,
+    bbox: tuple[float, float, float, float],
+    *,
+    block_index: int,
+    size: float = 11.0,
+) -> dict[str, Any]:
+    return {
+        "id": f"P001-F{number:03d}",
+        "text": text,
+        "bbox": list(bbox),
+        "block_index": block_index,
+        "line_index": 0,
+        "direction": [1.0, 0.0],
+        "font_sizes": [size],
+    }
+
+
+class ReadingOrderTests(unittest.TestCase):
+    def test_single_column_page_is_trusted_and_passes_validation(self) -> None:
+        fragments = [
+            fragment(1, "Setup", (72, 40, 130, 62), block_index=0, size=18),
+            fragment(2, "Place the board in the", (72, 80, 300, 93), block_index=1),
+            fragment(3, "middle of the table.", (72, 94, 280, 107), block_index=1),
+            fragment(4, "• Shuffle the deck", (72, 122, 250, 135), block_index=2),
+            fragment(5, "12", (300, 760, 312, 772), block_index=3),
+        ]
+
+        result = infer_reading_order(fragments, PAGE_SIZE)
+
+        self.assertEqual(result.confidence, 1.0)
+        validate_layout(fragments, result.layout)
+        blocks = reconstruct_blocks(fragments, result.layout)
+        self.assertEqual(
+            [(block["type"], block["include_in_text"]) for block in blocks],
+            [
+                ("heading", True),
+                ("paragraph", True),
+                ("list_item", True),
+                ("page_number", False),
+            ],
+        )
+        self.assertEqual(blocks[1]["text"], "Place the board in the middle of the table.")
+
+    def test_columns_are_read_one_after_another(self) -> None:
+        fragments = []
+        for row in range(3):
+            top = 80 + row * 14
+            fragments.append(
+                fragment(len(fragments) + 1, f"left {row}", (72, top, 250, top + 13), block_index=0)
+            )
+            fragments.append(
+                fragment(len(fragments) + 1, f"right {row}", (320, top, 540, top + 13), block_index=1)
+            )
+
+        result = infer_reading_order(fragments, PAGE_SIZE)
+
+        ordered = [
+            fragment_id
+            for block in result.layout["blocks"]
+            for fragment_id in block["fragment_ids"]
+        ]
+        self.assertEqual(
+            ordered,
+            ["P001-F001", "P001-F003", "P001-F005", "P001-F002", "P001-F004", "P001-F006"],
+        )
+        self.assertEqual(result.reasons, ("order differs from the PDF text order",))
+        self.assertEqual(result.confidence, 0.9)
+
+    def test_overlapping_or_table_like_pages_are_left_to_the_model(self) -> None:
+        overlapping = [
+            fragment(1, "Callout", (72, 80, 200, 93), block_index=0),
+            fragment(2, "Behind", (80, 82, 210, 95), block_index=1),
+        ]
+        table = [
+            fragment(1, "Cost", (72, 80, 120, 93), block_index=0),
+            fragment(2, "3 gold", (300, 80, 360, 93), block_index=1),
+        ]
+
+        self.assertLess(infer_reading_order(overlapping, PAGE_SIZE).confidence, 0.9)
+        result = infer_reading_order(table, PAGE_SIZE)
+        self.assertLess(result.confidence, 0.9)
+        self.assertIn("table-like rows", result.reasons)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from glk.infrastructure.request_hedging import HedgingPolicy, load_hedge_settings
+from glk.infrastructure.usage_telemetry import RequestMeter
+
+
+def primed_policy(**kwargs: int) -> HedgingPolicy:
+    policy = HedgingPolicy(percentile=50, min_samples=3, **kwargs)
+    for _ in range(3):
+        policy.call(lambda: None)
+    return policy
+
+
+class RequestHedgingTests(unittest.TestCase):
+    def test_a_slow_request_is_raced_by_a_duplicate_that_wins(self) -> None:
+        policy = primed_policy(budget_percent=100)
+        meter = RequestMeter(provider_name="gemini", model_name="test-model")
+        release_primary = threading.Event()
+        calls: list[int] = []
+        lock = threading.Lock()
+
+        def operation() -> str:
+            with lock:
+                calls.append(1)
+                copy = len(calls)
+            if copy == 1:
+                release_primary.wait(5)
+                return "primary"
+            return "hedge"
+
+        self.assertEqual(policy.call(operation, meter=meter), "hedge")
+        release_primary.set()
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual((meter.hedges, meter.hedge_wins), (1, 1))
+        snapshot = policy.snapshot()
+        self.assertEqual((snapshot["hedges"], snapshot["hedge_wins"]), (1, 1))
+
+    def test_hedges_stop_once_the_budget_is_spent(self) -> None:
+        policy = primed_policy(budget_percent=20)
+        release = threading.Event()
+        started: list[int] = []
+
+        def operation() -> str:
+            started.append(1)
+            release.wait(0.05)
+            return "done"
+
+        for _ in range(4):
+            policy.call(operation)
+        release.set()
+
+        # Seven requests at 20 percent leave room for exactly one duplicate.
+        self.assertEqual(policy.snapshot()["requests"], 7)
+        self.assertEqual(policy.snapshot()["hedges"], 1)
+        self.assertEqual(len(started), 5)
+
+    def test_async_hedge_cancels_the_slow_copy_in_flight(self) -> None:
+        policy = primed_policy(budget_percent=100)
+        cancelled = asyncio.Event()
+        calls: list[int] = []
+
+        async def operation() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+                return "primary"
+            return "hedge"
+
+        async def scenario() -> tuple[str, bool]:
+            result = await policy.call_async(operation)
+            await asyncio.sleep(0)
+            return result, cancelled.is_set()
+
+        self.assertEqual(asyncio.run(scenario()), ("hedge", True))
+
+    def test_settings_enable_hedging_and_reject_invalid_values(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            (root / ".env").write_text(
+                'GLK_HEDGE_PERCENTILE="95"\n',
+                encoding="utf-8",
+            )
+            with patch.dict(
+                "os.environ",
+                {"GLK_HEDGE_PERCENTILE": "", "GLK_HEDGE_BUDGET_PERCENT": ""},
+            ):
+                self.assertEqual(load_hedge_settings(root), (95, 10))
+                self.assertIsNone(load_hedge_settings(root / "none"))
+            with patch.dict("os.environ", {"GLK_HEDGE_BUDGET_PERCENT": "0"}):
+                with self.assertRaisesRegex(ValueError, "GLK_HEDGE_BUDGET_PERCENT"):
+                    load_hedge_settings(root)
+
+
+if __name__ == "__main__":
+    unittest.main()
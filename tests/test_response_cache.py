@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from types import SimpleNamespace
+from typing import Any
+import unittest
+from unittest.mock import patch
+
+from PIL import Image
+
+from glk.application.translation_service import translate_project
+from glk.application.translation_types import TranslationError
+from glk.infrastructure.openai_translation import OpenAITranslationProvider
+from glk.infrastructure.response_cache import (
+    ResponseCache,
+    load_response_cache_budget,
+    response_cache_key,
+    use_response_cache,
+)
+from tests.test_translation_service import (
+    create_translation_project,
+    sample_blocks,
+    valid_response,
+)
+
+
+def counting_provider(
+    response: dict[str, Any],
+    calls: list[int],
+    *,
+    fail_after: int | None = None,
+) -> OpenAITranslationProvider:
+    provider = OpenAITranslationProvider(
+        api_key="sk-test",
+        model_name="gpt-test",
+        max_retries=1,
+    )
+
+    def create(**_: Any) -> Any:
+        if fail_after is not None and len(calls) >= fail_after:
+            raise RuntimeError("service unavailable")
+        calls.append(1)
+        return SimpleNamespace(output_text=json.dumps(response), usage=None)
+
+    provider.client = SimpleNamespace(  # type: ignore[assignment]
+        responses=SimpleNamespace(create=create)
+    )
+    return provider
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def test_forked_project_reuses_responses_from_the_same_workspace(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = sample_blocks()
+            project_path = create_translation_project(workspace_root, blocks)
+            shutil.copytree(project_path, workspace_root / "forked_project")
+            calls: list[int] = []
+            provider = counting_provider(valid_response(blocks), calls)
+
+            first = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                translation_memory=False,
+                provider=provider,
+            )
+            forked = translate_project(
+                project="forked_project",
+                workspace_root=workspace_root,
+                translation_memory=False,
+                provider=provider,
+            )
+
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(forked.completed_blocks, first.completed_blocks)
+            self.assertTrue(
+                any((workspace_root / ".glk/cache/responses").glob("*/*.json"))
+            )
+            ledger = workspace_root / "forked_project/.glk/state/usage.jsonl"
+            self.assertFalse(ledger.exists())
+
+            translate_project(
+                project="forked_project",
+                workspace_root=workspace_root,
+                translation_memory=False,
+                force=True,
+                provider=provider,
+            )
+            self.assertEqual(len(calls), 2)
+
+    def test_rejected_translations_are_not_replayed_to_a_resumed_run(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = sample_blocks()
+            create_translation_project(workspace_root, blocks)
+            rejected_calls: list[int] = []
+
+            # The chunk and its first half are rejected twice each, then the
+            # provider goes away before the second half is answered.
+            with self.assertRaisesRegex(TranslationError, "use --resume"):
+                translate_project(
+                    project="translation_project",
+                    workspace_root=workspace_root,
+                    translation_memory=False,
+                    provider=counting_provider(
+                        {"translations": []},
+                        rejected_calls,
+                        fail_after=4,
+                    ),
+                )
+            self.assertEqual(len(rejected_calls), 4)
+            self.assertFalse(
+                any((workspace_root / ".glk/cache/responses").glob("*/*.json"))
+            )
+
+            calls: list[int] = []
+            result = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                translation_memory=False,
+                resume=True,
+                provider=counting_provider(valid_response(blocks), calls),
+            )
+
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(result.completed_blocks, len(blocks))
+
+    def test_least_recently_used_entries_are_evicted_past_the_budget(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResponseCache(Path(directory), max_bytes=800)
+            payload = {"text": "x" * 100}
+            for index, key in enumerate(("a1", "b2", "c3")):
+                cache.put(key * 32, payload)
+                os.utime(cache.path(key * 32), (index, index))
+            self.assertIsNotNone(cache.get("a1" * 32))
+
+            cache.put("d4" * 32, payload)
+
+            self.assertIsNotNone(cache.get("a1" * 32))
+            self.assertIsNone(cache.get("b2" * 32))
+            self.assertIsNotNone(cache.get("d4" * 32))
+
+    def test_keys_follow_image_pixels_and_refresh_replaces_entries(self) -> None:
+        white = Image.new("RGB", (4, 4), "white")
+        black = Image.new("RGB", (4, 4), "black")
+        identity = {
+            "provider_name": "gemini",
+            "model_name": "test-model",
+            "prompt_version": "layout-v1",
+            "prompt": "page 1",
+        }
+        self.assertEqual(
+            response_cache_key(**identity, images=(white,)),
+            response_cache_key(**identity, images=(white.copy(),)),
+        )
+        self.assertNotEqual(
+            response_cache_key(**identity, images=(white,)),
+            response_cache_key(**identity, images=(black,)),
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResponseCache(Path(directory), max_bytes=1_000_000)
+            calls: list[int] = []
+            provider = counting_provider({"translations": []}, calls)
+            with use_response_cache(cache):
+                provider.translate("prompt")
+                provider.translate("prompt")
+            with use_response_cache(cache, refresh=True):
+                provider.translate("prompt")
+            self.assertEqual(len(calls), 2)
+
+    def test_budget_setting_turns_the_cache_off_or_rejects_invalid_values(
+        self,
+    ) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            with patch.dict("os.environ", {"GLK_RESPONSE_CACHE_MB": ""}):
+                self.assertEqual(
+                    load_response_cache_budget(directory), 1024 * 1024 * 1024
+                )
+            with patch.dict("os.environ", {"GLK_RESPONSE_CACHE_MB": "0"}):
+                self.assertEqual(load_response_cache_budget(directory), 0)
+            with patch.dict("os.environ", {"GLK_RESPONSE_CACHE_MB": "-1"}):
+                with self.assertRaisesRegex(ValueError, "GLK_RESPONSE_CACHE_MB"):
+                    load_response_cache_budget(directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
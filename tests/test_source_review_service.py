@@ -153,6 +153,44 @@ class SourceReviewServiceTests(unittest.TestCase):
             self.assertEqual(reset.review_status, "current")
             self.assertIn("New extraction.", (project_path / "02_source/review.txt").read_text())
 
+    def test_source_change_carries_review_forward_for_untouched_pages(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            project_path = self.create_source(
+                workspace_root,
+                [make_block(1, "Page one text."), make_block(2, "Page two text.", page=2)],
+            )
+            prepare_project_source_review(
+                project="review_project", workspace_root=workspace_root
+            )
+            review_path = project_path / "02_source/review.txt"
+            review_path.write_text(
+                review_path.read_text(encoding="utf-8")
+                .replace("Page one text.", "Reviewed page one.")
+                .replace("Page two text.", "Reviewed page two."),
+                encoding="utf-8",
+            )
+            write_blocks(
+                project_path / ".glk/segments/source.jsonl",
+                [make_block(1, "Page one text."), make_block(2, "Revised page two.", page=2)],
+            )
+
+            carried = prepare_project_source_review(
+                project="review_project", workspace_root=workspace_root
+            )
+
+            self.assertEqual(carried.review_status, "current")
+            self.assertTrue(carried.carried_forward)
+            self.assertEqual(carried.refreshed_groups, ("pdf:2",))
+            review = review_path.read_text(encoding="utf-8")
+            self.assertIn("Reviewed page one.", review)
+            self.assertIn("Revised page two.", review)
+            self.assertNotIn("Reviewed page two.", review)
+            result = finalize_project_source_review(
+                project="review_project", workspace_root=workspace_root
+            )
+            self.assertEqual(result.changed_blocks, 1)
+
     def test_finalize_rejects_marker_damage_and_unresolved_text(self) -> None:
         with tempfile.TemporaryDirectory() as temporary_directory:
             workspace_root = Path(temporary_directory) / "workspaces"
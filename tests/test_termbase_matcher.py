@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import re
+import unittest
+from typing import Any
+
+from glk.domain.termbase_matcher import TermbaseMatcher, termbase_matcher
+
+
+def _entry(source_term: str, *variants: str, status: str = "approved") -> dict[str, Any]:
+    return {
+        "source_term": source_term,
+        "translation": "번역",
+        "status": status,
+        "variants": list(variants),
+        "note": "",
+    }
+
+
+def _regex_variants(text: str, entries: list[dict[str, Any]]) -> dict[int, list[str]]:
+    found: dict[int, list[str]] = {}
+    for index, entry in enumerate(entries):
+        variants = dict.fromkeys([entry["source_term"], *entry["variants"]])
+        for variant in variants:
+            clean = variant.strip()
+            prefix = r"(?<!\w)" if clean[0].isalnum() else ""
+            suffix = r"(?!\w)" if clean[-1].isalnum() else ""
+            if re.search(prefix + re.escape(clean) + suffix, text, re.IGNORECASE):
+                found.setdefault(index, []).append(variant)
+    return found
+
+
+class TermbaseMatcherTests(unittest.TestCase):
+    def test_reports_overlapping_variants_on_word_boundaries(self) -> None:
+        entries = [
+            _entry("Action", "Actions"),
+            _entry("Action Phase"),
+            _entry("HP", "hp"),
+            _entry("+1"),
+            _entry("1"),
+            _entry("Reaction", status="keep"),
+        ]
+        text = "During the action phase, gain +1 HP. Actions! Reactions hp"
+        matcher = TermbaseMatcher(entries)
+
+        self.assertEqual(
+            matcher.matching_variants(text),
+            _regex_variants(text, entries),
+        )
+        self.assertEqual(
+            [(match.start, match.end) for match in matcher.find(text)][:2],
+            [(11, 17), (11, 23)],
+        )
+
+    def test_compiled_matcher_is_reused_for_identical_termbases(self) -> None:
+        entries = [_entry("Victory Point", "Victory Points")]
+        first = termbase_matcher(entries)
+
+        self.assertIs(termbase_matcher([dict(entry) for entry in entries]), first)
+        self.assertIsNot(
+            termbase_matcher([_entry("Victory Point", status="keep")]),
+            first,
+        )
+
+    def test_empty_termbase_matches_nothing(self) -> None:
+        self.assertEqual(TermbaseMatcher([]).find("Anything at all"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
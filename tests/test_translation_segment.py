@@ -114,6 +114,30 @@ class TranslationSegmentTests(unittest.TestCase):
         ):
             TranslationSegment.from_dict(payload)
 
+    def test_serializes_provenance_only_for_reused_translations(self) -> None:
+        self.assertNotIn("origin", _segment().to_dict())
+        reused = replace(
+            _segment(),
+            origin="translation_memory",
+            origin_ref="base_game/pdf-p0003-b0002",
+        )
+
+        payload = reused.to_dict()
+
+        self.assertEqual(payload["origin"], "translation_memory")
+        self.assertEqual(TranslationSegment.from_dict(payload), reused)
+        for segment, message in (
+            (replace(_segment(), origin="cache"), "Invalid translation origin"),
+            (replace(_segment(), origin_ref="base_game/x"), "cannot have origin_ref"),
+            (replace(reused, origin_ref=None), "must record origin_ref"),
+        ):
+            with self.subTest(message=message):
+                with self.assertRaisesRegex(
+                    TranslationSegmentValidationError,
+                    message,
+                ):
+                    segment.validate()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 import hashlib
 import json
 import tempfile
+import threading
 import unittest
 from dataclasses import replace
 from pathlib import Path
@@ -11,10 +13,13 @@ from unittest.mock import patch
 
 from glk.application import translation_service
 from glk.application._io import append_bytes_durable
+from glk.application._token_estimate import estimate_tokens, token_estimate_profile
+from glk.application._translation_memory import FuzzyTranslationIndex
 from glk.application.glossary_service import GLOSSARY_BUILD_VERSION
 from glk.application.project_service import create_project, inspect_project
 from glk.application.translation_service import (
     TranslationError,
+    build_token_budget_chunks,
     build_translation_chunks,
     compile_translation_prompt,
     translate_project,
@@ -34,6 +39,10 @@ from glk.domain.source_block import SOURCE_BLOCK_SCHEMA_VERSION, SourceBlock
 from glk.domain.translation_qa import check_translation_contract
 from glk.domain.translation_segment import TranslationSegment
 from glk.domain.workspace import IMAGE_SOURCE_ROOT, WorkspacePaths
+from glk.infrastructure.openai_translation import OpenAITranslationProvider
+from glk.infrastructure.token_usage import TokenUsage
+from glk.infrastructure.translation_prompt import split_translation_prompt
+from tests.test_openai_providers import StandInBatchServer
 
 
 def make_block(order: int, text: str, *, block_type: str = "body") -> SourceBlock:
@@ -194,6 +203,50 @@ def create_translation_project(
     return project_path
 
 
+def create_approved_translation_project(
+    project_path: Path,
+    *,
+    termbase: dict[str, Any],
+    translations: list[tuple[SourceBlock, str]],
+) -> None:
+    """Write the minimal approved-translation artifacts of another project."""
+    paths = WorkspacePaths(project_path)
+    paths.termbase.parent.mkdir(parents=True)
+    paths.approved_translation_segments.parent.mkdir(parents=True)
+    (project_path / "project.json").write_text("{}", encoding="utf-8")
+    termbase_data = (json.dumps(termbase, ensure_ascii=False) + "\n").encode("utf-8")
+    paths.termbase.write_bytes(termbase_data)
+    segments = []
+    for order, (block, translation) in enumerate(translations, start=1):
+        translation_hash = hashlib.sha256(translation.encode("utf-8")).hexdigest()
+        segments.append(
+            ApprovedTranslationSegment(
+                schema_version=1,
+                source_block_id=f"pdf-p0009-b{order:04d}",
+                source_file="01_input/pdf/base.pdf",
+                page=9,
+                source_order=order,
+                block_type=block.block_type,
+                source_text=block.effective_text,
+                source_sha256=hashlib.sha256(
+                    block.effective_text.encode("utf-8")
+                ).hexdigest(),
+                draft_translation=translation,
+                draft_translation_sha256=translation_hash,
+                corrected_translation=None,
+                final_translation_sha256=translation_hash,
+                status="approved",
+                model="base-model",
+                prompt_sha256="a" * 64,
+                termbase_sha256=hashlib.sha256(termbase_data).hexdigest(),
+            ).to_dict()
+        )
+    paths.approved_translation_segments.write_text(
+        "".join(json.dumps(item, ensure_ascii=False) + "\n" for item in segments),
+        encoding="utf-8",
+    )
+
+
 def sample_blocks() -> list[SourceBlock]:
     return [
         make_block(1, "Combat", block_type="heading"),
@@ -202,6 +255,10 @@ def sample_blocks() -> list[SourceBlock]:
     ]
 
 
+def result_chunk_id(block: SourceBlock) -> str:
+    return build_translation_chunks([block], max_characters=1)[0].id
+
+
 def valid_response(blocks: list[SourceBlock]) -> dict[str, Any]:
     translations = {
         blocks[0].id: "전투",
@@ -233,7 +290,161 @@ class SequenceProvider:
         return value
 
 
+class StreamingSequenceProvider(SequenceProvider):
+    """Stream each queued response item by item; an exception entry ends a stream."""
+
+    def translate_stream(self, prompt: str) -> Iterator[dict[str, Any]]:
+        self.prompts.append(prompt)
+        if not self.responses:
+            raise AssertionError("Unexpected translation request")
+        for item in self.responses.pop(0):
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+class OutOfOrderProvider:
+    """Answer one-block chunks, holding the first until every later one finished."""
+
+    model_name = "test-model"
+    prompt_version = "test-translation-v1"
+
+    def __init__(self, translations: dict[str, str], *, fail_id: str | None = None):
+        self.translations = translations
+        self.fail_id = fail_id
+        self.first_id = next(iter(translations))
+        self.lock = threading.Lock()
+        self.finished: list[str] = []
+        self.later_finished = threading.Event()
+
+    def translate(self, prompt: str) -> dict[str, Any]:
+        block_id = next(
+            block_id for block_id in self.translations if block_id in prompt
+        )
+        if block_id == self.first_id:
+            self.later_finished.wait(timeout=5)
+        with self.lock:
+            self.finished.append(block_id)
+            if len(self.finished) == len(self.translations) - 1:
+                self.later_finished.set()
+        if block_id == self.fail_id:
+            raise RuntimeError("simulated provider outage")
+        return {
+            "translations": [{"id": block_id, "text": self.translations[block_id]}]
+        }
+
+
 class TranslationFoundationTests(unittest.TestCase):
+    def test_concurrent_chunks_commit_in_source_order(self) -> None:
+        blocks = [
+            make_block(index, f"Rule {index}: resolve this effect.")
+            for index in range(1, 6)
+        ]
+        translations = {
+            block.id: f"규칙 {index}: 이 효과를 해결합니다."
+            for index, block in enumerate(blocks, start=1)
+        }
+        sequential_provider = SequenceProvider(
+            [
+                {"translations": [{"id": block.id, "text": translations[block.id]}]}
+                for block in blocks
+            ]
+        )
+        concurrent_provider = OutOfOrderProvider(translations)
+        outputs: list[tuple[bytes, dict[str, Any]]] = []
+        for concurrency, provider in (
+            (1, sequential_provider),
+            (len(blocks), concurrent_provider),
+        ):
+            with tempfile.TemporaryDirectory() as temporary_directory:
+                workspace_root = Path(temporary_directory) / "workspaces"
+                project_path = create_translation_project(workspace_root, blocks)
+                result = translate_project(
+                    project="translation_project",
+                    workspace_root=workspace_root,
+                    provider=provider,
+                    max_characters=1,
+                    concurrency=concurrency,
+                )
+                self.assertEqual(result.completed_chunks, len(blocks))
+                state = json.loads(
+                    (project_path / ".glk/state/translation.json").read_text(
+                        encoding="utf-8"
+                    )
+                )
+                outputs.append(
+                    (
+                        (project_path / ".glk/segments/translation.jsonl").read_bytes(),
+                        state,
+                    )
+                )
+
+        self.assertEqual(concurrent_provider.finished[-1], blocks[0].id)
+        (sequential_data, sequential_state), (concurrent_data, concurrent_state) = (
+            outputs
+        )
+        self.assertEqual(concurrent_data, sequential_data)
+        self.assertEqual(
+            concurrent_state["translation_output_sha256"],
+            sequential_state["translation_output_sha256"],
+        )
+        self.assertEqual(concurrent_state["input_sha256"], sequential_state["input_sha256"])
+
+    def test_concurrent_failure_keeps_only_the_ordered_prefix(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = [
+                make_block(index, f"Rule {index}: resolve this effect.")
+                for index in range(1, 5)
+            ]
+            project_path = create_translation_project(workspace_root, blocks)
+            translations = {
+                block.id: f"규칙 {index}: 이 효과를 해결합니다."
+                for index, block in enumerate(blocks, start=1)
+            }
+            with self.assertRaisesRegex(TranslationError, "use --resume"):
+                translate_project(
+                    project="translation_project",
+                    workspace_root=workspace_root,
+                    provider=OutOfOrderProvider(translations, fail_id=blocks[1].id),
+                    max_characters=1,
+                    concurrency=len(blocks),
+                )
+
+            state = json.loads(
+                (project_path / ".glk/state/translation.json").read_text(
+                    encoding="utf-8"
+                )
+            )
+            output_path = project_path / ".glk/segments/translation.jsonl"
+            self.assertEqual(state["completed_chunks"], 1)
+            self.assertEqual(state["failed_chunk"], result_chunk_id(blocks[1]))
+            self.assertEqual(
+                state["translation_output_bytes"], output_path.stat().st_size
+            )
+
+            resumed = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=OutOfOrderProvider(
+                    {block.id: translations[block.id] for block in blocks[1:]}
+                ),
+                max_characters=1,
+                concurrency=len(blocks),
+                resume=True,
+            )
+            self.assertTrue(resumed.resumed)
+            self.assertEqual(resumed.completed_blocks, len(blocks))
+
+    def test_rejects_non_positive_concurrency(self) -> None:
+        with self.assertRaisesRegex(TranslationError, "concurrency"):
+            translate_project(
+                project="translation_project",
+                workspace_root="unused",
+                provider=SequenceProvider([]),
+                concurrency=0,
+            )
+
     def test_writes_translation_segments_once_instead_of_rewriting_prefixes(
         self,
     ) -> None:
@@ -353,6 +564,230 @@ class TranslationFoundationTests(unittest.TestCase):
                 output_path.stat().st_size,
             )
 
+    def test_group_commit_replays_journaled_chunks_on_resume(self) -> None:
+        class Crash(BaseException):
+            pass
+
+        class CrashingProvider(SequenceProvider):
+            def translate(self, prompt: str) -> dict[str, Any]:
+                if not self.responses:
+                    raise Crash()
+                return super().translate(prompt)
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = sample_blocks()
+            project_path = create_translation_project(workspace_root, blocks)
+            responses = [
+                {"translations": [item]}
+                for item in valid_response(blocks)["translations"]
+            ]
+            output_path = project_path / ".glk/segments/translation.jsonl"
+            state_path = project_path / ".glk/state/translation.json"
+            with self.assertRaises(Crash):
+                translate_project(
+                    project="translation_project",
+                    workspace_root=workspace_root,
+                    provider=CrashingProvider(responses[:2]),
+                    max_characters=1,
+                    concurrency=1,
+                    checkpoint_chunks=10,
+                )
+            state = json.loads(state_path.read_text(encoding="utf-8"))
+            # Only the first chunk was checkpointed; the second is journaled.
+            self.assertEqual(state["completed_chunks"], 1)
+            self.assertIn(blocks[1].id, output_path.read_text(encoding="utf-8"))
+            append_bytes_durable(output_path, b'{"interrupted":')
+            provider = SequenceProvider(responses[2:])
+
+            resumed = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=provider,
+                max_characters=1,
+                concurrency=1,
+                checkpoint_chunks=10,
+                resume=True,
+            )
+
+            self.assertEqual(len(provider.prompts), 1)
+            self.assertIn(blocks[2].id, provider.prompts[0])
+            self.assertEqual(resumed.completed_blocks, len(blocks))
+            self.assertNotIn(b"interrupted", output_path.read_bytes())
+            completed_state = json.loads(state_path.read_text(encoding="utf-8"))
+            self.assertEqual(
+                completed_state["translation_output_bytes"],
+                output_path.stat().st_size,
+            )
+        with self.assertRaisesRegex(TranslationError, "checkpoint chunks"):
+            translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                checkpoint_chunks=0,
+            )
+
+    def test_batch_mode_ingests_stand_in_batch_results_in_order(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = sample_blocks()
+            project_path = create_translation_project(workspace_root, blocks)
+            translations = {
+                item["id"]: item for item in valid_response(blocks)["translations"]
+            }
+
+            def respond(body: dict[str, Any]) -> str:
+                return json.dumps(
+                    {
+                        "translations": [
+                            item
+                            for block_id, item in translations.items()
+                            if block_id in body["input"]
+                        ]
+                    }
+                )
+
+            messages: list[str] = []
+            with StandInBatchServer(respond, polls_before_done=2) as server:
+                provider = OpenAITranslationProvider(
+                    api_key="sk-test",
+                    model_name="test-model",
+                    max_retries=1,
+                )
+                provider.client = server.client()
+
+                result = translate_project(
+                    project="translation_project",
+                    workspace_root=workspace_root,
+                    provider=provider,
+                    max_characters=1,
+                    batch=True,
+                    batch_poll_seconds=0,
+                    progress=messages.append,
+                )
+
+            self.assertEqual(len(server.batches), 1)
+            self.assertEqual(result.completed_blocks, len(blocks))
+            self.assertIn("Batch job batch-1: submitted 3 requests", messages)
+            self.assertIn("Batch job batch-1: 3/3 requests answered", messages)
+            segments = [
+                json.loads(line)
+                for line in (project_path / ".glk/segments/translation.jsonl")
+                .read_text(encoding="utf-8")
+                .splitlines()
+            ]
+            self.assertEqual(
+                [segment["translated_text"] for segment in segments],
+                [translations[block.id]["text"] for block in blocks],
+            )
+            self.assertFalse(
+                (project_path / ".glk/state/translation_batch.json").exists()
+            )
+
+    def test_batch_job_is_polled_again_on_resume_and_gaps_go_interactive(
+        self,
+    ) -> None:
+        class Crash(BaseException):
+            pass
+
+        class BatchProvider(SequenceProvider):
+            def __init__(self, responses: list[Any], results: Any) -> None:
+                super().__init__(responses)
+                self.results = results
+                self.submitted: list[dict[str, str]] = []
+
+            def submit_translation_batch(self, prompts: dict[str, str]) -> str:
+                self.submitted.append(dict(prompts))
+                return "job-1"
+
+            def translation_batch_results(self, job_id: str) -> Any:
+                return self.results(job_id)
+
+        def interrupted(_job_id: str) -> Any:
+            raise Crash()
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = sample_blocks()
+            project_path = create_translation_project(workspace_root, blocks)
+            job_path = project_path / ".glk/state/translation_batch.json"
+            first = BatchProvider([], interrupted)
+            with self.assertRaises(Crash):
+                translate_project(
+                    project="translation_project",
+                    workspace_root=workspace_root,
+                    provider=first,
+                    batch=True,
+                    batch_poll_seconds=0,
+                )
+            self.assertEqual(len(first.submitted), 1)
+            self.assertEqual(json.loads(job_path.read_text())["job_id"], "job-1")
+            [chunk_id] = first.submitted[0]
+
+            resumed = BatchProvider(
+                [valid_response(blocks)],
+                lambda job_id: {chunk_id: None} if job_id == "job-1" else None,
+            )
+            result = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=resumed,
+                batch=True,
+                batch_poll_seconds=0,
+                resume=True,
+            )
+
+            self.assertEqual(resumed.submitted, [])
+            self.assertEqual(resumed.prompts, [first.submitted[0][chunk_id]])
+            self.assertEqual(result.completed_blocks, len(blocks))
+            self.assertFalse(job_path.exists())
+            with self.assertRaisesRegex(TranslationError, "does not support batch"):
+                translate_project(
+                    project="translation_project",
+                    workspace_root=workspace_root,
+                    provider=SequenceProvider([]),
+                    batch=True,
+                    force=True,
+                )
+
+    def test_run_records_prompt_cache_tokens_reported_by_the_provider(self) -> None:
+        class CachingProvider(SequenceProvider):
+            def __init__(self, responses: list[Any]) -> None:
+                super().__init__(responses)
+                self.token_usage = TokenUsage()
+
+            def translate(self, prompt: str) -> dict[str, Any]:
+                self.token_usage.add(
+                    input_tokens=900,
+                    cached_input_tokens=600,
+                    output_tokens=50,
+                )
+                return super().translate(prompt)
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = sample_blocks()
+            project_path = create_translation_project(workspace_root, blocks)
+
+            result = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=CachingProvider([valid_response(blocks)]),
+            )
+
+            state = json.loads(
+                (project_path / ".glk/state/translation.json").read_text()
+            )
+            self.assertEqual(
+                state["token_usage"],
+                {
+                    "requests": 1,
+                    "input_tokens": 900,
+                    "cached_input_tokens": 600,
+                    "output_tokens": 50,
+                },
+            )
+            self.assertEqual(result.cached_input_tokens, 600)
+
     def test_resume_finishes_artifacts_after_interrupted_final_write(self) -> None:
         with tempfile.TemporaryDirectory() as temporary_directory:
             workspace_root = Path(temporary_directory) / "workspaces"
@@ -417,7 +852,75 @@ class TranslationFoundationTests(unittest.TestCase):
         self.assertTrue(all(chunk.blocks for chunk in chunks))
         self.assertEqual(len(chunks), 3)
 
-    def test_compiled_prompt_places_hard_rules_before_terms_and_project_prompt(self) -> None:
+    def test_token_budget_chunks_close_at_page_boundaries_when_mostly_full(
+        self,
+    ) -> None:
+        first, second, third, fourth = (
+            make_block(order, "Move one space toward the nearest exit.")
+            for order in range(4)
+        )
+        third = replace(third, page=2)
+        fourth = replace(fourth, page=2)
+
+        def estimate(blocks: list[SourceBlock]) -> int:
+            return build_token_budget_chunks(
+                blocks, max_tokens=10**6, termbase_entries=[]
+            )[0].estimated_tokens
+
+        budget = estimate([first, second, third])
+        self.assertGreaterEqual(estimate([first, second]), budget * 0.75)
+        chunks = build_token_budget_chunks(
+            [first, second, third, fourth],
+            max_tokens=budget,
+            termbase_entries=[],
+        )
+        self.assertEqual(
+            [[block.id for block in chunk.blocks] for chunk in chunks],
+            [[first.id, second.id], [third.id, fourth.id]],
+        )
+        self.assertTrue(all(chunk.estimated_tokens <= budget for chunk in chunks))
+        same_page = build_token_budget_chunks(
+            [first, second, replace(third, page=1), replace(fourth, page=1)],
+            max_tokens=budget,
+            termbase_entries=[],
+        )
+        self.assertEqual([len(chunk.blocks) for chunk in same_page], [3, 1])
+
+    def test_token_budget_counts_each_relevant_term_once_per_chunk(self) -> None:
+        entry = {
+            "source_term": "Victory Point",
+            "translation": "승점",
+            "status": "approved",
+            "variants": ["Victory Points"],
+            "note": "",
+        }
+        blocks = [make_block(1, "Gain a Victory Point."), make_block(2, "Lose a Victory Point.")]
+        plain = build_token_budget_chunks(
+            blocks, max_tokens=10**6, termbase_entries=[]
+        )[0]
+        with_term = build_token_budget_chunks(
+            blocks, max_tokens=10**6, termbase_entries=[entry]
+        )[0]
+        single = build_token_budget_chunks(
+            blocks[:1], max_tokens=10**6, termbase_entries=[entry]
+        )[0]
+        single_plain = build_token_budget_chunks(
+            blocks[:1], max_tokens=10**6, termbase_entries=[]
+        )[0]
+        self.assertEqual(
+            with_term.estimated_prompt_tokens - plain.estimated_prompt_tokens,
+            single.estimated_prompt_tokens - single_plain.estimated_prompt_tokens,
+        )
+
+    def test_token_estimates_follow_provider_and_model(self) -> None:
+        gemini = token_estimate_profile("gemini", "gemini-2.5-flash")
+        legacy = token_estimate_profile("openai", "gpt-4-turbo")
+        self.assertEqual(token_estimate_profile("openai", "gpt-5").name, "openai")
+        self.assertEqual(legacy.name, "openai-cl100k")
+        self.assertGreater(estimate_tokens("승리 점수", legacy), estimate_tokens("승리 점수", gemini))
+        self.assertLess(estimate_tokens("victory", gemini), len("victory"))
+
+    def test_compiled_prompt_keeps_run_wide_rules_in_a_cacheable_prefix(self) -> None:
         blocks = tuple(sample_blocks()[1:2])
         entries = [
             {
@@ -440,9 +943,21 @@ class TranslationFoundationTests(unittest.TestCase):
             termbase_entries=entries,
             project_instructions="Hunter를 헌터로 번역한다.",
         )
-        self.assertLess(prompt.index("[NON-OVERRIDABLE"), prompt.index("사냥꾼"))
-        self.assertLess(prompt.index("사냥꾼"), prompt.index("Hunter를 헌터"))
+        self.assertLess(
+            prompt.index("[NON-OVERRIDABLE"), prompt.index("Hunter를 헌터")
+        )
+        # Chunk-specific terms follow the run-wide prefix so it can be cached.
+        self.assertLess(prompt.index("Hunter를 헌터"), prompt.index("사냥꾼"))
         self.assertNotIn("미사용 용어", prompt)
+        other_chunk = compile_translation_prompt(
+            blocks=(make_block(9, "Discard a card."),),
+            termbase_entries=entries,
+            project_instructions="Hunter를 헌터로 번역한다.",
+        )
+        prefix, suffix = split_translation_prompt(prompt)
+        self.assertEqual(split_translation_prompt(other_chunk)[0], prefix)
+        self.assertTrue(suffix.startswith("[APPROVED TERMBASE FOR THIS CHUNK]\n"))
+        self.assertIn("사냥꾼", suffix)
 
     def test_rejected_terms_are_not_prompted_or_validated_as_keep(self) -> None:
         blocks = (make_block(1, "Each player draws five cards."),)
@@ -595,8 +1110,8 @@ class TranslationFoundationTests(unittest.TestCase):
             self.assertEqual(result.review_status, "current")
             self.assertEqual(len(provider.prompts), 1)
             self.assertLess(
-                provider.prompts[0].index("사냥꾼"),
                 provider.prompts[0].index("Hunter를 헌터"),
+                provider.prompts[0].index("사냥꾼"),
             )
             segments = [
                 TranslationSegment.from_dict(json.loads(line))
@@ -782,7 +1297,6 @@ class TranslationFoundationTests(unittest.TestCase):
                     }
                 ]
             }
-            missing_third = {"translations": []}
 
             with self.assertRaisesRegex(TranslationError, "use --resume"):
                 translate_project(
@@ -793,8 +1307,7 @@ class TranslationFoundationTests(unittest.TestCase):
                             first_valid,
                             second_invalid,
                             second_invalid,
-                            missing_third,
-                            missing_third,
+                            RuntimeError("service unavailable"),
                         ]
                     ),
                     max_characters=1,
@@ -858,13 +1371,12 @@ class TranslationFoundationTests(unittest.TestCase):
                 ["translated", "flagged", "translated"],
             )
 
-    def test_preserves_partial_state_and_resumes_after_validation_failure(self) -> None:
+    def test_preserves_partial_state_and_resumes_after_provider_failure(self) -> None:
         with tempfile.TemporaryDirectory() as temporary_directory:
             workspace_root = Path(temporary_directory) / "workspaces"
             blocks = sample_blocks()
             project_path = create_translation_project(workspace_root, blocks)
-            invalid = {"translations": []}
-            provider = SequenceProvider([invalid, invalid])
+            provider = SequenceProvider([RuntimeError("service unavailable")])
             with self.assertRaisesRegex(TranslationError, "use --resume"):
                 translate_project(
                     project="translation_project",
@@ -880,7 +1392,7 @@ class TranslationFoundationTests(unittest.TestCase):
                 state["hard_rules_version"],
                 "translation-hard-rules-v3",
             )
-            self.assertIn("missing ids", state["failure_reason"])
+            self.assertIn("service unavailable", state["failure_reason"])
             self.assertEqual(
                 inspect_project("translation_project", workspace_root)["pipeline"][
                     "translation_status"
@@ -901,49 +1413,599 @@ class TranslationFoundationTests(unittest.TestCase):
             )
             self.assertEqual(resumed.completed_blocks, 3)
 
-    def test_dry_run_needs_no_provider_and_writes_nothing(self) -> None:
+    def test_bisects_a_malformed_chunk_until_the_failing_block_is_isolated(
+        self,
+    ) -> None:
         with tempfile.TemporaryDirectory() as temporary_directory:
             workspace_root = Path(temporary_directory) / "workspaces"
             blocks = sample_blocks()
-            project_path = create_translation_project(workspace_root, blocks)
+            create_translation_project(workspace_root, blocks)
+            invalid = {"translations": []}
+            items = valid_response(blocks)["translations"]
+            provider = SequenceProvider(
+                [
+                    invalid,
+                    invalid,
+                    {"translations": items[:1]},
+                    invalid,
+                    invalid,
+                    {"translations": items[1:2]},
+                    {"translations": items[2:]},
+                ]
+            )
+            messages: list[str] = []
             result = translate_project(
                 project="translation_project",
                 workspace_root=workspace_root,
-                provider=SequenceProvider([]),
-                dry_run=True,
-                max_characters=20,
+                provider=provider,
+                progress=messages.append,
             )
-            self.assertTrue(result.dry_run)
-            self.assertEqual(result.total_blocks, 3)
-            self.assertEqual(result.total_chunks, 3)
-            self.assertFalse((project_path / "04_translation/prompt.txt").exists())
-            self.assertFalse((project_path / ".glk/segments/translation.jsonl").exists())
 
-    def test_prompt_edit_marks_translation_stale(self) -> None:
-        with tempfile.TemporaryDirectory() as temporary_directory:
-            workspace_root = Path(temporary_directory) / "workspaces"
-            blocks = sample_blocks()
-            project_path = create_translation_project(workspace_root, blocks)
-            translate_project(
-                project="translation_project",
-                workspace_root=workspace_root,
-                provider=SequenceProvider([valid_response(blocks)]),
+            self.assertEqual(result.completed_blocks, 3)
+            self.assertEqual(result.total_chunks, 1)
+            self.assertEqual(provider.responses, [])
+            self.assertIn(blocks[2].id, provider.prompts[3])
+            self.assertNotIn(blocks[0].id, provider.prompts[3])
+            self.assertIn(
+                "Chunk 1/1: splitting 3 blocks into 1 + 2 "
+                "after repeated validation failures",
+                messages,
             )
-            (project_path / "04_translation/prompt.txt").write_text(
-                "Changed project style.", encoding="utf-8"
+            self.assertIn(
+                "Chunk 1/1 blocks 2-3: splitting 2 blocks into 1 + 1 "
+                "after repeated validation failures",
+                messages,
             )
-            pipeline = inspect_project("translation_project", workspace_root)["pipeline"]
-            self.assertEqual(pipeline["translation_status"], "stale")
 
-    def test_force_retranslation_preserves_existing_human_review(self) -> None:
+    def test_block_that_fails_on_its_own_does_not_fail_the_chunk(self) -> None:
         with tempfile.TemporaryDirectory() as temporary_directory:
             workspace_root = Path(temporary_directory) / "workspaces"
-            blocks = sample_blocks()
-            project_path = create_translation_project(workspace_root, blocks)
-            translate_project(
-                project="translation_project",
-                workspace_root=workspace_root,
-                provider=SequenceProvider([valid_response(blocks)]),
+            blocks = [*sample_blocks(), make_block(4, "Discard one card.")]
+            create_translation_project(workspace_root, blocks)
+            translations = {
+                item["id"]: item["text"]
+                for item in valid_response(blocks[:3])["translations"]
+            }
+            translations[blocks[3].id] = "카드 한 장을 버립니다."
+            poisoned = blocks[2]
+
+            class PoisonedProvider:
+                model_name = "test-model"
+                prompt_version = "test-translation-v1"
+
+                def translate(self, prompt: str) -> dict[str, Any]:
+                    if poisoned.id in prompt:
+                        return {"translations": []}
+                    return {
+                        "translations": [
+                            {"id": block_id, "text": text}
+                            for block_id, text in translations.items()
+                            if block_id in prompt
+                        ]
+                    }
+
+            messages: list[str] = []
+            result = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=PoisonedProvider(),
+                progress=messages.append,
+            )
+
+            self.assertEqual(result.total_chunks, 1)
+            self.assertEqual(result.completed_blocks, 4)
+            self.assertEqual(result.validation_issue_blocks, 1)
+            self.assertIn(
+                f"Chunk 1/1 blocks 3-3: {poisoned.id} fails validation on "
+                "its own; keeping its source text for review",
+                messages,
+            )
+            segments = {
+                segment.source_block_id: segment
+                for segment in (
+                    TranslationSegment.from_dict(json.loads(line))
+                    for line in Path(result.output_file or "")
+                    .read_text(encoding="utf-8")
+                    .splitlines()
+                )
+            }
+            self.assertEqual(segments[poisoned.id].status, "flagged")
+            self.assertEqual(
+                segments[poisoned.id].translated_text,
+                poisoned.effective_text,
+            )
+            self.assertEqual(
+                {
+                    block_id: segment.translated_text
+                    for block_id, segment in segments.items()
+                    if block_id != poisoned.id
+                },
+                {
+                    block_id: text
+                    for block_id, text in translations.items()
+                    if block_id != poisoned.id
+                },
+            )
+            qa = run_project_translation_qa(
+                project="translation_project",
+                workspace_root=workspace_root,
+                dry_run=True,
+            )
+            self.assertEqual(
+                [
+                    (issue.code, issue.block_id)
+                    for issue in qa.issues
+                    if issue.code == "source_text_kept"
+                ],
+                [("source_text_kept", poisoned.id)],
+            )
+
+    def test_stream_retries_only_the_blocks_after_an_interruption(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = sample_blocks()
+            create_translation_project(workspace_root, blocks)
+            items = valid_response(blocks)["translations"]
+            provider = StreamingSequenceProvider(
+                [
+                    [items[0], TimeoutError("stream timed out")],
+                    [items[2]],
+                    items,
+                ]
+            )
+            messages: list[str] = []
+            result = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=provider,
+                stream=True,
+                progress=messages.append,
+            )
+
+            self.assertEqual(result.completed_blocks, 3)
+            self.assertIn(
+                "Chunk 1/1: response stream stopped after 1/3 blocks; "
+                "requesting the remaining 2",
+                messages,
+            )
+            self.assertNotIn(blocks[0].id, provider.prompts[1])
+            self.assertIn(blocks[1].id, provider.prompts[1])
+            self.assertIn("response item 1 has id", provider.prompts[2])
+            self.assertEqual(provider.responses, [])
+
+            with self.assertRaisesRegex(TranslationError, "streamed responses"):
+                translate_project(
+                    project="translation_project",
+                    workspace_root=workspace_root,
+                    provider=SequenceProvider([]),
+                    stream=True,
+                    force=True,
+                )
+
+    def test_stream_that_drops_before_the_first_block_is_opened_again(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = sample_blocks()
+            create_translation_project(workspace_root, blocks)
+            items = valid_response(blocks)["translations"]
+            provider = StreamingSequenceProvider(
+                [[ConnectionError("stream reset")], items]
+            )
+            messages: list[str] = []
+            result = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=provider,
+                stream=True,
+                progress=messages.append,
+            )
+
+            self.assertEqual(result.completed_blocks, 3)
+            self.assertEqual(provider.prompts[0], provider.prompts[1])
+            self.assertIn(
+                "Chunk 1/1: response stream stopped before the first block; "
+                "requesting it again: stream reset",
+                messages,
+            )
+
+            dropped = StreamingSequenceProvider(
+                [[ConnectionError("stream reset")], [ConnectionError("stream reset")]]
+            )
+            with self.assertRaisesRegex(TranslationError, "stream reset"):
+                translate_project(
+                    project="translation_project",
+                    workspace_root=workspace_root,
+                    provider=dropped,
+                    stream=True,
+                    force=True,
+                )
+            self.assertEqual(len(dropped.prompts), 2)
+
+    def test_dry_run_needs_no_provider_and_writes_nothing(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = sample_blocks()
+            project_path = create_translation_project(workspace_root, blocks)
+            result = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=SequenceProvider([]),
+                dry_run=True,
+                max_characters=20,
+            )
+            self.assertTrue(result.dry_run)
+            self.assertEqual(result.total_blocks, 3)
+            self.assertEqual(result.total_chunks, 3)
+            self.assertFalse((project_path / "04_translation/prompt.txt").exists())
+            self.assertFalse((project_path / ".glk/segments/translation.jsonl").exists())
+
+    def test_dry_run_reports_token_budget_chunks(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            create_translation_project(workspace_root, sample_blocks())
+            by_characters = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=SequenceProvider([]),
+                dry_run=True,
+            )
+            by_tokens = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=SequenceProvider([]),
+                dry_run=True,
+                max_tokens=100000,
+            )
+            self.assertIsNone(by_characters.max_tokens)
+            self.assertEqual(len(by_characters.estimated_chunk_tokens), 1)
+            self.assertEqual(by_tokens.max_tokens, 100000)
+            self.assertEqual(by_tokens.total_chunks, 1)
+            self.assertEqual(
+                by_tokens.estimated_chunk_tokens,
+                by_characters.estimated_chunk_tokens,
+            )
+            self.assertNotEqual(by_tokens.input_sha256, by_characters.input_sha256)
+            with self.assertRaisesRegex(TranslationError, "max_tokens"):
+                translate_project(
+                    project="translation_project",
+                    workspace_root=workspace_root,
+                    provider=SequenceProvider([]),
+                    dry_run=True,
+                    max_tokens=0,
+                )
+
+    def test_translation_memory_fills_exact_matches_from_other_projects(
+        self,
+    ) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = sample_blocks()
+            project_path = create_translation_project(workspace_root, blocks)
+            termbase = json.loads(
+                WorkspacePaths(project_path).termbase.read_text(encoding="utf-8")
+            )
+            # The base game translated Hunter differently, so only the block
+            # without termbase entries may be reused.
+            termbase["entries"][0]["translation"] = "헌터"
+            create_approved_translation_project(
+                workspace_root / "base_game",
+                termbase=termbase,
+                translations=[
+                    (blocks[0], "전투"),
+                    (blocks[1], "각 헌터는 스태미나 2를 얻습니다."),
+                ],
+            )
+            planned = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=SequenceProvider([]),
+                dry_run=True,
+            )
+            self.assertEqual(planned.memory_blocks, 1)
+            self.assertFalse((workspace_root / ".glk/translation_memory.json").exists())
+            response = valid_response(blocks)
+            response["translations"] = response["translations"][1:]
+            provider = SequenceProvider([response])
+
+            result = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=provider,
+            )
+
+            self.assertEqual(result.memory_blocks, 1)
+            self.assertEqual(len(provider.prompts), 1)
+            self.assertNotIn(blocks[0].id, provider.prompts[0])
+            segments = [
+                json.loads(line)
+                for line in (project_path / ".glk/segments/translation.jsonl")
+                .read_text(encoding="utf-8")
+                .splitlines()
+            ]
+            self.assertEqual(segments[0]["translated_text"], "전투")
+            self.assertEqual(segments[0]["origin"], "translation_memory")
+            self.assertEqual(segments[0]["origin_ref"], "base_game/pdf-p0009-b0001")
+            self.assertEqual(segments[0]["model"], "base-model")
+            self.assertNotIn("origin", segments[1])
+            self.assertEqual(segments[1]["model"], "test-model")
+            self.assertTrue(
+                translate_project(
+                    project="translation_project",
+                    workspace_root=workspace_root,
+                    provider=SequenceProvider([]),
+                ).cached
+            )
+            self.assertTrue((workspace_root / ".glk/translation_memory.json").is_file())
+            without_memory = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=SequenceProvider([]),
+                dry_run=True,
+                translation_memory=False,
+            )
+            self.assertEqual(without_memory.memory_blocks, 0)
+
+    def test_repeated_source_text_is_requested_once(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = [
+                make_block(1, "Combat", block_type="heading"),
+                make_block(2, "Each Hunter gains 2 Stamina."),
+                make_block(3, "Combat", block_type="heading"),
+                make_block(4, "Each Hunter gains 2 Stamina."),
+            ]
+            project_path = create_translation_project(workspace_root, blocks)
+            provider = SequenceProvider(
+                [
+                    {"translations": [{"id": blocks[0].id, "text": "전투"}]},
+                    {
+                        "translations": [
+                            {
+                                "id": blocks[1].id,
+                                "text": "각 사냥꾼은 스태미나 2를 얻습니다.",
+                            }
+                        ]
+                    },
+                ]
+            )
+            messages: list[str] = []
+
+            result = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=provider,
+                max_characters=1,
+                concurrency=1,
+                progress=messages.append,
+            )
+
+            self.assertEqual(result.total_chunks, 4)
+            self.assertEqual(result.duplicate_blocks, 2)
+            self.assertEqual(len(provider.prompts), 2)
+            self.assertIn("Chunk 3/4: filled from earlier identical blocks", messages)
+            segments = [
+                json.loads(line)
+                for line in (project_path / ".glk/segments/translation.jsonl")
+                .read_text(encoding="utf-8")
+                .splitlines()
+            ]
+            self.assertEqual(
+                [segment["translated_text"] for segment in segments],
+                ["전투", "각 사냥꾼은 스태미나 2를 얻습니다."] * 2,
+            )
+            state = json.loads(
+                (project_path / ".glk/state/translation.json").read_text(
+                    encoding="utf-8"
+                )
+            )
+            self.assertEqual(state["duplicate_blocks"], 2)
+            self.assertEqual(state["dedup_ratio"], 0.5)
+
+    def test_similar_approved_translations_are_prompt_examples(self) -> None:
+        index = FuzzyTranslationIndex(
+            [
+                ("Each Hunter gains 3 Stamina.", "각 헌터는 스태미나 3을 얻습니다."),
+                ("Each Monster loses 1 Wound.", "각 괴물은 상처 1을 잃습니다."),
+                ("Draw a card.", "카드를 1장 뽑습니다."),
+            ]
+        )
+        similar = index.similar(
+            "Each Hunter gains 2 Stamina!",
+            limit=3,
+            minimum_similarity=0.5,
+        )
+        self.assertEqual(
+            [example.source_text for example in similar],
+            ["Each Hunter gains 3 Stamina."],
+        )
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = sample_blocks()
+            project_path = create_translation_project(workspace_root, blocks)
+            create_approved_translation_project(
+                workspace_root / "base_game",
+                termbase=json.loads(
+                    WorkspacePaths(project_path).termbase.read_text(encoding="utf-8")
+                ),
+                translations=[
+                    (
+                        make_block(1, "Each Hunter gains 3 Stamina."),
+                        "각 사냥꾼은 스태미나 3을 얻습니다.",
+                    ),
+                ],
+            )
+            provider = SequenceProvider([valid_response(blocks)])
+
+            translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=provider,
+            )
+            without_memory = SequenceProvider([valid_response(blocks)])
+            translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=without_memory,
+                translation_memory=False,
+                force=True,
+            )
+
+        self.assertIn("[APPROVED TRANSLATIONS OF SIMILAR TEXT]", provider.prompts[0])
+        self.assertIn("각 사냥꾼은 스태미나 3을 얻습니다.", provider.prompts[0])
+        self.assertNotIn("[APPROVED TRANSLATIONS", without_memory.prompts[0])
+
+    def interrupted_incremental_run(self, workspace_root: Path) -> Path:
+        """Translate, add a term, then fail an incremental run before any commit."""
+        blocks = sample_blocks()
+        project_path = create_translation_project(workspace_root, blocks)
+        translate_project(
+            project="translation_project",
+            workspace_root=workspace_root,
+            provider=SequenceProvider(
+                [
+                    {"translations": [item]}
+                    for item in valid_response(blocks)["translations"]
+                ]
+            ),
+            max_characters=1,
+        )
+        termbase_path = WorkspacePaths(project_path).termbase
+        termbase = json.loads(termbase_path.read_text(encoding="utf-8"))
+        termbase["entries"].append(
+            {
+                **termbase["entries"][0],
+                "candidate_id": "term-combat",
+                "source_term": "Combat",
+                "translation": "전투",
+                "variants": [],
+            }
+        )
+        termbase_path.write_text(
+            json.dumps(termbase, ensure_ascii=False) + "\n", encoding="utf-8"
+        )
+        import_state_path = WorkspacePaths(project_path).glossary_import_state
+        import_state = json.loads(import_state_path.read_text(encoding="utf-8"))
+        import_state["termbase_sha256"] = hashlib.sha256(
+            termbase_path.read_bytes()
+        ).hexdigest()
+        import_state["entry_count"] = len(termbase["entries"])
+        import_state_path.write_text(json.dumps(import_state), encoding="utf-8")
+        with self.assertRaisesRegex(TranslationError, "stale"):
+            translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=SequenceProvider([]),
+                max_characters=1,
+            )
+        failing = SequenceProvider([TranslationError("provider down")])
+        with self.assertRaisesRegex(TranslationError, "provider down"):
+            translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=failing,
+                max_characters=1,
+                incremental=True,
+            )
+        self.assertEqual(len(failing.prompts), 1)
+        self.assertTrue(WorkspacePaths(project_path).translation_carry_over.is_file())
+        return project_path
+
+    def test_incremental_run_requeues_only_blocks_with_changed_terms(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = sample_blocks()
+            project_path = self.interrupted_incremental_run(workspace_root)
+            segments_path = project_path / ".glk/segments/translation.jsonl"
+            carry_over_path = WorkspacePaths(project_path).translation_carry_over
+            termbase_path = WorkspacePaths(project_path).termbase
+            provider = SequenceProvider(
+                [{"translations": [{"id": blocks[0].id, "text": "전투 단계"}]}]
+            )
+
+            result = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=provider,
+                max_characters=1,
+                resume=True,
+            )
+
+            self.assertEqual(len(provider.prompts), 1)
+            self.assertIn(blocks[0].id, provider.prompts[0])
+            self.assertEqual(result.carried_blocks, 2)
+            self.assertFalse(carry_over_path.exists())
+            segments = [
+                json.loads(line)
+                for line in segments_path.read_text(encoding="utf-8").splitlines()
+            ]
+            termbase_hash = hashlib.sha256(termbase_path.read_bytes()).hexdigest()
+            self.assertEqual(
+                [segment["translated_text"] for segment in segments],
+                [
+                    "전투 단계",
+                    "각 사냥꾼은 스태미나 2를 얻습니다.",
+                    "사냥꾼들은 {HP} 10을 사용할 수 있습니다.",
+                ],
+            )
+            self.assertTrue(
+                all(segment["termbase_sha256"] == termbase_hash for segment in segments)
+            )
+            self.assertTrue(
+                translate_project(
+                    project="translation_project",
+                    workspace_root=workspace_root,
+                    provider=SequenceProvider([]),
+                    max_characters=1,
+                ).cached
+            )
+
+    def test_interrupted_incremental_run_resumes_with_the_same_flags(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = sample_blocks()
+            self.interrupted_incremental_run(workspace_root)
+            provider = SequenceProvider(
+                [{"translations": [{"id": blocks[0].id, "text": "전투 단계"}]}]
+            )
+
+            result = translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=provider,
+                max_characters=1,
+                incremental=True,
+                resume=True,
+            )
+
+            self.assertEqual(len(provider.prompts), 1)
+            self.assertEqual(result.completed_blocks, 3)
+            self.assertEqual(result.carried_blocks, 2)
+
+    def test_prompt_edit_marks_translation_stale(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = sample_blocks()
+            project_path = create_translation_project(workspace_root, blocks)
+            translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=SequenceProvider([valid_response(blocks)]),
+            )
+            (project_path / "04_translation/prompt.txt").write_text(
+                "Changed project style.", encoding="utf-8"
+            )
+            pipeline = inspect_project("translation_project", workspace_root)["pipeline"]
+            self.assertEqual(pipeline["translation_status"], "stale")
+
+    def test_force_retranslation_preserves_existing_human_review(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = sample_blocks()
+            project_path = create_translation_project(workspace_root, blocks)
+            translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=SequenceProvider([valid_response(blocks)]),
             )
             review_path = project_path / "04_translation/review.txt"
             human_review = review_path.read_text(encoding="utf-8").replace(
@@ -1422,6 +2484,63 @@ class TranslationReviewTests(unittest.TestCase):
                 "qa_passed",
             )
 
+    def test_retry_packs_error_blocks_and_halves_a_chunk_that_stays_invalid(
+        self,
+    ) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            project_path, blocks = self._translated_project(workspace_root)
+            review_path = project_path / "04_translation/review.txt"
+            review_path.write_text(
+                review_path.read_text(encoding="utf-8")
+                .replace(
+                    "각 사냥꾼은 스태미나 2를 얻습니다.",
+                    "각 사냥꾼은 스태미나 3을 얻습니다.",
+                )
+                .replace(
+                    "사냥꾼들은 {HP} 10을 사용할 수 있습니다.",
+                    "사냥꾼들은 11을 사용할 수 있습니다.",
+                ),
+                encoding="utf-8",
+            )
+            items = valid_response(blocks)["translations"]
+            still_wrong = {
+                "translations": [
+                    items[1],
+                    {"id": blocks[2].id, "text": "사냥꾼들은 12를 사용할 수 있습니다."},
+                ]
+            }
+            provider = SequenceProvider(
+                [
+                    still_wrong,
+                    still_wrong,
+                    {"translations": [items[1]]},
+                    {"translations": [items[2]]},
+                ]
+            )
+            messages: list[str] = []
+            result = retry_failed_translations(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=provider,
+                concurrency=1,
+                progress=messages.append,
+            )
+
+            self.assertEqual(result.retried_blocks, 2)
+            self.assertEqual(result.remaining_error_count, 0)
+            self.assertIn(blocks[1].id, provider.prompts[0])
+            self.assertIn(blocks[2].id, provider.prompts[0])
+            self.assertIn(f"{blocks[2].id}: ", provider.prompts[0])
+            self.assertNotIn(blocks[2].id, provider.prompts[2])
+            self.assertIn("오류 블록 묶음 1/1 재번역 중: 블록 2개", messages)
+            self.assertIn(
+                "오류 블록 묶음 1/1 블록 2개를 1개와 1개로 나눠 재요청",
+                messages,
+            )
+            review_after = review_path.read_text(encoding="utf-8")
+            self.assertIn("사냥꾼들은 {HP} 10을 사용할 수 있습니다.", review_after)
+
     def test_retry_dry_run_lists_errors_without_calling_provider(self) -> None:
         with tempfile.TemporaryDirectory() as temporary_directory:
             workspace_root = Path(temporary_directory) / "workspaces"
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import tempfile
+from types import SimpleNamespace
+from typing import Any
+import unittest
+from unittest.mock import patch
+
+from glk.application.translation_service import translate_project
+from glk.application.usage_service import (
+    get_project_usage,
+    read_usage_ledger,
+    summarize_usage,
+)
+from glk.cli import main
+from glk.infrastructure.gemini_translation import GeminiTranslationProvider
+from glk.infrastructure.openai_translation import OpenAITranslationProvider
+from glk.infrastructure.usage_telemetry import request_scope
+from tests.test_gemini_common import api_error
+from tests.test_translation_service import (
+    create_translation_project,
+    sample_blocks,
+    valid_response,
+)
+
+
+def record(
+    *,
+    stage: str = "translation",
+    finished_at: str,
+    wall_seconds: float,
+    blocks: int = 2,
+    model: str = "gemini-2.5-flash",
+    failure_code: str | None = None,
+) -> dict[str, Any]:
+    return {
+        "schema_version": 1,
+        "stage": stage,
+        "item": "chunk-0001",
+        "blocks": blocks,
+        "provider": "gemini",
+        "model": model,
+        "input_tokens": 1_000,
+        "cached_input_tokens": 0,
+        "output_tokens": 500,
+        "wall_seconds": wall_seconds,
+        "attempts": 1,
+        "failure_code": failure_code,
+        "finished_at": finished_at,
+    }
+
+
+class UsageTelemetryTests(unittest.TestCase):
+    def test_provider_request_reports_attempts_tokens_and_scope(self) -> None:
+        with patch("glk.infrastructure.gemini_common.genai.Client"):
+            provider = GeminiTranslationProvider(
+                api_key="test-key",
+                model_name="test-model",
+                max_retries=2,
+                base_delay=0,
+            )
+        records: list[dict[str, Any]] = []
+        calls: list[int] = []
+
+        def operation() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                raise api_error(503, headers={"Retry-After": "0"})
+            provider.record_usage(
+                SimpleNamespace(
+                    usage_metadata=SimpleNamespace(
+                        prompt_token_count=120,
+                        cached_content_token_count=100,
+                        candidates_token_count=30,
+                    )
+                )
+            )
+            return "ok"
+
+        def rejected() -> str:
+            raise api_error(400)
+
+        with request_scope(stage="translation", observer=records.append):
+            with request_scope(item="chunk-0002", blocks=4):
+                provider.run_request(operation)
+            with self.assertRaises(Exception):
+                provider.run_request(rejected)
+        provider.run_request(lambda: "unobserved")
+
+        self.assertEqual(len(records), 2)
+        success, failure = records
+        self.assertEqual(
+            {key: success[key] for key in ("stage", "item", "blocks", "attempts")},
+            {"stage": "translation", "item": "chunk-0002", "blocks": 4, "attempts": 2},
+        )
+        self.assertEqual(
+            (
+                success["input_tokens"],
+                success["cached_input_tokens"],
+                success["output_tokens"],
+            ),
+            (120, 100, 30),
+        )
+        self.assertIsNone(success["failure_code"])
+        self.assertEqual(success["model"], "test-model")
+        self.assertEqual(failure["item"], None)
+        self.assertEqual(failure["failure_code"], "GEMINI_API_KEY_OR_REQUEST_INVALID")
+
+    def test_summary_counts_overlapping_requests_once_and_prices_known_models(
+        self,
+    ) -> None:
+        records = [
+            record(finished_at="2026-10-01T00:00:10+00:00", wall_seconds=10),
+            record(finished_at="2026-10-01T00:00:15+00:00", wall_seconds=10),
+            record(
+                finished_at="2026-10-01T00:00:30+00:00",
+                wall_seconds=5,
+                failure_code="GEMINI_QUOTA_EXCEEDED",
+            ),
+            record(
+                stage="layout",
+                finished_at="2026-10-01T00:00:05+00:00",
+                wall_seconds=5,
+                blocks=1,
+                model="unknown-model",
+            ),
+        ]
+
+        layout, translation = summarize_usage(records)
+
+        self.assertEqual(translation.stage, "translation")
+        self.assertEqual(translation.requests, 3)
+        self.assertEqual(translation.failed_requests, 1)
+        self.assertEqual(translation.blocks, 4)
+        self.assertEqual(translation.active_seconds, 20.0)
+        self.assertEqual(translation.blocks_per_minute, 12.0)
+        self.assertEqual(translation.tokens_per_second, 225.0)
+        self.assertEqual(translation.failure_codes, {"GEMINI_QUOTA_EXCEEDED": 1})
+        self.assertAlmostEqual(translation.estimated_cost_usd or 0, 3 * 0.00155)
+        self.assertEqual(layout.stage, "layout")
+        self.assertIsNone(layout.estimated_cost_usd)
+        self.assertEqual(layout.unpriced_requests, 1)
+
+    def test_translation_run_appends_one_ledger_line_per_request(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            workspace_root = Path(temporary_directory) / "workspaces"
+            blocks = sample_blocks()
+            project_path = create_translation_project(workspace_root, blocks)
+            provider = OpenAITranslationProvider(
+                api_key="sk-test",
+                model_name="gpt-test",
+                max_retries=1,
+            )
+            usage = SimpleNamespace(
+                input_tokens=400,
+                input_tokens_details=SimpleNamespace(cached_tokens=0),
+                output_tokens=80,
+            )
+            provider.client = SimpleNamespace(  # type: ignore[assignment]
+                responses=SimpleNamespace(
+                    create=lambda **_: SimpleNamespace(
+                        output_text=json.dumps(valid_response(blocks)),
+                        usage=usage,
+                    )
+                )
+            )
+
+            translate_project(
+                project="translation_project",
+                workspace_root=workspace_root,
+                provider=provider,
+            )
+
+            ledger = project_path / ".glk/state/usage.jsonl"
+            records, skipped = read_usage_ledger(ledger)
+            self.assertEqual(skipped, 0)
+            self.assertEqual(len(records), 1)
+            self.assertEqual(records[0]["stage"], "translation")
+            self.assertEqual(records[0]["blocks"], 3)
+            self.assertEqual(records[0]["output_tokens"], 80)
+
+            with ledger.open("a", encoding="utf-8") as file:
+                file.write('{"truncated')
+            report = get_project_usage("translation_project", workspace_root)
+            self.assertEqual(report.skipped_records, 1)
+            self.assertEqual(report.requests, 1)
+            self.assertEqual(report.stages[0].blocks, 3)
+
+            with patch("builtins.print") as printed:
+                exit_code = main(
+                    [
+                        "usage",
+                        "--project",
+                        "translation_project",
+                        "--workspace-root",
+                        str(workspace_root),
+                        "--json",
+                    ]
+                )
+            self.assertEqual(exit_code, 0)
+            payload = json.loads(printed.call_args.args[0])
+            self.assertEqual(payload["stages"][0]["stage"], "translation")
+            self.assertIsNone(payload["estimated_cost_usd"])
+
+
+if __name__ == "__main__":
+    unittest.main()